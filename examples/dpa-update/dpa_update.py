@@ -54,20 +54,24 @@ if __name__ == '__main__':
         else:
             items.append(line.split(','))
 
-    for item in items:
-        product_id, new_price = item
-        if new_price == '-':
-            response = catalog.update_product(
-                product_id,
-                availability=Product.Availability.out_of_stock
-            )
-            print('Product {} is now out of stock'.format(product_id))
-        else:
-            # prices should be in cents and be an integer
-            new_price_in_cents = int(float(new_price) * 100)
-            response = catalog.update_product(
-                product_id,
-                price=new_price_in_cents,
-                availability=Product.Availability.in_stock,
-            )
-            print('Product {} is now costs R$ {}'.format(product_id, new_price))
+    def updates():
+        for product_id, new_price in items:
+            if new_price == '-':
+                yield product_id, {
+                    'availability': Product.Availability.out_of_stock,
+                }
+            else:
+                # prices should be in cents and be an integer
+                yield product_id, {
+                    'price': int(float(new_price) * 100),
+                    'availability': Product.Availability.in_stock,
+                }
+
+    # one batch request per 5000 products instead of one request each
+    result = catalog.bulk_update_products(updates())
+    print('Sent {} product updates in {} batches'.format(
+        result.num_requests,
+        len(result.handles),
+    ))
+    for error in result.errors:
+        print('Error: {}'.format(error))
@@ -17,3 +17,36 @@
 # LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING
 # FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER
 # DEALINGS IN THE SOFTWARE.
+
+"""
+adobjects contains the generated classes for the objects of the Graph API,
+one module per class. The classes are also available from the package
+itself, e.g. facebookads.adobjects.AdAccount, and their module is only
+imported when the class is first used.
+"""
+
+import importlib
+import pkgutil
+
+from facebookads.utils import lazyimport
+
+_submodules = frozenset(
+    name for _, name, _ in pkgutil.iter_modules(__path__)
+)
+
+
+def _resolve(name):
+    """Imports the submodule called name, or the class defined by one."""
+    module_name = name.lower()
+    if module_name in _submodules:
+        module = importlib.import_module(__name__ + '.' + module_name)
+        if name == module_name:
+            return module
+        if hasattr(module, name):
+            return getattr(module, name)
+    raise AttributeError(
+        "module '%s' has no attribute '%s'" % (__name__, name),
+    )
+
+
+lazyimport.install(__name__, _resolve, _submodules)
@@ -30,6 +30,8 @@ from facebookads.api import (
 from facebookads.adobjects.abstractobject import AbstractObject
 from facebookads.adobjects.objectparser import ObjectParser
 
+from six.moves import intern
+
 class AbstractCrudObject(AbstractObject):
     """
     Extends AbstractObject and implements methods to create, read, update,
@@ -56,18 +58,29 @@ class AbstractCrudObject(AbstractObject):
         self._data['id'] = fbid
         self._include_summary = True
 
+    # Whether _data and _changes are referenced by a snapshot and must be
+    # copied before being modified.
+    _shared_state = False
+
     def __setitem__(self, key, value):
         """Sets an item in this CRUD object while maintaining a changelog."""
 
-        if key not in self._data or self._data[key] != value:
+        self._copy_on_write()
+        if key in self._changes or key not in self._data:
+            # Already dirty or new, no need to compare values
             self._changes[key] = value
+        else:
+            current = self._data[key]
+            if current is not value and current != value:
+                self._changes[key] = value
         super(AbstractCrudObject, self).__setitem__(key, value)
-        if '_setitem_trigger' in dir(self):
+        if hasattr(self, '_setitem_trigger'):
             self._setitem_trigger(key, value)
 
         return self
 
     def __delitem__(self, key):
+        self._copy_on_write()
         del self._data[key]
         self._changes.pop(key, None)
 
@@ -166,30 +179,110 @@ class AbstractCrudObject(AbstractObject):
     # Data management
 
     def _clear_history(self):
+        self._copy_on_write()
         self._changes = {}
+        self._clear_changed_leaves()
         if 'filename' in self._data:
             del self._data['filename']
         return self
 
+    def _mark_changed(self, key):
+        # Changed top level fields are logged in _changes
+        pass
+
+    def _get_changed_keys(self):
+        return self._changes
+
+    def _copy_on_write(self):
+        if self._shared_state:
+            self._data = dict(self._data)
+            self._changes = dict(self._changes)
+            self._shared_state = False
+
+    def snapshot(self):
+        """Returns a snapshot of the object's data and changelog.
+        Taking a snapshot does not copy anything: the object copies its
+        state the next time it is modified. Nested objects modified in
+        place are not part of the snapshot.
+        """
+        self._shared_state = True
+        return (self._data, self._changes)
+
+    def rollback(self, snapshot):
+        """Restores the data and changelog saved by snapshot()."""
+        self._data, self._changes = snapshot
+        self._shared_state = True
+        return self
+
     def _set_data(self, data):
         """
         Sets object's data as if it were read from the server.
         Warning: Does not log changes.
         """
-        for key in map(str, data):
-            self[key] = data[key]
+        self._copy_on_write()
+        can_hydrate, trigger = self._get_hydration_plan()
+        if can_hydrate:
+            self._hydrate(data, trigger)
+        else:
+            for key in map(str, data):
+                self[key] = data[key]
 
-            # clear history due to the update
-            self._changes.pop(key, None)
+                # clear history due to the update
+                self._changes.pop(key, None)
         self._json = data
         return self
 
+    @classmethod
+    def _get_hydration_plan(cls):
+        """Returns (can_hydrate, setitem_trigger), resolved once per class.
+        Server data can bypass __setitem__ only if no class in the hierarchy
+        customizes it; _setitem_trigger is still called for every key.
+        """
+        plan = cls.__dict__.get('_hydration_plan_cache')
+        if plan is None:
+            setitem_owners = [
+                klass for klass in cls.__mro__
+                if '__setitem__' in klass.__dict__
+            ]
+            can_hydrate = setitem_owners[:2] == [
+                AbstractCrudObject,
+                AbstractObject,
+            ]
+            plan = (can_hydrate, getattr(cls, '_setitem_trigger', None))
+            cls._hydration_plan_cache = plan
+        return plan
+
+    def _hydrate(self, data, trigger=None):
+        """Stores server data without comparing values or logging changes.
+        Field names are interned so they are shared across objects, and
+        nested AdObjects are only built when first read.
+        """
+        fields = self._data
+        changes = self._changes
+        get_typed_value = self._field_checker.get_typed_value
+        for key in map(str, data):
+            value = data[key]
+            key = intern(key)
+            if key.startswith('_'):
+                setattr(self, key, value)
+            else:
+                fields[key] = get_typed_value(key, value, lazy=True)
+            if trigger is not None:
+                trigger(self, key, value)
+            changes.pop(key, None)
+
     def export_changed_data(self):
         """
         Returns a dictionary of property names mapped to their values for
-        properties modified from their original values.
+        properties modified from their original values. A field holding a
+        nested object modified in place is exported as a whole.
         """
-        return self.export_value(self._changes)
+        changes = dict(self._changes)
+        for key, value in self._data.items():
+            if (key not in changes and
+                    self._get_value_changed_leaves(value, (key,))):
+                changes[key] = value
+        return self.export_value(changes)
 
     def export_data(self):
         """
@@ -523,12 +616,14 @@ class AbstractCrudObject(AbstractObject):
         fetch_first_page=True,
         include_summary=True,
         endpoint=None,
-        maximum_results=None
+        maximum_results=None,
+        compact=False,
     ):
         """
         Returns Cursor with argument self as source_object and
         the rest as given __init__ arguments.
         Note: list(iterate_edge(...)) can prefetch all the objects.
+        Pass compact=True to iterate over CompactObject records.
         """
         source_object = self
         cursor = Cursor(
@@ -539,6 +634,7 @@ class AbstractCrudObject(AbstractObject):
             include_summary=include_summary,
             endpoint=endpoint,
             maximum_results=maximum_results,
+            compact=compact,
         )
         if fetch_first_page:
             cursor.load_next_page()
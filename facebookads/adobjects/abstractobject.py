@@ -21,7 +21,7 @@
 from facebookads.exceptions import (
     FacebookBadObjectError,
 )
-from facebookads.typechecker import TypeChecker
+from facebookads.typechecker import LazyValue, TypeChecker
 
 import collections
 import json
@@ -35,23 +35,29 @@ class AbstractObject(collections.MutableMapping):
 
     _default_read_fields = []
     _field_types = {}
+    # Keys set locally since the object was last read, see _mark_changed.
+    _changed_keys = frozenset()
 
     class Field:
         pass
 
     def __init__(self):
         self._data = {}
-        self._field_checker = TypeChecker(self._field_types,
-            self._get_field_enum_info())
+        self._field_checker = self._get_field_checker()
 
     def __getitem__(self, key):
-        return self._data[str(key)]
+        key = str(key)
+        value = self._data[key]
+        if isinstance(value, LazyValue):
+            value = self._data[key] = value.resolve()
+        return value
 
     def __setitem__(self, key, value):
         if key.startswith('_'):
             self.__setattr__(key, value)
         else:
             self._data[key] = self._field_checker.get_typed_value(key, value)
+            self._mark_changed(key)
         return self
 
     def __eq__(self, other):
@@ -60,6 +66,7 @@ class AbstractObject(collections.MutableMapping):
 
     def __delitem__(self, key):
         del self._data[key]
+        self._mark_changed(key)
 
     def __iter__(self):
         return iter(self._data)
@@ -87,12 +94,82 @@ class AbstractObject(collections.MutableMapping):
     #reads in data from json object
     def _set_data(self, data):
         if hasattr(data, 'items'):
+            changed_keys = self._changed_keys
             for key, value in data.items():
                 self[key] = value
+            self._changed_keys = (changed_keys.difference(data) or
+                                  AbstractObject._changed_keys)
         else:
             raise FacebookBadObjectError("Bad data to set object data")
         self._json = data
 
+    def _mark_changed(self, key):
+        if not isinstance(self._changed_keys, set):
+            self._changed_keys = set(self._changed_keys)
+        self._changed_keys.add(key)
+
+    def _get_changed_keys(self):
+        return self._changed_keys
+
+    def _get_changed_leaves(self, prefix=()):
+        """Returns paths to the fields changed in this object or in nested
+        objects since they were last read, as tuples of keys and indexes.
+        Nested objects that were never read are skipped without conversion.
+        """
+        changed_keys = self._get_changed_keys()
+        leaves = [prefix + (key,) for key in changed_keys]
+        for key, value in self._data.items():
+            if key not in changed_keys:
+                leaves.extend(
+                    self._get_value_changed_leaves(value, prefix + (key,)))
+        return leaves
+
+    def _clear_changed_leaves(self):
+        self._changed_keys = AbstractObject._changed_keys
+        for value in self._data.values():
+            self._clear_value_changed_leaves(value)
+
+    @staticmethod
+    def _get_value_changed_leaves(value, prefix):
+        if isinstance(value, AbstractObject):
+            return value._get_changed_leaves(prefix)
+        if isinstance(value, list):
+            leaves = []
+            for index, item in enumerate(value):
+                leaves.extend(AbstractObject._get_value_changed_leaves(
+                    item, prefix + (index,)))
+            return leaves
+        return []
+
+    @staticmethod
+    def _clear_value_changed_leaves(value):
+        if isinstance(value, AbstractObject):
+            value._clear_changed_leaves()
+        elif isinstance(value, list):
+            for item in value:
+                AbstractObject._clear_value_changed_leaves(item)
+
+    def get_changed_fields(self):
+        """Returns the fields changed since the object was last read, as
+        dotted paths down to the changed leaves of nested objects, e.g.
+        'targeting.geo_locations.countries'.
+        """
+        return sorted(
+            '.'.join(map(str, path)) for path in self._get_changed_leaves()
+        )
+
+    @classmethod
+    def _get_field_checker(cls):
+        """Returns the TypeChecker for the class's fields.
+        The checker is built once per class so its compiled converters are
+        shared by all instances.
+        """
+        checker = cls.__dict__.get('_field_checker_cache')
+        if checker is None or checker._type_check_info is not cls._field_types:
+            checker = TypeChecker(cls._field_types, cls._get_field_enum_info())
+            cls._field_checker_cache = checker
+        return checker
+
     @classmethod
     def _get_field_enum_info(cls):
         """Returns info for fields that use enum values
@@ -141,6 +218,8 @@ class AbstractObject(collections.MutableMapping):
         self._set_data(data)
 
     def export_value(self, data):
+        if isinstance(data, LazyValue):
+            data = data.resolve()
         if isinstance(data, AbstractObject):
             data = data.export_all_data()
         elif isinstance(data, dict):
@@ -162,6 +241,31 @@ class AbstractObject(collections.MutableMapping):
 
     @classmethod
     def create_object(cls, api, data, target_class):
+        """Returns a target_class object holding data.
+        If the api has an identity map enabled and an object of target_class
+        with the same id is live, data is merged into that object instead.
+        """
+        identity_map = cls._get_identity_map(api)
+        fbid = None
+        if (identity_map is not None and hasattr(target_class, 'get_id') and
+                hasattr(data, 'get')):
+            fbid = data.get('id')
+        if fbid:
+            existing = identity_map.get(target_class, fbid)
+            if existing is not None:
+                existing._set_data(data)
+                return existing
         new_object = target_class(api=api)
         new_object._set_data(data)
+        if fbid:
+            identity_map.add(new_object)
         return new_object
+
+    @classmethod
+    def _get_identity_map(cls, api):
+        if api is None:
+            from facebookads.api import FacebookAdsApi
+            api = FacebookAdsApi.get_default_api()
+        if api is None or not hasattr(api, 'get_identity_map'):
+            return None
+        return api.get_identity_map()
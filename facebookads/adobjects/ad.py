@@ -21,8 +21,9 @@
 from facebookads.adobjects.abstractobject import AbstractObject
 from facebookads.adobjects.abstractcrudobject import AbstractCrudObject
 from facebookads.adobjects.objectparser import ObjectParser
+from facebookads.adobjects.apimethod import ApiMethod
 from facebookads.api import FacebookRequest
-from facebookads.typechecker import TypeChecker
+from facebookads.typechecker import ParamSchema
 from facebookads.mixins import HasAdLabels
 
 """
@@ -136,62 +137,26 @@ class Ad(
         from facebookads.adobjects.adaccount import AdAccount
         return AdAccount(api=self._api, fbid=parent_id).create_ad(fields, params, batch, pending)
 
-    def api_delete(self, fields=None, params=None, batch=None, pending=False):
-        param_types = {
-        }
-        enums = {
-        }
-        request = FacebookRequest(
-            node_id=self['id'],
-            method='DELETE',
-            endpoint='/',
-            api=self._api,
-            param_checker=TypeChecker(param_types, enums),
-            target_class=AbstractCrudObject,
-            api_type='NODE',
-            response_parser=ObjectParser(reuse_object=self),
-        )
-        request.add_params(params)
-        request.add_fields(fields)
-
-        if batch is not None:
-            request.add_to_batch(batch)
-            return request
-        elif pending:
-            return request
-        else:
-            self.assure_call()
-            return request.execute()
-
-    def api_get(self, fields=None, params=None, batch=None, pending=False):
-        param_types = {
-        }
-        enums = {
-        }
-        request = FacebookRequest(
-            node_id=self['id'],
-            method='GET',
-            endpoint='/',
-            api=self._api,
-            param_checker=TypeChecker(param_types, enums),
-            target_class=Ad,
-            api_type='NODE',
-            response_parser=ObjectParser(reuse_object=self),
-        )
-        request.add_params(params)
-        request.add_fields(fields)
-
-        if batch is not None:
-            request.add_to_batch(batch)
-            return request
-        elif pending:
-            return request
-        else:
-            self.assure_call()
-            return request.execute()
-
-    def api_update(self, fields=None, params=None, batch=None, pending=False):
-        param_types = {
+    api_delete = ApiMethod(
+        method='DELETE',
+        endpoint='/',
+        target='abstractcrudobject.AbstractCrudObject',
+        api_type='NODE',
+    )
+
+    api_get = ApiMethod(
+        method='GET',
+        endpoint='/',
+        target='ad.Ad',
+        api_type='NODE',
+    )
+
+    api_update = ApiMethod(
+        method='POST',
+        endpoint='/',
+        target='ad.Ad',
+        api_type='NODE',
+        param_types={
             'adlabels': 'list<Object>',
             'adset_id': 'unsigned int',
             'bid_amount': 'int',
@@ -202,161 +167,62 @@ class Ad(
             'redownload': 'bool',
             'status': 'status_enum',
             'tracking_specs': 'Object',
-        }
-        enums = {
-            'execution_options_enum': Ad.ExecutionOptions.__dict__.values(),
-            'status_enum': Ad.Status.__dict__.values(),
-        }
-        request = FacebookRequest(
-            node_id=self['id'],
-            method='POST',
-            endpoint='/',
-            api=self._api,
-            param_checker=TypeChecker(param_types, enums),
-            target_class=Ad,
-            api_type='NODE',
-            response_parser=ObjectParser(reuse_object=self),
-        )
-        request.add_params(params)
-        request.add_fields(fields)
-
-        if batch is not None:
-            request.add_to_batch(batch)
-            return request
-        elif pending:
-            return request
-        else:
-            self.assure_call()
-            return request.execute()
-
-    def get_ad_creatives(self, fields=None, params=None, batch=None, pending=False):
-        from facebookads.adobjects.adcreative import AdCreative
-        param_types = {
-        }
-        enums = {
-        }
-        request = FacebookRequest(
-            node_id=self['id'],
-            method='GET',
-            endpoint='/adcreatives',
-            api=self._api,
-            param_checker=TypeChecker(param_types, enums),
-            target_class=AdCreative,
-            api_type='EDGE',
-            response_parser=ObjectParser(target_class=AdCreative),
-        )
-        request.add_params(params)
-        request.add_fields(fields)
-
-        if batch is not None:
-            request.add_to_batch(batch)
-            return request
-        elif pending:
-            return request
-        else:
-            self.assure_call()
-            return request.execute()
-
-    def delete_ad_labels(self, fields=None, params=None, batch=None, pending=False):
-        from facebookads.adobjects.adlabel import AdLabel
-        param_types = {
+        },
+        enums={
+            'execution_options_enum': 'ad.Ad.ExecutionOptions',
+            'status_enum': 'ad.Ad.Status',
+        },
+    )
+
+    get_ad_creatives = ApiMethod(
+        method='GET',
+        endpoint='/adcreatives',
+        target='adcreative.AdCreative',
+        api_type='EDGE',
+    )
+
+    delete_ad_labels = ApiMethod(
+        method='DELETE',
+        endpoint='/adlabels',
+        target='abstractcrudobject.AbstractCrudObject',
+        api_type='EDGE',
+        param_types={
             'adlabels': 'list<Object>',
             'execution_options': 'list<execution_options_enum>',
-        }
-        enums = {
-            'execution_options_enum': AdLabel.ExecutionOptions.__dict__.values(),
-        }
-        request = FacebookRequest(
-            node_id=self['id'],
-            method='DELETE',
-            endpoint='/adlabels',
-            api=self._api,
-            param_checker=TypeChecker(param_types, enums),
-            target_class=AbstractCrudObject,
-            api_type='EDGE',
-            response_parser=ObjectParser(target_class=AbstractCrudObject),
-        )
-        request.add_params(params)
-        request.add_fields(fields)
-
-        if batch is not None:
-            request.add_to_batch(batch)
-            return request
-        elif pending:
-            return request
-        else:
-            self.assure_call()
-            return request.execute()
-
-    def create_ad_label(self, fields=None, params=None, batch=None, pending=False):
-        from facebookads.adobjects.adlabel import AdLabel
-        param_types = {
+        },
+        enums={
+            'execution_options_enum': 'adlabel.AdLabel.ExecutionOptions',
+        },
+    )
+
+    create_ad_label = ApiMethod(
+        method='POST',
+        endpoint='/adlabels',
+        target='adlabel.AdLabel',
+        api_type='EDGE',
+        param_types={
             'adlabels': 'list<Object>',
             'execution_options': 'list<execution_options_enum>',
-        }
-        enums = {
-            'execution_options_enum': AdLabel.ExecutionOptions.__dict__.values(),
-        }
-        request = FacebookRequest(
-            node_id=self['id'],
-            method='POST',
-            endpoint='/adlabels',
-            api=self._api,
-            param_checker=TypeChecker(param_types, enums),
-            target_class=AdLabel,
-            api_type='EDGE',
-            response_parser=ObjectParser(target_class=AdLabel),
-        )
-        request.add_params(params)
-        request.add_fields(fields)
-
-        if batch is not None:
-            request.add_to_batch(batch)
-            return request
-        elif pending:
-            return request
-        else:
-            self.assure_call()
-            return request.execute()
+        },
+        enums={
+            'execution_options_enum': 'adlabel.AdLabel.ExecutionOptions',
+        },
+    )
 
-    def get_insights(self, fields=None, params=None, async=False, batch=None, pending=False):
+    def get_insights(self, fields=None, params=None, async=False, batch=None, pending=False, strategy=None):
         from facebookads.adobjects.adsinsights import AdsInsights
+        if strategy is not None:
+          if batch is not None or pending:
+            raise ValueError('strategy cannot be used with batch or pending.')
+          return strategy.get_insights(self, fields, params, async)
         if async:
           return self.get_insights_async(fields, params, batch, pending)
-        param_types = {
-            'action_attribution_windows': 'list<action_attribution_windows_enum>',
-            'action_breakdowns': 'list<action_breakdowns_enum>',
-            'action_report_time': 'action_report_time_enum',
-            'breakdowns': 'list<breakdowns_enum>',
-            'date_preset': 'date_preset_enum',
-            'default_summary': 'bool',
-            'fields': 'list<fields_enum>',
-            'filtering': 'list<Object>',
-            'level': 'level_enum',
-            'product_id_limit': 'int',
-            'sort': 'list<string>',
-            'summary': 'list<summary_enum>',
-            'summary_action_breakdowns': 'list<summary_action_breakdowns_enum>',
-            'time_increment': 'string',
-            'time_range': 'map',
-            'time_ranges': 'list<map>',
-        }
-        enums = {
-            'action_attribution_windows_enum': AdsInsights.ActionAttributionWindows.__dict__.values(),
-            'action_breakdowns_enum': AdsInsights.ActionBreakdowns.__dict__.values(),
-            'action_report_time_enum': AdsInsights.ActionReportTime.__dict__.values(),
-            'breakdowns_enum': AdsInsights.Breakdowns.__dict__.values(),
-            'date_preset_enum': AdsInsights.DatePreset.__dict__.values(),
-            'summary_enum': AdsInsights.Summary.__dict__.values(),
-            'level_enum': AdsInsights.Level.__dict__.values(),
-            'summary_action_breakdowns_enum': AdsInsights.SummaryActionBreakdowns.__dict__.values(),
-        }
         request = FacebookRequest(
             node_id=self['id'],
             method='GET',
             endpoint='/insights',
             api=self._api,
-            param_checker=TypeChecker(param_types, enums),
+            param_checker=_get_insights_params.get_checker(),
             target_class=AdsInsights,
             api_type='EDGE',
             response_parser=ObjectParser(target_class=AdsInsights),
@@ -374,10 +240,12 @@ class Ad(
             self.assure_call()
             return request.execute()
 
-    def get_insights_async(self, fields=None, params=None, batch=None, pending=False):
-        from facebookads.adobjects.adreportrun import AdReportRun
-        from facebookads.adobjects.adsinsights import AdsInsights
-        param_types = {
+    get_insights_async = ApiMethod(
+        method='POST',
+        endpoint='/insights',
+        target='adreportrun.AdReportRun',
+        api_type='EDGE',
+        param_types={
             'action_attribution_windows': 'list<action_attribution_windows_enum>',
             'action_breakdowns': 'list<action_breakdowns_enum>',
             'action_report_time': 'action_report_time_enum',
@@ -394,100 +262,43 @@ class Ad(
             'time_increment': 'string',
             'time_range': 'map',
             'time_ranges': 'list<map>',
-        }
-        enums = {
-            'action_attribution_windows_enum': AdsInsights.ActionAttributionWindows.__dict__.values(),
-            'action_breakdowns_enum': AdsInsights.ActionBreakdowns.__dict__.values(),
-            'action_report_time_enum': AdsInsights.ActionReportTime.__dict__.values(),
-            'breakdowns_enum': AdsInsights.Breakdowns.__dict__.values(),
-            'date_preset_enum': AdsInsights.DatePreset.__dict__.values(),
-            'summary_enum': AdsInsights.Summary.__dict__.values(),
-            'level_enum': AdsInsights.Level.__dict__.values(),
-            'summary_action_breakdowns_enum': AdsInsights.SummaryActionBreakdowns.__dict__.values(),
-        }
-        request = FacebookRequest(
-            node_id=self['id'],
-            method='POST',
-            endpoint='/insights',
-            api=self._api,
-            param_checker=TypeChecker(param_types, enums),
-            target_class=AdReportRun,
-            api_type='EDGE',
-            response_parser=ObjectParser(target_class=AdReportRun),
-            include_summary=False,
-        )
-        request.add_params(params)
-        request.add_fields(fields)
-
-        if batch is not None:
-            request.add_to_batch(batch)
-            return request
-        elif pending:
-            return request
-        else:
-            self.assure_call()
-            return request.execute()
-
-    def get_keyword_stats(self, fields=None, params=None, batch=None, pending=False):
-        from facebookads.adobjects.adkeywordstats import AdKeywordStats
-        param_types = {
+        },
+        enums={
+            'action_attribution_windows_enum': 'adsinsights.AdsInsights.ActionAttributionWindows',
+            'action_breakdowns_enum': 'adsinsights.AdsInsights.ActionBreakdowns',
+            'action_report_time_enum': 'adsinsights.AdsInsights.ActionReportTime',
+            'breakdowns_enum': 'adsinsights.AdsInsights.Breakdowns',
+            'date_preset_enum': 'adsinsights.AdsInsights.DatePreset',
+            'summary_enum': 'adsinsights.AdsInsights.Summary',
+            'level_enum': 'adsinsights.AdsInsights.Level',
+            'summary_action_breakdowns_enum': 'adsinsights.AdsInsights.SummaryActionBreakdowns',
+        },
+        include_summary=False,
+    )
+
+    get_keyword_stats = ApiMethod(
+        method='GET',
+        endpoint='/keywordstats',
+        target='adkeywordstats.AdKeywordStats',
+        api_type='EDGE',
+        param_types={
             'date': 'datetime',
-        }
-        enums = {
-        }
-        request = FacebookRequest(
-            node_id=self['id'],
-            method='GET',
-            endpoint='/keywordstats',
-            api=self._api,
-            param_checker=TypeChecker(param_types, enums),
-            target_class=AdKeywordStats,
-            api_type='EDGE',
-            response_parser=ObjectParser(target_class=AdKeywordStats),
-        )
-        request.add_params(params)
-        request.add_fields(fields)
-
-        if batch is not None:
-            request.add_to_batch(batch)
-            return request
-        elif pending:
-            return request
-        else:
-            self.assure_call()
-            return request.execute()
-
-    def get_leads(self, fields=None, params=None, batch=None, pending=False):
-        from facebookads.adobjects.lead import Lead
-        param_types = {
-        }
-        enums = {
-        }
-        request = FacebookRequest(
-            node_id=self['id'],
-            method='GET',
-            endpoint='/leads',
-            api=self._api,
-            param_checker=TypeChecker(param_types, enums),
-            target_class=Lead,
-            api_type='EDGE',
-            response_parser=ObjectParser(target_class=Lead),
-        )
-        request.add_params(params)
-        request.add_fields(fields)
-
-        if batch is not None:
-            request.add_to_batch(batch)
-            return request
-        elif pending:
-            return request
-        else:
-            self.assure_call()
-            return request.execute()
-
-    def get_previews(self, fields=None, params=None, batch=None, pending=False):
-        from facebookads.adobjects.adpreview import AdPreview
-        param_types = {
+        },
+    )
+
+    get_leads = ApiMethod(
+        method='GET',
+        endpoint='/leads',
+        target='lead.Lead',
+        api_type='EDGE',
+    )
+
+    get_previews = ApiMethod(
+        method='GET',
+        endpoint='/previews',
+        target='adpreview.AdPreview',
+        api_type='EDGE',
+        param_types={
             'ad_format': 'ad_format_enum',
             'dynamic_creative_spec': 'Object',
             'height': 'unsigned int',
@@ -496,91 +307,33 @@ class Ad(
             'post': 'Object',
             'product_item_ids': 'list<string>',
             'width': 'unsigned int',
-        }
-        enums = {
-            'ad_format_enum': AdPreview.AdFormat.__dict__.values(),
-        }
-        request = FacebookRequest(
-            node_id=self['id'],
-            method='GET',
-            endpoint='/previews',
-            api=self._api,
-            param_checker=TypeChecker(param_types, enums),
-            target_class=AdPreview,
-            api_type='EDGE',
-            response_parser=ObjectParser(target_class=AdPreview),
-        )
-        request.add_params(params)
-        request.add_fields(fields)
-
-        if batch is not None:
-            request.add_to_batch(batch)
-            return request
-        elif pending:
-            return request
-        else:
-            self.assure_call()
-            return request.execute()
-
-    def get_reach_estimate(self, fields=None, params=None, batch=None, pending=False):
-        from facebookads.adobjects.reachestimate import ReachEstimate
-        param_types = {
+        },
+        enums={
+            'ad_format_enum': 'adpreview.AdPreview.AdFormat',
+        },
+    )
+
+    get_reach_estimate = ApiMethod(
+        method='GET',
+        endpoint='/reachestimate',
+        target='reachestimate.ReachEstimate',
+        api_type='EDGE',
+        param_types={
             'currency': 'string',
             'daily_budget': 'float',
             'optimize_for': 'optimize_for_enum',
-        }
-        enums = {
-            'optimize_for_enum': ReachEstimate.OptimizeFor.__dict__.values(),
-        }
-        request = FacebookRequest(
-            node_id=self['id'],
-            method='GET',
-            endpoint='/reachestimate',
-            api=self._api,
-            param_checker=TypeChecker(param_types, enums),
-            target_class=ReachEstimate,
-            api_type='EDGE',
-            response_parser=ObjectParser(target_class=ReachEstimate),
-        )
-        request.add_params(params)
-        request.add_fields(fields)
-
-        if batch is not None:
-            request.add_to_batch(batch)
-            return request
-        elif pending:
-            return request
-        else:
-            self.assure_call()
-            return request.execute()
-
-    def get_targeting_sentence_lines(self, fields=None, params=None, batch=None, pending=False):
-        from facebookads.adobjects.targetingsentenceline import TargetingSentenceLine
-        param_types = {
-        }
-        enums = {
-        }
-        request = FacebookRequest(
-            node_id=self['id'],
-            method='GET',
-            endpoint='/targetingsentencelines',
-            api=self._api,
-            param_checker=TypeChecker(param_types, enums),
-            target_class=TargetingSentenceLine,
-            api_type='EDGE',
-            response_parser=ObjectParser(target_class=TargetingSentenceLine),
-        )
-        request.add_params(params)
-        request.add_fields(fields)
-
-        if batch is not None:
-            request.add_to_batch(batch)
-            return request
-        elif pending:
-            return request
-        else:
-            self.assure_call()
-            return request.execute()
+        },
+        enums={
+            'optimize_for_enum': 'reachestimate.ReachEstimate.OptimizeFor',
+        },
+    )
+
+    get_targeting_sentence_lines = ApiMethod(
+        method='GET',
+        endpoint='/targetingsentencelines',
+        target='targetingsentenceline.TargetingSentenceLine',
+        api_type='EDGE',
+    )
 
     _field_types = {
         'account_id': 'string',
@@ -623,3 +376,36 @@ class Ad(
         field_enum_info['ExecutionOptions'] = Ad.ExecutionOptions.__dict__.values()
         field_enum_info['Operator'] = Ad.Operator.__dict__.values()
         return field_enum_info
+
+
+# Parameter types of the API calls above.
+_get_insights_params = ParamSchema(
+    param_types={
+        'action_attribution_windows': 'list<action_attribution_windows_enum>',
+        'action_breakdowns': 'list<action_breakdowns_enum>',
+        'action_report_time': 'action_report_time_enum',
+        'breakdowns': 'list<breakdowns_enum>',
+        'date_preset': 'date_preset_enum',
+        'default_summary': 'bool',
+        'fields': 'list<fields_enum>',
+        'filtering': 'list<Object>',
+        'level': 'level_enum',
+        'product_id_limit': 'int',
+        'sort': 'list<string>',
+        'summary': 'list<summary_enum>',
+        'summary_action_breakdowns': 'list<summary_action_breakdowns_enum>',
+        'time_increment': 'string',
+        'time_range': 'map',
+        'time_ranges': 'list<map>',
+    },
+    enums={
+        'action_attribution_windows_enum': 'adsinsights.AdsInsights.ActionAttributionWindows',
+        'action_breakdowns_enum': 'adsinsights.AdsInsights.ActionBreakdowns',
+        'action_report_time_enum': 'adsinsights.AdsInsights.ActionReportTime',
+        'breakdowns_enum': 'adsinsights.AdsInsights.Breakdowns',
+        'date_preset_enum': 'adsinsights.AdsInsights.DatePreset',
+        'summary_enum': 'adsinsights.AdsInsights.Summary',
+        'level_enum': 'adsinsights.AdsInsights.Level',
+        'summary_action_breakdowns_enum': 'adsinsights.AdsInsights.SummaryActionBreakdowns',
+    },
+)
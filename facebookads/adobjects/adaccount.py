@@ -21,8 +21,9 @@
 from facebookads.adobjects.abstractobject import AbstractObject
 from facebookads.adobjects.abstractcrudobject import AbstractCrudObject
 from facebookads.adobjects.objectparser import ObjectParser
+from facebookads.adobjects.apimethod import ApiMethod
 from facebookads.api import FacebookRequest
-from facebookads.typechecker import TypeChecker
+from facebookads.typechecker import ParamSchema
 from facebookads.adobjects.helpers.adaccountmixin import AdAccountMixin
 from facebookads.mixins import HasAdLabels
 
@@ -114,35 +115,19 @@ class AdAccount(
     def get_endpoint(cls):
         return 'adaccounts'
 
-    def api_get(self, fields=None, params=None, batch=None, pending=False):
-        param_types = {
-        }
-        enums = {
-        }
-        request = FacebookRequest(
-            node_id=self['id'],
-            method='GET',
-            endpoint='/',
-            api=self._api,
-            param_checker=TypeChecker(param_types, enums),
-            target_class=AdAccount,
-            api_type='NODE',
-            response_parser=ObjectParser(reuse_object=self),
-        )
-        request.add_params(params)
-        request.add_fields(fields)
-
-        if batch is not None:
-            request.add_to_batch(batch)
-            return request
-        elif pending:
-            return request
-        else:
-            self.assure_call()
-            return request.execute()
-
-    def api_update(self, fields=None, params=None, batch=None, pending=False):
-        param_types = {
+    api_get = ApiMethod(
+        method='GET',
+        endpoint='/',
+        target='adaccount.AdAccount',
+        api_type='NODE',
+    )
+
+    api_update = ApiMethod(
+        method='POST',
+        endpoint='/',
+        target='adaccount.AdAccount',
+        api_type='NODE',
+        param_types={
             'agency_client_declaration': 'map',
             'business_info': 'map',
             'end_advertiser': 'string',
@@ -153,34 +138,15 @@ class AdAccount(
             'redownload': 'bool',
             'spend_cap': 'float',
             'spend_cap_action': 'string',
-        }
-        enums = {
-        }
-        request = FacebookRequest(
-            node_id=self['id'],
-            method='POST',
-            endpoint='/',
-            api=self._api,
-            param_checker=TypeChecker(param_types, enums),
-            target_class=AdAccount,
-            api_type='NODE',
-            response_parser=ObjectParser(reuse_object=self),
-        )
-        request.add_params(params)
-        request.add_fields(fields)
-
-        if batch is not None:
-            request.add_to_batch(batch)
-            return request
-        elif pending:
-            return request
-        else:
-            self.assure_call()
-            return request.execute()
-
-    def get_activities(self, fields=None, params=None, batch=None, pending=False):
-        from facebookads.adobjects.adactivity import AdActivity
-        param_types = {
+        },
+    )
+
+    get_activities = ApiMethod(
+        method='GET',
+        endpoint='/activities',
+        target='adactivity.AdActivity',
+        api_type='EDGE',
+        param_types={
             'add_children': 'bool',
             'business_id': 'string',
             'category': 'category_enum',
@@ -189,121 +155,43 @@ class AdAccount(
             'since': 'datetime',
             'uid': 'int',
             'until': 'datetime',
-        }
-        enums = {
-            'category_enum': AdActivity.Category.__dict__.values(),
-        }
-        request = FacebookRequest(
-            node_id=self['id'],
-            method='GET',
-            endpoint='/activities',
-            api=self._api,
-            param_checker=TypeChecker(param_types, enums),
-            target_class=AdActivity,
-            api_type='EDGE',
-            response_parser=ObjectParser(target_class=AdActivity),
-        )
-        request.add_params(params)
-        request.add_fields(fields)
-
-        if batch is not None:
-            request.add_to_batch(batch)
-            return request
-        elif pending:
-            return request
-        else:
-            self.assure_call()
-            return request.execute()
-
-    def get_ad_place_page_sets(self, fields=None, params=None, batch=None, pending=False):
-        from facebookads.adobjects.adplacepageset import AdPlacePageSet
-        param_types = {
-        }
-        enums = {
-        }
-        request = FacebookRequest(
-            node_id=self['id'],
-            method='GET',
-            endpoint='/ad_place_page_sets',
-            api=self._api,
-            param_checker=TypeChecker(param_types, enums),
-            target_class=AdPlacePageSet,
-            api_type='EDGE',
-            response_parser=ObjectParser(target_class=AdPlacePageSet),
-        )
-        request.add_params(params)
-        request.add_fields(fields)
-
-        if batch is not None:
-            request.add_to_batch(batch)
-            return request
-        elif pending:
-            return request
-        else:
-            self.assure_call()
-            return request.execute()
-
-    def create_ad_place_page_set(self, fields=None, params=None, batch=None, pending=False):
-        from facebookads.adobjects.adplacepageset import AdPlacePageSet
-        param_types = {
+        },
+        enums={
+            'category_enum': 'adactivity.AdActivity.Category',
+        },
+    )
+
+    get_ad_place_page_sets = ApiMethod(
+        method='GET',
+        endpoint='/ad_place_page_sets',
+        target='adplacepageset.AdPlacePageSet',
+        api_type='EDGE',
+    )
+
+    create_ad_place_page_set = ApiMethod(
+        method='POST',
+        endpoint='/ad_place_page_sets',
+        target='adplacepageset.AdPlacePageSet',
+        api_type='EDGE',
+        param_types={
             'name': 'string',
             'parent_page': 'string',
-        }
-        enums = {
-        }
-        request = FacebookRequest(
-            node_id=self['id'],
-            method='POST',
-            endpoint='/ad_place_page_sets',
-            api=self._api,
-            param_checker=TypeChecker(param_types, enums),
-            target_class=AdPlacePageSet,
-            api_type='EDGE',
-            response_parser=ObjectParser(target_class=AdPlacePageSet),
-        )
-        request.add_params(params)
-        request.add_fields(fields)
-
-        if batch is not None:
-            request.add_to_batch(batch)
-            return request
-        elif pending:
-            return request
-        else:
-            self.assure_call()
-            return request.execute()
-
-    def get_ad_creatives(self, fields=None, params=None, batch=None, pending=False):
-        from facebookads.adobjects.adcreative import AdCreative
-        param_types = {
-        }
-        enums = {
-        }
-        request = FacebookRequest(
-            node_id=self['id'],
-            method='GET',
-            endpoint='/adcreatives',
-            api=self._api,
-            param_checker=TypeChecker(param_types, enums),
-            target_class=AdCreative,
-            api_type='EDGE',
-            response_parser=ObjectParser(target_class=AdCreative),
-        )
-        request.add_params(params)
-        request.add_fields(fields)
-
-        if batch is not None:
-            request.add_to_batch(batch)
-            return request
-        elif pending:
-            return request
-        else:
-            self.assure_call()
-            return request.execute()
-
-    def create_ad_creative(self, fields=None, params=None, batch=None, pending=False):
-        from facebookads.adobjects.adcreative import AdCreative
-        param_types = {
+        },
+    )
+
+    get_ad_creatives = ApiMethod(
+        method='GET',
+        endpoint='/adcreatives',
+        target='adcreative.AdCreative',
+        api_type='EDGE',
+    )
+
+    create_ad_creative = ApiMethod(
+        method='POST',
+        endpoint='/adcreatives',
+        target='adcreative.AdCreative',
+        api_type='EDGE',
+        param_types={
             'action_spec': 'list<unsigned int>',
             'actor_id': 'unsigned int',
             'actor_image_hash': 'string',
@@ -338,1908 +226,64 @@ class AdAccount(
             'title': 'string',
             'url_tags': 'string',
             'video_id': 'unsigned int',
-        }
-        enums = {
-            'applink_treatment_enum': AdCreative.ApplinkTreatment.__dict__.values(),
-            'dynamic_ad_voice_enum': AdCreative.DynamicAdVoice.__dict__.values(),
-        }
-        request = FacebookRequest(
-            node_id=self['id'],
-            method='POST',
-            endpoint='/adcreatives',
-            api=self._api,
-            param_checker=TypeChecker(param_types, enums),
-            target_class=AdCreative,
-            api_type='EDGE',
-            response_parser=ObjectParser(target_class=AdCreative),
-        )
-        request.add_params(params)
-        request.add_fields(fields)
-
-        if batch is not None:
-            request.add_to_batch(batch)
-            return request
-        elif pending:
-            return request
-        else:
-            self.assure_call()
-            return request.execute()
-
-    def get_ad_creatives_by_labels(self, fields=None, params=None, batch=None, pending=False):
-        from facebookads.adobjects.adcreative import AdCreative
-        param_types = {
+        },
+        enums={
+            'applink_treatment_enum': 'adcreative.AdCreative.ApplinkTreatment',
+            'dynamic_ad_voice_enum': 'adcreative.AdCreative.DynamicAdVoice',
+        },
+    )
+
+    get_ad_creatives_by_labels = ApiMethod(
+        method='GET',
+        endpoint='/adcreativesbylabels',
+        target='adcreative.AdCreative',
+        api_type='EDGE',
+        param_types={
             'ad_label_ids': 'list<string>',
             'operator': 'operator_enum',
-        }
-        enums = {
-            'operator_enum': AdCreative.Operator.__dict__.values(),
-        }
-        request = FacebookRequest(
-            node_id=self['id'],
-            method='GET',
-            endpoint='/adcreativesbylabels',
-            api=self._api,
-            param_checker=TypeChecker(param_types, enums),
-            target_class=AdCreative,
-            api_type='EDGE',
-            response_parser=ObjectParser(target_class=AdCreative),
-        )
-        request.add_params(params)
-        request.add_fields(fields)
-
-        if batch is not None:
-            request.add_to_batch(batch)
-            return request
-        elif pending:
-            return request
-        else:
-            self.assure_call()
-            return request.execute()
-
-    def delete_ad_images(self, fields=None, params=None, batch=None, pending=False):
-        param_types = {
+        },
+        enums={
+            'operator_enum': 'adcreative.AdCreative.Operator',
+        },
+    )
+
+    delete_ad_images = ApiMethod(
+        method='DELETE',
+        endpoint='/adimages',
+        target='abstractcrudobject.AbstractCrudObject',
+        api_type='EDGE',
+        param_types={
             'hash': 'string',
-        }
-        enums = {
-        }
-        request = FacebookRequest(
-            node_id=self['id'],
-            method='DELETE',
-            endpoint='/adimages',
-            api=self._api,
-            param_checker=TypeChecker(param_types, enums),
-            target_class=AbstractCrudObject,
-            api_type='EDGE',
-            response_parser=ObjectParser(target_class=AbstractCrudObject),
-        )
-        request.add_params(params)
-        request.add_fields(fields)
-
-        if batch is not None:
-            request.add_to_batch(batch)
-            return request
-        elif pending:
-            return request
-        else:
-            self.assure_call()
-            return request.execute()
-
-    def get_ad_images(self, fields=None, params=None, batch=None, pending=False):
-        from facebookads.adobjects.adimage import AdImage
-        param_types = {
+        },
+    )
+
+    get_ad_images = ApiMethod(
+        method='GET',
+        endpoint='/adimages',
+        target='adimage.AdImage',
+        api_type='EDGE',
+        param_types={
             'biz_tag_id': 'unsigned int',
             'business_id': 'string',
             'hashes': 'list<string>',
-            'minheight': 'unsigned int',
-            'minwidth': 'unsigned int',
-            'name': 'string',
-        }
-        enums = {
-        }
-        request = FacebookRequest(
-            node_id=self['id'],
-            method='GET',
-            endpoint='/adimages',
-            api=self._api,
-            param_checker=TypeChecker(param_types, enums),
-            target_class=AdImage,
-            api_type='EDGE',
-            response_parser=ObjectParser(target_class=AdImage),
-        )
-        request.add_params(params)
-        request.add_fields(fields)
-
-        if batch is not None:
-            request.add_to_batch(batch)
-            return request
-        elif pending:
-            return request
-        else:
-            self.assure_call()
-            return request.execute()
-
-    def create_ad_image(self, fields=None, params=None, batch=None, pending=False):
-        from facebookads.adobjects.adimage import AdImage
-        param_types = {
-            'bytes': 'string',
-            'copy_from': 'Object',
-            'zipbytes': 'string',
-        }
-        enums = {
-        }
-        request = FacebookRequest(
-            node_id=self['id'],
-            method='POST',
-            endpoint='/adimages',
-            api=self._api,
-            param_checker=TypeChecker(param_types, enums),
-            target_class=AdImage,
-            api_type='EDGE',
-            allow_file_upload=True,
-            response_parser=ObjectParser(target_class=AdImage),
-        )
-        request.add_params(params)
-        request.add_fields(fields)
-
-        if batch is not None:
-            request.add_to_batch(batch)
-            return request
-        elif pending:
-            return request
-        else:
-            self.assure_call()
-            return request.execute()
-
-    def get_ad_labels(self, fields=None, params=None, batch=None, pending=False):
-        from facebookads.adobjects.adlabel import AdLabel
-        param_types = {
-        }
-        enums = {
-        }
-        request = FacebookRequest(
-            node_id=self['id'],
-            method='GET',
-            endpoint='/adlabels',
-            api=self._api,
-            param_checker=TypeChecker(param_types, enums),
-            target_class=AdLabel,
-            api_type='EDGE',
-            response_parser=ObjectParser(target_class=AdLabel),
-        )
-        request.add_params(params)
-        request.add_fields(fields)
-
-        if batch is not None:
-            request.add_to_batch(batch)
-            return request
-        elif pending:
-            return request
-        else:
-            self.assure_call()
-            return request.execute()
-
-    def create_ad_label(self, fields=None, params=None, batch=None, pending=False):
-        from facebookads.adobjects.adlabel import AdLabel
-        param_types = {
-            'name': 'string',
-        }
-        enums = {
-        }
-        request = FacebookRequest(
-            node_id=self['id'],
-            method='POST',
-            endpoint='/adlabels',
-            api=self._api,
-            param_checker=TypeChecker(param_types, enums),
-            target_class=AdLabel,
-            api_type='EDGE',
-            response_parser=ObjectParser(target_class=AdLabel),
-        )
-        request.add_params(params)
-        request.add_fields(fields)
-
-        if batch is not None:
-            request.add_to_batch(batch)
-            return request
-        elif pending:
-            return request
-        else:
-            self.assure_call()
-            return request.execute()
-
-    def get_ad_report_runs(self, fields=None, params=None, batch=None, pending=False):
-        from facebookads.adobjects.adreportrun import AdReportRun
-        param_types = {
-        }
-        enums = {
-        }
-        request = FacebookRequest(
-            node_id=self['id'],
-            method='GET',
-            endpoint='/adreportruns',
-            api=self._api,
-            param_checker=TypeChecker(param_types, enums),
-            target_class=AdReportRun,
-            api_type='EDGE',
-            response_parser=ObjectParser(target_class=AdReportRun),
-        )
-        request.add_params(params)
-        request.add_fields(fields)
-
-        if batch is not None:
-            request.add_to_batch(batch)
-            return request
-        elif pending:
-            return request
-        else:
-            self.assure_call()
-            return request.execute()
-
-    def get_ad_report_schedules(self, fields=None, params=None, batch=None, pending=False):
-        param_types = {
-        }
-        enums = {
-        }
-        request = FacebookRequest(
-            node_id=self['id'],
-            method='GET',
-            endpoint='/adreportschedules',
-            api=self._api,
-            param_checker=TypeChecker(param_types, enums),
-            target_class=AbstractCrudObject,
-            api_type='EDGE',
-            response_parser=ObjectParser(target_class=AbstractCrudObject),
-        )
-        request.add_params(params)
-        request.add_fields(fields)
-
-        if batch is not None:
-            request.add_to_batch(batch)
-            return request
-        elif pending:
-            return request
-        else:
-            self.assure_call()
-            return request.execute()
-
-    def get_ads(self, fields=None, params=None, batch=None, pending=False):
-        from facebookads.adobjects.ad import Ad
-        param_types = {
-            'ad_draft_id': 'string',
-            'date_preset': 'date_preset_enum',
-            'effective_status': 'list<string>',
-            'include_deleted': 'bool',
-            'time_range': 'map',
-            'updated_since': 'int',
-        }
-        enums = {
-            'date_preset_enum': Ad.DatePreset.__dict__.values(),
-        }
-        request = FacebookRequest(
-            node_id=self['id'],
-            method='GET',
-            endpoint='/ads',
-            api=self._api,
-            param_checker=TypeChecker(param_types, enums),
-            target_class=Ad,
-            api_type='EDGE',
-            response_parser=ObjectParser(target_class=Ad),
-        )
-        request.add_params(params)
-        request.add_fields(fields)
-
-        if batch is not None:
-            request.add_to_batch(batch)
-            return request
-        elif pending:
-            return request
-        else:
-            self.assure_call()
-            return request.execute()
-
-    def create_ad(self, fields=None, params=None, batch=None, pending=False):
-        from facebookads.adobjects.ad import Ad
-        param_types = {
-            'adlabels': 'list<Object>',
-            'adset_id': 'unsigned int',
-            'bid_amount': 'int',
-            'creative': 'AdCreative',
-            'date_format': 'string',
-            'display_sequence': 'unsigned int',
-            'execution_options': 'list<execution_options_enum>',
-            'name': 'string',
-            'redownload': 'bool',
-            'status': 'status_enum',
-            'tracking_specs': 'Object',
-        }
-        enums = {
-            'execution_options_enum': Ad.ExecutionOptions.__dict__.values(),
-            'status_enum': Ad.Status.__dict__.values(),
-        }
-        request = FacebookRequest(
-            node_id=self['id'],
-            method='POST',
-            endpoint='/ads',
-            api=self._api,
-            param_checker=TypeChecker(param_types, enums),
-            target_class=Ad,
-            api_type='EDGE',
-            allow_file_upload=True,
-            response_parser=ObjectParser(target_class=Ad),
-        )
-        request.add_params(params)
-        request.add_fields(fields)
-
-        if batch is not None:
-            request.add_to_batch(batch)
-            return request
-        elif pending:
-            return request
-        else:
-            self.assure_call()
-            return request.execute()
-
-    def get_ads_by_labels(self, fields=None, params=None, batch=None, pending=False):
-        from facebookads.adobjects.ad import Ad
-        param_types = {
-            'ad_label_ids': 'list<string>',
-            'operator': 'operator_enum',
-        }
-        enums = {
-            'operator_enum': Ad.Operator.__dict__.values(),
-        }
-        request = FacebookRequest(
-            node_id=self['id'],
-            method='GET',
-            endpoint='/adsbylabels',
-            api=self._api,
-            param_checker=TypeChecker(param_types, enums),
-            target_class=Ad,
-            api_type='EDGE',
-            response_parser=ObjectParser(target_class=Ad),
-        )
-        request.add_params(params)
-        request.add_fields(fields)
-
-        if batch is not None:
-            request.add_to_batch(batch)
-            return request
-        elif pending:
-            return request
-        else:
-            self.assure_call()
-            return request.execute()
-
-    def get_ad_sets(self, fields=None, params=None, batch=None, pending=False):
-        from facebookads.adobjects.adset import AdSet
-        param_types = {
-            'ad_draft_id': 'string',
-            'date_preset': 'date_preset_enum',
-            'effective_status': 'list<effective_status_enum>',
-            'include_deleted': 'bool',
-            'is_completed': 'bool',
-            'time_range': 'map',
-        }
-        enums = {
-            'date_preset_enum': AdSet.DatePreset.__dict__.values(),
-            'effective_status_enum': AdSet.EffectiveStatus.__dict__.values(),
-        }
-        request = FacebookRequest(
-            node_id=self['id'],
-            method='GET',
-            endpoint='/adsets',
-            api=self._api,
-            param_checker=TypeChecker(param_types, enums),
-            target_class=AdSet,
-            api_type='EDGE',
-            response_parser=ObjectParser(target_class=AdSet),
-        )
-        request.add_params(params)
-        request.add_fields(fields)
-
-        if batch is not None:
-            request.add_to_batch(batch)
-            return request
-        elif pending:
-            return request
-        else:
-            self.assure_call()
-            return request.execute()
-
-    def create_ad_set(self, fields=None, params=None, batch=None, pending=False):
-        from facebookads.adobjects.adset import AdSet
-        param_types = {
-            'adlabels': 'list<Object>',
-            'adset_schedule': 'list<Object>',
-            'attribution_window_days': 'unsigned int',
-            'bid_amount': 'int',
-            'billing_event': 'billing_event_enum',
-            'campaign_id': 'string',
-            'creative_sequence': 'list<string>',
-            'daily_budget': 'unsigned int',
-            'daily_imps': 'unsigned int',
-            'end_time': 'datetime',
-            'execution_options': 'list<execution_options_enum>',
-            'frequency_control_specs': 'list<Object>',
-            'is_autobid': 'bool',
-            'lifetime_budget': 'unsigned int',
-            'lifetime_imps': 'unsigned int',
-            'name': 'string',
-            'optimization_goal': 'optimization_goal_enum',
-            'pacing_type': 'list<string>',
-            'promoted_object': 'Object',
-            'redownload': 'bool',
-            'rf_prediction_id': 'string',
-            'rtb_flag': 'bool',
-            'start_time': 'datetime',
-            'status': 'status_enum',
-            'targeting': 'Targeting',
-            'time_based_ad_rotation_id_blocks': 'list<list<unsigned int>>',
-            'time_based_ad_rotation_intervals': 'list<unsigned int>',
-        }
-        enums = {
-            'billing_event_enum': AdSet.BillingEvent.__dict__.values(),
-            'execution_options_enum': AdSet.ExecutionOptions.__dict__.values(),
-            'optimization_goal_enum': AdSet.OptimizationGoal.__dict__.values(),
-            'status_enum': AdSet.Status.__dict__.values(),
-        }
-        request = FacebookRequest(
-            node_id=self['id'],
-            method='POST',
-            endpoint='/adsets',
-            api=self._api,
-            param_checker=TypeChecker(param_types, enums),
-            target_class=AdSet,
-            api_type='EDGE',
-            response_parser=ObjectParser(target_class=AdSet),
-        )
-        request.add_params(params)
-        request.add_fields(fields)
-
-        if batch is not None:
-            request.add_to_batch(batch)
-            return request
-        elif pending:
-            return request
-        else:
-            self.assure_call()
-            return request.execute()
-
-    def get_ad_sets_by_labels(self, fields=None, params=None, batch=None, pending=False):
-        from facebookads.adobjects.adset import AdSet
-        param_types = {
-            'ad_label_ids': 'list<string>',
-            'operator': 'operator_enum',
-        }
-        enums = {
-            'operator_enum': AdSet.Operator.__dict__.values(),
-        }
-        request = FacebookRequest(
-            node_id=self['id'],
-            method='GET',
-            endpoint='/adsetsbylabels',
-            api=self._api,
-            param_checker=TypeChecker(param_types, enums),
-            target_class=AdSet,
-            api_type='EDGE',
-            response_parser=ObjectParser(target_class=AdSet),
-        )
-        request.add_params(params)
-        request.add_fields(fields)
-
-        if batch is not None:
-            request.add_to_batch(batch)
-            return request
-        elif pending:
-            return request
-        else:
-            self.assure_call()
-            return request.execute()
-
-    def get_ads_pixels(self, fields=None, params=None, batch=None, pending=False):
-        from facebookads.adobjects.adspixel import AdsPixel
-        param_types = {
-        }
-        enums = {
-        }
-        request = FacebookRequest(
-            node_id=self['id'],
-            method='GET',
-            endpoint='/adspixels',
-            api=self._api,
-            param_checker=TypeChecker(param_types, enums),
-            target_class=AdsPixel,
-            api_type='EDGE',
-            response_parser=ObjectParser(target_class=AdsPixel),
-        )
-        request.add_params(params)
-        request.add_fields(fields)
-
-        if batch is not None:
-            request.add_to_batch(batch)
-            return request
-        elif pending:
-            return request
-        else:
-            self.assure_call()
-            return request.execute()
-
-    def create_ads_pixel(self, fields=None, params=None, batch=None, pending=False):
-        from facebookads.adobjects.adspixel import AdsPixel
-        param_types = {
-            'name': 'string',
-        }
-        enums = {
-        }
-        request = FacebookRequest(
-            node_id=self['id'],
-            method='POST',
-            endpoint='/adspixels',
-            api=self._api,
-            param_checker=TypeChecker(param_types, enums),
-            target_class=AdsPixel,
-            api_type='EDGE',
-            response_parser=ObjectParser(target_class=AdsPixel),
-        )
-        request.add_params(params)
-        request.add_fields(fields)
-
-        if batch is not None:
-            request.add_to_batch(batch)
-            return request
-        elif pending:
-            return request
-        else:
-            self.assure_call()
-            return request.execute()
-
-    def get_advertisable_applications(self, fields=None, params=None, batch=None, pending=False):
-        param_types = {
-            'app_id': 'string',
-            'business_id': 'string',
-        }
-        enums = {
-        }
-        request = FacebookRequest(
-            node_id=self['id'],
-            method='GET',
-            endpoint='/advertisable_applications',
-            api=self._api,
-            param_checker=TypeChecker(param_types, enums),
-            target_class=AbstractCrudObject,
-            api_type='EDGE',
-            response_parser=ObjectParser(target_class=AbstractCrudObject),
-        )
-        request.add_params(params)
-        request.add_fields(fields)
-
-        if batch is not None:
-            request.add_to_batch(batch)
-            return request
-        elif pending:
-            return request
-        else:
-            self.assure_call()
-            return request.execute()
-
-    def get_ad_videos(self, fields=None, params=None, batch=None, pending=False):
-        param_types = {
-        }
-        enums = {
-        }
-        request = FacebookRequest(
-            node_id=self['id'],
-            method='GET',
-            endpoint='/advideos',
-            api=self._api,
-            param_checker=TypeChecker(param_types, enums),
-            target_class=AbstractCrudObject,
-            api_type='EDGE',
-            response_parser=ObjectParser(target_class=AbstractCrudObject),
-        )
-        request.add_params(params)
-        request.add_fields(fields)
-
-        if batch is not None:
-            request.add_to_batch(batch)
-            return request
-        elif pending:
-            return request
-        else:
-            self.assure_call()
-            return request.execute()
-
-    def create_ad_video(self, fields=None, params=None, batch=None, pending=False):
-        from facebookads.adobjects.advideo import AdVideo
-        param_types = {
-            'composer_session_id': 'string',
-            'description': 'string',
-            'file_size': 'unsigned int',
-            'file_url': 'string',
-            'is_explicit_share': 'bool',
-            'manual_privacy': 'bool',
-            'name': 'string',
-            'og_action_type_id': 'string',
-            'og_icon_id': 'string',
-            'og_object_id': 'string',
-            'og_phrase': 'string',
-            'og_suggestion_mechanism': 'string',
-            'overwrite_id': 'string',
-            'referenced_sticker_id': 'string',
-            'slideshow_spec': 'map',
-            'start_offset': 'unsigned int',
-            'time_since_original_post': 'unsigned int',
-            'title': 'string',
-            'unpublished_content_type': 'unpublished_content_type_enum',
-            'upload_phase': 'upload_phase_enum',
-            'upload_session_id': 'string',
-            'video_file_chunk': 'string',
-        }
-        enums = {
-            'unpublished_content_type_enum': [
-                'SCHEDULED',
-                'DRAFT',
-                'ADS_POST',
-            ],
-            'upload_phase_enum': [
-                'start',
-                'transfer',
-                'finish',
-                'cancel',
-            ],
-        }
-        request = FacebookRequest(
-            node_id=self['id'],
-            method='POST',
-            endpoint='/advideos',
-            api=self._api,
-            param_checker=TypeChecker(param_types, enums),
-            target_class=AbstractCrudObject,
-            api_type='EDGE',
-            allow_file_upload=True,
-            response_parser=ObjectParser(target_class=AbstractCrudObject),
-        )
-        request.add_params(params)
-        request.add_fields(fields)
-
-        if batch is not None:
-            request.add_to_batch(batch)
-            return request
-        elif pending:
-            return request
-        else:
-            self.assure_call()
-            return request.execute()
-
-    def get_applications(self, fields=None, params=None, batch=None, pending=False):
-        param_types = {
-        }
-        enums = {
-        }
-        request = FacebookRequest(
-            node_id=self['id'],
-            method='GET',
-            endpoint='/applications',
-            api=self._api,
-            param_checker=TypeChecker(param_types, enums),
-            target_class=AbstractCrudObject,
-            api_type='EDGE',
-            response_parser=ObjectParser(target_class=AbstractCrudObject),
-        )
-        request.add_params(params)
-        request.add_fields(fields)
-
-        if batch is not None:
-            request.add_to_batch(batch)
-            return request
-        elif pending:
-            return request
-        else:
-            self.assure_call()
-            return request.execute()
-
-    def get_async_ad_request_sets(self, fields=None, params=None, batch=None, pending=False):
-        from facebookads.adobjects.adasyncrequestset import AdAsyncRequestSet
-        param_types = {
-            'is_completed': 'bool',
-        }
-        enums = {
-        }
-        request = FacebookRequest(
-            node_id=self['id'],
-            method='GET',
-            endpoint='/asyncadrequestsets',
-            api=self._api,
-            param_checker=TypeChecker(param_types, enums),
-            target_class=AdAsyncRequestSet,
-            api_type='EDGE',
-            response_parser=ObjectParser(target_class=AdAsyncRequestSet),
-        )
-        request.add_params(params)
-        request.add_fields(fields)
-
-        if batch is not None:
-            request.add_to_batch(batch)
-            return request
-        elif pending:
-            return request
-        else:
-            self.assure_call()
-            return request.execute()
-
-    def create_async_ad_request_set(self, fields=None, params=None, batch=None, pending=False):
-        from facebookads.adobjects.adasyncrequestset import AdAsyncRequestSet
-        param_types = {
-            'ad_specs': 'list<map>',
-            'name': 'string',
-            'notification_mode': 'notification_mode_enum',
-            'notification_uri': 'string',
-        }
-        enums = {
-            'notification_mode_enum': [
-                'OFF',
-                'ON_COMPLETE',
-            ],
-        }
-        request = FacebookRequest(
-            node_id=self['id'],
-            method='POST',
-            endpoint='/asyncadrequestsets',
-            api=self._api,
-            param_checker=TypeChecker(param_types, enums),
-            target_class=AdAsyncRequestSet,
-            api_type='EDGE',
-            response_parser=ObjectParser(target_class=AdAsyncRequestSet),
-        )
-        request.add_params(params)
-        request.add_fields(fields)
-
-        if batch is not None:
-            request.add_to_batch(batch)
-            return request
-        elif pending:
-            return request
-        else:
-            self.assure_call()
-            return request.execute()
-
-    def get_broad_targeting_categories(self, fields=None, params=None, batch=None, pending=False):
-        from facebookads.adobjects.broadtargetingcategories import BroadTargetingCategories
-        param_types = {
-            'custom_categories_only': 'bool',
-        }
-        enums = {
-        }
-        request = FacebookRequest(
-            node_id=self['id'],
-            method='GET',
-            endpoint='/broadtargetingcategories',
-            api=self._api,
-            param_checker=TypeChecker(param_types, enums),
-            target_class=BroadTargetingCategories,
-            api_type='EDGE',
-            response_parser=ObjectParser(target_class=BroadTargetingCategories),
-        )
-        request.add_params(params)
-        request.add_fields(fields)
-
-        if batch is not None:
-            request.add_to_batch(batch)
-            return request
-        elif pending:
-            return request
-        else:
-            self.assure_call()
-            return request.execute()
-
-    def delete_campaigns(self, fields=None, params=None, batch=None, pending=False):
-        from facebookads.adobjects.campaign import Campaign
-        param_types = {
-            'before_date': 'datetime',
-            'delete_strategy': 'delete_strategy_enum',
-            'object_count': 'int',
-        }
-        enums = {
-            'delete_strategy_enum': Campaign.DeleteStrategy.__dict__.values(),
-        }
-        request = FacebookRequest(
-            node_id=self['id'],
-            method='DELETE',
-            endpoint='/campaigns',
-            api=self._api,
-            param_checker=TypeChecker(param_types, enums),
-            target_class=AbstractCrudObject,
-            api_type='EDGE',
-            response_parser=ObjectParser(target_class=AbstractCrudObject),
-        )
-        request.add_params(params)
-        request.add_fields(fields)
-
-        if batch is not None:
-            request.add_to_batch(batch)
-            return request
-        elif pending:
-            return request
-        else:
-            self.assure_call()
-            return request.execute()
-
-    def get_campaigns(self, fields=None, params=None, batch=None, pending=False):
-        from facebookads.adobjects.campaign import Campaign
-        param_types = {
-            'ad_draft_id': 'string',
-            'date_preset': 'date_preset_enum',
-            'effective_status': 'list<effective_status_enum>',
-            'is_completed': 'bool',
-            'time_range': 'map',
-        }
-        enums = {
-            'date_preset_enum': Campaign.DatePreset.__dict__.values(),
-            'effective_status_enum': Campaign.EffectiveStatus.__dict__.values(),
-        }
-        request = FacebookRequest(
-            node_id=self['id'],
-            method='GET',
-            endpoint='/campaigns',
-            api=self._api,
-            param_checker=TypeChecker(param_types, enums),
-            target_class=Campaign,
-            api_type='EDGE',
-            response_parser=ObjectParser(target_class=Campaign),
-        )
-        request.add_params(params)
-        request.add_fields(fields)
-
-        if batch is not None:
-            request.add_to_batch(batch)
-            return request
-        elif pending:
-            return request
-        else:
-            self.assure_call()
-            return request.execute()
-
-    def create_campaign(self, fields=None, params=None, batch=None, pending=False):
-        from facebookads.adobjects.campaign import Campaign
-        param_types = {
-            'adlabels': 'list<Object>',
-            'buying_type': 'string',
-            'execution_options': 'list<execution_options_enum>',
-            'name': 'string',
-            'objective': 'objective_enum',
-            'promoted_object': 'Object',
-            'spend_cap': 'unsigned int',
-            'status': 'status_enum',
-        }
-        enums = {
-            'execution_options_enum': Campaign.ExecutionOptions.__dict__.values(),
-            'objective_enum': Campaign.Objective.__dict__.values(),
-            'status_enum': Campaign.Status.__dict__.values(),
-        }
-        request = FacebookRequest(
-            node_id=self['id'],
-            method='POST',
-            endpoint='/campaigns',
-            api=self._api,
-            param_checker=TypeChecker(param_types, enums),
-            target_class=Campaign,
-            api_type='EDGE',
-            response_parser=ObjectParser(target_class=Campaign),
-        )
-        request.add_params(params)
-        request.add_fields(fields)
-
-        if batch is not None:
-            request.add_to_batch(batch)
-            return request
-        elif pending:
-            return request
-        else:
-            self.assure_call()
-            return request.execute()
-
-    def get_campaigns_by_labels(self, fields=None, params=None, batch=None, pending=False):
-        from facebookads.adobjects.campaign import Campaign
-        param_types = {
-            'ad_label_ids': 'list<string>',
-            'operator': 'operator_enum',
-        }
-        enums = {
-            'operator_enum': Campaign.Operator.__dict__.values(),
-        }
-        request = FacebookRequest(
-            node_id=self['id'],
-            method='GET',
-            endpoint='/campaignsbylabels',
-            api=self._api,
-            param_checker=TypeChecker(param_types, enums),
-            target_class=Campaign,
-            api_type='EDGE',
-            response_parser=ObjectParser(target_class=Campaign),
-        )
-        request.add_params(params)
-        request.add_fields(fields)
-
-        if batch is not None:
-            request.add_to_batch(batch)
-            return request
-        elif pending:
-            return request
-        else:
-            self.assure_call()
-            return request.execute()
-
-    def get_custom_audiences(self, fields=None, params=None, batch=None, pending=False):
-        from facebookads.adobjects.customaudience import CustomAudience
-        param_types = {
-            'business_id': 'string',
-            'fields': 'list<fields_enum>',
-            'filtering': 'list<Object>',
-            'pixel_id': 'string',
-        }
-        enums = {
-            'fields_enum': CustomAudience.Fields.__dict__.values(),
-        }
-        request = FacebookRequest(
-            node_id=self['id'],
-            method='GET',
-            endpoint='/customaudiences',
-            api=self._api,
-            param_checker=TypeChecker(param_types, enums),
-            target_class=CustomAudience,
-            api_type='EDGE',
-            response_parser=ObjectParser(target_class=CustomAudience),
-        )
-        request.add_params(params)
-        request.add_fields(fields)
-
-        if batch is not None:
-            request.add_to_batch(batch)
-            return request
-        elif pending:
-            return request
-        else:
-            self.assure_call()
-            return request.execute()
-
-    def create_custom_audience(self, fields=None, params=None, batch=None, pending=False):
-        from facebookads.adobjects.customaudience import CustomAudience
-        param_types = {
-            'claim_objective': 'claim_objective_enum',
-            'content_type': 'content_type_enum',
-            'dataset_id': 'string',
-            'description': 'string',
-            'event_source_group': 'string',
-            'list_of_accounts': 'list<unsigned int>',
-            'lookalike_spec': 'string',
-            'name': 'string',
-            'opt_out_link': 'string',
-            'origin_audience_id': 'string',
-            'pixel_id': 'unsigned int',
-            'prefill': 'bool',
-            'product_set_id': 'string',
-            'retention_days': 'unsigned int',
-            'rule': 'string',
-            'subtype': 'subtype_enum',
-        }
-        enums = {
-            'claim_objective_enum': CustomAudience.ClaimObjective.__dict__.values(),
-            'content_type_enum': CustomAudience.ContentType.__dict__.values(),
-            'subtype_enum': CustomAudience.Subtype.__dict__.values(),
-        }
-        request = FacebookRequest(
-            node_id=self['id'],
-            method='POST',
-            endpoint='/customaudiences',
-            api=self._api,
-            param_checker=TypeChecker(param_types, enums),
-            target_class=CustomAudience,
-            api_type='EDGE',
-            response_parser=ObjectParser(target_class=CustomAudience),
-        )
-        request.add_params(params)
-        request.add_fields(fields)
-
-        if batch is not None:
-            request.add_to_batch(batch)
-            return request
-        elif pending:
-            return request
-        else:
-            self.assure_call()
-            return request.execute()
-
-    def get_custom_audiences_tos(self, fields=None, params=None, batch=None, pending=False):
-        from facebookads.adobjects.customaudiencestos import CustomAudiencesTOS
-        param_types = {
-        }
-        enums = {
-        }
-        request = FacebookRequest(
-            node_id=self['id'],
-            method='GET',
-            endpoint='/customaudiencestos',
-            api=self._api,
-            param_checker=TypeChecker(param_types, enums),
-            target_class=CustomAudiencesTOS,
-            api_type='EDGE',
-            response_parser=ObjectParser(target_class=CustomAudiencesTOS),
-        )
-        request.add_params(params)
-        request.add_fields(fields)
-
-        if batch is not None:
-            request.add_to_batch(batch)
-            return request
-        elif pending:
-            return request
-        else:
-            self.assure_call()
-            return request.execute()
-
-    def create_custom_conversion(self, fields=None, params=None, batch=None, pending=False):
-        from facebookads.adobjects.customconversion import CustomConversion
-        param_types = {
-            'custom_event_type': 'custom_event_type_enum',
-            'default_conversion_value': 'float',
-            'description': 'string',
-            'name': 'string',
-            'pixel_id': 'string',
-            'pixel_rule': 'string',
-        }
-        enums = {
-            'custom_event_type_enum': CustomConversion.CustomEventType.__dict__.values(),
-        }
-        request = FacebookRequest(
-            node_id=self['id'],
-            method='POST',
-            endpoint='/customconversions',
-            api=self._api,
-            param_checker=TypeChecker(param_types, enums),
-            target_class=CustomConversion,
-            api_type='EDGE',
-            response_parser=ObjectParser(target_class=CustomConversion),
-        )
-        request.add_params(params)
-        request.add_fields(fields)
-
-        if batch is not None:
-            request.add_to_batch(batch)
-            return request
-        elif pending:
-            return request
-        else:
-            self.assure_call()
-            return request.execute()
-
-    def get_generate_previews(self, fields=None, params=None, batch=None, pending=False):
-        from facebookads.adobjects.adpreview import AdPreview
-        param_types = {
-            'ad_format': 'ad_format_enum',
-            'creative': 'AdCreative',
-            'dynamic_creative_spec': 'Object',
-            'height': 'unsigned int',
-            'interactive': 'bool',
-            'locale': 'string',
-            'post': 'Object',
-            'product_item_ids': 'list<string>',
-            'width': 'unsigned int',
-        }
-        enums = {
-            'ad_format_enum': AdPreview.AdFormat.__dict__.values(),
-        }
-        request = FacebookRequest(
-            node_id=self['id'],
-            method='GET',
-            endpoint='/generatepreviews',
-            api=self._api,
-            param_checker=TypeChecker(param_types, enums),
-            target_class=AdPreview,
-            api_type='EDGE',
-            response_parser=ObjectParser(target_class=AdPreview),
-        )
-        request.add_params(params)
-        request.add_fields(fields)
-
-        if batch is not None:
-            request.add_to_batch(batch)
-            return request
-        elif pending:
-            return request
-        else:
-            self.assure_call()
-            return request.execute()
-
-    def get_insights(self, fields=None, params=None, async=False, batch=None, pending=False):
-        from facebookads.adobjects.adsinsights import AdsInsights
-        if async:
-          return self.get_insights_async(fields, params, batch, pending)
-        param_types = {
-            'action_attribution_windows': 'list<action_attribution_windows_enum>',
-            'action_breakdowns': 'list<action_breakdowns_enum>',
-            'action_report_time': 'action_report_time_enum',
-            'breakdowns': 'list<breakdowns_enum>',
-            'date_preset': 'date_preset_enum',
-            'default_summary': 'bool',
-            'fields': 'list<fields_enum>',
-            'filtering': 'list<Object>',
-            'level': 'level_enum',
-            'product_id_limit': 'int',
-            'sort': 'list<string>',
-            'summary': 'list<summary_enum>',
-            'summary_action_breakdowns': 'list<summary_action_breakdowns_enum>',
-            'time_increment': 'string',
-            'time_range': 'map',
-            'time_ranges': 'list<map>',
-        }
-        enums = {
-            'action_attribution_windows_enum': AdsInsights.ActionAttributionWindows.__dict__.values(),
-            'action_breakdowns_enum': AdsInsights.ActionBreakdowns.__dict__.values(),
-            'action_report_time_enum': AdsInsights.ActionReportTime.__dict__.values(),
-            'breakdowns_enum': AdsInsights.Breakdowns.__dict__.values(),
-            'date_preset_enum': AdsInsights.DatePreset.__dict__.values(),
-            'summary_enum': AdsInsights.Summary.__dict__.values(),
-            'level_enum': AdsInsights.Level.__dict__.values(),
-            'summary_action_breakdowns_enum': AdsInsights.SummaryActionBreakdowns.__dict__.values(),
-        }
-        request = FacebookRequest(
-            node_id=self['id'],
-            method='GET',
-            endpoint='/insights',
-            api=self._api,
-            param_checker=TypeChecker(param_types, enums),
-            target_class=AdsInsights,
-            api_type='EDGE',
-            response_parser=ObjectParser(target_class=AdsInsights),
-            include_summary=False,
-        )
-        request.add_params(params)
-        request.add_fields(fields)
-
-        if batch is not None:
-            request.add_to_batch(batch)
-            return request
-        elif pending:
-            return request
-        else:
-            self.assure_call()
-            return request.execute()
-
-    def get_insights_async(self, fields=None, params=None, batch=None, pending=False):
-        from facebookads.adobjects.adreportrun import AdReportRun
-        from facebookads.adobjects.adsinsights import AdsInsights
-        param_types = {
-            'action_attribution_windows': 'list<action_attribution_windows_enum>',
-            'action_breakdowns': 'list<action_breakdowns_enum>',
-            'action_report_time': 'action_report_time_enum',
-            'breakdowns': 'list<breakdowns_enum>',
-            'date_preset': 'date_preset_enum',
-            'default_summary': 'bool',
-            'fields': 'list<fields_enum>',
-            'filtering': 'list<Object>',
-            'level': 'level_enum',
-            'product_id_limit': 'int',
-            'sort': 'list<string>',
-            'summary': 'list<summary_enum>',
-            'summary_action_breakdowns': 'list<summary_action_breakdowns_enum>',
-            'time_increment': 'string',
-            'time_range': 'map',
-            'time_ranges': 'list<map>',
-        }
-        enums = {
-            'action_attribution_windows_enum': AdsInsights.ActionAttributionWindows.__dict__.values(),
-            'action_breakdowns_enum': AdsInsights.ActionBreakdowns.__dict__.values(),
-            'action_report_time_enum': AdsInsights.ActionReportTime.__dict__.values(),
-            'breakdowns_enum': AdsInsights.Breakdowns.__dict__.values(),
-            'date_preset_enum': AdsInsights.DatePreset.__dict__.values(),
-            'summary_enum': AdsInsights.Summary.__dict__.values(),
-            'level_enum': AdsInsights.Level.__dict__.values(),
-            'summary_action_breakdowns_enum': AdsInsights.SummaryActionBreakdowns.__dict__.values(),
-        }
-        request = FacebookRequest(
-            node_id=self['id'],
-            method='POST',
-            endpoint='/insights',
-            api=self._api,
-            param_checker=TypeChecker(param_types, enums),
-            target_class=AdReportRun,
-            api_type='EDGE',
-            response_parser=ObjectParser(target_class=AdReportRun),
-            include_summary=False,
-        )
-        request.add_params(params)
-        request.add_fields(fields)
-
-        if batch is not None:
-            request.add_to_batch(batch)
-            return request
-        elif pending:
-            return request
-        else:
-            self.assure_call()
-            return request.execute()
-
-    def get_instagram_accounts(self, fields=None, params=None, batch=None, pending=False):
-        param_types = {
-        }
-        enums = {
-        }
-        request = FacebookRequest(
-            node_id=self['id'],
-            method='GET',
-            endpoint='/instagram_accounts',
-            api=self._api,
-            param_checker=TypeChecker(param_types, enums),
-            target_class=AbstractCrudObject,
-            api_type='EDGE',
-            response_parser=ObjectParser(target_class=AbstractCrudObject),
-        )
-        request.add_params(params)
-        request.add_fields(fields)
-
-        if batch is not None:
-            request.add_to_batch(batch)
-            return request
-        elif pending:
-            return request
-        else:
-            self.assure_call()
-            return request.execute()
-
-    def get_lead_gen_forms(self, fields=None, params=None, batch=None, pending=False):
-        from facebookads.adobjects.leadgenform import LeadgenForm
-        param_types = {
-            'query': 'string',
-        }
-        enums = {
-        }
-        request = FacebookRequest(
-            node_id=self['id'],
-            method='GET',
-            endpoint='/leadgen_forms',
-            api=self._api,
-            param_checker=TypeChecker(param_types, enums),
-            target_class=LeadgenForm,
-            api_type='EDGE',
-            response_parser=ObjectParser(target_class=LeadgenForm),
-        )
-        request.add_params(params)
-        request.add_fields(fields)
-
-        if batch is not None:
-            request.add_to_batch(batch)
-            return request
-        elif pending:
-            return request
-        else:
-            self.assure_call()
-            return request.execute()
-
-    def get_minimum_budgets(self, fields=None, params=None, batch=None, pending=False):
-        from facebookads.adobjects.minimumbudget import MinimumBudget
-        param_types = {
-            'bid_amount': 'int',
-        }
-        enums = {
-        }
-        request = FacebookRequest(
-            node_id=self['id'],
-            method='GET',
-            endpoint='/minimum_budgets',
-            api=self._api,
-            param_checker=TypeChecker(param_types, enums),
-            target_class=MinimumBudget,
-            api_type='EDGE',
-            response_parser=ObjectParser(target_class=MinimumBudget),
-        )
-        request.add_params(params)
-        request.add_fields(fields)
-
-        if batch is not None:
-            request.add_to_batch(batch)
-            return request
-        elif pending:
-            return request
-        else:
-            self.assure_call()
-            return request.execute()
-
-    def get_offline_conversion_data_sets(self, fields=None, params=None, batch=None, pending=False):
-        param_types = {
-        }
-        enums = {
-        }
-        request = FacebookRequest(
-            node_id=self['id'],
-            method='GET',
-            endpoint='/offline_conversion_data_sets',
-            api=self._api,
-            param_checker=TypeChecker(param_types, enums),
-            target_class=AbstractCrudObject,
-            api_type='EDGE',
-            response_parser=ObjectParser(target_class=AbstractCrudObject),
-        )
-        request.add_params(params)
-        request.add_fields(fields)
-
-        if batch is not None:
-            request.add_to_batch(batch)
-            return request
-        elif pending:
-            return request
-        else:
-            self.assure_call()
-            return request.execute()
-
-    def create_offline_conversion(self, fields=None, params=None, batch=None, pending=False):
-        param_types = {
-            'event': 'string',
-            'payload': 'list<Object>',
-            'pixel_id': 'string',
-        }
-        enums = {
-        }
-        request = FacebookRequest(
-            node_id=self['id'],
-            method='POST',
-            endpoint='/offlineconversions',
-            api=self._api,
-            param_checker=TypeChecker(param_types, enums),
-            target_class=AbstractCrudObject,
-            api_type='EDGE',
-            response_parser=ObjectParser(target_class=AbstractCrudObject),
-        )
-        request.add_params(params)
-        request.add_fields(fields)
-
-        if batch is not None:
-            request.add_to_batch(batch)
-            return request
-        elif pending:
-            return request
-        else:
-            self.assure_call()
-            return request.execute()
-
-    def get_offsite_pixels(self, fields=None, params=None, batch=None, pending=False):
-        from facebookads.adobjects.offsitepixel import OffsitePixel
-        param_types = {
-        }
-        enums = {
-        }
-        request = FacebookRequest(
-            node_id=self['id'],
-            method='GET',
-            endpoint='/offsitepixels',
-            api=self._api,
-            param_checker=TypeChecker(param_types, enums),
-            target_class=OffsitePixel,
-            api_type='EDGE',
-            response_parser=ObjectParser(target_class=OffsitePixel),
-        )
-        request.add_params(params)
-        request.add_fields(fields)
-
-        if batch is not None:
-            request.add_to_batch(batch)
-            return request
-        elif pending:
-            return request
-        else:
-            self.assure_call()
-            return request.execute()
-
-    def create_offsite_pixel(self, fields=None, params=None, batch=None, pending=False):
-        from facebookads.adobjects.offsitepixel import OffsitePixel
-        param_types = {
-            'name': 'string',
-            'tag': 'tag_enum',
-        }
-        enums = {
-            'tag_enum': OffsitePixel.Tag.__dict__.values(),
-        }
-        request = FacebookRequest(
-            node_id=self['id'],
-            method='POST',
-            endpoint='/offsitepixels',
-            api=self._api,
-            param_checker=TypeChecker(param_types, enums),
-            target_class=OffsitePixel,
-            api_type='EDGE',
-            response_parser=ObjectParser(target_class=OffsitePixel),
-        )
-        request.add_params(params)
-        request.add_fields(fields)
-
-        if batch is not None:
-            request.add_to_batch(batch)
-            return request
-        elif pending:
-            return request
-        else:
-            self.assure_call()
-            return request.execute()
-
-    def get_partner_categories(self, fields=None, params=None, batch=None, pending=False):
-        from facebookads.adobjects.partnercategory import PartnerCategory
-        param_types = {
-            'hide_pc': 'bool',
-            'private_or_public': 'string',
-            'targeting_type': 'string',
-        }
-        enums = {
-        }
-        request = FacebookRequest(
-            node_id=self['id'],
-            method='GET',
-            endpoint='/partnercategories',
-            api=self._api,
-            param_checker=TypeChecker(param_types, enums),
-            target_class=PartnerCategory,
-            api_type='EDGE',
-            response_parser=ObjectParser(target_class=PartnerCategory),
-        )
-        request.add_params(params)
-        request.add_fields(fields)
-
-        if batch is not None:
-            request.add_to_batch(batch)
-            return request
-        elif pending:
-            return request
-        else:
-            self.assure_call()
-            return request.execute()
-
-    def get_partners(self, fields=None, params=None, batch=None, pending=False):
-        from facebookads.adobjects.adsdatapartner import AdsDataPartner
-        param_types = {
-        }
-        enums = {
-        }
-        request = FacebookRequest(
-            node_id=self['id'],
-            method='GET',
-            endpoint='/partners',
-            api=self._api,
-            param_checker=TypeChecker(param_types, enums),
-            target_class=AdsDataPartner,
-            api_type='EDGE',
-            response_parser=ObjectParser(target_class=AdsDataPartner),
-        )
-        request.add_params(params)
-        request.add_fields(fields)
-
-        if batch is not None:
-            request.add_to_batch(batch)
-            return request
-        elif pending:
-            return request
-        else:
-            self.assure_call()
-            return request.execute()
-
-    def create_product_audience(self, fields=None, params=None, batch=None, pending=False):
-        param_types = {
-            'associated_audience_id': 'unsigned int',
-            'creation_params': 'map',
-            'description': 'string',
-            'exclusions': 'list<Object>',
-            'inclusions': 'list<Object>',
-            'name': 'string',
-            'opt_out_link': 'string',
-            'parent_audience_id': 'unsigned int',
-            'product_set_id': 'string',
-            'subtype': 'subtype_enum',
-            'tags': 'list<string>',
-        }
-        enums = {
-            'subtype_enum': [
-                'CUSTOM',
-                'WEBSITE',
-                'APP',
-                'OFFLINE',
-                'CLAIM',
-                'PARTNER',
-                'MANAGED',
-                'VIDEO',
-                'LOOKALIKE',
-                'ENGAGEMENT',
-                'DATA_SET',
-                'BAG_OF_ACCOUNTS',
-            ],
-        }
-        request = FacebookRequest(
-            node_id=self['id'],
-            method='POST',
-            endpoint='/product_audiences',
-            api=self._api,
-            param_checker=TypeChecker(param_types, enums),
-            target_class=AbstractCrudObject,
-            api_type='EDGE',
-            response_parser=ObjectParser(target_class=AbstractCrudObject),
-        )
-        request.add_params(params)
-        request.add_fields(fields)
-
-        if batch is not None:
-            request.add_to_batch(batch)
-            return request
-        elif pending:
-            return request
-        else:
-            self.assure_call()
-            return request.execute()
-
-    def get_publisher_block_lists(self, fields=None, params=None, batch=None, pending=False):
-        param_types = {
-        }
-        enums = {
-        }
-        request = FacebookRequest(
-            node_id=self['id'],
-            method='GET',
-            endpoint='/publisher_block_lists',
-            api=self._api,
-            param_checker=TypeChecker(param_types, enums),
-            target_class=AbstractCrudObject,
-            api_type='EDGE',
-            response_parser=ObjectParser(target_class=AbstractCrudObject),
-        )
-        request.add_params(params)
-        request.add_fields(fields)
-
-        if batch is not None:
-            request.add_to_batch(batch)
-            return request
-        elif pending:
-            return request
-        else:
-            self.assure_call()
-            return request.execute()
-
-    def create_publisher_block_list(self, fields=None, params=None, batch=None, pending=False):
-        param_types = {
-            'name': 'string',
-        }
-        enums = {
-        }
-        request = FacebookRequest(
-            node_id=self['id'],
-            method='POST',
-            endpoint='/publisher_block_lists',
-            api=self._api,
-            param_checker=TypeChecker(param_types, enums),
-            target_class=AbstractCrudObject,
-            api_type='EDGE',
-            response_parser=ObjectParser(target_class=AbstractCrudObject),
-        )
-        request.add_params(params)
-        request.add_fields(fields)
-
-        if batch is not None:
-            request.add_to_batch(batch)
-            return request
-        elif pending:
-            return request
-        else:
-            self.assure_call()
-            return request.execute()
-
-    def get_rate_card(self, fields=None, params=None, batch=None, pending=False):
-        from facebookads.adobjects.ratecard import RateCard
-        param_types = {
-        }
-        enums = {
-        }
-        request = FacebookRequest(
-            node_id=self['id'],
-            method='GET',
-            endpoint='/ratecard',
-            api=self._api,
-            param_checker=TypeChecker(param_types, enums),
-            target_class=RateCard,
-            api_type='EDGE',
-            response_parser=ObjectParser(target_class=RateCard),
-        )
-        request.add_params(params)
-        request.add_fields(fields)
-
-        if batch is not None:
-            request.add_to_batch(batch)
-            return request
-        elif pending:
-            return request
-        else:
-            self.assure_call()
-            return request.execute()
-
-    def get_reach_estimate(self, fields=None, params=None, batch=None, pending=False):
-        from facebookads.adobjects.reachestimate import ReachEstimate
-        from facebookads.adobjects.adset import AdSet
-        param_types = {
-            'currency': 'string',
-            'daily_budget': 'float',
-            'object_store_url': 'string',
-            'optimize_for': 'optimize_for_enum',
-            'targeting_spec': 'Targeting',
-        }
-        enums = {
-            'optimize_for_enum': ReachEstimate.OptimizeFor.__dict__.values(),
-            'optimization_goal_enum': AdSet.OptimizationGoal.__dict__.values(),
-        }
-        request = FacebookRequest(
-            node_id=self['id'],
-            method='GET',
-            endpoint='/delivery_estimate',
-            api=self._api,
-            param_checker=TypeChecker(param_types, enums),
-            target_class=ReachEstimate,
-            api_type='EDGE',
-            response_parser=ObjectParser(target_class=ReachEstimate),
-        )
-        request.add_params(params)
-        request.add_fields(fields)
-
-        if batch is not None:
-            request.add_to_batch(batch)
-            return request
-        elif pending:
-            return request
-        else:
-            self.assure_call()
-            return request.execute()
-
-    def get_reach_frequency_predictions(self, fields=None, params=None, batch=None, pending=False):
-        from facebookads.adobjects.reachfrequencyprediction import ReachFrequencyPrediction
-        param_types = {
-        }
-        enums = {
-        }
-        request = FacebookRequest(
-            node_id=self['id'],
-            method='GET',
-            endpoint='/reachfrequencypredictions',
-            api=self._api,
-            param_checker=TypeChecker(param_types, enums),
-            target_class=ReachFrequencyPrediction,
-            api_type='EDGE',
-            response_parser=ObjectParser(target_class=ReachFrequencyPrediction),
-        )
-        request.add_params(params)
-        request.add_fields(fields)
-
-        if batch is not None:
-            request.add_to_batch(batch)
-            return request
-        elif pending:
-            return request
-        else:
-            self.assure_call()
-            return request.execute()
-
-    def create_reach_frequency_prediction(self, fields=None, params=None, batch=None, pending=False):
-        from facebookads.adobjects.reachfrequencyprediction import ReachFrequencyPrediction
-        param_types = {
-            'budget': 'unsigned int',
-            'campaign_group_id': 'string',
-            'destination_id': 'unsigned int',
-            'destination_ids': 'list<string>',
-            'end_time': 'unsigned int',
-            'frequency_cap': 'unsigned int',
-            'interval_frequency_cap_reset_period': 'unsigned int',
-            'num_curve_points': 'unsigned int',
-            'objective': 'string',
-            'prediction_mode': 'unsigned int',
-            'reach': 'unsigned int',
-            'rf_prediction_id_to_share': 'string',
-            'start_time': 'unsigned int',
-            'stop_time': 'unsigned int',
-            'story_event_type': 'unsigned int',
-            'target_spec': 'Targeting',
-        }
-        enums = {
-        }
-        request = FacebookRequest(
-            node_id=self['id'],
-            method='POST',
-            endpoint='/reachfrequencypredictions',
-            api=self._api,
-            param_checker=TypeChecker(param_types, enums),
-            target_class=ReachFrequencyPrediction,
-            api_type='EDGE',
-            response_parser=ObjectParser(target_class=ReachFrequencyPrediction),
-        )
-        request.add_params(params)
-        request.add_fields(fields)
-
-        if batch is not None:
-            request.add_to_batch(batch)
-            return request
-        elif pending:
-            return request
-        else:
-            self.assure_call()
-            return request.execute()
-
-    def get_roas(self, fields=None, params=None, batch=None, pending=False):
-        from facebookads.adobjects.adaccountroas import AdAccountRoas
-        param_types = {
-            'fields': 'list<fields_enum>',
-            'filtering': 'list<Object>',
-            'time_increment': 'string',
-            'time_range': 'Object',
-        }
-        enums = {
-            'fields_enum': AdAccountRoas.Fields.__dict__.values(),
-        }
-        request = FacebookRequest(
-            node_id=self['id'],
-            method='GET',
-            endpoint='/roas',
-            api=self._api,
-            param_checker=TypeChecker(param_types, enums),
-            target_class=AdAccountRoas,
-            api_type='EDGE',
-            response_parser=ObjectParser(target_class=AdAccountRoas),
-        )
-        request.add_params(params)
-        request.add_fields(fields)
-
-        if batch is not None:
-            request.add_to_batch(batch)
-            return request
-        elif pending:
-            return request
-        else:
-            self.assure_call()
-            return request.execute()
-
-    def get_targeting_insights(self, fields=None, params=None, batch=None, pending=False):
-        from facebookads.adobjects.adaccounttargetinginsights import AdAccountTargetingInsights
-        param_types = {
-            'mode': 'mode_enum',
-            'objective': 'objective_enum',
-            'rank_mode': 'rank_mode_enum',
-        }
-        enums = {
-            'mode_enum': AdAccountTargetingInsights.Mode.__dict__.values(),
-            'objective_enum': AdAccountTargetingInsights.Objective.__dict__.values(),
-            'rank_mode_enum': AdAccountTargetingInsights.RankMode.__dict__.values(),
-        }
-        request = FacebookRequest(
-            node_id=self['id'],
-            method='GET',
-            endpoint='/targetinginsights',
-            api=self._api,
-            param_checker=TypeChecker(param_types, enums),
-            target_class=AdAccountTargetingInsights,
-            api_type='EDGE',
-            response_parser=ObjectParser(target_class=AdAccountTargetingInsights),
-        )
-        request.add_params(params)
-        request.add_fields(fields)
-
-        if batch is not None:
-            request.add_to_batch(batch)
-            return request
-        elif pending:
-            return request
-        else:
-            self.assure_call()
-            return request.execute()
-
-    def get_targeting_browse(self, fields=None, params=None, batch=None, pending=False):
-        from facebookads.adobjects.adaccounttargetingunified import AdAccountTargetingUnified
-        param_types = {
-            'include_nodes': 'bool',
-            'limit_type': 'limit_type_enum',
-        }
-        enums = {
-            'limit_type_enum': AdAccountTargetingUnified.LimitType.__dict__.values(),
-        }
-        request = FacebookRequest(
-            node_id=self['id'],
-            method='GET',
-            endpoint='/targetingbrowse',
-            api=self._api,
-            param_checker=TypeChecker(param_types, enums),
-            target_class=AdAccountTargetingUnified,
-            api_type='EDGE',
-            response_parser=ObjectParser(target_class=AdAccountTargetingUnified),
-        )
-        request.add_params(params)
-        request.add_fields(fields)
-
-        if batch is not None:
-            request.add_to_batch(batch)
-            return request
-        elif pending:
-            return request
-        else:
-            self.assure_call()
-            return request.execute()
-
-    def get_targeting_search(self, fields=None, params=None, batch=None, pending=False):
-        from facebookads.adobjects.adaccounttargetingunified import AdAccountTargetingUnified
-        param_types = {
-            'limit_type': 'limit_type_enum',
-            'q': 'string',
-        }
-        enums = {
-            'limit_type_enum': AdAccountTargetingUnified.LimitType.__dict__.values(),
-        }
-        request = FacebookRequest(
-            node_id=self['id'],
-            method='GET',
-            endpoint='/targetingsearch',
-            api=self._api,
-            param_checker=TypeChecker(param_types, enums),
-            target_class=AdAccountTargetingUnified,
-            api_type='EDGE',
-            response_parser=ObjectParser(target_class=AdAccountTargetingUnified),
-        )
-        request.add_params(params)
-        request.add_fields(fields)
-
-        if batch is not None:
-            request.add_to_batch(batch)
-            return request
-        elif pending:
-            return request
-        else:
-            self.assure_call()
-            return request.execute()
-
-    def get_targeting_sentence_lines(self, fields=None, params=None, batch=None, pending=False):
-        from facebookads.adobjects.targetingsentenceline import TargetingSentenceLine
-        param_types = {
-            'discard_ages': 'bool',
-            'discard_placements': 'bool',
-            'targeting_spec': 'Targeting',
-        }
-        enums = {
-        }
-        request = FacebookRequest(
-            node_id=self['id'],
-            method='GET',
-            endpoint='/targetingsentencelines',
-            api=self._api,
-            param_checker=TypeChecker(param_types, enums),
-            target_class=TargetingSentenceLine,
-            api_type='EDGE',
-            response_parser=ObjectParser(target_class=TargetingSentenceLine),
-        )
-        request.add_params(params)
-        request.add_fields(fields)
-
-        if batch is not None:
-            request.add_to_batch(batch)
-            return request
-        elif pending:
-            return request
-        else:
-            self.assure_call()
-            return request.execute()
+            'minheight': 'unsigned int',
+            'minwidth': 'unsigned int',
+            'name': 'string',
+        },
+    )
 
-    def get_targeting_suggestions(self, fields=None, params=None, batch=None, pending=False):
-        from facebookads.adobjects.adaccounttargetingunified import AdAccountTargetingUnified
-        param_types = {
-            'limit_type': 'limit_type_enum',
-            'targeting_list': 'list<Object>',
-        }
-        enums = {
-            'limit_type_enum': AdAccountTargetingUnified.LimitType.__dict__.values(),
-        }
+    def create_ad_image(self, fields=None, params=None, batch=None, pending=False):
+        from facebookads.adobjects.adimage import AdImage
         request = FacebookRequest(
             node_id=self['id'],
-            method='GET',
-            endpoint='/targetingsuggestions',
+            method='POST',
+            endpoint='/adimages',
             api=self._api,
-            param_checker=TypeChecker(param_types, enums),
-            target_class=AdAccountTargetingUnified,
+            param_checker=_create_ad_image_params.get_checker(),
+            target_class=AdImage,
             api_type='EDGE',
-            response_parser=ObjectParser(target_class=AdAccountTargetingUnified),
+            allow_file_upload=True,
+            response_parser=ObjectParser(target_class=AdImage),
         )
         request.add_params(params)
         request.add_fields(fields)
@@ -2253,24 +297,67 @@ class AdAccount(
             self.assure_call()
             return request.execute()
 
-    def get_targeting_validation(self, fields=None, params=None, batch=None, pending=False):
-        from facebookads.adobjects.adaccounttargetingunified import AdAccountTargetingUnified
-        param_types = {
-            'id_list': 'list<unsigned int>',
-            'name_list': 'list<string>',
-            'targeting_list': 'list<Object>',
-        }
-        enums = {
-        }
+    get_ad_labels = ApiMethod(
+        method='GET',
+        endpoint='/adlabels',
+        target='adlabel.AdLabel',
+        api_type='EDGE',
+    )
+
+    create_ad_label = ApiMethod(
+        method='POST',
+        endpoint='/adlabels',
+        target='adlabel.AdLabel',
+        api_type='EDGE',
+        param_types={
+            'name': 'string',
+        },
+    )
+
+    get_ad_report_runs = ApiMethod(
+        method='GET',
+        endpoint='/adreportruns',
+        target='adreportrun.AdReportRun',
+        api_type='EDGE',
+    )
+
+    get_ad_report_schedules = ApiMethod(
+        method='GET',
+        endpoint='/adreportschedules',
+        target='abstractcrudobject.AbstractCrudObject',
+        api_type='EDGE',
+    )
+
+    get_ads = ApiMethod(
+        method='GET',
+        endpoint='/ads',
+        target='ad.Ad',
+        api_type='EDGE',
+        param_types={
+            'ad_draft_id': 'string',
+            'date_preset': 'date_preset_enum',
+            'effective_status': 'list<string>',
+            'include_deleted': 'bool',
+            'time_range': 'map',
+            'updated_since': 'int',
+        },
+        enums={
+            'date_preset_enum': 'ad.Ad.DatePreset',
+        },
+    )
+
+    def create_ad(self, fields=None, params=None, batch=None, pending=False):
+        from facebookads.adobjects.ad import Ad
         request = FacebookRequest(
             node_id=self['id'],
-            method='GET',
-            endpoint='/targetingvalidation',
+            method='POST',
+            endpoint='/ads',
             api=self._api,
-            param_checker=TypeChecker(param_types, enums),
-            target_class=AdAccountTargetingUnified,
+            param_checker=_create_ad_params.get_checker(),
+            target_class=Ad,
             api_type='EDGE',
-            response_parser=ObjectParser(target_class=AdAccountTargetingUnified),
+            allow_file_upload=True,
+            response_parser=ObjectParser(target_class=Ad),
         )
         request.add_params(params)
         request.add_fields(fields)
@@ -2284,23 +371,141 @@ class AdAccount(
             self.assure_call()
             return request.execute()
 
-    def get_transactions(self, fields=None, params=None, batch=None, pending=False):
-        from facebookads.adobjects.transaction import Transaction
-        param_types = {
-            'time_start': 'int',
-            'time_stop': 'int',
-        }
-        enums = {
-        }
+    get_ads_by_labels = ApiMethod(
+        method='GET',
+        endpoint='/adsbylabels',
+        target='ad.Ad',
+        api_type='EDGE',
+        param_types={
+            'ad_label_ids': 'list<string>',
+            'operator': 'operator_enum',
+        },
+        enums={
+            'operator_enum': 'ad.Ad.Operator',
+        },
+    )
+
+    get_ad_sets = ApiMethod(
+        method='GET',
+        endpoint='/adsets',
+        target='adset.AdSet',
+        api_type='EDGE',
+        param_types={
+            'ad_draft_id': 'string',
+            'date_preset': 'date_preset_enum',
+            'effective_status': 'list<effective_status_enum>',
+            'include_deleted': 'bool',
+            'is_completed': 'bool',
+            'time_range': 'map',
+        },
+        enums={
+            'date_preset_enum': 'adset.AdSet.DatePreset',
+            'effective_status_enum': 'adset.AdSet.EffectiveStatus',
+        },
+    )
+
+    create_ad_set = ApiMethod(
+        method='POST',
+        endpoint='/adsets',
+        target='adset.AdSet',
+        api_type='EDGE',
+        param_types={
+            'adlabels': 'list<Object>',
+            'adset_schedule': 'list<Object>',
+            'attribution_window_days': 'unsigned int',
+            'bid_amount': 'int',
+            'billing_event': 'billing_event_enum',
+            'campaign_id': 'string',
+            'creative_sequence': 'list<string>',
+            'daily_budget': 'unsigned int',
+            'daily_imps': 'unsigned int',
+            'end_time': 'datetime',
+            'execution_options': 'list<execution_options_enum>',
+            'frequency_control_specs': 'list<Object>',
+            'is_autobid': 'bool',
+            'lifetime_budget': 'unsigned int',
+            'lifetime_imps': 'unsigned int',
+            'name': 'string',
+            'optimization_goal': 'optimization_goal_enum',
+            'pacing_type': 'list<string>',
+            'promoted_object': 'Object',
+            'redownload': 'bool',
+            'rf_prediction_id': 'string',
+            'rtb_flag': 'bool',
+            'start_time': 'datetime',
+            'status': 'status_enum',
+            'targeting': 'Targeting',
+            'time_based_ad_rotation_id_blocks': 'list<list<unsigned int>>',
+            'time_based_ad_rotation_intervals': 'list<unsigned int>',
+        },
+        enums={
+            'billing_event_enum': 'adset.AdSet.BillingEvent',
+            'execution_options_enum': 'adset.AdSet.ExecutionOptions',
+            'optimization_goal_enum': 'adset.AdSet.OptimizationGoal',
+            'status_enum': 'adset.AdSet.Status',
+        },
+    )
+
+    get_ad_sets_by_labels = ApiMethod(
+        method='GET',
+        endpoint='/adsetsbylabels',
+        target='adset.AdSet',
+        api_type='EDGE',
+        param_types={
+            'ad_label_ids': 'list<string>',
+            'operator': 'operator_enum',
+        },
+        enums={
+            'operator_enum': 'adset.AdSet.Operator',
+        },
+    )
+
+    get_ads_pixels = ApiMethod(
+        method='GET',
+        endpoint='/adspixels',
+        target='adspixel.AdsPixel',
+        api_type='EDGE',
+    )
+
+    create_ads_pixel = ApiMethod(
+        method='POST',
+        endpoint='/adspixels',
+        target='adspixel.AdsPixel',
+        api_type='EDGE',
+        param_types={
+            'name': 'string',
+        },
+    )
+
+    get_advertisable_applications = ApiMethod(
+        method='GET',
+        endpoint='/advertisable_applications',
+        target='abstractcrudobject.AbstractCrudObject',
+        api_type='EDGE',
+        param_types={
+            'app_id': 'string',
+            'business_id': 'string',
+        },
+    )
+
+    get_ad_videos = ApiMethod(
+        method='GET',
+        endpoint='/advideos',
+        target='abstractcrudobject.AbstractCrudObject',
+        api_type='EDGE',
+    )
+
+    def create_ad_video(self, fields=None, params=None, batch=None, pending=False):
         request = FacebookRequest(
             node_id=self['id'],
-            method='GET',
-            endpoint='/transactions',
+            method='POST',
+            endpoint='/advideos',
             api=self._api,
-            param_checker=TypeChecker(param_types, enums),
-            target_class=Transaction,
+            param_checker=_create_ad_video_params.get_checker(),
+            target_class=AbstractCrudObject,
             api_type='EDGE',
-            response_parser=ObjectParser(target_class=Transaction),
+            allow_file_upload=True,
+            response_parser=ObjectParser(target_class=AbstractCrudObject),
         )
         request.add_params(params)
         request.add_fields(fields)
@@ -2314,21 +519,231 @@ class AdAccount(
             self.assure_call()
             return request.execute()
 
-    def get_users(self, fields=None, params=None, batch=None, pending=False):
-        from facebookads.adobjects.adaccountuser import AdAccountUser
-        param_types = {
-        }
-        enums = {
-        }
+    get_applications = ApiMethod(
+        method='GET',
+        endpoint='/applications',
+        target='abstractcrudobject.AbstractCrudObject',
+        api_type='EDGE',
+    )
+
+    get_async_ad_request_sets = ApiMethod(
+        method='GET',
+        endpoint='/asyncadrequestsets',
+        target='adasyncrequestset.AdAsyncRequestSet',
+        api_type='EDGE',
+        param_types={
+            'is_completed': 'bool',
+        },
+    )
+
+    create_async_ad_request_set = ApiMethod(
+        method='POST',
+        endpoint='/asyncadrequestsets',
+        target='adasyncrequestset.AdAsyncRequestSet',
+        api_type='EDGE',
+        param_types={
+            'ad_specs': 'list<map>',
+            'name': 'string',
+            'notification_mode': 'notification_mode_enum',
+            'notification_uri': 'string',
+        },
+        enums={
+            'notification_mode_enum': [
+                'OFF',
+                'ON_COMPLETE',
+            ],
+        },
+    )
+
+    get_broad_targeting_categories = ApiMethod(
+        method='GET',
+        endpoint='/broadtargetingcategories',
+        target='broadtargetingcategories.BroadTargetingCategories',
+        api_type='EDGE',
+        param_types={
+            'custom_categories_only': 'bool',
+        },
+    )
+
+    delete_campaigns = ApiMethod(
+        method='DELETE',
+        endpoint='/campaigns',
+        target='abstractcrudobject.AbstractCrudObject',
+        api_type='EDGE',
+        param_types={
+            'before_date': 'datetime',
+            'delete_strategy': 'delete_strategy_enum',
+            'object_count': 'int',
+        },
+        enums={
+            'delete_strategy_enum': 'campaign.Campaign.DeleteStrategy',
+        },
+    )
+
+    get_campaigns = ApiMethod(
+        method='GET',
+        endpoint='/campaigns',
+        target='campaign.Campaign',
+        api_type='EDGE',
+        param_types={
+            'ad_draft_id': 'string',
+            'date_preset': 'date_preset_enum',
+            'effective_status': 'list<effective_status_enum>',
+            'is_completed': 'bool',
+            'time_range': 'map',
+        },
+        enums={
+            'date_preset_enum': 'campaign.Campaign.DatePreset',
+            'effective_status_enum': 'campaign.Campaign.EffectiveStatus',
+        },
+    )
+
+    create_campaign = ApiMethod(
+        method='POST',
+        endpoint='/campaigns',
+        target='campaign.Campaign',
+        api_type='EDGE',
+        param_types={
+            'adlabels': 'list<Object>',
+            'buying_type': 'string',
+            'execution_options': 'list<execution_options_enum>',
+            'name': 'string',
+            'objective': 'objective_enum',
+            'promoted_object': 'Object',
+            'spend_cap': 'unsigned int',
+            'status': 'status_enum',
+        },
+        enums={
+            'execution_options_enum': 'campaign.Campaign.ExecutionOptions',
+            'objective_enum': 'campaign.Campaign.Objective',
+            'status_enum': 'campaign.Campaign.Status',
+        },
+    )
+
+    get_campaigns_by_labels = ApiMethod(
+        method='GET',
+        endpoint='/campaignsbylabels',
+        target='campaign.Campaign',
+        api_type='EDGE',
+        param_types={
+            'ad_label_ids': 'list<string>',
+            'operator': 'operator_enum',
+        },
+        enums={
+            'operator_enum': 'campaign.Campaign.Operator',
+        },
+    )
+
+    get_custom_audiences = ApiMethod(
+        method='GET',
+        endpoint='/customaudiences',
+        target='customaudience.CustomAudience',
+        api_type='EDGE',
+        param_types={
+            'business_id': 'string',
+            'fields': 'list<fields_enum>',
+            'filtering': 'list<Object>',
+            'pixel_id': 'string',
+        },
+        enums={
+            'fields_enum': 'customaudience.CustomAudience.Fields',
+        },
+    )
+
+    create_custom_audience = ApiMethod(
+        method='POST',
+        endpoint='/customaudiences',
+        target='customaudience.CustomAudience',
+        api_type='EDGE',
+        param_types={
+            'claim_objective': 'claim_objective_enum',
+            'content_type': 'content_type_enum',
+            'dataset_id': 'string',
+            'description': 'string',
+            'event_source_group': 'string',
+            'list_of_accounts': 'list<unsigned int>',
+            'lookalike_spec': 'string',
+            'name': 'string',
+            'opt_out_link': 'string',
+            'origin_audience_id': 'string',
+            'pixel_id': 'unsigned int',
+            'prefill': 'bool',
+            'product_set_id': 'string',
+            'retention_days': 'unsigned int',
+            'rule': 'string',
+            'subtype': 'subtype_enum',
+        },
+        enums={
+            'claim_objective_enum': 'customaudience.CustomAudience.ClaimObjective',
+            'content_type_enum': 'customaudience.CustomAudience.ContentType',
+            'subtype_enum': 'customaudience.CustomAudience.Subtype',
+        },
+    )
+
+    get_custom_audiences_tos = ApiMethod(
+        method='GET',
+        endpoint='/customaudiencestos',
+        target='customaudiencestos.CustomAudiencesTOS',
+        api_type='EDGE',
+    )
+
+    create_custom_conversion = ApiMethod(
+        method='POST',
+        endpoint='/customconversions',
+        target='customconversion.CustomConversion',
+        api_type='EDGE',
+        param_types={
+            'custom_event_type': 'custom_event_type_enum',
+            'default_conversion_value': 'float',
+            'description': 'string',
+            'name': 'string',
+            'pixel_id': 'string',
+            'pixel_rule': 'string',
+        },
+        enums={
+            'custom_event_type_enum': 'customconversion.CustomConversion.CustomEventType',
+        },
+    )
+
+    get_generate_previews = ApiMethod(
+        method='GET',
+        endpoint='/generatepreviews',
+        target='adpreview.AdPreview',
+        api_type='EDGE',
+        param_types={
+            'ad_format': 'ad_format_enum',
+            'creative': 'AdCreative',
+            'dynamic_creative_spec': 'Object',
+            'height': 'unsigned int',
+            'interactive': 'bool',
+            'locale': 'string',
+            'post': 'Object',
+            'product_item_ids': 'list<string>',
+            'width': 'unsigned int',
+        },
+        enums={
+            'ad_format_enum': 'adpreview.AdPreview.AdFormat',
+        },
+    )
+
+    def get_insights(self, fields=None, params=None, async=False, batch=None, pending=False, strategy=None):
+        from facebookads.adobjects.adsinsights import AdsInsights
+        if strategy is not None:
+          if batch is not None or pending:
+            raise ValueError('strategy cannot be used with batch or pending.')
+          return strategy.get_insights(self, fields, params, async)
+        if async:
+          return self.get_insights_async(fields, params, batch, pending)
         request = FacebookRequest(
             node_id=self['id'],
             method='GET',
-            endpoint='/users',
+            endpoint='/insights',
             api=self._api,
-            param_checker=TypeChecker(param_types, enums),
-            target_class=AdAccountUser,
+            param_checker=_get_insights_params.get_checker(),
+            target_class=AdsInsights,
             api_type='EDGE',
-            response_parser=ObjectParser(target_class=AdAccountUser),
+            response_parser=ObjectParser(target_class=AdsInsights),
+            include_summary=False,
         )
         request.add_params(params)
         request.add_fields(fields)
@@ -2342,6 +757,355 @@ class AdAccount(
             self.assure_call()
             return request.execute()
 
+    get_insights_async = ApiMethod(
+        method='POST',
+        endpoint='/insights',
+        target='adreportrun.AdReportRun',
+        api_type='EDGE',
+        param_types={
+            'action_attribution_windows': 'list<action_attribution_windows_enum>',
+            'action_breakdowns': 'list<action_breakdowns_enum>',
+            'action_report_time': 'action_report_time_enum',
+            'breakdowns': 'list<breakdowns_enum>',
+            'date_preset': 'date_preset_enum',
+            'default_summary': 'bool',
+            'fields': 'list<fields_enum>',
+            'filtering': 'list<Object>',
+            'level': 'level_enum',
+            'product_id_limit': 'int',
+            'sort': 'list<string>',
+            'summary': 'list<summary_enum>',
+            'summary_action_breakdowns': 'list<summary_action_breakdowns_enum>',
+            'time_increment': 'string',
+            'time_range': 'map',
+            'time_ranges': 'list<map>',
+        },
+        enums={
+            'action_attribution_windows_enum': 'adsinsights.AdsInsights.ActionAttributionWindows',
+            'action_breakdowns_enum': 'adsinsights.AdsInsights.ActionBreakdowns',
+            'action_report_time_enum': 'adsinsights.AdsInsights.ActionReportTime',
+            'breakdowns_enum': 'adsinsights.AdsInsights.Breakdowns',
+            'date_preset_enum': 'adsinsights.AdsInsights.DatePreset',
+            'summary_enum': 'adsinsights.AdsInsights.Summary',
+            'level_enum': 'adsinsights.AdsInsights.Level',
+            'summary_action_breakdowns_enum': 'adsinsights.AdsInsights.SummaryActionBreakdowns',
+        },
+        include_summary=False,
+    )
+
+    get_instagram_accounts = ApiMethod(
+        method='GET',
+        endpoint='/instagram_accounts',
+        target='abstractcrudobject.AbstractCrudObject',
+        api_type='EDGE',
+    )
+
+    get_lead_gen_forms = ApiMethod(
+        method='GET',
+        endpoint='/leadgen_forms',
+        target='leadgenform.LeadgenForm',
+        api_type='EDGE',
+        param_types={
+            'query': 'string',
+        },
+    )
+
+    get_minimum_budgets = ApiMethod(
+        method='GET',
+        endpoint='/minimum_budgets',
+        target='minimumbudget.MinimumBudget',
+        api_type='EDGE',
+        param_types={
+            'bid_amount': 'int',
+        },
+    )
+
+    get_offline_conversion_data_sets = ApiMethod(
+        method='GET',
+        endpoint='/offline_conversion_data_sets',
+        target='abstractcrudobject.AbstractCrudObject',
+        api_type='EDGE',
+    )
+
+    create_offline_conversion = ApiMethod(
+        method='POST',
+        endpoint='/offlineconversions',
+        target='abstractcrudobject.AbstractCrudObject',
+        api_type='EDGE',
+        param_types={
+            'event': 'string',
+            'payload': 'list<Object>',
+            'pixel_id': 'string',
+        },
+    )
+
+    get_offsite_pixels = ApiMethod(
+        method='GET',
+        endpoint='/offsitepixels',
+        target='offsitepixel.OffsitePixel',
+        api_type='EDGE',
+    )
+
+    create_offsite_pixel = ApiMethod(
+        method='POST',
+        endpoint='/offsitepixels',
+        target='offsitepixel.OffsitePixel',
+        api_type='EDGE',
+        param_types={
+            'name': 'string',
+            'tag': 'tag_enum',
+        },
+        enums={
+            'tag_enum': 'offsitepixel.OffsitePixel.Tag',
+        },
+    )
+
+    get_partner_categories = ApiMethod(
+        method='GET',
+        endpoint='/partnercategories',
+        target='partnercategory.PartnerCategory',
+        api_type='EDGE',
+        param_types={
+            'hide_pc': 'bool',
+            'private_or_public': 'string',
+            'targeting_type': 'string',
+        },
+    )
+
+    get_partners = ApiMethod(
+        method='GET',
+        endpoint='/partners',
+        target='adsdatapartner.AdsDataPartner',
+        api_type='EDGE',
+    )
+
+    create_product_audience = ApiMethod(
+        method='POST',
+        endpoint='/product_audiences',
+        target='abstractcrudobject.AbstractCrudObject',
+        api_type='EDGE',
+        param_types={
+            'associated_audience_id': 'unsigned int',
+            'creation_params': 'map',
+            'description': 'string',
+            'exclusions': 'list<Object>',
+            'inclusions': 'list<Object>',
+            'name': 'string',
+            'opt_out_link': 'string',
+            'parent_audience_id': 'unsigned int',
+            'product_set_id': 'string',
+            'subtype': 'subtype_enum',
+            'tags': 'list<string>',
+        },
+        enums={
+            'subtype_enum': [
+                'CUSTOM',
+                'WEBSITE',
+                'APP',
+                'OFFLINE',
+                'CLAIM',
+                'PARTNER',
+                'MANAGED',
+                'VIDEO',
+                'LOOKALIKE',
+                'ENGAGEMENT',
+                'DATA_SET',
+                'BAG_OF_ACCOUNTS',
+            ],
+        },
+    )
+
+    get_publisher_block_lists = ApiMethod(
+        method='GET',
+        endpoint='/publisher_block_lists',
+        target='abstractcrudobject.AbstractCrudObject',
+        api_type='EDGE',
+    )
+
+    create_publisher_block_list = ApiMethod(
+        method='POST',
+        endpoint='/publisher_block_lists',
+        target='abstractcrudobject.AbstractCrudObject',
+        api_type='EDGE',
+        param_types={
+            'name': 'string',
+        },
+    )
+
+    get_rate_card = ApiMethod(
+        method='GET',
+        endpoint='/ratecard',
+        target='ratecard.RateCard',
+        api_type='EDGE',
+    )
+
+    get_reach_estimate = ApiMethod(
+        method='GET',
+        endpoint='/delivery_estimate',
+        target='reachestimate.ReachEstimate',
+        api_type='EDGE',
+        param_types={
+            'currency': 'string',
+            'daily_budget': 'float',
+            'object_store_url': 'string',
+            'optimize_for': 'optimize_for_enum',
+            'targeting_spec': 'Targeting',
+        },
+        enums={
+            'optimize_for_enum': 'reachestimate.ReachEstimate.OptimizeFor',
+            'optimization_goal_enum': 'adset.AdSet.OptimizationGoal',
+        },
+    )
+
+    get_reach_frequency_predictions = ApiMethod(
+        method='GET',
+        endpoint='/reachfrequencypredictions',
+        target='reachfrequencyprediction.ReachFrequencyPrediction',
+        api_type='EDGE',
+    )
+
+    create_reach_frequency_prediction = ApiMethod(
+        method='POST',
+        endpoint='/reachfrequencypredictions',
+        target='reachfrequencyprediction.ReachFrequencyPrediction',
+        api_type='EDGE',
+        param_types={
+            'budget': 'unsigned int',
+            'campaign_group_id': 'string',
+            'destination_id': 'unsigned int',
+            'destination_ids': 'list<string>',
+            'end_time': 'unsigned int',
+            'frequency_cap': 'unsigned int',
+            'interval_frequency_cap_reset_period': 'unsigned int',
+            'num_curve_points': 'unsigned int',
+            'objective': 'string',
+            'prediction_mode': 'unsigned int',
+            'reach': 'unsigned int',
+            'rf_prediction_id_to_share': 'string',
+            'start_time': 'unsigned int',
+            'stop_time': 'unsigned int',
+            'story_event_type': 'unsigned int',
+            'target_spec': 'Targeting',
+        },
+    )
+
+    get_roas = ApiMethod(
+        method='GET',
+        endpoint='/roas',
+        target='adaccountroas.AdAccountRoas',
+        api_type='EDGE',
+        param_types={
+            'fields': 'list<fields_enum>',
+            'filtering': 'list<Object>',
+            'time_increment': 'string',
+            'time_range': 'Object',
+        },
+        enums={
+            'fields_enum': 'adaccountroas.AdAccountRoas.Fields',
+        },
+    )
+
+    get_targeting_insights = ApiMethod(
+        method='GET',
+        endpoint='/targetinginsights',
+        target='adaccounttargetinginsights.AdAccountTargetingInsights',
+        api_type='EDGE',
+        param_types={
+            'mode': 'mode_enum',
+            'objective': 'objective_enum',
+            'rank_mode': 'rank_mode_enum',
+        },
+        enums={
+            'mode_enum': 'adaccounttargetinginsights.AdAccountTargetingInsights.Mode',
+            'objective_enum': 'adaccounttargetinginsights.AdAccountTargetingInsights.Objective',
+            'rank_mode_enum': 'adaccounttargetinginsights.AdAccountTargetingInsights.RankMode',
+        },
+    )
+
+    get_targeting_browse = ApiMethod(
+        method='GET',
+        endpoint='/targetingbrowse',
+        target='adaccounttargetingunified.AdAccountTargetingUnified',
+        api_type='EDGE',
+        param_types={
+            'include_nodes': 'bool',
+            'limit_type': 'limit_type_enum',
+        },
+        enums={
+            'limit_type_enum': 'adaccounttargetingunified.AdAccountTargetingUnified.LimitType',
+        },
+    )
+
+    get_targeting_search = ApiMethod(
+        method='GET',
+        endpoint='/targetingsearch',
+        target='adaccounttargetingunified.AdAccountTargetingUnified',
+        api_type='EDGE',
+        param_types={
+            'limit_type': 'limit_type_enum',
+            'q': 'string',
+        },
+        enums={
+            'limit_type_enum': 'adaccounttargetingunified.AdAccountTargetingUnified.LimitType',
+        },
+    )
+
+    get_targeting_sentence_lines = ApiMethod(
+        method='GET',
+        endpoint='/targetingsentencelines',
+        target='targetingsentenceline.TargetingSentenceLine',
+        api_type='EDGE',
+        param_types={
+            'discard_ages': 'bool',
+            'discard_placements': 'bool',
+            'targeting_spec': 'Targeting',
+        },
+    )
+
+    get_targeting_suggestions = ApiMethod(
+        method='GET',
+        endpoint='/targetingsuggestions',
+        target='adaccounttargetingunified.AdAccountTargetingUnified',
+        api_type='EDGE',
+        param_types={
+            'limit_type': 'limit_type_enum',
+            'targeting_list': 'list<Object>',
+        },
+        enums={
+            'limit_type_enum': 'adaccounttargetingunified.AdAccountTargetingUnified.LimitType',
+        },
+    )
+
+    get_targeting_validation = ApiMethod(
+        method='GET',
+        endpoint='/targetingvalidation',
+        target='adaccounttargetingunified.AdAccountTargetingUnified',
+        api_type='EDGE',
+        param_types={
+            'id_list': 'list<unsigned int>',
+            'name_list': 'list<string>',
+            'targeting_list': 'list<Object>',
+        },
+    )
+
+    get_transactions = ApiMethod(
+        method='GET',
+        endpoint='/transactions',
+        target='transaction.Transaction',
+        api_type='EDGE',
+        param_types={
+            'time_start': 'int',
+            'time_stop': 'int',
+        },
+    )
+
+    get_users = ApiMethod(
+        method='GET',
+        endpoint='/users',
+        target='adaccountuser.AdAccountUser',
+        api_type='EDGE',
+    )
+
     _field_types = {
         'account_groups': 'list<AdAccountGroupResult>',
         'account_id': 'string',
@@ -2403,3 +1167,104 @@ class AdAccount(
         field_enum_info['AccessType'] = AdAccount.AccessType.__dict__.values()
         field_enum_info['PermittedRoles'] = AdAccount.PermittedRoles.__dict__.values()
         return field_enum_info
+
+
+# Parameter types of the API calls above.
+_create_ad_image_params = ParamSchema(
+    param_types={
+        'bytes': 'string',
+        'copy_from': 'Object',
+        'zipbytes': 'string',
+    },
+)
+
+_create_ad_params = ParamSchema(
+    param_types={
+        'adlabels': 'list<Object>',
+        'adset_id': 'unsigned int',
+        'bid_amount': 'int',
+        'creative': 'AdCreative',
+        'date_format': 'string',
+        'display_sequence': 'unsigned int',
+        'execution_options': 'list<execution_options_enum>',
+        'name': 'string',
+        'redownload': 'bool',
+        'status': 'status_enum',
+        'tracking_specs': 'Object',
+    },
+    enums={
+        'execution_options_enum': 'ad.Ad.ExecutionOptions',
+        'status_enum': 'ad.Ad.Status',
+    },
+)
+
+_create_ad_video_params = ParamSchema(
+    param_types={
+        'composer_session_id': 'string',
+        'description': 'string',
+        'file_size': 'unsigned int',
+        'file_url': 'string',
+        'is_explicit_share': 'bool',
+        'manual_privacy': 'bool',
+        'name': 'string',
+        'og_action_type_id': 'string',
+        'og_icon_id': 'string',
+        'og_object_id': 'string',
+        'og_phrase': 'string',
+        'og_suggestion_mechanism': 'string',
+        'overwrite_id': 'string',
+        'referenced_sticker_id': 'string',
+        'slideshow_spec': 'map',
+        'start_offset': 'unsigned int',
+        'time_since_original_post': 'unsigned int',
+        'title': 'string',
+        'unpublished_content_type': 'unpublished_content_type_enum',
+        'upload_phase': 'upload_phase_enum',
+        'upload_session_id': 'string',
+        'video_file_chunk': 'string',
+    },
+    enums={
+        'unpublished_content_type_enum': [
+            'SCHEDULED',
+            'DRAFT',
+            'ADS_POST',
+        ],
+        'upload_phase_enum': [
+            'start',
+            'transfer',
+            'finish',
+            'cancel',
+        ],
+    },
+)
+
+_get_insights_params = ParamSchema(
+    param_types={
+        'action_attribution_windows': 'list<action_attribution_windows_enum>',
+        'action_breakdowns': 'list<action_breakdowns_enum>',
+        'action_report_time': 'action_report_time_enum',
+        'breakdowns': 'list<breakdowns_enum>',
+        'date_preset': 'date_preset_enum',
+        'default_summary': 'bool',
+        'fields': 'list<fields_enum>',
+        'filtering': 'list<Object>',
+        'level': 'level_enum',
+        'product_id_limit': 'int',
+        'sort': 'list<string>',
+        'summary': 'list<summary_enum>',
+        'summary_action_breakdowns': 'list<summary_action_breakdowns_enum>',
+        'time_increment': 'string',
+        'time_range': 'map',
+        'time_ranges': 'list<map>',
+    },
+    enums={
+        'action_attribution_windows_enum': 'adsinsights.AdsInsights.ActionAttributionWindows',
+        'action_breakdowns_enum': 'adsinsights.AdsInsights.ActionBreakdowns',
+        'action_report_time_enum': 'adsinsights.AdsInsights.ActionReportTime',
+        'breakdowns_enum': 'adsinsights.AdsInsights.Breakdowns',
+        'date_preset_enum': 'adsinsights.AdsInsights.DatePreset',
+        'summary_enum': 'adsinsights.AdsInsights.Summary',
+        'level_enum': 'adsinsights.AdsInsights.Level',
+        'summary_action_breakdowns_enum': 'adsinsights.AdsInsights.SummaryActionBreakdowns',
+    },
+)
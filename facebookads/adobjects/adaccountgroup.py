@@ -20,9 +20,7 @@
 
 from facebookads.adobjects.abstractobject import AbstractObject
 from facebookads.adobjects.abstractcrudobject import AbstractCrudObject
-from facebookads.adobjects.objectparser import ObjectParser
-from facebookads.api import FacebookRequest
-from facebookads.typechecker import TypeChecker
+from facebookads.adobjects.apimethod import ApiMethod
 
 """
 This class is auto-generated.
@@ -56,233 +54,83 @@ class AdAccountGroup(
         from facebookads.adobjects.adaccountuser import AdAccountUser
         return AdAccountUser(api=self._api, fbid=parent_id).create_ad_account_group(fields, params, batch, pending)
 
-    def api_delete(self, fields=None, params=None, batch=None, pending=False):
-        param_types = {
-        }
-        enums = {
-        }
-        request = FacebookRequest(
-            node_id=self['id'],
-            method='DELETE',
-            endpoint='/',
-            api=self._api,
-            param_checker=TypeChecker(param_types, enums),
-            target_class=AbstractCrudObject,
-            api_type='NODE',
-            response_parser=ObjectParser(reuse_object=self),
-        )
-        request.add_params(params)
-        request.add_fields(fields)
-
-        if batch is not None:
-            request.add_to_batch(batch)
-            return request
-        elif pending:
-            return request
-        else:
-            self.assure_call()
-            return request.execute()
-
-    def api_get(self, fields=None, params=None, batch=None, pending=False):
-        param_types = {
-        }
-        enums = {
-        }
-        request = FacebookRequest(
-            node_id=self['id'],
-            method='GET',
-            endpoint='/',
-            api=self._api,
-            param_checker=TypeChecker(param_types, enums),
-            target_class=AdAccountGroup,
-            api_type='NODE',
-            response_parser=ObjectParser(reuse_object=self),
-        )
-        request.add_params(params)
-        request.add_fields(fields)
-
-        if batch is not None:
-            request.add_to_batch(batch)
-            return request
-        elif pending:
-            return request
-        else:
-            self.assure_call()
-            return request.execute()
-
-    def api_update(self, fields=None, params=None, batch=None, pending=False):
-        param_types = {
+    api_delete = ApiMethod(
+        method='DELETE',
+        endpoint='/',
+        target='abstractcrudobject.AbstractCrudObject',
+        api_type='NODE',
+    )
+
+    api_get = ApiMethod(
+        method='GET',
+        endpoint='/',
+        target='adaccountgroup.AdAccountGroup',
+        api_type='NODE',
+    )
+
+    api_update = ApiMethod(
+        method='POST',
+        endpoint='/',
+        target='abstractcrudobject.AbstractCrudObject',
+        api_type='NODE',
+        param_types={
             'accounts': 'map',
             'name': 'string',
             'redownload': 'bool',
             'status': 'unsigned int',
             'users': 'map',
-        }
-        enums = {
-        }
-        request = FacebookRequest(
-            node_id=self['id'],
-            method='POST',
-            endpoint='/',
-            api=self._api,
-            param_checker=TypeChecker(param_types, enums),
-            target_class=AbstractCrudObject,
-            api_type='NODE',
-            response_parser=ObjectParser(reuse_object=self),
-        )
-        request.add_params(params)
-        request.add_fields(fields)
-
-        if batch is not None:
-            request.add_to_batch(batch)
-            return request
-        elif pending:
-            return request
-        else:
-            self.assure_call()
-            return request.execute()
-
-    def delete_ad_accounts(self, fields=None, params=None, batch=None, pending=False):
-        param_types = {
+        },
+    )
+
+    delete_ad_accounts = ApiMethod(
+        method='DELETE',
+        endpoint='/adaccounts',
+        target='abstractcrudobject.AbstractCrudObject',
+        api_type='EDGE',
+        param_types={
             'account_id': 'string',
-        }
-        enums = {
-        }
-        request = FacebookRequest(
-            node_id=self['id'],
-            method='DELETE',
-            endpoint='/adaccounts',
-            api=self._api,
-            param_checker=TypeChecker(param_types, enums),
-            target_class=AbstractCrudObject,
-            api_type='EDGE',
-            response_parser=ObjectParser(target_class=AbstractCrudObject),
-        )
-        request.add_params(params)
-        request.add_fields(fields)
-
-        if batch is not None:
-            request.add_to_batch(batch)
-            return request
-        elif pending:
-            return request
-        else:
-            self.assure_call()
-            return request.execute()
-
-    def get_ad_accounts(self, fields=None, params=None, batch=None, pending=False):
-        param_types = {
-        }
-        enums = {
-        }
-        request = FacebookRequest(
-            node_id=self['id'],
-            method='GET',
-            endpoint='/adaccounts',
-            api=self._api,
-            param_checker=TypeChecker(param_types, enums),
-            target_class=AbstractCrudObject,
-            api_type='EDGE',
-            response_parser=ObjectParser(target_class=AbstractCrudObject),
-        )
-        request.add_params(params)
-        request.add_fields(fields)
-
-        if batch is not None:
-            request.add_to_batch(batch)
-            return request
-        elif pending:
-            return request
-        else:
-            self.assure_call()
-            return request.execute()
-
-    def create_ad_account(self, fields=None, params=None, batch=None, pending=False):
-        param_types = {
+        },
+    )
+
+    get_ad_accounts = ApiMethod(
+        method='GET',
+        endpoint='/adaccounts',
+        target='abstractcrudobject.AbstractCrudObject',
+        api_type='EDGE',
+    )
+
+    create_ad_account = ApiMethod(
+        method='POST',
+        endpoint='/adaccounts',
+        target='abstractcrudobject.AbstractCrudObject',
+        api_type='EDGE',
+        param_types={
             'account_ids': 'list<string>',
             'redownload': 'bool',
-        }
-        enums = {
-        }
-        request = FacebookRequest(
-            node_id=self['id'],
-            method='POST',
-            endpoint='/adaccounts',
-            api=self._api,
-            param_checker=TypeChecker(param_types, enums),
-            target_class=AbstractCrudObject,
-            api_type='EDGE',
-            response_parser=ObjectParser(target_class=AbstractCrudObject),
-        )
-        request.add_params(params)
-        request.add_fields(fields)
-
-        if batch is not None:
-            request.add_to_batch(batch)
-            return request
-        elif pending:
-            return request
-        else:
-            self.assure_call()
-            return request.execute()
-
-    def delete_users(self, fields=None, params=None, batch=None, pending=False):
-        param_types = {
+        },
+    )
+
+    delete_users = ApiMethod(
+        method='DELETE',
+        endpoint='/users',
+        target='abstractcrudobject.AbstractCrudObject',
+        api_type='EDGE',
+        param_types={
             'redownload': 'bool',
             'uid': 'int',
-        }
-        enums = {
-        }
-        request = FacebookRequest(
-            node_id=self['id'],
-            method='DELETE',
-            endpoint='/users',
-            api=self._api,
-            param_checker=TypeChecker(param_types, enums),
-            target_class=AbstractCrudObject,
-            api_type='EDGE',
-            response_parser=ObjectParser(target_class=AbstractCrudObject),
-        )
-        request.add_params(params)
-        request.add_fields(fields)
-
-        if batch is not None:
-            request.add_to_batch(batch)
-            return request
-        elif pending:
-            return request
-        else:
-            self.assure_call()
-            return request.execute()
-
-    def create_user(self, fields=None, params=None, batch=None, pending=False):
-        param_types = {
+        },
+    )
+
+    create_user = ApiMethod(
+        method='POST',
+        endpoint='/users',
+        target='abstractcrudobject.AbstractCrudObject',
+        api_type='EDGE',
+        param_types={
             'account_group_roles': 'list<map>',
             'redownload': 'bool',
-        }
-        enums = {
-        }
-        request = FacebookRequest(
-            node_id=self['id'],
-            method='POST',
-            endpoint='/users',
-            api=self._api,
-            param_checker=TypeChecker(param_types, enums),
-            target_class=AbstractCrudObject,
-            api_type='EDGE',
-            response_parser=ObjectParser(target_class=AbstractCrudObject),
-        )
-        request.add_params(params)
-        request.add_fields(fields)
-
-        if batch is not None:
-            request.add_to_batch(batch)
-            return request
-        elif pending:
-            return request
-        else:
-            self.assure_call()
-            return request.execute()
+        },
+    )
 
     _field_types = {
         'account_group_id': 'string',
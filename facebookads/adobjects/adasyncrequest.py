@@ -20,9 +20,7 @@
 
 from facebookads.adobjects.abstractobject import AbstractObject
 from facebookads.adobjects.abstractcrudobject import AbstractCrudObject
-from facebookads.adobjects.objectparser import ObjectParser
-from facebookads.api import FacebookRequest
-from facebookads.typechecker import TypeChecker
+from facebookads.adobjects.apimethod import ApiMethod
 
 """
 This class is auto-generated.
@@ -72,32 +70,12 @@ class AdAsyncRequest(
         error_dependency = 'ERROR_DEPENDENCY'
         error_conflicts = 'ERROR_CONFLICTS'
 
-    def api_get(self, fields=None, params=None, batch=None, pending=False):
-        param_types = {
-        }
-        enums = {
-        }
-        request = FacebookRequest(
-            node_id=self['id'],
-            method='GET',
-            endpoint='/',
-            api=self._api,
-            param_checker=TypeChecker(param_types, enums),
-            target_class=AdAsyncRequest,
-            api_type='NODE',
-            response_parser=ObjectParser(reuse_object=self),
-        )
-        request.add_params(params)
-        request.add_fields(fields)
-
-        if batch is not None:
-            request.add_to_batch(batch)
-            return request
-        elif pending:
-            return request
-        else:
-            self.assure_call()
-            return request.execute()
+    api_get = ApiMethod(
+        method='GET',
+        endpoint='/',
+        target='adasyncrequest.AdAsyncRequest',
+        api_type='NODE',
+    )
 
     _field_types = {
         'async_request_set': 'AdAsyncRequestSet',
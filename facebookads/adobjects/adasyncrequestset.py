@@ -20,9 +20,7 @@
 
 from facebookads.adobjects.abstractobject import AbstractObject
 from facebookads.adobjects.abstractcrudobject import AbstractCrudObject
-from facebookads.adobjects.objectparser import ObjectParser
-from facebookads.api import FacebookRequest
-from facebookads.typechecker import TypeChecker
+from facebookads.adobjects.apimethod import ApiMethod
 
 """
 This class is auto-generated.
@@ -76,62 +74,25 @@ class AdAsyncRequestSet(
         from facebookads.adobjects.adaccount import AdAccount
         return AdAccount(api=self._api, fbid=parent_id).create_async_ad_request_set(fields, params, batch, pending)
 
-    def api_get(self, fields=None, params=None, batch=None, pending=False):
-        param_types = {
-        }
-        enums = {
-        }
-        request = FacebookRequest(
-            node_id=self['id'],
-            method='GET',
-            endpoint='/',
-            api=self._api,
-            param_checker=TypeChecker(param_types, enums),
-            target_class=AdAsyncRequestSet,
-            api_type='NODE',
-            response_parser=ObjectParser(reuse_object=self),
-        )
-        request.add_params(params)
-        request.add_fields(fields)
-
-        if batch is not None:
-            request.add_to_batch(batch)
-            return request
-        elif pending:
-            return request
-        else:
-            self.assure_call()
-            return request.execute()
-
-    def get_requests(self, fields=None, params=None, batch=None, pending=False):
-        from facebookads.adobjects.adasyncrequest import AdAsyncRequest
-        param_types = {
+    api_get = ApiMethod(
+        method='GET',
+        endpoint='/',
+        target='adasyncrequestset.AdAsyncRequestSet',
+        api_type='NODE',
+    )
+
+    get_requests = ApiMethod(
+        method='GET',
+        endpoint='/requests',
+        target='adasyncrequest.AdAsyncRequest',
+        api_type='EDGE',
+        param_types={
             'statuses': 'list<statuses_enum>',
-        }
-        enums = {
-            'statuses_enum': AdAsyncRequest.Statuses.__dict__.values(),
-        }
-        request = FacebookRequest(
-            node_id=self['id'],
-            method='GET',
-            endpoint='/requests',
-            api=self._api,
-            param_checker=TypeChecker(param_types, enums),
-            target_class=AdAsyncRequest,
-            api_type='EDGE',
-            response_parser=ObjectParser(target_class=AdAsyncRequest),
-        )
-        request.add_params(params)
-        request.add_fields(fields)
-
-        if batch is not None:
-            request.add_to_batch(batch)
-            return request
-        elif pending:
-            return request
-        else:
-            self.assure_call()
-            return request.execute()
+        },
+        enums={
+            'statuses_enum': 'adasyncrequest.AdAsyncRequest.Statuses',
+        },
+    )
 
     _field_types = {
         'canceled_count': 'int',
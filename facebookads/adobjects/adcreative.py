@@ -20,9 +20,7 @@
 
 from facebookads.adobjects.abstractobject import AbstractObject
 from facebookads.adobjects.abstractcrudobject import AbstractCrudObject
-from facebookads.adobjects.objectparser import ObjectParser
-from facebookads.api import FacebookRequest
-from facebookads.typechecker import TypeChecker
+from facebookads.adobjects.apimethod import ApiMethod
 from facebookads.mixins import HasAdLabels
 
 """
@@ -153,157 +151,69 @@ class AdCreative(
         from facebookads.adobjects.adaccount import AdAccount
         return AdAccount(api=self._api, fbid=parent_id).create_ad_creative(fields, params, batch, pending)
 
-    def api_delete(self, fields=None, params=None, batch=None, pending=False):
-        param_types = {
+    api_delete = ApiMethod(
+        method='DELETE',
+        endpoint='/',
+        target='abstractcrudobject.AbstractCrudObject',
+        api_type='NODE',
+        param_types={
             'account_id': 'string',
             'adlabels': 'list<Object>',
             'name': 'string',
             'run_status': 'unsigned int',
-        }
-        enums = {
-        }
-        request = FacebookRequest(
-            node_id=self['id'],
-            method='DELETE',
-            endpoint='/',
-            api=self._api,
-            param_checker=TypeChecker(param_types, enums),
-            target_class=AbstractCrudObject,
-            api_type='NODE',
-            response_parser=ObjectParser(reuse_object=self),
-        )
-        request.add_params(params)
-        request.add_fields(fields)
-
-        if batch is not None:
-            request.add_to_batch(batch)
-            return request
-        elif pending:
-            return request
-        else:
-            self.assure_call()
-            return request.execute()
-
-    def api_get(self, fields=None, params=None, batch=None, pending=False):
-        param_types = {
+        },
+    )
+
+    api_get = ApiMethod(
+        method='GET',
+        endpoint='/',
+        target='adcreative.AdCreative',
+        api_type='NODE',
+        param_types={
             'thumbnail_height': 'unsigned int',
             'thumbnail_width': 'unsigned int',
-        }
-        enums = {
-        }
-        request = FacebookRequest(
-            node_id=self['id'],
-            method='GET',
-            endpoint='/',
-            api=self._api,
-            param_checker=TypeChecker(param_types, enums),
-            target_class=AdCreative,
-            api_type='NODE',
-            response_parser=ObjectParser(reuse_object=self),
-        )
-        request.add_params(params)
-        request.add_fields(fields)
-
-        if batch is not None:
-            request.add_to_batch(batch)
-            return request
-        elif pending:
-            return request
-        else:
-            self.assure_call()
-            return request.execute()
-
-    def api_update(self, fields=None, params=None, batch=None, pending=False):
-        param_types = {
+        },
+    )
+
+    api_update = ApiMethod(
+        method='POST',
+        endpoint='/',
+        target='adcreative.AdCreative',
+        api_type='NODE',
+        param_types={
             'account_id': 'string',
             'adlabels': 'list<Object>',
             'name': 'string',
             'run_status': 'unsigned int',
-        }
-        enums = {
-        }
-        request = FacebookRequest(
-            node_id=self['id'],
-            method='POST',
-            endpoint='/',
-            api=self._api,
-            param_checker=TypeChecker(param_types, enums),
-            target_class=AdCreative,
-            api_type='NODE',
-            response_parser=ObjectParser(reuse_object=self),
-        )
-        request.add_params(params)
-        request.add_fields(fields)
-
-        if batch is not None:
-            request.add_to_batch(batch)
-            return request
-        elif pending:
-            return request
-        else:
-            self.assure_call()
-            return request.execute()
-
-    def delete_ad_labels(self, fields=None, params=None, batch=None, pending=False):
-        param_types = {
+        },
+    )
+
+    delete_ad_labels = ApiMethod(
+        method='DELETE',
+        endpoint='/adlabels',
+        target='abstractcrudobject.AbstractCrudObject',
+        api_type='EDGE',
+        param_types={
             'adlabels': 'list<Object>',
-        }
-        enums = {
-        }
-        request = FacebookRequest(
-            node_id=self['id'],
-            method='DELETE',
-            endpoint='/adlabels',
-            api=self._api,
-            param_checker=TypeChecker(param_types, enums),
-            target_class=AbstractCrudObject,
-            api_type='EDGE',
-            response_parser=ObjectParser(target_class=AbstractCrudObject),
-        )
-        request.add_params(params)
-        request.add_fields(fields)
-
-        if batch is not None:
-            request.add_to_batch(batch)
-            return request
-        elif pending:
-            return request
-        else:
-            self.assure_call()
-            return request.execute()
-
-    def create_ad_label(self, fields=None, params=None, batch=None, pending=False):
-        from facebookads.adobjects.adlabel import AdLabel
-        param_types = {
+        },
+    )
+
+    create_ad_label = ApiMethod(
+        method='POST',
+        endpoint='/adlabels',
+        target='adlabel.AdLabel',
+        api_type='EDGE',
+        param_types={
             'adlabels': 'list<Object>',
-        }
-        enums = {
-        }
-        request = FacebookRequest(
-            node_id=self['id'],
-            method='POST',
-            endpoint='/adlabels',
-            api=self._api,
-            param_checker=TypeChecker(param_types, enums),
-            target_class=AdLabel,
-            api_type='EDGE',
-            response_parser=ObjectParser(target_class=AdLabel),
-        )
-        request.add_params(params)
-        request.add_fields(fields)
-
-        if batch is not None:
-            request.add_to_batch(batch)
-            return request
-        elif pending:
-            return request
-        else:
-            self.assure_call()
-            return request.execute()
-
-    def get_previews(self, fields=None, params=None, batch=None, pending=False):
-        from facebookads.adobjects.adpreview import AdPreview
-        param_types = {
+        },
+    )
+
+    get_previews = ApiMethod(
+        method='GET',
+        endpoint='/previews',
+        target='adpreview.AdPreview',
+        api_type='EDGE',
+        param_types={
             'ad_format': 'ad_format_enum',
             'dynamic_creative_spec': 'Object',
             'height': 'unsigned int',
@@ -312,31 +222,11 @@ class AdCreative(
             'post': 'Object',
             'product_item_ids': 'list<string>',
             'width': 'unsigned int',
-        }
-        enums = {
-            'ad_format_enum': AdPreview.AdFormat.__dict__.values(),
-        }
-        request = FacebookRequest(
-            node_id=self['id'],
-            method='GET',
-            endpoint='/previews',
-            api=self._api,
-            param_checker=TypeChecker(param_types, enums),
-            target_class=AdPreview,
-            api_type='EDGE',
-            response_parser=ObjectParser(target_class=AdPreview),
-        )
-        request.add_params(params)
-        request.add_fields(fields)
-
-        if batch is not None:
-            request.add_to_batch(batch)
-            return request
-        elif pending:
-            return request
-        else:
-            self.assure_call()
-            return request.execute()
+        },
+        enums={
+            'ad_format_enum': 'adpreview.AdPreview.AdFormat',
+        },
+    )
 
     _field_types = {
         'actor_id': 'string',
@@ -20,9 +20,7 @@
 
 from facebookads.adobjects.abstractobject import AbstractObject
 from facebookads.adobjects.abstractcrudobject import AbstractCrudObject
-from facebookads.adobjects.objectparser import ObjectParser
-from facebookads.api import FacebookRequest
-from facebookads.typechecker import TypeChecker
+from facebookads.adobjects.apimethod import ApiMethod
 
 """
 This class is auto-generated.
@@ -58,199 +56,57 @@ class AdLabel(
         from facebookads.adobjects.adaccount import AdAccount
         return AdAccount(api=self._api, fbid=parent_id).create_ad_label(fields, params, batch, pending)
 
-    def api_delete(self, fields=None, params=None, batch=None, pending=False):
-        param_types = {
-        }
-        enums = {
-        }
-        request = FacebookRequest(
-            node_id=self['id'],
-            method='DELETE',
-            endpoint='/',
-            api=self._api,
-            param_checker=TypeChecker(param_types, enums),
-            target_class=AbstractCrudObject,
-            api_type='NODE',
-            response_parser=ObjectParser(reuse_object=self),
-        )
-        request.add_params(params)
-        request.add_fields(fields)
-
-        if batch is not None:
-            request.add_to_batch(batch)
-            return request
-        elif pending:
-            return request
-        else:
-            self.assure_call()
-            return request.execute()
-
-    def api_get(self, fields=None, params=None, batch=None, pending=False):
-        param_types = {
-        }
-        enums = {
-        }
-        request = FacebookRequest(
-            node_id=self['id'],
-            method='GET',
-            endpoint='/',
-            api=self._api,
-            param_checker=TypeChecker(param_types, enums),
-            target_class=AdLabel,
-            api_type='NODE',
-            response_parser=ObjectParser(reuse_object=self),
-        )
-        request.add_params(params)
-        request.add_fields(fields)
-
-        if batch is not None:
-            request.add_to_batch(batch)
-            return request
-        elif pending:
-            return request
-        else:
-            self.assure_call()
-            return request.execute()
-
-    def api_update(self, fields=None, params=None, batch=None, pending=False):
-        param_types = {
+    api_delete = ApiMethod(
+        method='DELETE',
+        endpoint='/',
+        target='abstractcrudobject.AbstractCrudObject',
+        api_type='NODE',
+    )
+
+    api_get = ApiMethod(
+        method='GET',
+        endpoint='/',
+        target='adlabel.AdLabel',
+        api_type='NODE',
+    )
+
+    api_update = ApiMethod(
+        method='POST',
+        endpoint='/',
+        target='adlabel.AdLabel',
+        api_type='NODE',
+        param_types={
             'name': 'string',
-        }
-        enums = {
-        }
-        request = FacebookRequest(
-            node_id=self['id'],
-            method='POST',
-            endpoint='/',
-            api=self._api,
-            param_checker=TypeChecker(param_types, enums),
-            target_class=AdLabel,
-            api_type='NODE',
-            response_parser=ObjectParser(reuse_object=self),
-        )
-        request.add_params(params)
-        request.add_fields(fields)
-
-        if batch is not None:
-            request.add_to_batch(batch)
-            return request
-        elif pending:
-            return request
-        else:
-            self.assure_call()
-            return request.execute()
-
-    def get_ad_creatives(self, fields=None, params=None, batch=None, pending=False):
-        from facebookads.adobjects.adcreative import AdCreative
-        param_types = {
-        }
-        enums = {
-        }
-        request = FacebookRequest(
-            node_id=self['id'],
-            method='GET',
-            endpoint='/adcreatives',
-            api=self._api,
-            param_checker=TypeChecker(param_types, enums),
-            target_class=AdCreative,
-            api_type='EDGE',
-            response_parser=ObjectParser(target_class=AdCreative),
-        )
-        request.add_params(params)
-        request.add_fields(fields)
-
-        if batch is not None:
-            request.add_to_batch(batch)
-            return request
-        elif pending:
-            return request
-        else:
-            self.assure_call()
-            return request.execute()
-
-    def get_ads(self, fields=None, params=None, batch=None, pending=False):
-        from facebookads.adobjects.ad import Ad
-        param_types = {
-        }
-        enums = {
-        }
-        request = FacebookRequest(
-            node_id=self['id'],
-            method='GET',
-            endpoint='/ads',
-            api=self._api,
-            param_checker=TypeChecker(param_types, enums),
-            target_class=Ad,
-            api_type='EDGE',
-            response_parser=ObjectParser(target_class=Ad),
-        )
-        request.add_params(params)
-        request.add_fields(fields)
-
-        if batch is not None:
-            request.add_to_batch(batch)
-            return request
-        elif pending:
-            return request
-        else:
-            self.assure_call()
-            return request.execute()
-
-    def get_ad_sets(self, fields=None, params=None, batch=None, pending=False):
-        from facebookads.adobjects.adset import AdSet
-        param_types = {
-        }
-        enums = {
-        }
-        request = FacebookRequest(
-            node_id=self['id'],
-            method='GET',
-            endpoint='/adsets',
-            api=self._api,
-            param_checker=TypeChecker(param_types, enums),
-            target_class=AdSet,
-            api_type='EDGE',
-            response_parser=ObjectParser(target_class=AdSet),
-        )
-        request.add_params(params)
-        request.add_fields(fields)
-
-        if batch is not None:
-            request.add_to_batch(batch)
-            return request
-        elif pending:
-            return request
-        else:
-            self.assure_call()
-            return request.execute()
-
-    def get_campaigns(self, fields=None, params=None, batch=None, pending=False):
-        from facebookads.adobjects.campaign import Campaign
-        param_types = {
-        }
-        enums = {
-        }
-        request = FacebookRequest(
-            node_id=self['id'],
-            method='GET',
-            endpoint='/campaigns',
-            api=self._api,
-            param_checker=TypeChecker(param_types, enums),
-            target_class=Campaign,
-            api_type='EDGE',
-            response_parser=ObjectParser(target_class=Campaign),
-        )
-        request.add_params(params)
-        request.add_fields(fields)
-
-        if batch is not None:
-            request.add_to_batch(batch)
-            return request
-        elif pending:
-            return request
-        else:
-            self.assure_call()
-            return request.execute()
+        },
+    )
+
+    get_ad_creatives = ApiMethod(
+        method='GET',
+        endpoint='/adcreatives',
+        target='adcreative.AdCreative',
+        api_type='EDGE',
+    )
+
+    get_ads = ApiMethod(
+        method='GET',
+        endpoint='/ads',
+        target='ad.Ad',
+        api_type='EDGE',
+    )
+
+    get_ad_sets = ApiMethod(
+        method='GET',
+        endpoint='/adsets',
+        target='adset.AdSet',
+        api_type='EDGE',
+    )
+
+    get_campaigns = ApiMethod(
+        method='GET',
+        endpoint='/campaigns',
+        target='campaign.Campaign',
+        api_type='EDGE',
+    )
 
     _field_types = {
         'account': 'AdAccount',
@@ -21,8 +21,9 @@
 from facebookads.adobjects.abstractobject import AbstractObject
 from facebookads.adobjects.abstractcrudobject import AbstractCrudObject
 from facebookads.adobjects.objectparser import ObjectParser
+from facebookads.adobjects.apimethod import ApiMethod
 from facebookads.api import FacebookRequest
-from facebookads.typechecker import TypeChecker
+from facebookads.typechecker import ParamSchema
 from facebookads.adobjects.helpers.adreportrunmixin import AdReportRunMixin
 
 """
@@ -81,53 +82,23 @@ class AdReportRun(
         from facebookads.adobjects.adaccount import AdAccount
         return AdAccount(api=self._api, fbid=parent_id).get_insights_async(fields, params, batch, pending)
 
-    def api_get(self, fields=None, params=None, batch=None, pending=False):
-        param_types = {
-        }
-        enums = {
-        }
-        request = FacebookRequest(
-            node_id=self['id'],
-            method='GET',
-            endpoint='/',
-            api=self._api,
-            param_checker=TypeChecker(param_types, enums),
-            target_class=AdReportRun,
-            api_type='NODE',
-            response_parser=ObjectParser(reuse_object=self),
-        )
-        request.add_params(params)
-        request.add_fields(fields)
-
-        if batch is not None:
-            request.add_to_batch(batch)
-            return request
-        elif pending:
-            return request
-        else:
-            self.assure_call()
-            return request.execute()
+    api_get = ApiMethod(
+        method='GET',
+        endpoint='/',
+        target='adreportrun.AdReportRun',
+        api_type='NODE',
+    )
 
     def get_insights(self, fields=None, params=None, async=False, batch=None, pending=False):
         from facebookads.adobjects.adsinsights import AdsInsights
         if async:
           return self.get_insights_async(fields, params, batch, pending)
-        param_types = {
-            'default_summary': 'bool',
-            'fields': 'list<fields_enum>',
-            'filtering': 'list<Object>',
-            'sort': 'list<string>',
-            'summary': 'list<summary_enum>',
-        }
-        enums = {
-            'summary_enum': AdsInsights.Summary.__dict__.values(),
-        }
         request = FacebookRequest(
             node_id=self['id'],
             method='GET',
             endpoint='/insights',
             api=self._api,
-            param_checker=TypeChecker(param_types, enums),
+            param_checker=_get_insights_params.get_checker(),
             target_class=AdsInsights,
             api_type='EDGE',
             response_parser=ObjectParser(target_class=AdsInsights),
@@ -181,3 +152,18 @@ class AdReportRun(
     def _get_field_enum_info(cls):
         field_enum_info = {}
         return field_enum_info
+
+
+# Parameter types of the API calls above.
+_get_insights_params = ParamSchema(
+    param_types={
+        'default_summary': 'bool',
+        'fields': 'list<fields_enum>',
+        'filtering': 'list<Object>',
+        'sort': 'list<string>',
+        'summary': 'list<summary_enum>',
+    },
+    enums={
+        'summary_enum': 'adsinsights.AdsInsights.Summary',
+    },
+)
@@ -20,9 +20,7 @@
 
 from facebookads.adobjects.abstractobject import AbstractObject
 from facebookads.adobjects.abstractcrudobject import AbstractCrudObject
-from facebookads.adobjects.objectparser import ObjectParser
-from facebookads.api import FacebookRequest
-from facebookads.typechecker import TypeChecker
+from facebookads.adobjects.apimethod import ApiMethod
 from facebookads.adobjects.helpers.adspixelmixin import AdsPixelMixin
 
 """
@@ -59,178 +57,62 @@ class AdsPixel(
         from facebookads.adobjects.adaccount import AdAccount
         return AdAccount(api=self._api, fbid=parent_id).create_ads_pixel(fields, params, batch, pending)
 
-    def api_get(self, fields=None, params=None, batch=None, pending=False):
-        param_types = {
-        }
-        enums = {
-        }
-        request = FacebookRequest(
-            node_id=self['id'],
-            method='GET',
-            endpoint='/',
-            api=self._api,
-            param_checker=TypeChecker(param_types, enums),
-            target_class=AdsPixel,
-            api_type='NODE',
-            response_parser=ObjectParser(reuse_object=self),
-        )
-        request.add_params(params)
-        request.add_fields(fields)
-
-        if batch is not None:
-            request.add_to_batch(batch)
-            return request
-        elif pending:
-            return request
-        else:
-            self.assure_call()
-            return request.execute()
-
-    def api_update(self, fields=None, params=None, batch=None, pending=False):
-        param_types = {
+    api_get = ApiMethod(
+        method='GET',
+        endpoint='/',
+        target='adspixel.AdsPixel',
+        api_type='NODE',
+    )
+
+    api_update = ApiMethod(
+        method='POST',
+        endpoint='/',
+        target='adspixel.AdsPixel',
+        api_type='NODE',
+        param_types={
             'name': 'string',
-        }
-        enums = {
-        }
-        request = FacebookRequest(
-            node_id=self['id'],
-            method='POST',
-            endpoint='/',
-            api=self._api,
-            param_checker=TypeChecker(param_types, enums),
-            target_class=AdsPixel,
-            api_type='NODE',
-            response_parser=ObjectParser(reuse_object=self),
-        )
-        request.add_params(params)
-        request.add_fields(fields)
-
-        if batch is not None:
-            request.add_to_batch(batch)
-            return request
-        elif pending:
-            return request
-        else:
-            self.assure_call()
-            return request.execute()
-
-    def get_audiences(self, fields=None, params=None, batch=None, pending=False):
-        from facebookads.adobjects.customaudience import CustomAudience
-        param_types = {
-        }
-        enums = {
-        }
-        request = FacebookRequest(
-            node_id=self['id'],
-            method='GET',
-            endpoint='/audiences',
-            api=self._api,
-            param_checker=TypeChecker(param_types, enums),
-            target_class=CustomAudience,
-            api_type='EDGE',
-            response_parser=ObjectParser(target_class=CustomAudience),
-        )
-        request.add_params(params)
-        request.add_fields(fields)
-
-        if batch is not None:
-            request.add_to_batch(batch)
-            return request
-        elif pending:
-            return request
-        else:
-            self.assure_call()
-            return request.execute()
-
-    def get_shared_accounts(self, fields=None, params=None, batch=None, pending=False):
-        from facebookads.adobjects.adaccount import AdAccount
-        param_types = {
+        },
+    )
+
+    get_audiences = ApiMethod(
+        method='GET',
+        endpoint='/audiences',
+        target='customaudience.CustomAudience',
+        api_type='EDGE',
+    )
+
+    get_shared_accounts = ApiMethod(
+        method='GET',
+        endpoint='/shared_accounts',
+        target='adaccount.AdAccount',
+        api_type='EDGE',
+        param_types={
             'business': 'string',
-        }
-        enums = {
-        }
-        request = FacebookRequest(
-            node_id=self['id'],
-            method='GET',
-            endpoint='/shared_accounts',
-            api=self._api,
-            param_checker=TypeChecker(param_types, enums),
-            target_class=AdAccount,
-            api_type='EDGE',
-            response_parser=ObjectParser(target_class=AdAccount),
-        )
-        request.add_params(params)
-        request.add_fields(fields)
-
-        if batch is not None:
-            request.add_to_batch(batch)
-            return request
-        elif pending:
-            return request
-        else:
-            self.assure_call()
-            return request.execute()
-
-    def get_shared_agencies(self, fields=None, params=None, batch=None, pending=False):
-        from facebookads.adobjects.business import Business
-        param_types = {
-        }
-        enums = {
-        }
-        request = FacebookRequest(
-            node_id=self['id'],
-            method='GET',
-            endpoint='/shared_agencies',
-            api=self._api,
-            param_checker=TypeChecker(param_types, enums),
-            target_class=Business,
-            api_type='EDGE',
-            response_parser=ObjectParser(target_class=Business),
-        )
-        request.add_params(params)
-        request.add_fields(fields)
-
-        if batch is not None:
-            request.add_to_batch(batch)
-            return request
-        elif pending:
-            return request
-        else:
-            self.assure_call()
-            return request.execute()
-
-    def get_stats(self, fields=None, params=None, batch=None, pending=False):
-        from facebookads.adobjects.adspixelstatsresult import AdsPixelStatsResult
-        param_types = {
+        },
+    )
+
+    get_shared_agencies = ApiMethod(
+        method='GET',
+        endpoint='/shared_agencies',
+        target='business.Business',
+        api_type='EDGE',
+    )
+
+    get_stats = ApiMethod(
+        method='GET',
+        endpoint='/stats',
+        target='adspixelstatsresult.AdsPixelStatsResult',
+        api_type='EDGE',
+        param_types={
             'aggregation': 'aggregation_enum',
             'end_time': 'datetime',
             'event': 'string',
             'start_time': 'datetime',
-        }
-        enums = {
-            'aggregation_enum': AdsPixelStatsResult.Aggregation.__dict__.values(),
-        }
-        request = FacebookRequest(
-            node_id=self['id'],
-            method='GET',
-            endpoint='/stats',
-            api=self._api,
-            param_checker=TypeChecker(param_types, enums),
-            target_class=AdsPixelStatsResult,
-            api_type='EDGE',
-            response_parser=ObjectParser(target_class=AdsPixelStatsResult),
-        )
-        request.add_params(params)
-        request.add_fields(fields)
-
-        if batch is not None:
-            request.add_to_batch(batch)
-            return request
-        elif pending:
-            return request
-        else:
-            self.assure_call()
-            return request.execute()
+        },
+        enums={
+            'aggregation_enum': 'adspixelstatsresult.AdsPixelStatsResult.Aggregation',
+        },
+    )
 
     _field_types = {
         'code': 'string',
@@ -0,0 +1,144 @@
+# Copyright 2014 Facebook, Inc.
+
+# You are hereby granted a non-exclusive, worldwide, royalty-free license to
+# use, copy, modify, and distribute this software in source code or binary
+# form for use in connection with the web services and APIs provided by
+# Facebook.
+
+# As with any software that integrates with the Facebook platform, your use
+# of this software is subject to the Facebook Developer Principles and
+# Policies [http://developers.facebook.com/policy/]. This copyright notice
+# shall be included in all copies or substantial portions of the software.
+
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL
+# THE AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING
+# FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER
+# DEALINGS IN THE SOFTWARE.
+
+from facebookads.adobjects.objectparser import ObjectParser
+from facebookads.api import FacebookRequest
+from facebookads.typechecker import ParamSchema
+
+import importlib
+import threading
+
+
+class ApiMethod(object):
+
+    """
+    Describes a generated node or edge API method as data.
+    Generated classes declare most of their methods as ApiMethod attributes
+    rather than spelling out the same request boilerplate in each of them.
+    The method is only turned into a function the first time it is looked
+    up, and that function then replaces the descriptor on the class, so
+    calls cost the same as a handwritten method. It keeps the generated
+    signature: (self, fields=None, params=None, batch=None, pending=False).
+    """
+
+    _install_lock = threading.Lock()
+
+    def __init__(
+        self,
+        method,
+        endpoint,
+        target,
+        api_type,
+        param_types=None,
+        enums=None,
+        allow_file_upload=False,
+        include_summary=True,
+    ):
+        """
+        Args:
+            method: The HTTP method of the call.
+            endpoint: The edge of the call, '/' for the node itself.
+            target: The return class of the call, as a 'module.Class' path
+                under facebookads.adobjects. It is imported on first call.
+            api_type: NODE or EDGE. NODE calls parse the response into the
+                object the method was called on.
+            param_types (optional): The param types of the call.
+            enums (optional): The enums used by param_types, see ParamSchema.
+            allow_file_upload (optional): Whether the call allows upload.
+            include_summary (optional): Include "summary".
+        """
+        self._method = method
+        self._endpoint = endpoint
+        self._target = target
+        self._target_class = None
+        self._function = None
+        self._api_type = api_type
+        self._schema = ParamSchema(param_types or {}, enums)
+        self._allow_file_upload = allow_file_upload
+        self._include_summary = include_summary
+
+    def __get__(self, instance, owner):
+        function = self._function or self._install(owner)
+        return function.__get__(instance, owner)
+
+    def _install(self, owner):
+        with self._install_lock:
+            if self._function is not None:
+                return self._function
+            for cls in owner.__mro__:
+                for name, value in list(vars(cls).items()):
+                    if value is self:
+                        self._function = self._create_function(cls, name)
+                        setattr(cls, name, self._function)
+                        return self._function
+        raise AttributeError('ApiMethod is not an attribute of ' +
+                             owner.__name__)
+
+    def _create_function(self, cls, name):
+        api_method = self
+
+        def method(self, fields=None, params=None, batch=None, pending=False):
+            request = api_method.create_request(self)
+            request.add_params(params)
+            request.add_fields(fields)
+
+            if batch is not None:
+                request.add_to_batch(batch)
+                return request
+            elif pending:
+                return request
+            else:
+                self.assure_call()
+                return request.execute()
+
+        method.__name__ = name
+        method.__module__ = cls.__module__
+        if hasattr(cls, '__qualname__'):
+            method.__qualname__ = cls.__qualname__ + '.' + name
+        return method
+
+    def get_target_class(self):
+        """Returns the return class of the call."""
+        if self._target_class is None:
+            module_name, _, class_name = self._target.partition('.')
+            module = importlib.import_module(
+                'facebookads.adobjects.' + module_name)
+            self._target_class = getattr(module, class_name)
+        return self._target_class
+
+    def create_request(self, node):
+        """Returns a FacebookRequest of this call on node."""
+        target_class = self.get_target_class()
+        if self._api_type == 'NODE':
+            response_parser = ObjectParser(reuse_object=node)
+        else:
+            response_parser = ObjectParser(target_class=target_class)
+        return FacebookRequest(
+            node_id=node['id'],
+            method=self._method,
+            endpoint=self._endpoint,
+            api=node._api,
+            param_checker=self._schema.get_checker(),
+            target_class=target_class,
+            api_type=self._api_type,
+            allow_file_upload=self._allow_file_upload,
+            response_parser=response_parser,
+            include_summary=self._include_summary,
+        )
@@ -20,9 +20,7 @@
 
 from facebookads.adobjects.abstractobject import AbstractObject
 from facebookads.adobjects.abstractcrudobject import AbstractCrudObject
-from facebookads.adobjects.objectparser import ObjectParser
-from facebookads.api import FacebookRequest
-from facebookads.typechecker import TypeChecker
+from facebookads.adobjects.apimethod import ApiMethod
 from facebookads.adobjects.helpers.businessmixin import BusinessMixin
 
 """
@@ -62,36 +60,19 @@ class Business(
         payment_account_id = 'payment_account_id'
         primary_page = 'primary_page'
 
-    def api_get(self, fields=None, params=None, batch=None, pending=False):
-        param_types = {
-        }
-        enums = {
-        }
-        request = FacebookRequest(
-            node_id=self['id'],
-            method='GET',
-            endpoint='/',
-            api=self._api,
-            param_checker=TypeChecker(param_types, enums),
-            target_class=Business,
-            api_type='NODE',
-            response_parser=ObjectParser(reuse_object=self),
-        )
-        request.add_params(params)
-        request.add_fields(fields)
-
-        if batch is not None:
-            request.add_to_batch(batch)
-            return request
-        elif pending:
-            return request
-        else:
-            self.assure_call()
-            return request.execute()
-
-    def create_ad_account(self, fields=None, params=None, batch=None, pending=False):
-        from facebookads.adobjects.adaccount import AdAccount
-        param_types = {
+    api_get = ApiMethod(
+        method='GET',
+        endpoint='/',
+        target='business.Business',
+        api_type='NODE',
+    )
+
+    create_ad_account = ApiMethod(
+        method='POST',
+        endpoint='/adaccount',
+        target='adaccount.AdAccount',
+        api_type='EDGE',
+        param_types={
             'currency': 'string',
             'end_advertiser': 'string',
             'funding_id': 'string',
@@ -102,33 +83,15 @@ class Business(
             'partner': 'string',
             'po_number': 'string',
             'timezone_id': 'unsigned int',
-        }
-        enums = {
-        }
-        request = FacebookRequest(
-            node_id=self['id'],
-            method='POST',
-            endpoint='/adaccount',
-            api=self._api,
-            param_checker=TypeChecker(param_types, enums),
-            target_class=AdAccount,
-            api_type='EDGE',
-            response_parser=ObjectParser(target_class=AdAccount),
-        )
-        request.add_params(params)
-        request.add_fields(fields)
-
-        if batch is not None:
-            request.add_to_batch(batch)
-            return request
-        elif pending:
-            return request
-        else:
-            self.assure_call()
-            return request.execute()
-
-    def create_ad_account_creation_request(self, fields=None, params=None, batch=None, pending=False):
-        param_types = {
+        },
+    )
+
+    create_ad_account_creation_request = ApiMethod(
+        method='POST',
+        endpoint='/adaccountcreationrequests',
+        target='abstractcrudobject.AbstractCrudObject',
+        api_type='EDGE',
+        param_types={
             'account_type': 'string',
             'additional_comment': 'string',
             'address_in_chinese': 'string',
@@ -145,917 +108,321 @@ class Business(
             'has_planning_agency': 'bool',
             'is_targeting_outside_china': 'bool',
             'planning_agency_name': 'string',
-        }
-        enums = {
-        }
-        request = FacebookRequest(
-            node_id=self['id'],
-            method='POST',
-            endpoint='/adaccountcreationrequests',
-            api=self._api,
-            param_checker=TypeChecker(param_types, enums),
-            target_class=AbstractCrudObject,
-            api_type='EDGE',
-            response_parser=ObjectParser(target_class=AbstractCrudObject),
-        )
-        request.add_params(params)
-        request.add_fields(fields)
-
-        if batch is not None:
-            request.add_to_batch(batch)
-            return request
-        elif pending:
-            return request
-        else:
-            self.assure_call()
-            return request.execute()
-
-    def create_ad_accounts(self, fields=None, params=None, batch=None, pending=False):
-        from facebookads.adobjects.adaccount import AdAccount
-        param_types = {
+        },
+    )
+
+    create_ad_accounts = ApiMethod(
+        method='POST',
+        endpoint='/adaccounts',
+        target='adaccount.AdAccount',
+        api_type='EDGE',
+        param_types={
             'access_type': 'access_type_enum',
             'adaccount_id': 'string',
             'permitted_roles': 'list<permitted_roles_enum>',
-        }
-        enums = {
-            'access_type_enum': AdAccount.AccessType.__dict__.values(),
-            'permitted_roles_enum': AdAccount.PermittedRoles.__dict__.values(),
-        }
-        request = FacebookRequest(
-            node_id=self['id'],
-            method='POST',
-            endpoint='/adaccounts',
-            api=self._api,
-            param_checker=TypeChecker(param_types, enums),
-            target_class=AdAccount,
-            api_type='EDGE',
-            response_parser=ObjectParser(target_class=AdAccount),
-        )
-        request.add_params(params)
-        request.add_fields(fields)
-
-        if batch is not None:
-            request.add_to_batch(batch)
-            return request
-        elif pending:
-            return request
-        else:
-            self.assure_call()
-            return request.execute()
-
-    def get_ads_pixels(self, fields=None, params=None, batch=None, pending=False):
-        from facebookads.adobjects.adspixel import AdsPixel
-        param_types = {
-        }
-        enums = {
-        }
-        request = FacebookRequest(
-            node_id=self['id'],
-            method='GET',
-            endpoint='/adspixels',
-            api=self._api,
-            param_checker=TypeChecker(param_types, enums),
-            target_class=AdsPixel,
-            api_type='EDGE',
-            response_parser=ObjectParser(target_class=AdsPixel),
-        )
-        request.add_params(params)
-        request.add_fields(fields)
-
-        if batch is not None:
-            request.add_to_batch(batch)
-            return request
-        elif pending:
-            return request
-        else:
-            self.assure_call()
-            return request.execute()
-
-    def delete_apps(self, fields=None, params=None, batch=None, pending=False):
-        param_types = {
+        },
+        enums={
+            'access_type_enum': 'adaccount.AdAccount.AccessType',
+            'permitted_roles_enum': 'adaccount.AdAccount.PermittedRoles',
+        },
+    )
+
+    get_ads_pixels = ApiMethod(
+        method='GET',
+        endpoint='/adspixels',
+        target='adspixel.AdsPixel',
+        api_type='EDGE',
+    )
+
+    delete_apps = ApiMethod(
+        method='DELETE',
+        endpoint='/apps',
+        target='abstractcrudobject.AbstractCrudObject',
+        api_type='EDGE',
+        param_types={
             'app_id': 'int',
-        }
-        enums = {
-        }
-        request = FacebookRequest(
-            node_id=self['id'],
-            method='DELETE',
-            endpoint='/apps',
-            api=self._api,
-            param_checker=TypeChecker(param_types, enums),
-            target_class=AbstractCrudObject,
-            api_type='EDGE',
-            response_parser=ObjectParser(target_class=AbstractCrudObject),
-        )
-        request.add_params(params)
-        request.add_fields(fields)
-
-        if batch is not None:
-            request.add_to_batch(batch)
-            return request
-        elif pending:
-            return request
-        else:
-            self.assure_call()
-            return request.execute()
-
-    def get_assigned_ad_accounts(self, fields=None, params=None, batch=None, pending=False):
-        from facebookads.adobjects.adaccount import AdAccount
-        param_types = {
+        },
+    )
+
+    get_assigned_ad_accounts = ApiMethod(
+        method='GET',
+        endpoint='/assigned_ad_accounts',
+        target='adaccount.AdAccount',
+        api_type='EDGE',
+        param_types={
             'email': 'string',
             'user_id': 'int',
-        }
-        enums = {
-        }
-        request = FacebookRequest(
-            node_id=self['id'],
-            method='GET',
-            endpoint='/assigned_ad_accounts',
-            api=self._api,
-            param_checker=TypeChecker(param_types, enums),
-            target_class=AdAccount,
-            api_type='EDGE',
-            response_parser=ObjectParser(target_class=AdAccount),
-        )
-        request.add_params(params)
-        request.add_fields(fields)
-
-        if batch is not None:
-            request.add_to_batch(batch)
-            return request
-        elif pending:
-            return request
-        else:
-            self.assure_call()
-            return request.execute()
+        },
+    )
 
     def get_client_pages(self, fields=None, params=None):
         cursor = self.iterate_edge(ClientPages, fields, params)
         return cursor
 
 
-    def get_assigned_pages(self, fields=None, params=None, batch=None, pending=False):
-        param_types = {
+    get_assigned_pages = ApiMethod(
+        method='GET',
+        endpoint='/client_pages',
+        target='abstractcrudobject.AbstractCrudObject',
+        api_type='EDGE',
+        param_types={
             'email': 'string',
             'user_id': 'int',
-        }
-        enums = {
-        }
-        request = FacebookRequest(
-            node_id=self['id'],
-            method='GET',
-            endpoint='/client_pages',
-            api=self._api,
-            param_checker=TypeChecker(param_types, enums),
-            target_class=AbstractCrudObject,
-            api_type='EDGE',
-            response_parser=ObjectParser(target_class=AbstractCrudObject),
-        )
-        request.add_params(params)
-        request.add_fields(fields)
-
-        if batch is not None:
-            request.add_to_batch(batch)
-            return request
-        elif pending:
-            return request
-        else:
-            self.assure_call()
-            return request.execute()
-
-    def get_assigned_product_catalogs(self, fields=None, params=None, batch=None, pending=False):
-        from facebookads.adobjects.productcatalog import ProductCatalog
-        param_types = {
+        },
+    )
+
+    get_assigned_product_catalogs = ApiMethod(
+        method='GET',
+        endpoint='/assigned_product_catalogs',
+        target='productcatalog.ProductCatalog',
+        api_type='EDGE',
+        param_types={
             'email': 'string',
             'user_id': 'int',
-        }
-        enums = {
-        }
-        request = FacebookRequest(
-            node_id=self['id'],
-            method='GET',
-            endpoint='/assigned_product_catalogs',
-            api=self._api,
-            param_checker=TypeChecker(param_types, enums),
-            target_class=ProductCatalog,
-            api_type='EDGE',
-            response_parser=ObjectParser(target_class=ProductCatalog),
-        )
-        request.add_params(params)
-        request.add_fields(fields)
-
-        if batch is not None:
-            request.add_to_batch(batch)
-            return request
-        elif pending:
-            return request
-        else:
-            self.assure_call()
-            return request.execute()
-
-    def get_client_ad_account_requests(self, fields=None, params=None, batch=None, pending=False):
-        from facebookads.adobjects.businessadaccountrequest import BusinessAdAccountRequest
-        param_types = {
-        }
-        enums = {
-        }
-        request = FacebookRequest(
-            node_id=self['id'],
-            method='GET',
-            endpoint='/client_ad_account_requests',
-            api=self._api,
-            param_checker=TypeChecker(param_types, enums),
-            target_class=BusinessAdAccountRequest,
-            api_type='EDGE',
-            response_parser=ObjectParser(target_class=BusinessAdAccountRequest),
-        )
-        request.add_params(params)
-        request.add_fields(fields)
-
-        if batch is not None:
-            request.add_to_batch(batch)
-            return request
-        elif pending:
-            return request
-        else:
-            self.assure_call()
-            return request.execute()
-
-    def get_client_ad_accounts(self, fields=None, params=None, batch=None, pending=False):
-        from facebookads.adobjects.adaccount import AdAccount
-        param_types = {
-        }
-        enums = {
-        }
-        request = FacebookRequest(
-            node_id=self['id'],
-            method='GET',
-            endpoint='/client_ad_accounts',
-            api=self._api,
-            param_checker=TypeChecker(param_types, enums),
-            target_class=AdAccount,
-            api_type='EDGE',
-            response_parser=ObjectParser(target_class=AdAccount),
-        )
-        request.add_params(params)
-        request.add_fields(fields)
-
-        if batch is not None:
-            request.add_to_batch(batch)
-            return request
-        elif pending:
-            return request
-        else:
-            self.assure_call()
-            return request.execute()
-
-    def get_client_page_requests(self, fields=None, params=None, batch=None, pending=False):
-        from facebookads.adobjects.businesspagerequest import BusinessPageRequest
-        param_types = {
-        }
-        enums = {
-        }
-        request = FacebookRequest(
-            node_id=self['id'],
-            method='GET',
-            endpoint='/client_page_requests',
-            api=self._api,
-            param_checker=TypeChecker(param_types, enums),
-            target_class=BusinessPageRequest,
-            api_type='EDGE',
-            response_parser=ObjectParser(target_class=BusinessPageRequest),
-        )
-        request.add_params(params)
-        request.add_fields(fields)
-
-        if batch is not None:
-            request.add_to_batch(batch)
-            return request
-        elif pending:
-            return request
-        else:
-            self.assure_call()
-            return request.execute()
-
-    def get_client_pages(self, fields=None, params=None, batch=None, pending=False):
-        param_types = {
-        }
-        enums = {
-        }
-        request = FacebookRequest(
-            node_id=self['id'],
-            method='GET',
-            endpoint='/client_pages',
-            api=self._api,
-            param_checker=TypeChecker(param_types, enums),
-            target_class=AbstractCrudObject,
-            api_type='EDGE',
-            response_parser=ObjectParser(target_class=AbstractCrudObject),
-        )
-        request.add_params(params)
-        request.add_fields(fields)
-
-        if batch is not None:
-            request.add_to_batch(batch)
-            return request
-        elif pending:
-            return request
-        else:
-            self.assure_call()
-            return request.execute()
-
-
-    def get_pending_client_pages(self, fields=None, params=None, batch=None, pending=False):
-        param_types = {
-        }
-        enums = {
-        }
-        request = FacebookRequest(
-            node_id=self['id'],
-            method='GET',
-            endpoint='/pending_client_pages',
-            api=self._api,
-            param_checker=TypeChecker(param_types, enums),
-            target_class=AbstractCrudObject,
-            api_type='EDGE',
-            response_parser=ObjectParser(target_class=AbstractCrudObject),
-        )
-        request.add_params(params)
-        request.add_fields(fields)
-
-        if batch is not None:
-            request.add_to_batch(batch)
-            return request
-        elif pending:
-            return request
-        else:
-            self.assure_call()
-            return request.execute()
-
-
-    def create_event_source_group(self, fields=None, params=None, batch=None, pending=False):
-        from facebookads.adobjects.eventsourcegroup import EventSourceGroup
-        param_types = {
+        },
+    )
+
+    get_client_ad_account_requests = ApiMethod(
+        method='GET',
+        endpoint='/client_ad_account_requests',
+        target='businessadaccountrequest.BusinessAdAccountRequest',
+        api_type='EDGE',
+    )
+
+    get_client_ad_accounts = ApiMethod(
+        method='GET',
+        endpoint='/client_ad_accounts',
+        target='adaccount.AdAccount',
+        api_type='EDGE',
+    )
+
+    get_client_page_requests = ApiMethod(
+        method='GET',
+        endpoint='/client_page_requests',
+        target='businesspagerequest.BusinessPageRequest',
+        api_type='EDGE',
+    )
+
+    get_client_pages = ApiMethod(
+        method='GET',
+        endpoint='/client_pages',
+        target='abstractcrudobject.AbstractCrudObject',
+        api_type='EDGE',
+    )
+
+
+    get_pending_client_pages = ApiMethod(
+        method='GET',
+        endpoint='/pending_client_pages',
+        target='abstractcrudobject.AbstractCrudObject',
+        api_type='EDGE',
+    )
+
+
+    create_event_source_group = ApiMethod(
+        method='POST',
+        endpoint='/event_source_groups',
+        target='eventsourcegroup.EventSourceGroup',
+        api_type='EDGE',
+        param_types={
             'event_sources': 'list<string>',
             'name': 'string',
-        }
-        enums = {
-        }
-        request = FacebookRequest(
-            node_id=self['id'],
-            method='POST',
-            endpoint='/event_source_groups',
-            api=self._api,
-            param_checker=TypeChecker(param_types, enums),
-            target_class=EventSourceGroup,
-            api_type='EDGE',
-            response_parser=ObjectParser(target_class=EventSourceGroup),
-        )
-        request.add_params(params)
-        request.add_fields(fields)
-
-        if batch is not None:
-            request.add_to_batch(batch)
-            return request
-        elif pending:
-            return request
-        else:
-            self.assure_call()
-            return request.execute()
-
-    def get_grp_plans(self, fields=None, params=None, batch=None, pending=False):
-        from facebookads.adobjects.reachfrequencyprediction import ReachFrequencyPrediction
-        param_types = {
+        },
+    )
+
+    get_grp_plans = ApiMethod(
+        method='GET',
+        endpoint='/grp_plans',
+        target='reachfrequencyprediction.ReachFrequencyPrediction',
+        api_type='EDGE',
+        param_types={
             'status': 'status_enum',
-        }
-        enums = {
-            'status_enum': ReachFrequencyPrediction.Status.__dict__.values(),
-        }
-        request = FacebookRequest(
-            node_id=self['id'],
-            method='GET',
-            endpoint='/grp_plans',
-            api=self._api,
-            param_checker=TypeChecker(param_types, enums),
-            target_class=ReachFrequencyPrediction,
-            api_type='EDGE',
-            response_parser=ObjectParser(target_class=ReachFrequencyPrediction),
-        )
-        request.add_params(params)
-        request.add_fields(fields)
-
-        if batch is not None:
-            request.add_to_batch(batch)
-            return request
-        elif pending:
-            return request
-        else:
-            self.assure_call()
-            return request.execute()
-
-    def get_instagram_accounts(self, fields=None, params=None, batch=None, pending=False):
-        param_types = {
-        }
-        enums = {
-        }
-        request = FacebookRequest(
-            node_id=self['id'],
-            method='GET',
-            endpoint='/instagram_accounts',
-            api=self._api,
-            param_checker=TypeChecker(param_types, enums),
-            target_class=AbstractCrudObject,
-            api_type='EDGE',
-            response_parser=ObjectParser(target_class=AbstractCrudObject),
-        )
-        request.add_params(params)
-        request.add_fields(fields)
-
-        if batch is not None:
-            request.add_to_batch(batch)
-            return request
-        elif pending:
-            return request
-        else:
-            self.assure_call()
-            return request.execute()
-
-    def get_measurement_reports(self, fields=None, params=None, batch=None, pending=False):
-        from facebookads.adobjects.measurementreport import MeasurementReport
-        param_types = {
+        },
+        enums={
+            'status_enum': 'reachfrequencyprediction.ReachFrequencyPrediction.Status',
+        },
+    )
+
+    get_instagram_accounts = ApiMethod(
+        method='GET',
+        endpoint='/instagram_accounts',
+        target='abstractcrudobject.AbstractCrudObject',
+        api_type='EDGE',
+    )
+
+    get_measurement_reports = ApiMethod(
+        method='GET',
+        endpoint='/measurement_reports',
+        target='abstractcrudobject.AbstractCrudObject',
+        api_type='EDGE',
+        param_types={
             'filters': 'list<Object>',
             'report_type': 'report_type_enum',
-        }
-        enums = {
+        },
+        enums={
             'report_type_enum': [
                 'multi_channel_report',
                 'video_metrics_report',
                 'fruit_rollup_report',
                 'third_party_mta_report',
             ],
-        }
-        request = FacebookRequest(
-            node_id=self['id'],
-            method='GET',
-            endpoint='/measurement_reports',
-            api=self._api,
-            param_checker=TypeChecker(param_types, enums),
-            target_class=AbstractCrudObject,
-            api_type='EDGE',
-            response_parser=ObjectParser(target_class=AbstractCrudObject),
-        )
-        request.add_params(params)
-        request.add_fields(fields)
-
-        if batch is not None:
-            request.add_to_batch(batch)
-            return request
-        elif pending:
-            return request
-        else:
-            self.assure_call()
-            return request.execute()
-
-    def create_measurement_report(self, fields=None, params=None, batch=None, pending=False):
-        from facebookads.adobjects.measurementreport import MeasurementReport
-        param_types = {
+        },
+    )
+
+    create_measurement_report = ApiMethod(
+        method='POST',
+        endpoint='/measurement_reports',
+        target='abstractcrudobject.AbstractCrudObject',
+        api_type='EDGE',
+        param_types={
             'metadata': 'string',
             'report_type': 'report_type_enum',
-        }
-        enums = {
+        },
+        enums={
             'report_type_enum': [
                 'multi_channel_report',
                 'video_metrics_report',
                 'fruit_rollup_report',
                 'third_party_mta_report',
             ],
-        }
-        request = FacebookRequest(
-            node_id=self['id'],
-            method='POST',
-            endpoint='/measurement_reports',
-            api=self._api,
-            param_checker=TypeChecker(param_types, enums),
-            target_class=AbstractCrudObject,
-            api_type='EDGE',
-            response_parser=ObjectParser(target_class=AbstractCrudObject),
-        )
-        request.add_params(params)
-        request.add_fields(fields)
-
-        if batch is not None:
-            request.add_to_batch(batch)
-            return request
-        elif pending:
-            return request
-        else:
-            self.assure_call()
-            return request.execute()
-
-    def get_offline_conversion_data_sets(self, fields=None, params=None, batch=None, pending=False):
-        param_types = {
-        }
-        enums = {
-        }
-        request = FacebookRequest(
-            node_id=self['id'],
-            method='GET',
-            endpoint='/offline_conversion_data_sets',
-            api=self._api,
-            param_checker=TypeChecker(param_types, enums),
-            target_class=AbstractCrudObject,
-            api_type='EDGE',
-            response_parser=ObjectParser(target_class=AbstractCrudObject),
-        )
-        request.add_params(params)
-        request.add_fields(fields)
-
-        if batch is not None:
-            request.add_to_batch(batch)
-            return request
-        elif pending:
-            return request
-        else:
-            self.assure_call()
-            return request.execute()
-
-    def create_offline_conversion_data_set(self, fields=None, params=None, batch=None, pending=False):
-        param_types = {
+        },
+    )
+
+    get_offline_conversion_data_sets = ApiMethod(
+        method='GET',
+        endpoint='/offline_conversion_data_sets',
+        target='abstractcrudobject.AbstractCrudObject',
+        api_type='EDGE',
+    )
+
+    create_offline_conversion_data_set = ApiMethod(
+        method='POST',
+        endpoint='/offline_conversion_data_sets',
+        target='abstractcrudobject.AbstractCrudObject',
+        api_type='EDGE',
+        param_types={
             'description': 'string',
             'name': 'string',
-        }
-        enums = {
-        }
-        request = FacebookRequest(
-            node_id=self['id'],
-            method='POST',
-            endpoint='/offline_conversion_data_sets',
-            api=self._api,
-            param_checker=TypeChecker(param_types, enums),
-            target_class=AbstractCrudObject,
-            api_type='EDGE',
-            response_parser=ObjectParser(target_class=AbstractCrudObject),
-        )
-        request.add_params(params)
-        request.add_fields(fields)
-
-        if batch is not None:
-            request.add_to_batch(batch)
-            return request
-        elif pending:
-            return request
-        else:
-            self.assure_call()
-            return request.execute()
-
-    def get_owned_ad_account_requests(self, fields=None, params=None, batch=None, pending=False):
-        from facebookads.adobjects.businessadaccountrequest import BusinessAdAccountRequest
-        param_types = {
-        }
-        enums = {
-        }
-        request = FacebookRequest(
-            node_id=self['id'],
-            method='GET',
-            endpoint='/owned_ad_account_requests',
-            api=self._api,
-            param_checker=TypeChecker(param_types, enums),
-            target_class=BusinessAdAccountRequest,
-            api_type='EDGE',
-            response_parser=ObjectParser(target_class=BusinessAdAccountRequest),
-        )
-        request.add_params(params)
-        request.add_fields(fields)
-
-        if batch is not None:
-            request.add_to_batch(batch)
-            return request
-        elif pending:
-            return request
-        else:
-            self.assure_call()
-            return request.execute()
-
-    def get_owned_ad_accounts(self, fields=None, params=None, batch=None, pending=False):
-        from facebookads.adobjects.adaccount import AdAccount
-        param_types = {
-        }
-        enums = {
-        }
-        request = FacebookRequest(
-            node_id=self['id'],
-            method='GET',
-            endpoint='/owned_ad_accounts',
-            api=self._api,
-            param_checker=TypeChecker(param_types, enums),
-            target_class=AdAccount,
-            api_type='EDGE',
-            response_parser=ObjectParser(target_class=AdAccount),
-        )
-        request.add_params(params)
-        request.add_fields(fields)
-
-        if batch is not None:
-            request.add_to_batch(batch)
-            return request
-        elif pending:
-            return request
-        else:
-            self.assure_call()
-            return request.execute()
-
-    def get_owned_instagram_accounts(self, fields=None, params=None, batch=None, pending=False):
-        param_types = {
-        }
-        enums = {
-        }
-        request = FacebookRequest(
-            node_id=self['id'],
-            method='GET',
-            endpoint='/owned_instagram_accounts',
-            api=self._api,
-            param_checker=TypeChecker(param_types, enums),
-            target_class=AbstractCrudObject,
-            api_type='EDGE',
-            response_parser=ObjectParser(target_class=AbstractCrudObject),
-        )
-        request.add_params(params)
-        request.add_fields(fields)
-
-        if batch is not None:
-            request.add_to_batch(batch)
-            return request
-        elif pending:
-            return request
-        else:
-            self.assure_call()
-            return request.execute()
-
-    def get_owned_page_requests(self, fields=None, params=None, batch=None, pending=False):
-        from facebookads.adobjects.businesspagerequest import BusinessPageRequest
-        param_types = {
-        }
-        enums = {
-        }
-        request = FacebookRequest(
-            node_id=self['id'],
-            method='GET',
-            endpoint='/owned_page_requests',
-            api=self._api,
-            param_checker=TypeChecker(param_types, enums),
-            target_class=BusinessPageRequest,
-            api_type='EDGE',
-            response_parser=ObjectParser(target_class=BusinessPageRequest),
-        )
-        request.add_params(params)
-        request.add_fields(fields)
-
-        if batch is not None:
-            request.add_to_batch(batch)
-            return request
-        elif pending:
-            return request
-        else:
-            self.assure_call()
-            return request.execute()
-
-    def get_owned_pages(self, fields=None, params=None, batch=None, pending=False):
-        param_types = {
-        }
-        enums = {
-        }
-        request = FacebookRequest(
-            node_id=self['id'],
-            method='GET',
-            endpoint='/owned_pages',
-            api=self._api,
-            param_checker=TypeChecker(param_types, enums),
-            target_class=AbstractCrudObject,
-            api_type='EDGE',
-            response_parser=ObjectParser(target_class=AbstractCrudObject),
-        )
-        request.add_params(params)
-        request.add_fields(fields)
-
-        if batch is not None:
-            request.add_to_batch(batch)
-            return request
-        elif pending:
-            return request
-        else:
-            self.assure_call()
-            return request.execute()
-
-    def get_owned_pixels(self, fields=None, params=None, batch=None, pending=False):
-        from facebookads.adobjects.adspixel import AdsPixel
-        param_types = {
-        }
-        enums = {
-        }
-        request = FacebookRequest(
-            node_id=self['id'],
-            method='GET',
-            endpoint='/owned_pixels',
-            api=self._api,
-            param_checker=TypeChecker(param_types, enums),
-            target_class=AdsPixel,
-            api_type='EDGE',
-            response_parser=ObjectParser(target_class=AdsPixel),
-        )
-        request.add_params(params)
-        request.add_fields(fields)
-
-        if batch is not None:
-            request.add_to_batch(batch)
-            return request
-        elif pending:
-            return request
-        else:
-            self.assure_call()
-            return request.execute()
-
-    def get_picture(self, fields=None, params=None, batch=None, pending=False):
-        from facebookads.adobjects.profilepicturesource import ProfilePictureSource
-        param_types = {
+        },
+    )
+
+    get_owned_ad_account_requests = ApiMethod(
+        method='GET',
+        endpoint='/owned_ad_account_requests',
+        target='businessadaccountrequest.BusinessAdAccountRequest',
+        api_type='EDGE',
+    )
+
+    get_owned_ad_accounts = ApiMethod(
+        method='GET',
+        endpoint='/owned_ad_accounts',
+        target='adaccount.AdAccount',
+        api_type='EDGE',
+    )
+
+    get_owned_instagram_accounts = ApiMethod(
+        method='GET',
+        endpoint='/owned_instagram_accounts',
+        target='abstractcrudobject.AbstractCrudObject',
+        api_type='EDGE',
+    )
+
+    get_owned_page_requests = ApiMethod(
+        method='GET',
+        endpoint='/owned_page_requests',
+        target='businesspagerequest.BusinessPageRequest',
+        api_type='EDGE',
+    )
+
+    get_owned_pages = ApiMethod(
+        method='GET',
+        endpoint='/owned_pages',
+        target='abstractcrudobject.AbstractCrudObject',
+        api_type='EDGE',
+    )
+
+    get_owned_pixels = ApiMethod(
+        method='GET',
+        endpoint='/owned_pixels',
+        target='adspixel.AdsPixel',
+        api_type='EDGE',
+    )
+
+    get_picture = ApiMethod(
+        method='GET',
+        endpoint='/picture',
+        target='profilepicturesource.ProfilePictureSource',
+        api_type='EDGE',
+        param_types={
             'height': 'int',
             'redirect': 'bool',
             'type': 'type_enum',
             'width': 'int',
-        }
-        enums = {
-            'type_enum': ProfilePictureSource.Type.__dict__.values(),
-        }
-        request = FacebookRequest(
-            node_id=self['id'],
-            method='GET',
-            endpoint='/picture',
-            api=self._api,
-            param_checker=TypeChecker(param_types, enums),
-            target_class=ProfilePictureSource,
-            api_type='EDGE',
-            response_parser=ObjectParser(target_class=ProfilePictureSource),
-        )
-        request.add_params(params)
-        request.add_fields(fields)
-
-        if batch is not None:
-            request.add_to_batch(batch)
-            return request
-        elif pending:
-            return request
-        else:
-            self.assure_call()
-            return request.execute()
-
-    def get_product_catalogs(self, fields=None, params=None, batch=None, pending=False):
-        from facebookads.adobjects.productcatalog import ProductCatalog
-        param_types = {
-        }
-        enums = {
-        }
-        request = FacebookRequest(
-            node_id=self['id'],
-            method='GET',
-            endpoint='/product_catalogs',
-            api=self._api,
-            param_checker=TypeChecker(param_types, enums),
-            target_class=ProductCatalog,
-            api_type='EDGE',
-            response_parser=ObjectParser(target_class=ProductCatalog),
-        )
-        request.add_params(params)
-        request.add_fields(fields)
-
-        if batch is not None:
-            request.add_to_batch(batch)
-            return request
-        elif pending:
-            return request
-        else:
-            self.assure_call()
-            return request.execute()
-
-    def create_product_catalog(self, fields=None, params=None, batch=None, pending=False):
-        from facebookads.adobjects.productcatalog import ProductCatalog
-        param_types = {
+        },
+        enums={
+            'type_enum': 'profilepicturesource.ProfilePictureSource.Type',
+        },
+    )
+
+    get_product_catalogs = ApiMethod(
+        method='GET',
+        endpoint='/product_catalogs',
+        target='productcatalog.ProductCatalog',
+        api_type='EDGE',
+    )
+
+    create_product_catalog = ApiMethod(
+        method='POST',
+        endpoint='/product_catalogs',
+        target='productcatalog.ProductCatalog',
+        api_type='EDGE',
+        param_types={
             'name': 'string',
             'vertical': 'vertical_enum',
-        }
-        enums = {
-            'vertical_enum': ProductCatalog.Vertical.__dict__.values(),
-        }
-        request = FacebookRequest(
-            node_id=self['id'],
-            method='POST',
-            endpoint='/product_catalogs',
-            api=self._api,
-            param_checker=TypeChecker(param_types, enums),
-            target_class=ProductCatalog,
-            api_type='EDGE',
-            response_parser=ObjectParser(target_class=ProductCatalog),
-        )
-        request.add_params(params)
-        request.add_fields(fields)
-
-        if batch is not None:
-            request.add_to_batch(batch)
-            return request
-        elif pending:
-            return request
-        else:
-            self.assure_call()
-            return request.execute()
-
-    def get_received_audience_permissions(self, fields=None, params=None, batch=None, pending=False):
-        param_types = {
+        },
+        enums={
+            'vertical_enum': 'productcatalog.ProductCatalog.Vertical',
+        },
+    )
+
+    get_received_audience_permissions = ApiMethod(
+        method='GET',
+        endpoint='/received_audience_permissions',
+        target='abstractcrudobject.AbstractCrudObject',
+        api_type='EDGE',
+        param_types={
             'partner_id': 'string',
-        }
-        enums = {
-        }
-        request = FacebookRequest(
-            node_id=self['id'],
-            method='GET',
-            endpoint='/received_audience_permissions',
-            api=self._api,
-            param_checker=TypeChecker(param_types, enums),
-            target_class=AbstractCrudObject,
-            api_type='EDGE',
-            response_parser=ObjectParser(target_class=AbstractCrudObject),
-        )
-        request.add_params(params)
-        request.add_fields(fields)
-
-        if batch is not None:
-            request.add_to_batch(batch)
-            return request
-        elif pending:
-            return request
-        else:
-            self.assure_call()
-            return request.execute()
-
-    def get_shared_audience_permissions(self, fields=None, params=None, batch=None, pending=False):
-        param_types = {
+        },
+    )
+
+    get_shared_audience_permissions = ApiMethod(
+        method='GET',
+        endpoint='/shared_audience_permissions',
+        target='abstractcrudobject.AbstractCrudObject',
+        api_type='EDGE',
+        param_types={
             'partner_id': 'string',
-        }
-        enums = {
-        }
-        request = FacebookRequest(
-            node_id=self['id'],
-            method='GET',
-            endpoint='/shared_audience_permissions',
-            api=self._api,
-            param_checker=TypeChecker(param_types, enums),
-            target_class=AbstractCrudObject,
-            api_type='EDGE',
-            response_parser=ObjectParser(target_class=AbstractCrudObject),
-        )
-        request.add_params(params)
-        request.add_fields(fields)
-
-        if batch is not None:
-            request.add_to_batch(batch)
-            return request
-        elif pending:
-            return request
-        else:
-            self.assure_call()
-            return request.execute()
-
-    def get_system_users(self, fields=None, params=None, batch=None, pending=False):
-        param_types = {
-        }
-        enums = {
-        }
-        request = FacebookRequest(
-            node_id=self['id'],
-            method='GET',
-            endpoint='/system_users',
-            api=self._api,
-            param_checker=TypeChecker(param_types, enums),
-            target_class=AbstractCrudObject,
-            api_type='EDGE',
-            response_parser=ObjectParser(target_class=AbstractCrudObject),
-        )
-        request.add_params(params)
-        request.add_fields(fields)
-
-        if batch is not None:
-            request.add_to_batch(batch)
-            return request
-        elif pending:
-            return request
-        else:
-            self.assure_call()
-            return request.execute()
-
-    def create_user_permission(self, fields=None, params=None, batch=None, pending=False):
-        param_types = {
+        },
+    )
+
+    get_system_users = ApiMethod(
+        method='GET',
+        endpoint='/system_users',
+        target='abstractcrudobject.AbstractCrudObject',
+        api_type='EDGE',
+    )
+
+    create_user_permission = ApiMethod(
+        method='POST',
+        endpoint='/userpermissions',
+        target='abstractcrudobject.AbstractCrudObject',
+        api_type='EDGE',
+        param_types={
             'email': 'string',
             'role': 'role_enum',
             'user': 'int',
-        }
-        enums = {
+        },
+        enums={
             'role_enum': [
                 'ADMIN',
                 'EMPLOYEE',
@@ -1066,28 +433,8 @@ class Business(
                 'FB_EMPLOYEE_ACCOUNT_MANAGER',
                 'FB_EMPLOYEE_SALES_REP',
             ],
-        }
-        request = FacebookRequest(
-            node_id=self['id'],
-            method='POST',
-            endpoint='/userpermissions',
-            api=self._api,
-            param_checker=TypeChecker(param_types, enums),
-            target_class=AbstractCrudObject,
-            api_type='EDGE',
-            response_parser=ObjectParser(target_class=AbstractCrudObject),
-        )
-        request.add_params(params)
-        request.add_fields(fields)
-
-        if batch is not None:
-            request.add_to_batch(batch)
-            return request
-        elif pending:
-            return request
-        else:
-            self.assure_call()
-            return request.execute()
+        },
+    )
 
     _field_types = {
         'id': 'string',
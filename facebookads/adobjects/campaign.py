@@ -21,8 +21,9 @@
 from facebookads.adobjects.abstractobject import AbstractObject
 from facebookads.adobjects.abstractcrudobject import AbstractCrudObject
 from facebookads.adobjects.objectparser import ObjectParser
+from facebookads.adobjects.apimethod import ApiMethod
 from facebookads.api import FacebookRequest
-from facebookads.typechecker import TypeChecker
+from facebookads.typechecker import ParamSchema
 from facebookads.mixins import HasAdLabels
 from facebookads.mixins import CanValidate
 
@@ -148,62 +149,26 @@ class Campaign(
         from facebookads.adobjects.adaccount import AdAccount
         return AdAccount(api=self._api, fbid=parent_id).create_campaign(fields, params, batch, pending)
 
-    def api_delete(self, fields=None, params=None, batch=None, pending=False):
-        param_types = {
-        }
-        enums = {
-        }
-        request = FacebookRequest(
-            node_id=self['id'],
-            method='DELETE',
-            endpoint='/',
-            api=self._api,
-            param_checker=TypeChecker(param_types, enums),
-            target_class=AbstractCrudObject,
-            api_type='NODE',
-            response_parser=ObjectParser(reuse_object=self),
-        )
-        request.add_params(params)
-        request.add_fields(fields)
-
-        if batch is not None:
-            request.add_to_batch(batch)
-            return request
-        elif pending:
-            return request
-        else:
-            self.assure_call()
-            return request.execute()
-
-    def api_get(self, fields=None, params=None, batch=None, pending=False):
-        param_types = {
-        }
-        enums = {
-        }
-        request = FacebookRequest(
-            node_id=self['id'],
-            method='GET',
-            endpoint='/',
-            api=self._api,
-            param_checker=TypeChecker(param_types, enums),
-            target_class=Campaign,
-            api_type='NODE',
-            response_parser=ObjectParser(reuse_object=self),
-        )
-        request.add_params(params)
-        request.add_fields(fields)
-
-        if batch is not None:
-            request.add_to_batch(batch)
-            return request
-        elif pending:
-            return request
-        else:
-            self.assure_call()
-            return request.execute()
-
-    def api_update(self, fields=None, params=None, batch=None, pending=False):
-        param_types = {
+    api_delete = ApiMethod(
+        method='DELETE',
+        endpoint='/',
+        target='abstractcrudobject.AbstractCrudObject',
+        api_type='NODE',
+    )
+
+    api_get = ApiMethod(
+        method='GET',
+        endpoint='/',
+        target='campaign.Campaign',
+        api_type='NODE',
+    )
+
+    api_update = ApiMethod(
+        method='POST',
+        endpoint='/',
+        target='campaign.Campaign',
+        api_type='NODE',
+        param_types={
             'adlabels': 'list<Object>',
             'execution_options': 'list<execution_options_enum>',
             'name': 'string',
@@ -211,204 +176,92 @@ class Campaign(
             'promoted_object': 'Object',
             'spend_cap': 'unsigned int',
             'status': 'status_enum',
-        }
-        enums = {
-            'execution_options_enum': Campaign.ExecutionOptions.__dict__.values(),
-            'objective_enum': Campaign.Objective.__dict__.values(),
-            'status_enum': Campaign.Status.__dict__.values(),
-        }
-        request = FacebookRequest(
-            node_id=self['id'],
-            method='POST',
-            endpoint='/',
-            api=self._api,
-            param_checker=TypeChecker(param_types, enums),
-            target_class=Campaign,
-            api_type='NODE',
-            response_parser=ObjectParser(reuse_object=self),
-        )
-        request.add_params(params)
-        request.add_fields(fields)
-
-        if batch is not None:
-            request.add_to_batch(batch)
-            return request
-        elif pending:
-            return request
-        else:
-            self.assure_call()
-            return request.execute()
-
-    def delete_ad_labels(self, fields=None, params=None, batch=None, pending=False):
-        from facebookads.adobjects.adlabel import AdLabel
-        param_types = {
+        },
+        enums={
+            'execution_options_enum': 'campaign.Campaign.ExecutionOptions',
+            'objective_enum': 'campaign.Campaign.Objective',
+            'status_enum': 'campaign.Campaign.Status',
+        },
+    )
+
+    delete_ad_labels = ApiMethod(
+        method='DELETE',
+        endpoint='/adlabels',
+        target='abstractcrudobject.AbstractCrudObject',
+        api_type='EDGE',
+        param_types={
             'adlabels': 'list<Object>',
             'execution_options': 'list<execution_options_enum>',
-        }
-        enums = {
-            'execution_options_enum': AdLabel.ExecutionOptions.__dict__.values(),
-        }
-        request = FacebookRequest(
-            node_id=self['id'],
-            method='DELETE',
-            endpoint='/adlabels',
-            api=self._api,
-            param_checker=TypeChecker(param_types, enums),
-            target_class=AbstractCrudObject,
-            api_type='EDGE',
-            response_parser=ObjectParser(target_class=AbstractCrudObject),
-        )
-        request.add_params(params)
-        request.add_fields(fields)
-
-        if batch is not None:
-            request.add_to_batch(batch)
-            return request
-        elif pending:
-            return request
-        else:
-            self.assure_call()
-            return request.execute()
-
-    def create_ad_label(self, fields=None, params=None, batch=None, pending=False):
-        from facebookads.adobjects.adlabel import AdLabel
-        param_types = {
+        },
+        enums={
+            'execution_options_enum': 'adlabel.AdLabel.ExecutionOptions',
+        },
+    )
+
+    create_ad_label = ApiMethod(
+        method='POST',
+        endpoint='/adlabels',
+        target='adlabel.AdLabel',
+        api_type='EDGE',
+        param_types={
             'adlabels': 'list<Object>',
             'execution_options': 'list<execution_options_enum>',
-        }
-        enums = {
-            'execution_options_enum': AdLabel.ExecutionOptions.__dict__.values(),
-        }
-        request = FacebookRequest(
-            node_id=self['id'],
-            method='POST',
-            endpoint='/adlabels',
-            api=self._api,
-            param_checker=TypeChecker(param_types, enums),
-            target_class=AdLabel,
-            api_type='EDGE',
-            response_parser=ObjectParser(target_class=AdLabel),
-        )
-        request.add_params(params)
-        request.add_fields(fields)
-
-        if batch is not None:
-            request.add_to_batch(batch)
-            return request
-        elif pending:
-            return request
-        else:
-            self.assure_call()
-            return request.execute()
-
-    def get_ads(self, fields=None, params=None, batch=None, pending=False):
-        from facebookads.adobjects.ad import Ad
-        param_types = {
+        },
+        enums={
+            'execution_options_enum': 'adlabel.AdLabel.ExecutionOptions',
+        },
+    )
+
+    get_ads = ApiMethod(
+        method='GET',
+        endpoint='/ads',
+        target='ad.Ad',
+        api_type='EDGE',
+        param_types={
             'ad_draft_id': 'string',
             'date_preset': 'date_preset_enum',
             'effective_status': 'list<string>',
             'include_deleted': 'bool',
             'time_range': 'map',
             'updated_since': 'int',
-        }
-        enums = {
-            'date_preset_enum': Ad.DatePreset.__dict__.values(),
-        }
-        request = FacebookRequest(
-            node_id=self['id'],
-            method='GET',
-            endpoint='/ads',
-            api=self._api,
-            param_checker=TypeChecker(param_types, enums),
-            target_class=Ad,
-            api_type='EDGE',
-            response_parser=ObjectParser(target_class=Ad),
-        )
-        request.add_params(params)
-        request.add_fields(fields)
-
-        if batch is not None:
-            request.add_to_batch(batch)
-            return request
-        elif pending:
-            return request
-        else:
-            self.assure_call()
-            return request.execute()
-
-    def get_ad_sets(self, fields=None, params=None, batch=None, pending=False):
-        from facebookads.adobjects.adset import AdSet
-        param_types = {
+        },
+        enums={
+            'date_preset_enum': 'ad.Ad.DatePreset',
+        },
+    )
+
+    get_ad_sets = ApiMethod(
+        method='GET',
+        endpoint='/adsets',
+        target='adset.AdSet',
+        api_type='EDGE',
+        param_types={
             'ad_draft_id': 'string',
             'date_preset': 'date_preset_enum',
             'effective_status': 'list<effective_status_enum>',
             'is_completed': 'bool',
             'time_range': 'map',
-        }
-        enums = {
-            'date_preset_enum': AdSet.DatePreset.__dict__.values(),
-            'effective_status_enum': AdSet.EffectiveStatus.__dict__.values(),
-        }
-        request = FacebookRequest(
-            node_id=self['id'],
-            method='GET',
-            endpoint='/adsets',
-            api=self._api,
-            param_checker=TypeChecker(param_types, enums),
-            target_class=AdSet,
-            api_type='EDGE',
-            response_parser=ObjectParser(target_class=AdSet),
-        )
-        request.add_params(params)
-        request.add_fields(fields)
-
-        if batch is not None:
-            request.add_to_batch(batch)
-            return request
-        elif pending:
-            return request
-        else:
-            self.assure_call()
-            return request.execute()
-
-    def get_insights(self, fields=None, params=None, async=False, batch=None, pending=False):
+        },
+        enums={
+            'date_preset_enum': 'adset.AdSet.DatePreset',
+            'effective_status_enum': 'adset.AdSet.EffectiveStatus',
+        },
+    )
+
+    def get_insights(self, fields=None, params=None, async=False, batch=None, pending=False, strategy=None):
         from facebookads.adobjects.adsinsights import AdsInsights
+        if strategy is not None:
+          if batch is not None or pending:
+            raise ValueError('strategy cannot be used with batch or pending.')
+          return strategy.get_insights(self, fields, params, async)
         if async:
           return self.get_insights_async(fields, params, batch, pending)
-        param_types = {
-            'action_attribution_windows': 'list<action_attribution_windows_enum>',
-            'action_breakdowns': 'list<action_breakdowns_enum>',
-            'action_report_time': 'action_report_time_enum',
-            'breakdowns': 'list<breakdowns_enum>',
-            'date_preset': 'date_preset_enum',
-            'default_summary': 'bool',
-            'fields': 'list<fields_enum>',
-            'filtering': 'list<Object>',
-            'level': 'level_enum',
-            'product_id_limit': 'int',
-            'sort': 'list<string>',
-            'summary': 'list<summary_enum>',
-            'summary_action_breakdowns': 'list<summary_action_breakdowns_enum>',
-            'time_increment': 'string',
-            'time_range': 'map',
-            'time_ranges': 'list<map>',
-        }
-        enums = {
-            'action_attribution_windows_enum': AdsInsights.ActionAttributionWindows.__dict__.values(),
-            'action_breakdowns_enum': AdsInsights.ActionBreakdowns.__dict__.values(),
-            'action_report_time_enum': AdsInsights.ActionReportTime.__dict__.values(),
-            'breakdowns_enum': AdsInsights.Breakdowns.__dict__.values(),
-            'date_preset_enum': AdsInsights.DatePreset.__dict__.values(),
-            'summary_enum': AdsInsights.Summary.__dict__.values(),
-            'level_enum': AdsInsights.Level.__dict__.values(),
-            'summary_action_breakdowns_enum': AdsInsights.SummaryActionBreakdowns.__dict__.values(),
-        }
         request = FacebookRequest(
             node_id=self['id'],
             method='GET',
             endpoint='/insights',
             api=self._api,
-            param_checker=TypeChecker(param_types, enums),
+            param_checker=_get_insights_params.get_checker(),
             target_class=AdsInsights,
             api_type='EDGE',
             response_parser=ObjectParser(target_class=AdsInsights),
@@ -426,10 +279,12 @@ class Campaign(
             self.assure_call()
             return request.execute()
 
-    def get_insights_async(self, fields=None, params=None, batch=None, pending=False):
-        from facebookads.adobjects.adreportrun import AdReportRun
-        from facebookads.adobjects.adsinsights import AdsInsights
-        param_types = {
+    get_insights_async = ApiMethod(
+        method='POST',
+        endpoint='/insights',
+        target='adreportrun.AdReportRun',
+        api_type='EDGE',
+        param_types={
             'action_attribution_windows': 'list<action_attribution_windows_enum>',
             'action_breakdowns': 'list<action_breakdowns_enum>',
             'action_report_time': 'action_report_time_enum',
@@ -446,39 +301,19 @@ class Campaign(
             'time_increment': 'string',
             'time_range': 'map',
             'time_ranges': 'list<map>',
-        }
-        enums = {
-            'action_attribution_windows_enum': AdsInsights.ActionAttributionWindows.__dict__.values(),
-            'action_breakdowns_enum': AdsInsights.ActionBreakdowns.__dict__.values(),
-            'action_report_time_enum': AdsInsights.ActionReportTime.__dict__.values(),
-            'breakdowns_enum': AdsInsights.Breakdowns.__dict__.values(),
-            'date_preset_enum': AdsInsights.DatePreset.__dict__.values(),
-            'summary_enum': AdsInsights.Summary.__dict__.values(),
-            'level_enum': AdsInsights.Level.__dict__.values(),
-            'summary_action_breakdowns_enum': AdsInsights.SummaryActionBreakdowns.__dict__.values(),
-        }
-        request = FacebookRequest(
-            node_id=self['id'],
-            method='POST',
-            endpoint='/insights',
-            api=self._api,
-            param_checker=TypeChecker(param_types, enums),
-            target_class=AdReportRun,
-            api_type='EDGE',
-            response_parser=ObjectParser(target_class=AdReportRun),
-            include_summary=False,
-        )
-        request.add_params(params)
-        request.add_fields(fields)
-
-        if batch is not None:
-            request.add_to_batch(batch)
-            return request
-        elif pending:
-            return request
-        else:
-            self.assure_call()
-            return request.execute()
+        },
+        enums={
+            'action_attribution_windows_enum': 'adsinsights.AdsInsights.ActionAttributionWindows',
+            'action_breakdowns_enum': 'adsinsights.AdsInsights.ActionBreakdowns',
+            'action_report_time_enum': 'adsinsights.AdsInsights.ActionReportTime',
+            'breakdowns_enum': 'adsinsights.AdsInsights.Breakdowns',
+            'date_preset_enum': 'adsinsights.AdsInsights.DatePreset',
+            'summary_enum': 'adsinsights.AdsInsights.Summary',
+            'level_enum': 'adsinsights.AdsInsights.Level',
+            'summary_action_breakdowns_enum': 'adsinsights.AdsInsights.SummaryActionBreakdowns',
+        },
+        include_summary=False,
+    )
 
     _field_types = {
         'account_id': 'string',
@@ -513,3 +348,36 @@ class Campaign(
         field_enum_info['Objective'] = Campaign.Objective.__dict__.values()
         field_enum_info['Operator'] = Campaign.Operator.__dict__.values()
         return field_enum_info
+
+
+# Parameter types of the API calls above.
+_get_insights_params = ParamSchema(
+    param_types={
+        'action_attribution_windows': 'list<action_attribution_windows_enum>',
+        'action_breakdowns': 'list<action_breakdowns_enum>',
+        'action_report_time': 'action_report_time_enum',
+        'breakdowns': 'list<breakdowns_enum>',
+        'date_preset': 'date_preset_enum',
+        'default_summary': 'bool',
+        'fields': 'list<fields_enum>',
+        'filtering': 'list<Object>',
+        'level': 'level_enum',
+        'product_id_limit': 'int',
+        'sort': 'list<string>',
+        'summary': 'list<summary_enum>',
+        'summary_action_breakdowns': 'list<summary_action_breakdowns_enum>',
+        'time_increment': 'string',
+        'time_range': 'map',
+        'time_ranges': 'list<map>',
+    },
+    enums={
+        'action_attribution_windows_enum': 'adsinsights.AdsInsights.ActionAttributionWindows',
+        'action_breakdowns_enum': 'adsinsights.AdsInsights.ActionBreakdowns',
+        'action_report_time_enum': 'adsinsights.AdsInsights.ActionReportTime',
+        'breakdowns_enum': 'adsinsights.AdsInsights.Breakdowns',
+        'date_preset_enum': 'adsinsights.AdsInsights.DatePreset',
+        'summary_enum': 'adsinsights.AdsInsights.Summary',
+        'level_enum': 'adsinsights.AdsInsights.Level',
+        'summary_action_breakdowns_enum': 'adsinsights.AdsInsights.SummaryActionBreakdowns',
+    },
+)
@@ -0,0 +1,124 @@
+# Copyright 2014 Facebook, Inc.
+
+# You are hereby granted a non-exclusive, worldwide, royalty-free license to
+# use, copy, modify, and distribute this software in source code or binary
+# form for use in connection with the web services and APIs provided by
+# Facebook.
+
+# As with any software that integrates with the Facebook platform, your use
+# of this software is subject to the Facebook Developer Principles and
+# Policies [http://developers.facebook.com/policy/]. This copyright notice
+# shall be included in all copies or substantial portions of the software.
+
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL
+# THE AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING
+# FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER
+# DEALINGS IN THE SOFTWARE.
+
+from facebookads.exceptions import (
+    FacebookBadObjectError,
+)
+
+from facebookads.typechecker import LazyValue
+
+from six.moves import intern
+import collections
+import json
+
+
+class CompactObject(collections.MutableMapping):
+
+    """
+    A low-memory MutableMapping view of an AdObject's data, meant for large
+    result sets that are mostly read.
+    Compared to the target AdObject it has no __dict__, keeps no change log
+    and no copy of the raw response, and its field names are interned so
+    that they are shared by all records. Values are typed like the target
+    class would type them. Use to_object() to get a full AdObject that can
+    make API calls.
+    """
+
+    __slots__ = ('_data', '_target_class', '_api')
+
+    def __init__(self, target_class, data=None, api=None):
+        self._data = {}
+        self._target_class = target_class
+        self._api = api
+        if data is not None:
+            self._set_data(data)
+
+    def __getitem__(self, key):
+        key = str(key)
+        value = self._data[key]
+        if isinstance(value, LazyValue):
+            value = self._data[key] = value.resolve()
+        return value
+
+    def __setitem__(self, key, value):
+        checker = self._target_class._get_field_checker()
+        self._data[intern(str(key))] = checker.get_typed_value(key, value)
+
+    def __delitem__(self, key):
+        del self._data[key]
+
+    def __iter__(self):
+        return iter(self._data)
+
+    def __len__(self):
+        return len(self._data)
+
+    def __contains__(self, key):
+        return key in self._data
+
+    def __repr__(self):
+        return "<%s:compact> %s" % (
+            self._target_class.__name__,
+            json.dumps(
+                self.export_all_data(),
+                sort_keys=True,
+                indent=4,
+                separators=(',', ': '),
+            ),
+        )
+
+    def _set_data(self, data):
+        if not hasattr(data, 'items'):
+            raise FacebookBadObjectError("Bad data to set object data")
+        get_typed_value = self._target_class._get_field_checker().get_typed_value
+        fields = self._data
+        for key, value in data.items():
+            key = intern(str(key))
+            fields[key] = get_typed_value(key, value, lazy=True)
+
+    def get_target_class(self):
+        """Returns the AdObject class this record holds data for."""
+        return self._target_class
+
+    def get_id(self):
+        """Returns the record's fbid if set. Else, it returns None."""
+        return self.get('id')
+
+    def export_value(self, data):
+        if isinstance(data, LazyValue):
+            data = data.resolve()
+        if hasattr(data, 'export_all_data'):
+            data = data.export_all_data()
+        elif isinstance(data, dict):
+            data = dict((k, self.export_value(v))
+                        for k, v in data.items()
+                        if v is not None)
+        elif isinstance(data, list):
+            data = [self.export_value(v) for v in data]
+        return data
+
+    def export_all_data(self):
+        return self.export_value(self._data)
+
+    def to_object(self):
+        """Returns a full instance of the target class with this data."""
+        obj = self._target_class(api=self._api)
+        obj._set_data(dict(self._data))
+        return obj
@@ -20,9 +20,7 @@
 
 from facebookads.adobjects.abstractobject import AbstractObject
 from facebookads.adobjects.abstractcrudobject import AbstractCrudObject
-from facebookads.adobjects.objectparser import ObjectParser
-from facebookads.api import FacebookRequest
-from facebookads.typechecker import TypeChecker
+from facebookads.adobjects.apimethod import ApiMethod
 from facebookads.adobjects.helpers.customaudiencemixin import CustomAudienceMixin
 
 """
@@ -128,62 +126,26 @@ class CustomAudience(
         from facebookads.adobjects.adaccount import AdAccount
         return AdAccount(api=self._api, fbid=parent_id).create_custom_audience(fields, params, batch, pending)
 
-    def api_delete(self, fields=None, params=None, batch=None, pending=False):
-        param_types = {
-        }
-        enums = {
-        }
-        request = FacebookRequest(
-            node_id=self['id'],
-            method='DELETE',
-            endpoint='/',
-            api=self._api,
-            param_checker=TypeChecker(param_types, enums),
-            target_class=AbstractCrudObject,
-            api_type='NODE',
-            response_parser=ObjectParser(reuse_object=self),
-        )
-        request.add_params(params)
-        request.add_fields(fields)
-
-        if batch is not None:
-            request.add_to_batch(batch)
-            return request
-        elif pending:
-            return request
-        else:
-            self.assure_call()
-            return request.execute()
-
-    def api_get(self, fields=None, params=None, batch=None, pending=False):
-        param_types = {
-        }
-        enums = {
-        }
-        request = FacebookRequest(
-            node_id=self['id'],
-            method='GET',
-            endpoint='/',
-            api=self._api,
-            param_checker=TypeChecker(param_types, enums),
-            target_class=CustomAudience,
-            api_type='NODE',
-            response_parser=ObjectParser(reuse_object=self),
-        )
-        request.add_params(params)
-        request.add_fields(fields)
-
-        if batch is not None:
-            request.add_to_batch(batch)
-            return request
-        elif pending:
-            return request
-        else:
-            self.assure_call()
-            return request.execute()
-
-    def api_update(self, fields=None, params=None, batch=None, pending=False):
-        param_types = {
+    api_delete = ApiMethod(
+        method='DELETE',
+        endpoint='/',
+        target='abstractcrudobject.AbstractCrudObject',
+        api_type='NODE',
+    )
+
+    api_get = ApiMethod(
+        method='GET',
+        endpoint='/',
+        target='customaudience.CustomAudience',
+        api_type='NODE',
+    )
+
+    api_update = ApiMethod(
+        method='POST',
+        endpoint='/',
+        target='customaudience.CustomAudience',
+        api_type='NODE',
+        param_types={
             'claim_objective': 'claim_objective_enum',
             'content_type': 'content_type_enum',
             'description': 'string',
@@ -194,265 +156,93 @@ class CustomAudience(
             'product_set_id': 'string',
             'retention_days': 'unsigned int',
             'rule': 'string',
-        }
-        enums = {
-            'claim_objective_enum': CustomAudience.ClaimObjective.__dict__.values(),
-            'content_type_enum': CustomAudience.ContentType.__dict__.values(),
-        }
-        request = FacebookRequest(
-            node_id=self['id'],
-            method='POST',
-            endpoint='/',
-            api=self._api,
-            param_checker=TypeChecker(param_types, enums),
-            target_class=CustomAudience,
-            api_type='NODE',
-            response_parser=ObjectParser(reuse_object=self),
-        )
-        request.add_params(params)
-        request.add_fields(fields)
-
-        if batch is not None:
-            request.add_to_batch(batch)
-            return request
-        elif pending:
-            return request
-        else:
-            self.assure_call()
-            return request.execute()
-
-    def delete_ad_accounts(self, fields=None, params=None, batch=None, pending=False):
-        param_types = {
+        },
+        enums={
+            'claim_objective_enum': 'customaudience.CustomAudience.ClaimObjective',
+            'content_type_enum': 'customaudience.CustomAudience.ContentType',
+        },
+    )
+
+    delete_ad_accounts = ApiMethod(
+        method='DELETE',
+        endpoint='/adaccounts',
+        target='abstractcrudobject.AbstractCrudObject',
+        api_type='EDGE',
+        param_types={
             'adaccounts': 'list<string>',
-        }
-        enums = {
-        }
-        request = FacebookRequest(
-            node_id=self['id'],
-            method='DELETE',
-            endpoint='/adaccounts',
-            api=self._api,
-            param_checker=TypeChecker(param_types, enums),
-            target_class=AbstractCrudObject,
-            api_type='EDGE',
-            response_parser=ObjectParser(target_class=AbstractCrudObject),
-        )
-        request.add_params(params)
-        request.add_fields(fields)
-
-        if batch is not None:
-            request.add_to_batch(batch)
-            return request
-        elif pending:
-            return request
-        else:
-            self.assure_call()
-            return request.execute()
-
-    def get_ad_accounts(self, fields=None, params=None, batch=None, pending=False):
-        from facebookads.adobjects.adaccount import AdAccount
-        param_types = {
+        },
+    )
+
+    get_ad_accounts = ApiMethod(
+        method='GET',
+        endpoint='/adaccounts',
+        target='adaccount.AdAccount',
+        api_type='EDGE',
+        param_types={
             'permissions': 'string',
-        }
-        enums = {
-        }
-        request = FacebookRequest(
-            node_id=self['id'],
-            method='GET',
-            endpoint='/adaccounts',
-            api=self._api,
-            param_checker=TypeChecker(param_types, enums),
-            target_class=AdAccount,
-            api_type='EDGE',
-            response_parser=ObjectParser(target_class=AdAccount),
-        )
-        request.add_params(params)
-        request.add_fields(fields)
-
-        if batch is not None:
-            request.add_to_batch(batch)
-            return request
-        elif pending:
-            return request
-        else:
-            self.assure_call()
-            return request.execute()
-
-    def create_ad_account(self, fields=None, params=None, batch=None, pending=False):
-        from facebookads.adobjects.adaccount import AdAccount
-        param_types = {
+        },
+    )
+
+    create_ad_account = ApiMethod(
+        method='POST',
+        endpoint='/adaccounts',
+        target='adaccount.AdAccount',
+        api_type='EDGE',
+        param_types={
             'adaccounts': 'list<string>',
             'permissions': 'string',
             'replace': 'bool',
-        }
-        enums = {
-        }
-        request = FacebookRequest(
-            node_id=self['id'],
-            method='POST',
-            endpoint='/adaccounts',
-            api=self._api,
-            param_checker=TypeChecker(param_types, enums),
-            target_class=AdAccount,
-            api_type='EDGE',
-            response_parser=ObjectParser(target_class=AdAccount),
-        )
-        request.add_params(params)
-        request.add_fields(fields)
-
-        if batch is not None:
-            request.add_to_batch(batch)
-            return request
-        elif pending:
-            return request
-        else:
-            self.assure_call()
-            return request.execute()
-
-    def get_ads(self, fields=None, params=None, batch=None, pending=False):
-        from facebookads.adobjects.ad import Ad
-        param_types = {
+        },
+    )
+
+    get_ads = ApiMethod(
+        method='GET',
+        endpoint='/ads',
+        target='ad.Ad',
+        api_type='EDGE',
+        param_types={
             'effective_status': 'list<string>',
-        }
-        enums = {
-        }
-        request = FacebookRequest(
-            node_id=self['id'],
-            method='GET',
-            endpoint='/ads',
-            api=self._api,
-            param_checker=TypeChecker(param_types, enums),
-            target_class=Ad,
-            api_type='EDGE',
-            response_parser=ObjectParser(target_class=Ad),
-        )
-        request.add_params(params)
-        request.add_fields(fields)
-
-        if batch is not None:
-            request.add_to_batch(batch)
-            return request
-        elif pending:
-            return request
-        else:
-            self.assure_call()
-            return request.execute()
-
-    def get_prefills(self, fields=None, params=None, batch=None, pending=False):
-        from facebookads.adobjects.customaudienceprefillstate import CustomAudiencePrefillState
-        param_types = {
-        }
-        enums = {
-        }
-        request = FacebookRequest(
-            node_id=self['id'],
-            method='GET',
-            endpoint='/prefills',
-            api=self._api,
-            param_checker=TypeChecker(param_types, enums),
-            target_class=CustomAudiencePrefillState,
-            api_type='EDGE',
-            response_parser=ObjectParser(target_class=CustomAudiencePrefillState),
-        )
-        request.add_params(params)
-        request.add_fields(fields)
-
-        if batch is not None:
-            request.add_to_batch(batch)
-            return request
-        elif pending:
-            return request
-        else:
-            self.assure_call()
-            return request.execute()
-
-    def get_sessions(self, fields=None, params=None, batch=None, pending=False):
-        from facebookads.adobjects.customaudiencesession import CustomAudienceSession
-        param_types = {
+        },
+    )
+
+    get_prefills = ApiMethod(
+        method='GET',
+        endpoint='/prefills',
+        target='customaudienceprefillstate.CustomAudiencePrefillState',
+        api_type='EDGE',
+    )
+
+    get_sessions = ApiMethod(
+        method='GET',
+        endpoint='/sessions',
+        target='customaudiencesession.CustomAudienceSession',
+        api_type='EDGE',
+        param_types={
             'session_id': 'unsigned int',
-        }
-        enums = {
-        }
-        request = FacebookRequest(
-            node_id=self['id'],
-            method='GET',
-            endpoint='/sessions',
-            api=self._api,
-            param_checker=TypeChecker(param_types, enums),
-            target_class=CustomAudienceSession,
-            api_type='EDGE',
-            response_parser=ObjectParser(target_class=CustomAudienceSession),
-        )
-        request.add_params(params)
-        request.add_fields(fields)
-
-        if batch is not None:
-            request.add_to_batch(batch)
-            return request
-        elif pending:
-            return request
-        else:
-            self.assure_call()
-            return request.execute()
-
-    def delete_users(self, fields=None, params=None, batch=None, pending=False):
-        param_types = {
+        },
+    )
+
+    delete_users = ApiMethod(
+        method='DELETE',
+        endpoint='/users',
+        target='abstractcrudobject.AbstractCrudObject',
+        api_type='EDGE',
+        param_types={
             'payload': 'Object',
             'session': 'Object',
-        }
-        enums = {
-        }
-        request = FacebookRequest(
-            node_id=self['id'],
-            method='DELETE',
-            endpoint='/users',
-            api=self._api,
-            param_checker=TypeChecker(param_types, enums),
-            target_class=AbstractCrudObject,
-            api_type='EDGE',
-            response_parser=ObjectParser(target_class=AbstractCrudObject),
-        )
-        request.add_params(params)
-        request.add_fields(fields)
-
-        if batch is not None:
-            request.add_to_batch(batch)
-            return request
-        elif pending:
-            return request
-        else:
-            self.assure_call()
-            return request.execute()
-
-    def create_user(self, fields=None, params=None, batch=None, pending=False):
-        from facebookads.adobjects.user import User
-        param_types = {
+        },
+    )
+
+    create_user = ApiMethod(
+        method='POST',
+        endpoint='/users',
+        target='user.User',
+        api_type='EDGE',
+        param_types={
             'payload': 'Object',
             'session': 'Object',
-        }
-        enums = {
-        }
-        request = FacebookRequest(
-            node_id=self['id'],
-            method='POST',
-            endpoint='/users',
-            api=self._api,
-            param_checker=TypeChecker(param_types, enums),
-            target_class=User,
-            api_type='EDGE',
-            response_parser=ObjectParser(target_class=User),
-        )
-        request.add_params(params)
-        request.add_fields(fields)
-
-        if batch is not None:
-            request.add_to_batch(batch)
-            return request
-        elif pending:
-            return request
-        else:
-            self.assure_call()
-            return request.execute()
+        },
+    )
 
     _field_types = {
         'account_id': 'string',
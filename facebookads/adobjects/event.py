@@ -20,10 +20,8 @@
 
 from facebookads.adobjects.abstractobject import AbstractObject
 from facebookads.adobjects.abstractcrudobject import AbstractCrudObject
-from facebookads.adobjects.objectparser import ObjectParser
+from facebookads.adobjects.apimethod import ApiMethod
 from facebookads.adobjects.facebookuser import FacebookUser
-from facebookads.api import FacebookRequest
-from facebookads.typechecker import TypeChecker
 from facebookads.mixins import (
     CannotCreate,
     CannotDelete,
@@ -59,7 +57,7 @@ class RSVPNoReply(RSVP):
         return 'noreply'
 
 from facebookads.api import FacebookRequest
-from facebookads.typechecker import TypeChecker
+from facebookads.typechecker import ParamSchema
 
 """
 This class is auto-generated.
@@ -138,65 +136,28 @@ class Event(
         community = 'community'
         legacy = 'legacy'
 
-    def api_get(self, fields=None, params=None, batch=None, pending=False):
-        param_types = {
-        }
-        enums = {
-        }
-        request = FacebookRequest(
-            node_id=self['id'],
-            method='GET',
-            endpoint='/',
-            api=self._api,
-            param_checker=TypeChecker(param_types, enums),
-            target_class=Event,
-            api_type='NODE',
-            response_parser=ObjectParser(reuse_object=self),
-        )
-        request.add_params(params)
-        request.add_fields(fields)
-
-        if batch is not None:
-            request.add_to_batch(batch)
-            return request
-        elif pending:
-            return request
-        else:
-            self.assure_call()
-            return request.execute()
-
-    def get_picture(self, fields=None, params=None, batch=None, pending=False):
-        from facebookads.adobjects.profilepicturesource import ProfilePictureSource
-        param_types = {
+    api_get = ApiMethod(
+        method='GET',
+        endpoint='/',
+        target='event.Event',
+        api_type='NODE',
+    )
+
+    get_picture = ApiMethod(
+        method='GET',
+        endpoint='/picture',
+        target='profilepicturesource.ProfilePictureSource',
+        api_type='EDGE',
+        param_types={
             'height': 'int',
             'redirect': 'bool',
             'type': 'type_enum',
             'width': 'int',
-        }
-        enums = {
-            'type_enum': ProfilePictureSource.Type.__dict__.values(),
-        }
-        request = FacebookRequest(
-            node_id=self['id'],
-            method='GET',
-            endpoint='/picture',
-            api=self._api,
-            param_checker=TypeChecker(param_types, enums),
-            target_class=ProfilePictureSource,
-            api_type='EDGE',
-            response_parser=ObjectParser(target_class=ProfilePictureSource),
-        )
-        request.add_params(params)
-        request.add_fields(fields)
-
-        if batch is not None:
-            request.add_to_batch(batch)
-            return request
-        elif pending:
-            return request
-        else:
-            self.assure_call()
-            return request.execute()
+        },
+        enums={
+            'type_enum': 'profilepicturesource.ProfilePictureSource.Type',
+        },
+    )
 
     _field_types = {
         'attending_count': 'int',
@@ -18,12 +18,9 @@
 # FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER
 # DEALINGS IN THE SOFTWARE.
 
-from facebookads.adobjects.adaccount import AdAccount
-from facebookads.adobjects.adaccountgroup import AdAccountGroup
-from facebookads.adobjects.page import Page
 from facebookads.adobjects.objectparser import ObjectParser
 from facebookads.api import FacebookRequest
-from facebookads.typechecker import TypeChecker
+from facebookads.typechecker import ParamSchema
 
 class AdAccountUserMixin:
 
@@ -52,26 +49,27 @@ class AdAccountUserMixin:
 
     def get_ad_accounts(self, fields=None, params=None):
         """Returns iterator over AdAccounts associated with this user."""
+        from facebookads.adobjects.adaccount import AdAccount
         return self.iterate_edge(AdAccount, fields, params, endpoint='adaccounts')
 
     def get_ad_account(self, fields=None, params=None):
         """Returns first AdAccount associated with this user."""
+        from facebookads.adobjects.adaccount import AdAccount
         return self.edge_object(AdAccount, fields, params)
 
     def get_pages(self, fields=None, params=None):
         """Returns iterator over Pages's associated with this user."""
+        from facebookads.adobjects.page import Page
         return self.iterate_edge(Page, fields, params)
 
     def get_ad_account_groups(self, fields=None, params=None):
         """Returns iterator over AdAccount Groups associated with this user."""
+        from facebookads.adobjects.adaccountgroup import AdAccountGroup
         return self.iterate_edge(AdAccountGroup, fields, params)
 
     def create_ad_account_group(self, fields=None, params=None, batch=None, pending=False):
-        param_types = {
-        }
-        enums = {
-        }
-        param_checker = TypeChecker(param_types, enums)
+        from facebookads.adobjects.adaccountgroup import AdAccountGroup
+        param_checker = _create_ad_account_group_params.get_checker()
         request = FacebookRequest(
             api=self._api,
             node_id=self['id'],
@@ -97,3 +95,9 @@ class AdAccountUserMixin:
             return request
         else:
             return request.execute()
+
+
+# Parameter types of the API calls above.
+_create_ad_account_group_params = ParamSchema(
+    param_types={},
+)
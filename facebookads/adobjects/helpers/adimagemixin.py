@@ -18,7 +18,6 @@
 # FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER
 # DEALINGS IN THE SOFTWARE.
 
-from facebookads.adobjects.adaccount import AdAccount
 from facebookads.api import FacebookAdsApi
 from facebookads.exceptions import FacebookBadObjectError
 from facebookads.adobjects.abstractcrudobject import AbstractCrudObject
@@ -89,6 +88,7 @@ class AdImageMixin:
 
         if 'images' in data:
             _, data = data['images'].popitem()
+            self._copy_on_write()
 
             for key in map(str, data):
                 self._data[key] = data[key]
@@ -151,6 +151,7 @@ class AdImageMixin:
     ):
         if self[self.__class__.Field.id]:
             _, image_hash = self[self.__class__.Field.id].split(':')
+            from facebookads.adobjects.adaccount import AdAccount
             account = AdAccount(fbid=self.get_parent_id_assured())
             params = {
                 'hashes': [
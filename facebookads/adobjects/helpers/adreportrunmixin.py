@@ -18,8 +18,21 @@
 # FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER
 # DEALINGS IN THE SOFTWARE.
 
+from facebookads.exceptions import FacebookError
+
+import codecs
+import collections
+import csv
+import logging
+import requests
+
+logger = logging.getLogger(__name__)
+
+
 class AdReportRunMixin:
 
+    EXPORT_URL = 'https://www.facebook.com/ads/ads_insights/export_report'
+
     def get_result(self, params=None):
         """
         Gets the final result from an async job
@@ -27,6 +40,145 @@ class AdReportRunMixin:
         """
         return self.get_insights(params=params)
 
+    def export_rows(self, params=None, rename=None, fallback=True,
+                    chunk_size=1 << 16, insights_params=None):
+        """
+        Downloads the CSV export of the finished report as a stream and
+        yields its rows as dicts, one at a time, so memory stays constant
+        whatever the size of the report. Rows of the export are keyed by
+        its column headers, which rename maps to field names.
+        If the export is unavailable, the rows are read from the paged
+        insights edge instead, keyed by field names.
+        Args:
+            params (optional): Extra params of the export, e.g. locale.
+            rename (optional): A dict of column header to field name.
+            fallback (optional): Whether to read the pages if the export
+                fails, else a FacebookError is raised.
+            chunk_size (optional): Bytes read from the stream at a time.
+            insights_params (optional): Params of the paged reads, e.g.
+                limit.
+        """
+        try:
+            response = self._open_export(params)
+        except (FacebookError, requests.RequestException) as e:
+            if not fallback:
+                raise
+            logger.warning(
+                'Export of report %s unavailable, reading pages: %s',
+                self.get_id(), e,
+            )
+            for row in self.get_insights(params=insights_params):
+                yield row.export_all_data()
+            return
+
+        rename = rename or {}
+        try:
+            lines = self._iter_export_lines(response, chunk_size)
+            reader = csv.reader(lines)
+            header = [rename.get(name, name) for name in next(reader, [])]
+            for values in reader:
+                if values:
+                    yield dict(zip(header, values))
+        finally:
+            response.close()
+
+    def export_columns(self, fields=None, params=None, rename=None,
+                       fallback=True, chunk_rows=10000, insights_params=None):
+        """
+        Parses the rows of export_rows into typed columns, see
+        InsightsColumns, chunk_rows rows at a time, so only the columns and
+        one chunk of rows are in memory. Empty cells count as missing.
+        list<AdsActionStats> fields such as actions are not supported, as
+        the action types they pivot into may differ from chunk to chunk.
+        """
+        from facebookads.adobjects.adsinsights import AdsInsights
+        from facebookads.insights_columns import (
+            InsightsColumns, PIVOT_TYPE, numpy,
+        )
+        chunks = collections.OrderedDict()
+        columns = None
+
+        def flush():
+            for name, column in columns.build().items():
+                chunks.setdefault(name, []).append(column)
+
+        def check(fields):
+            pivoted = [field for field in fields
+                       if AdsInsights._field_types.get(field) == PIVOT_TYPE]
+            if pivoted:
+                raise ValueError(
+                    'export_columns cannot pivot %s, use InsightsColumns on '
+                    'the rows instead.' % ', '.join(pivoted),
+                )
+            return fields
+
+        if fields is not None:
+            fields = check(list(fields))
+        for row in self.export_rows(params, rename, fallback,
+                                    insights_params=insights_params):
+            if columns is None or len(columns) >= chunk_rows:
+                if columns is not None:
+                    flush()
+                # Every chunk has the columns of the first row, even where
+                # all its cells are empty.
+                fields = fields or check(sorted(row))
+                columns = InsightsColumns(fields)
+            columns.add_rows([dict(
+                (name, value) for name, value in row.items() if value != ''
+            )])
+        if columns is not None:
+            flush()
+
+        result = collections.OrderedDict()
+        for name, parts in chunks.items():
+            if numpy is not None and not isinstance(parts[0], list):
+                result[name] = numpy.concatenate(parts)
+            else:
+                result[name] = parts[0]
+                for part in parts[1:]:
+                    result[name].extend(part)
+        return result
+
+    def _open_export(self, params=None):
+        from facebookads.api import FacebookAdsApi
+        api = self.get_api_assured()
+        export_params = {
+            'report_run_id': self.get_id_assured(),
+            'format': 'csv',
+        }
+        export_params.update(params or {})
+        response = api._session.requests.get(
+            self.EXPORT_URL,
+            params=export_params,
+            headers=FacebookAdsApi.HTTP_DEFAULT_HEADERS,
+            stream=True,
+        )
+        # Without access to the export, the endpoint answers with an html
+        # page instead of the csv file.
+        content_type = response.headers.get('content-type', '')
+        if response.status_code != 200 or content_type.startswith('text/html'):
+            response.close()
+            raise FacebookError(
+                'Export of report %s failed with status %s (%s)' %
+                (self.get_id(), response.status_code, content_type),
+            )
+        return response
+
+    @staticmethod
+    def _iter_export_lines(response, chunk_size):
+        # Decodes the byte stream into lines that keep their line endings,
+        # as csv needs them to parse quoted fields spanning several lines.
+        decoder = codecs.getincrementaldecoder('utf-8-sig')()
+        pending = ''
+        for chunk in response.iter_content(chunk_size):
+            lines = (pending + decoder.decode(chunk)).split('\n')
+            pending = lines.pop()
+            for line in lines:
+                yield line + '\n'
+        pending += decoder.decode(b'', True)
+        if pending:
+            yield pending
+
     def __nonzero__(self):
         return self[self.Field.async_percent_completion] == 100
 
@@ -18,8 +18,6 @@
 # FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER
 # DEALINGS IN THE SOFTWARE.
 
-from facebookads.adobjects.business import Business
-from facebookads.adobjects.adaccount import AdAccount
 
 class AdsPixelMixin:
 
@@ -66,6 +64,7 @@ class AdsPixelMixin:
 
     def get_agencies(self):
         """Returns a list of businesses associated with the ads pixel"""
+        from facebookads.adobjects.business import Business
         response = self.get_api_assured().call(
             'GET',
             (self.get_id_assured(), 'shared_agencies'),
@@ -82,6 +81,7 @@ class AdsPixelMixin:
 
     def get_ad_accounts(self, business_id):
         """Returns list of adaccounts associated with the ads pixel"""
+        from facebookads.adobjects.adaccount import AdAccount
         response = self.get_api_assured().call(
             'GET',
             (self.get_id_assured(), 'shared_accounts'),
@@ -18,11 +18,11 @@
 # FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER
 # DEALINGS IN THE SOFTWARE.
 
-from facebookads.adobjects.adsinsights import AdsInsights
 
 class BusinessMixin:
 
     def get_insights(self, fields=None, params=None, async=False):
+        from facebookads.adobjects.adsinsights import AdsInsights
         return self.iterate_edge_async(
             AdsInsights,
             fields,
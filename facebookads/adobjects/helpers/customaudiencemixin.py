@@ -19,10 +19,7 @@
 # DEALINGS IN THE SOFTWARE.
 
 from facebookads.exceptions import FacebookBadObjectError
-
-import hashlib
-import six
-import re
+from facebookads import pii_hashing
 
 class CustomAudienceMixin:
 
@@ -55,54 +52,25 @@ class CustomAudienceMixin:
                       users,
                       is_raw=False,
                       app_ids=None,
-                      pre_hashed=None):
-        hashed_users = []
-        if schema in (cls.Schema.phone_hash,
-                      cls.Schema.email_hash,
-                      cls.Schema.mobile_advertiser_id):
-            for user in users:
-                if schema == cls.Schema.email_hash:
-                    user = user.strip(" \t\r\n\0\x0B.").lower()
-                if isinstance(user, six.text_type) and not(pre_hashed):
-                    user = user.encode('utf8')  # required for hashlib
-                if pre_hashed:
-                    hashed_users.append(user)
-                else:
-                    hashed_users.append(hashlib.sha256(user).hexdigest())
-        elif isinstance(schema, list):
+                      pre_hashed=None,
+                      processes=None):
+        """
+        Returns the params of add_users and remove_users, with the users
+        normalized and hashed as the schema requires. With processes > 1
+        the users are hashed in a pool of that many processes, see
+        facebookads.pii_hashing.UserHasher.
+        """
+        if isinstance(schema, list) and not is_raw:
             # SDK will support only single PII
-            if not is_raw:
-                raise FacebookBadObjectError(
-                    "Please send single PIIs i.e. is_raw should be true. " +
-                    "The combining of the keys will be done internally.",
-                )
-            # users is array of array
-            for user in users:
-                if len(schema) != len(user):
-                    raise FacebookBadObjectError(
-                        "Number of keys in each list in the data should " +
-                        "match the number of keys specified in scheme",
-                    )
-                    break
-
-                # If the keys are already hashed then send as it is
-                if pre_hashed:
-                    hashed_users.append(user)
-                else:
-                    counter = 0
-                    hashed_user = []
-                    for key in user:
-                        key = key.strip(" \t\r\n\0\x0B.").lower()
-                        key = cls.normalize_key(schema[counter],
-                                                           str(key))
-                        if schema[counter] != \
-                                cls.Schema.MultiKeySchema.extern_id:
-                            if isinstance(key, six.text_type):
-                                key = key.encode('utf8')
-                            key = hashlib.sha256(key).hexdigest()
-                        counter = counter + 1
-                        hashed_user.append(key)
-                    hashed_users.append(hashed_user)
+            raise FacebookBadObjectError(
+                "Please send single PIIs i.e. is_raw should be true. " +
+                "The combining of the keys will be done internally.",
+            )
+        hasher = pii_hashing.UserHasher(schema, pre_hashed)
+        if processes is not None and processes > 1:
+            hashed_users = list(hasher.iter_hash_users(users, processes))
+        else:
+            hashed_users = hasher.hash_users(users)
 
         payload = {
             'schema': schema,
@@ -127,49 +95,7 @@ class CustomAudienceMixin:
         """
             Normalize the value based on the key
         """
-        if key_value is None:
-            return key_value
-
-        if(key_name == cls.Schema.MultiKeySchema.extern_id or
-           key_name == cls.Schema.MultiKeySchema.email or
-           key_name == cls.Schema.MultiKeySchema.madid):
-            return key_value
-
-        if(key_name == cls.Schema.MultiKeySchema.phone):
-            key_value = re.sub(r'[^0-9]', '', key_value)
-            return key_value
-
-        if(key_name == cls.Schema.MultiKeySchema.gen):
-            key_value = key_value.strip()[:1]
-            return key_value
-
-        if(key_name == cls.Schema.MultiKeySchema.doby):
-            key_value = re.sub(r'[^0-9]', '', key_value)
-            return key_value
-
-        if(key_name == cls.Schema.MultiKeySchema.dobm or
-           key_name == cls.Schema.MultiKeySchema.dobd):
-
-            key_value = re.sub(r'[^0-9]', '', key_value)
-            if len(key_value) == 1:
-                key_value = '0' + key_value
-            return key_value
-
-        if(key_name == cls.Schema.MultiKeySchema.ln or
-           key_name == cls.Schema.MultiKeySchema.fn or
-           key_name == cls.Schema.MultiKeySchema.ct or
-           key_name == cls.Schema.MultiKeySchema.fi or
-           key_name == cls.Schema.MultiKeySchema.st):
-            key_value = re.sub(r'[^a-zA-Z]', '', key_value)
-            return key_value
-
-        if(key_name == cls.Schema.MultiKeySchema.zip):
-            key_value = re.split('-', key_value)[0]
-            return key_value
-
-        if(key_name == cls.Schema.MultiKeySchema.country):
-            key_value = re.sub(r'[^a-zA-Z]', '', key_value)[:2]
-            return key_value
+        return pii_hashing.normalize_key(key_name, key_value)
 
     def add_users(self,
                   schema,
@@ -19,12 +19,47 @@
 # DEALINGS IN THE SOFTWARE.
 
 import base64
+import collections
+import itertools
+import time
+from multiprocessing.pool import ThreadPool
 from facebookads.api import FacebookAdsApi
 from facebookads.session import FacebookSession
 from facebookads.exceptions import FacebookError
+from facebookads.exceptions import FacebookRequestError
+
+
+class ProductBatchResult(collections.namedtuple(
+    'ProductBatchResult',
+    ['handles', 'num_requests', 'errors', 'pending'],
+)):
+    """
+    The outcome of ProductCatalog.bulk_update_products: the handles of the
+    batches, the number of item requests sent, and the errors reported for
+    items, each a dict of the API with the handle of its batch added. A
+    batch that could not be posted, or whose status could not be checked,
+    adds one error with its 'message', 'code' and the 'retailer_ids' of its
+    items instead. pending maps the handles still processing when the
+    timeout expired to the retailer ids of their items.
+    """
+
+    __slots__ = ()
+
 
 class ProductCatalogMixin:
 
+    # Number of item requests the batch endpoint accepts per call.
+    MAX_BATCH_REQUESTS = 5000
+
+    class BatchMethod(object):
+        create = 'CREATE'
+        update = 'UPDATE'
+        delete = 'DELETE'
+
+    class BatchStatus(object):
+        finished = 'finished'
+        error = 'error'
+
     class Role(object):
         admin = 'ADMIN'
 
@@ -134,6 +169,189 @@ class ProductCatalogMixin:
             params=kwargs,
         )
 
+    def bulk_update_products(
+        self,
+        updates,
+        batch_size=MAX_BATCH_REQUESTS,
+        max_workers=4,
+        poll_interval=1.0,
+        timeout=None,
+        sleep=time.sleep,
+        max_retries=3,
+        retry_interval=1.0,
+    ):
+        """Creates, updates or deletes many products through the batch
+        endpoint of the catalog, instead of one request per product.
+
+        Args:
+            updates: An iterable of item requests, either dicts with
+                'method' (a BatchMethod, UPDATE by default), 'retailer_id'
+                and 'data', or (retailer_id, data) tuples to update.
+            batch_size: Item requests per batch call, at most
+                MAX_BATCH_REQUESTS.
+            max_workers: Number of batch calls in flight.
+            poll_interval: Seconds between status checks of the handles.
+            timeout: Seconds to wait for the batches to be processed, None
+                to wait until they are. The batches still processing then
+                are returned as pending.
+            sleep: The function used to wait between status checks and
+                before retries.
+            max_retries: Attempts after the first of a batch call, or of a
+                status check, that failed with a transient error.
+            retry_interval: Seconds before the first retry, doubled at each
+                one.
+
+        Returns:
+            A ProductBatchResult.
+        """
+        if not 0 < batch_size <= self.MAX_BATCH_REQUESTS:
+            raise FacebookError(
+                'batch_size must be between 1 and %d' %
+                self.MAX_BATCH_REQUESTS,
+            )
+        requests = (self._get_batch_request(update) for update in updates)
+        batches = iter(
+            lambda: list(itertools.islice(requests, batch_size)),
+            [],
+        )
+
+        handles = []
+        errors = []
+        retailer_ids = {}
+        num_requests = 0
+
+        def collect(batch, result):
+            batch_handles, batch_errors = result.get()
+            handles.extend(batch_handles)
+            errors.extend(batch_errors)
+            for handle in batch_handles:
+                retailer_ids[handle] = [
+                    request.get('retailer_id') for request in batch
+                ]
+
+        pool = ThreadPool(max_workers)
+        try:
+            pending = collections.deque()
+            for batch in batches:
+                num_requests += len(batch)
+                pending.append((batch, pool.apply_async(
+                    self._post_product_batch,
+                    (batch, max_retries, retry_interval, sleep),
+                )))
+                if len(pending) >= 2 * max_workers:
+                    collect(*pending.popleft())
+            while pending:
+                collect(*pending.popleft())
+        finally:
+            pool.terminate()
+            pool.join()
+
+        status_errors, waiting = self._wait_product_batches(
+            handles, retailer_ids, poll_interval, timeout, sleep,
+            max_retries, retry_interval)
+        errors.extend(status_errors)
+        return ProductBatchResult(
+            handles,
+            num_requests,
+            errors,
+            dict((handle, retailer_ids[handle]) for handle in waiting),
+        )
+
+    def _get_batch_request(self, update):
+        if isinstance(update, tuple):
+            retailer_id, data = update
+            update = {'retailer_id': retailer_id, 'data': data}
+        request = {'method': self.BatchMethod.update}
+        request.update(update)
+        return request
+
+    def _post_product_batch(self, batch, max_retries, retry_interval, sleep):
+        # Returns the handles of the batch and, if it failed, its error.
+        interval = retry_interval
+        for attempt in itertools.count():
+            try:
+                response = self.get_api_assured().call(
+                    'POST',
+                    (self.get_id_assured(), 'batch'),
+                    params={'requests': batch},
+                ).json()
+            except FacebookRequestError as e:
+                if attempt < max_retries and e.is_transient():
+                    sleep(interval)
+                    interval *= 2
+                    continue
+                return [], [{
+                    'message': e.api_error_message() or e.get_message(),
+                    'code': e.api_error_code(),
+                    'retailer_ids': [
+                        request.get('retailer_id') for request in batch
+                    ],
+                }]
+            return response.get('handles', []), []
+
+    def _wait_product_batches(
+        self,
+        handles,
+        retailer_ids,
+        poll_interval,
+        timeout,
+        sleep,
+        max_retries,
+        retry_interval,
+    ):
+        # Returns the item errors and the handles still processing at the
+        # deadline. A handle whose status checks keep failing gets one error
+        # with the retailer ids of its batch.
+        deadline = None if timeout is None else time.time() + timeout
+        errors = []
+        failures = collections.Counter()
+        waiting = list(handles)
+        while waiting:
+            still_waiting = []
+            interval = poll_interval
+            for handle in waiting:
+                try:
+                    response = self.get_api_assured().call(
+                        'GET',
+                        (self.get_id_assured(), 'check_batch_request_status'),
+                        params={'handle': handle},
+                    ).json()
+                except FacebookRequestError as e:
+                    if failures[handle] < max_retries and e.is_transient():
+                        interval = max(
+                            interval,
+                            retry_interval * 2 ** failures[handle],
+                        )
+                        failures[handle] += 1
+                        still_waiting.append(handle)
+                        continue
+                    errors.append({
+                        'message': e.api_error_message() or e.get_message(),
+                        'code': e.api_error_code(),
+                        'handle': handle,
+                        'retailer_ids': retailer_ids.get(handle, []),
+                    })
+                    continue
+                failures.pop(handle, None)
+                statuses = response.get('data') or [{}]
+                status = statuses[0]
+                if status.get('status') in (
+                    self.BatchStatus.finished,
+                    self.BatchStatus.error,
+                ):
+                    for error in status.get('errors') or ():
+                        error = dict(error)
+                        error['handle'] = handle
+                        errors.append(error)
+                else:
+                    still_waiting.append(handle)
+            waiting = still_waiting
+            if waiting:
+                if deadline is not None and time.time() >= deadline:
+                    break
+                sleep(interval)
+        return errors, waiting
+
     def b64_encoded_id(self, retailer_id):
         # # we need a byte string for base64.b64encode argument
         b64_id = base64.urlsafe_b64encode(retailer_id.encode('utf8'))
@@ -20,9 +20,7 @@
 
 from facebookads.adobjects.abstractobject import AbstractObject
 from facebookads.adobjects.abstractcrudobject import AbstractCrudObject
-from facebookads.adobjects.objectparser import ObjectParser
-from facebookads.api import FacebookRequest
-from facebookads.typechecker import TypeChecker
+from facebookads.adobjects.apimethod import ApiMethod
 
 """
 This class is auto-generated.
@@ -63,36 +61,19 @@ class Hotel(
         from facebookads.adobjects.productcatalog import ProductCatalog
         return ProductCatalog(api=self._api, fbid=parent_id).create_hotel(fields, params, batch, pending)
 
-    def api_get(self, fields=None, params=None, batch=None, pending=False):
-        param_types = {
-        }
-        enums = {
-        }
-        request = FacebookRequest(
-            node_id=self['id'],
-            method='GET',
-            endpoint='/',
-            api=self._api,
-            param_checker=TypeChecker(param_types, enums),
-            target_class=Hotel,
-            api_type='NODE',
-            response_parser=ObjectParser(reuse_object=self),
-        )
-        request.add_params(params)
-        request.add_fields(fields)
-
-        if batch is not None:
-            request.add_to_batch(batch)
-            return request
-        elif pending:
-            return request
-        else:
-            self.assure_call()
-            return request.execute()
-
-    def create_hotel_room(self, fields=None, params=None, batch=None, pending=False):
-        from facebookads.adobjects.hotelroom import HotelRoom
-        param_types = {
+    api_get = ApiMethod(
+        method='GET',
+        endpoint='/',
+        target='hotel.Hotel',
+        api_type='NODE',
+    )
+
+    create_hotel_room = ApiMethod(
+        method='POST',
+        endpoint='/hotel_rooms',
+        target='hotelroom.HotelRoom',
+        api_type='EDGE',
+        param_types={
             'applinks': 'Object',
             'base_price': 'float',
             'currency': 'string',
@@ -103,30 +84,8 @@ class Hotel(
             'pricing_variables': 'list<Object>',
             'room_id': 'string',
             'url': 'string',
-        }
-        enums = {
-        }
-        request = FacebookRequest(
-            node_id=self['id'],
-            method='POST',
-            endpoint='/hotel_rooms',
-            api=self._api,
-            param_checker=TypeChecker(param_types, enums),
-            target_class=HotelRoom,
-            api_type='EDGE',
-            response_parser=ObjectParser(target_class=HotelRoom),
-        )
-        request.add_params(params)
-        request.add_fields(fields)
-
-        if batch is not None:
-            request.add_to_batch(batch)
-            return request
-        elif pending:
-            return request
-        else:
-            self.assure_call()
-            return request.execute()
+        },
+    )
 
     _field_types = {
         'address': 'string',
@@ -22,6 +22,7 @@ from facebookads.exceptions import (
     FacebookBadObjectError,
 )
 from facebookads.adobjects.abstractobject import AbstractObject
+from facebookads.adobjects.compactobject import CompactObject
 import collections
 
 class ObjectParser:
@@ -35,6 +36,7 @@ class ObjectParser:
         target_class=None,
         reuse_object=None,
         custom_parse_method=None,
+        compact=False,
     ):
         """ Initialize an ObjectParser.
         To Initialize, you need to provide either a resuse_object, target_class,
@@ -44,6 +46,8 @@ class ObjectParser:
             target_class (optional): The expected return object type.
             reuse_object (optional): Reuse existing object to populate response.
             custom_parse_method (optional): Custom parsing method.
+            compact (optional): Build CompactObject records of target_class
+                instead of full objects, to save memory on large results.
         """
         if not any([target_class, reuse_object is not None, custom_parse_method]):
             raise FacebookBadObjectError(
@@ -53,6 +57,7 @@ class ObjectParser:
         self._target_class = target_class
         self._custom_parse_method = custom_parse_method
         self._api = api
+        self._compact = compact
 
     @classmethod
     def assure_response_valid(cls, data):
@@ -81,10 +86,10 @@ class ObjectParser:
 
         if self._reuse_object is not None:
             self._reuse_object._set_data(data)
+            self._map_identity(self._reuse_object)
             return self._reuse_object
         elif self._target_class is not None:
-            return AbstractObject.create_object(self._api, data,
-                                                self._target_class)
+            return self._create_object(data)
         else:
             raise FacebookBadObjectError(
                 'Must specify either target class calling object' +
@@ -106,7 +111,18 @@ class ObjectParser:
                 ret.append(self.parse_single(response['data']))
         else:
             data = response['data'] if 'data' in response else response
-            ret = [AbstractObject.create_object(self._api, data,
-                                                self._target_class)]
+            ret = [self._create_object(data)]
 
         return ret
+
+    def _map_identity(self, obj):
+        identity_map = AbstractObject._get_identity_map(
+            self._api or getattr(obj, '_api', None))
+        if identity_map is not None and hasattr(obj, 'get_id') and obj.get_id():
+            identity_map.add(obj)
+
+    def _create_object(self, data):
+        if self._compact:
+            return CompactObject(self._target_class, data, api=self._api)
+        return AbstractObject.create_object(self._api, data,
+                                            self._target_class)
@@ -20,10 +20,8 @@
 
 from facebookads.adobjects.abstractobject import AbstractObject
 from facebookads.adobjects.abstractcrudobject import AbstractCrudObject
-from facebookads.adobjects.objectparser import ObjectParser
+from facebookads.adobjects.apimethod import ApiMethod
 from facebookads.adobjects.facebookuser import FacebookUser
-from facebookads.api import FacebookRequest
-from facebookads.typechecker import TypeChecker
 from facebookads.mixins import (
     CannotCreate,
     CannotDelete,
@@ -31,7 +29,7 @@ from facebookads.mixins import (
 )
 
 from facebookads.api import FacebookRequest
-from facebookads.typechecker import TypeChecker
+from facebookads.typechecker import ParamSchema
 
 """
 This class is auto-generated.
@@ -115,32 +113,12 @@ class Post(
         video = 'video'
         offer = 'offer'
 
-    def api_get(self, fields=None, params=None, batch=None, pending=False):
-        param_types = {
-        }
-        enums = {
-        }
-        request = FacebookRequest(
-            node_id=self['id'],
-            method='GET',
-            endpoint='/',
-            api=self._api,
-            param_checker=TypeChecker(param_types, enums),
-            target_class=Post,
-            api_type='NODE',
-            response_parser=ObjectParser(reuse_object=self),
-        )
-        request.add_params(params)
-        request.add_fields(fields)
-
-        if batch is not None:
-            request.add_to_batch(batch)
-            return request
-        elif pending:
-            return request
-        else:
-            self.assure_call()
-            return request.execute()
+    api_get = ApiMethod(
+        method='GET',
+        endpoint='/',
+        target='post.Post',
+        api_type='NODE',
+    )
 
 
     @classmethod
@@ -20,9 +20,7 @@
 
 from facebookads.adobjects.abstractobject import AbstractObject
 from facebookads.adobjects.abstractcrudobject import AbstractCrudObject
-from facebookads.adobjects.objectparser import ObjectParser
-from facebookads.api import FacebookRequest
-from facebookads.typechecker import TypeChecker
+from facebookads.adobjects.apimethod import ApiMethod
 from facebookads.adobjects.helpers.productcatalogmixin import ProductCatalogMixin
 
 """
@@ -64,265 +62,92 @@ class ProductCatalog(
         from facebookads.adobjects.business import Business
         return Business(api=self._api, fbid=parent_id).create_product_catalog(fields, params, batch, pending)
 
-    def api_delete(self, fields=None, params=None, batch=None, pending=False):
-        param_types = {
-        }
-        enums = {
-        }
-        request = FacebookRequest(
-            node_id=self['id'],
-            method='DELETE',
-            endpoint='/',
-            api=self._api,
-            param_checker=TypeChecker(param_types, enums),
-            target_class=AbstractCrudObject,
-            api_type='NODE',
-            response_parser=ObjectParser(reuse_object=self),
-        )
-        request.add_params(params)
-        request.add_fields(fields)
-
-        if batch is not None:
-            request.add_to_batch(batch)
-            return request
-        elif pending:
-            return request
-        else:
-            self.assure_call()
-            return request.execute()
-
-    def api_get(self, fields=None, params=None, batch=None, pending=False):
-        param_types = {
-        }
-        enums = {
-        }
-        request = FacebookRequest(
-            node_id=self['id'],
-            method='GET',
-            endpoint='/',
-            api=self._api,
-            param_checker=TypeChecker(param_types, enums),
-            target_class=ProductCatalog,
-            api_type='NODE',
-            response_parser=ObjectParser(reuse_object=self),
-        )
-        request.add_params(params)
-        request.add_fields(fields)
-
-        if batch is not None:
-            request.add_to_batch(batch)
-            return request
-        elif pending:
-            return request
-        else:
-            self.assure_call()
-            return request.execute()
-
-    def api_update(self, fields=None, params=None, batch=None, pending=False):
-        param_types = {
+    api_delete = ApiMethod(
+        method='DELETE',
+        endpoint='/',
+        target='abstractcrudobject.AbstractCrudObject',
+        api_type='NODE',
+    )
+
+    api_get = ApiMethod(
+        method='GET',
+        endpoint='/',
+        target='productcatalog.ProductCatalog',
+        api_type='NODE',
+    )
+
+    api_update = ApiMethod(
+        method='POST',
+        endpoint='/',
+        target='productcatalog.ProductCatalog',
+        api_type='NODE',
+        param_types={
             'name': 'string',
-        }
-        enums = {
-        }
-        request = FacebookRequest(
-            node_id=self['id'],
-            method='POST',
-            endpoint='/',
-            api=self._api,
-            param_checker=TypeChecker(param_types, enums),
-            target_class=ProductCatalog,
-            api_type='NODE',
-            response_parser=ObjectParser(reuse_object=self),
-        )
-        request.add_params(params)
-        request.add_fields(fields)
-
-        if batch is not None:
-            request.add_to_batch(batch)
-            return request
-        elif pending:
-            return request
-        else:
-            self.assure_call()
-            return request.execute()
-
-    def get_agencies(self, fields=None, params=None, batch=None, pending=False):
-        from facebookads.adobjects.business import Business
-        param_types = {
-        }
-        enums = {
-        }
-        request = FacebookRequest(
-            node_id=self['id'],
-            method='GET',
-            endpoint='/agencies',
-            api=self._api,
-            param_checker=TypeChecker(param_types, enums),
-            target_class=Business,
-            api_type='EDGE',
-            response_parser=ObjectParser(target_class=Business),
-        )
-        request.add_params(params)
-        request.add_fields(fields)
-
-        if batch is not None:
-            request.add_to_batch(batch)
-            return request
-        elif pending:
-            return request
-        else:
-            self.assure_call()
-            return request.execute()
-
-    def get_external_event_sources(self, fields=None, params=None, batch=None, pending=False):
-        from facebookads.adobjects.externaleventsource import ExternalEventSource
-        param_types = {
-        }
-        enums = {
-        }
-        request = FacebookRequest(
-            node_id=self['id'],
-            method='GET',
-            endpoint='/external_event_sources',
-            api=self._api,
-            param_checker=TypeChecker(param_types, enums),
-            target_class=ExternalEventSource,
-            api_type='EDGE',
-            response_parser=ObjectParser(target_class=ExternalEventSource),
-        )
-        request.add_params(params)
-        request.add_fields(fields)
-
-        if batch is not None:
-            request.add_to_batch(batch)
-            return request
-        elif pending:
-            return request
-        else:
-            self.assure_call()
-            return request.execute()
-
-    def create_external_event_source(self, fields=None, params=None, batch=None, pending=False):
-        from facebookads.adobjects.externaleventsource import ExternalEventSource
-        param_types = {
+        },
+    )
+
+    get_agencies = ApiMethod(
+        method='GET',
+        endpoint='/agencies',
+        target='business.Business',
+        api_type='EDGE',
+    )
+
+    get_external_event_sources = ApiMethod(
+        method='GET',
+        endpoint='/external_event_sources',
+        target='externaleventsource.ExternalEventSource',
+        api_type='EDGE',
+    )
+
+    create_external_event_source = ApiMethod(
+        method='POST',
+        endpoint='/external_event_sources',
+        target='externaleventsource.ExternalEventSource',
+        api_type='EDGE',
+        param_types={
             'external_event_sources': 'list<string>',
-        }
-        enums = {
-        }
-        request = FacebookRequest(
-            node_id=self['id'],
-            method='POST',
-            endpoint='/external_event_sources',
-            api=self._api,
-            param_checker=TypeChecker(param_types, enums),
-            target_class=ExternalEventSource,
-            api_type='EDGE',
-            response_parser=ObjectParser(target_class=ExternalEventSource),
-        )
-        request.add_params(params)
-        request.add_fields(fields)
-
-        if batch is not None:
-            request.add_to_batch(batch)
-            return request
-        elif pending:
-            return request
-        else:
-            self.assure_call()
-            return request.execute()
-
-    def get_hotel_rooms_batch(self, fields=None, params=None, batch=None, pending=False):
-        from facebookads.adobjects.productcataloghotelroomsbatch import ProductCatalogHotelRoomsBatch
-        param_types = {
+        },
+    )
+
+    get_hotel_rooms_batch = ApiMethod(
+        method='GET',
+        endpoint='/hotel_rooms_batch',
+        target='productcataloghotelroomsbatch.ProductCatalogHotelRoomsBatch',
+        api_type='EDGE',
+        param_types={
             'handle': 'string',
-        }
-        enums = {
-        }
-        request = FacebookRequest(
-            node_id=self['id'],
-            method='GET',
-            endpoint='/hotel_rooms_batch',
-            api=self._api,
-            param_checker=TypeChecker(param_types, enums),
-            target_class=ProductCatalogHotelRoomsBatch,
-            api_type='EDGE',
-            response_parser=ObjectParser(target_class=ProductCatalogHotelRoomsBatch),
-        )
-        request.add_params(params)
-        request.add_fields(fields)
-
-        if batch is not None:
-            request.add_to_batch(batch)
-            return request
-        elif pending:
-            return request
-        else:
-            self.assure_call()
-            return request.execute()
-
-    def create_hotel_rooms_batch(self, fields=None, params=None, batch=None, pending=False):
-        from facebookads.adobjects.productcataloghotelroomsbatch import ProductCatalogHotelRoomsBatch
-        param_types = {
+        },
+    )
+
+    create_hotel_rooms_batch = ApiMethod(
+        method='POST',
+        endpoint='/hotel_rooms_batch',
+        target='productcataloghotelroomsbatch.ProductCatalogHotelRoomsBatch',
+        api_type='EDGE',
+        param_types={
             'file': 'file',
             'standard': 'standard_enum',
             'update_only': 'bool',
-        }
-        enums = {
-            'standard_enum': ProductCatalogHotelRoomsBatch.Standard.__dict__.values(),
-        }
-        request = FacebookRequest(
-            node_id=self['id'],
-            method='POST',
-            endpoint='/hotel_rooms_batch',
-            api=self._api,
-            param_checker=TypeChecker(param_types, enums),
-            target_class=ProductCatalogHotelRoomsBatch,
-            api_type='EDGE',
-            response_parser=ObjectParser(target_class=ProductCatalogHotelRoomsBatch),
-        )
-        request.add_params(params)
-        request.add_fields(fields)
-
-        if batch is not None:
-            request.add_to_batch(batch)
-            return request
-        elif pending:
-            return request
-        else:
-            self.assure_call()
-            return request.execute()
-
-    def get_hotels(self, fields=None, params=None, batch=None, pending=False):
-        from facebookads.adobjects.hotel import Hotel
-        param_types = {
-        }
-        enums = {
-        }
-        request = FacebookRequest(
-            node_id=self['id'],
-            method='GET',
-            endpoint='/hotels',
-            api=self._api,
-            param_checker=TypeChecker(param_types, enums),
-            target_class=Hotel,
-            api_type='EDGE',
-            response_parser=ObjectParser(target_class=Hotel),
-        )
-        request.add_params(params)
-        request.add_fields(fields)
-
-        if batch is not None:
-            request.add_to_batch(batch)
-            return request
-        elif pending:
-            return request
-        else:
-            self.assure_call()
-            return request.execute()
-
-    def create_hotel(self, fields=None, params=None, batch=None, pending=False):
-        from facebookads.adobjects.hotel import Hotel
-        param_types = {
+        },
+        enums={
+            'standard_enum': 'productcataloghotelroomsbatch.ProductCatalogHotelRoomsBatch.Standard',
+        },
+    )
+
+    get_hotels = ApiMethod(
+        method='GET',
+        endpoint='/hotels',
+        target='hotel.Hotel',
+        api_type='EDGE',
+    )
+
+    create_hotel = ApiMethod(
+        method='POST',
+        endpoint='/hotels',
+        target='hotel.Hotel',
+        api_type='EDGE',
+        param_types={
             'address': 'Object',
             'applinks': 'Object',
             'brand': 'string',
@@ -334,90 +159,32 @@ class ProductCatalog(
             'phone': 'string',
             'star_rating': 'float',
             'url': 'string',
-        }
-        enums = {
-        }
-        request = FacebookRequest(
-            node_id=self['id'],
-            method='POST',
-            endpoint='/hotels',
-            api=self._api,
-            param_checker=TypeChecker(param_types, enums),
-            target_class=Hotel,
-            api_type='EDGE',
-            response_parser=ObjectParser(target_class=Hotel),
-        )
-        request.add_params(params)
-        request.add_fields(fields)
-
-        if batch is not None:
-            request.add_to_batch(batch)
-            return request
-        elif pending:
-            return request
-        else:
-            self.assure_call()
-            return request.execute()
-
-    def get_pricing_variables_batch(self, fields=None, params=None, batch=None, pending=False):
-        param_types = {
+        },
+    )
+
+    get_pricing_variables_batch = ApiMethod(
+        method='GET',
+        endpoint='/pricing_variables_batch',
+        target='abstractcrudobject.AbstractCrudObject',
+        api_type='EDGE',
+        param_types={
             'handle': 'string',
-        }
-        enums = {
-        }
-        request = FacebookRequest(
-            node_id=self['id'],
-            method='GET',
-            endpoint='/pricing_variables_batch',
-            api=self._api,
-            param_checker=TypeChecker(param_types, enums),
-            target_class=AbstractCrudObject,
-            api_type='EDGE',
-            response_parser=ObjectParser(target_class=AbstractCrudObject),
-        )
-        request.add_params(params)
-        request.add_fields(fields)
-
-        if batch is not None:
-            request.add_to_batch(batch)
-            return request
-        elif pending:
-            return request
-        else:
-            self.assure_call()
-            return request.execute()
-
-    def get_product_feeds(self, fields=None, params=None, batch=None, pending=False):
-        from facebookads.adobjects.productfeed import ProductFeed
-        param_types = {
-        }
-        enums = {
-        }
-        request = FacebookRequest(
-            node_id=self['id'],
-            method='GET',
-            endpoint='/product_feeds',
-            api=self._api,
-            param_checker=TypeChecker(param_types, enums),
-            target_class=ProductFeed,
-            api_type='EDGE',
-            response_parser=ObjectParser(target_class=ProductFeed),
-        )
-        request.add_params(params)
-        request.add_fields(fields)
-
-        if batch is not None:
-            request.add_to_batch(batch)
-            return request
-        elif pending:
-            return request
-        else:
-            self.assure_call()
-            return request.execute()
-
-    def create_product_feed(self, fields=None, params=None, batch=None, pending=False):
-        from facebookads.adobjects.productfeed import ProductFeed
-        param_types = {
+        },
+    )
+
+    get_product_feeds = ApiMethod(
+        method='GET',
+        endpoint='/product_feeds',
+        target='productfeed.ProductFeed',
+        api_type='EDGE',
+    )
+
+    create_product_feed = ApiMethod(
+        method='POST',
+        endpoint='/product_feeds',
+        target='productfeed.ProductFeed',
+        api_type='EDGE',
+        param_types={
             'country': 'string',
             'default_currency': 'string',
             'deletion_enabled': 'bool',
@@ -427,214 +194,82 @@ class ProductCatalog(
             'name': 'string',
             'quoted_fields_mode': 'quoted_fields_mode_enum',
             'schedule': 'string',
-        }
-        enums = {
-            'delimiter_enum': ProductFeed.Delimiter.__dict__.values(),
-            'encoding_enum': ProductFeed.Encoding.__dict__.values(),
-            'quoted_fields_mode_enum': ProductFeed.QuotedFieldsMode.__dict__.values(),
-        }
-        request = FacebookRequest(
-            node_id=self['id'],
-            method='POST',
-            endpoint='/product_feeds',
-            api=self._api,
-            param_checker=TypeChecker(param_types, enums),
-            target_class=ProductFeed,
-            api_type='EDGE',
-            response_parser=ObjectParser(target_class=ProductFeed),
-        )
-        request.add_params(params)
-        request.add_fields(fields)
-
-        if batch is not None:
-            request.add_to_batch(batch)
-            return request
-        elif pending:
-            return request
-        else:
-            self.assure_call()
-            return request.execute()
-
-    def get_product_groups(self, fields=None, params=None, batch=None, pending=False):
-        from facebookads.adobjects.productgroup import ProductGroup
-        param_types = {
-        }
-        enums = {
-        }
-        request = FacebookRequest(
-            node_id=self['id'],
-            method='GET',
-            endpoint='/product_groups',
-            api=self._api,
-            param_checker=TypeChecker(param_types, enums),
-            target_class=ProductGroup,
-            api_type='EDGE',
-            response_parser=ObjectParser(target_class=ProductGroup),
-        )
-        request.add_params(params)
-        request.add_fields(fields)
-
-        if batch is not None:
-            request.add_to_batch(batch)
-            return request
-        elif pending:
-            return request
-        else:
-            self.assure_call()
-            return request.execute()
-
-    def create_product_group(self, fields=None, params=None, batch=None, pending=False):
-        from facebookads.adobjects.productgroup import ProductGroup
-        param_types = {
+        },
+        enums={
+            'delimiter_enum': 'productfeed.ProductFeed.Delimiter',
+            'encoding_enum': 'productfeed.ProductFeed.Encoding',
+            'quoted_fields_mode_enum': 'productfeed.ProductFeed.QuotedFieldsMode',
+        },
+    )
+
+    get_product_groups = ApiMethod(
+        method='GET',
+        endpoint='/product_groups',
+        target='productgroup.ProductGroup',
+        api_type='EDGE',
+    )
+
+    create_product_group = ApiMethod(
+        method='POST',
+        endpoint='/product_groups',
+        target='productgroup.ProductGroup',
+        api_type='EDGE',
+        param_types={
             'retailer_id': 'string',
             'variants': 'list<Object>',
-        }
-        enums = {
-        }
-        request = FacebookRequest(
-            node_id=self['id'],
-            method='POST',
-            endpoint='/product_groups',
-            api=self._api,
-            param_checker=TypeChecker(param_types, enums),
-            target_class=ProductGroup,
-            api_type='EDGE',
-            response_parser=ObjectParser(target_class=ProductGroup),
-        )
-        request.add_params(params)
-        request.add_fields(fields)
-
-        if batch is not None:
-            request.add_to_batch(batch)
-            return request
-        elif pending:
-            return request
-        else:
-            self.assure_call()
-            return request.execute()
-
-    def get_product_sets(self, fields=None, params=None, batch=None, pending=False):
-        from facebookads.adobjects.productset import ProductSet
-        param_types = {
+        },
+    )
+
+    get_product_sets = ApiMethod(
+        method='GET',
+        endpoint='/product_sets',
+        target='productset.ProductSet',
+        api_type='EDGE',
+        param_types={
             'ancestor_id': 'string',
             'has_children': 'bool',
             'parent_id': 'string',
             'retailer_id': 'string',
-        }
-        enums = {
-        }
-        request = FacebookRequest(
-            node_id=self['id'],
-            method='GET',
-            endpoint='/product_sets',
-            api=self._api,
-            param_checker=TypeChecker(param_types, enums),
-            target_class=ProductSet,
-            api_type='EDGE',
-            response_parser=ObjectParser(target_class=ProductSet),
-        )
-        request.add_params(params)
-        request.add_fields(fields)
-
-        if batch is not None:
-            request.add_to_batch(batch)
-            return request
-        elif pending:
-            return request
-        else:
-            self.assure_call()
-            return request.execute()
-
-    def create_product_set(self, fields=None, params=None, batch=None, pending=False):
-        from facebookads.adobjects.productset import ProductSet
-        param_types = {
+        },
+    )
+
+    create_product_set = ApiMethod(
+        method='POST',
+        endpoint='/product_sets',
+        target='productset.ProductSet',
+        api_type='EDGE',
+        param_types={
             'filter': 'Object',
             'name': 'string',
-        }
-        enums = {
-        }
-        request = FacebookRequest(
-            node_id=self['id'],
-            method='POST',
-            endpoint='/product_sets',
-            api=self._api,
-            param_checker=TypeChecker(param_types, enums),
-            target_class=ProductSet,
-            api_type='EDGE',
-            response_parser=ObjectParser(target_class=ProductSet),
-        )
-        request.add_params(params)
-        request.add_fields(fields)
-
-        if batch is not None:
-            request.add_to_batch(batch)
-            return request
-        elif pending:
-            return request
-        else:
-            self.assure_call()
-            return request.execute()
-
-    def get_product_sets_batch(self, fields=None, params=None, batch=None, pending=False):
-        param_types = {
+        },
+    )
+
+    get_product_sets_batch = ApiMethod(
+        method='GET',
+        endpoint='/product_sets_batch',
+        target='abstractcrudobject.AbstractCrudObject',
+        api_type='EDGE',
+        param_types={
             'handle': 'string',
-        }
-        enums = {
-        }
-        request = FacebookRequest(
-            node_id=self['id'],
-            method='GET',
-            endpoint='/product_sets_batch',
-            api=self._api,
-            param_checker=TypeChecker(param_types, enums),
-            target_class=AbstractCrudObject,
-            api_type='EDGE',
-            response_parser=ObjectParser(target_class=AbstractCrudObject),
-        )
-        request.add_params(params)
-        request.add_fields(fields)
-
-        if batch is not None:
-            request.add_to_batch(batch)
-            return request
-        elif pending:
-            return request
-        else:
-            self.assure_call()
-            return request.execute()
-
-    def get_products(self, fields=None, params=None, batch=None, pending=False):
-        from facebookads.adobjects.productitem import ProductItem
-        param_types = {
+        },
+    )
+
+    get_products = ApiMethod(
+        method='GET',
+        endpoint='/products',
+        target='productitem.ProductItem',
+        api_type='EDGE',
+        param_types={
             'filter': 'Object',
-        }
-        enums = {
-        }
-        request = FacebookRequest(
-            node_id=self['id'],
-            method='GET',
-            endpoint='/products',
-            api=self._api,
-            param_checker=TypeChecker(param_types, enums),
-            target_class=ProductItem,
-            api_type='EDGE',
-            response_parser=ObjectParser(target_class=ProductItem),
-        )
-        request.add_params(params)
-        request.add_fields(fields)
-
-        if batch is not None:
-            request.add_to_batch(batch)
-            return request
-        elif pending:
-            return request
-        else:
-            self.assure_call()
-            return request.execute()
-
-    def create_product(self, fields=None, params=None, batch=None, pending=False):
-        from facebookads.adobjects.productitem import ProductItem
-        param_types = {
+        },
+    )
+
+    create_product = ApiMethod(
+        method='POST',
+        endpoint='/products',
+        target='productitem.ProductItem',
+        api_type='EDGE',
+        param_types={
             'additional_image_urls': 'list<string>',
             'android_app_name': 'string',
             'android_class': 'string',
@@ -686,38 +321,21 @@ class ProductCatalog(
             'windows_phone_app_id': 'unsigned int',
             'windows_phone_app_name': 'string',
             'windows_phone_url': 'string',
-        }
-        enums = {
-            'availability_enum': ProductItem.Availability.__dict__.values(),
-            'condition_enum': ProductItem.Condition.__dict__.values(),
-            'gender_enum': ProductItem.Gender.__dict__.values(),
-            'visibility_enum': ProductItem.Visibility.__dict__.values(),
-        }
-        request = FacebookRequest(
-            node_id=self['id'],
-            method='POST',
-            endpoint='/products',
-            api=self._api,
-            param_checker=TypeChecker(param_types, enums),
-            target_class=ProductItem,
-            api_type='EDGE',
-            response_parser=ObjectParser(target_class=ProductItem),
-        )
-        request.add_params(params)
-        request.add_fields(fields)
-
-        if batch is not None:
-            request.add_to_batch(batch)
-            return request
-        elif pending:
-            return request
-        else:
-            self.assure_call()
-            return request.execute()
-
-    def create_video(self, fields=None, params=None, batch=None, pending=False):
-        from facebookads.adobjects.advideo import AdVideo
-        param_types = {
+        },
+        enums={
+            'availability_enum': 'productitem.ProductItem.Availability',
+            'condition_enum': 'productitem.ProductItem.Condition',
+            'gender_enum': 'productitem.ProductItem.Gender',
+            'visibility_enum': 'productitem.ProductItem.Visibility',
+        },
+    )
+
+    create_video = ApiMethod(
+        method='POST',
+        endpoint='/videos',
+        target='abstractcrudobject.AbstractCrudObject',
+        api_type='EDGE',
+        param_types={
             'content_category': 'content_category_enum',
             'description': 'string',
             'embeddable': 'bool',
@@ -733,8 +351,8 @@ class ProductCatalog(
             'upload_phase': 'upload_phase_enum',
             'upload_session_id': 'string',
             'video_file_chunk': 'string',
-        }
-        enums = {
+        },
+        enums={
             'content_category_enum': [
                 'BEAUTY_FASHION',
                 'BUSINESS',
@@ -766,28 +384,8 @@ class ProductCatalog(
                 'finish',
                 'cancel',
             ],
-        }
-        request = FacebookRequest(
-            node_id=self['id'],
-            method='POST',
-            endpoint='/videos',
-            api=self._api,
-            param_checker=TypeChecker(param_types, enums),
-            target_class=AbstractCrudObject,
-            api_type='EDGE',
-            response_parser=ObjectParser(target_class=AbstractCrudObject),
-        )
-        request.add_params(params)
-        request.add_fields(fields)
-
-        if batch is not None:
-            request.add_to_batch(batch)
-            return request
-        elif pending:
-            return request
-        else:
-            self.assure_call()
-            return request.execute()
+        },
+    )
 
     _field_types = {
         'business': 'Business',
@@ -20,9 +20,7 @@
 
 from facebookads.adobjects.abstractobject import AbstractObject
 from facebookads.adobjects.abstractcrudobject import AbstractCrudObject
-from facebookads.adobjects.objectparser import ObjectParser
-from facebookads.api import FacebookRequest
-from facebookads.typechecker import TypeChecker
+from facebookads.adobjects.apimethod import ApiMethod
 
 """
 This class is auto-generated.
@@ -85,62 +83,26 @@ class ProductFeed(
         from facebookads.adobjects.productcatalog import ProductCatalog
         return ProductCatalog(api=self._api, fbid=parent_id).create_product_feed(fields, params, batch, pending)
 
-    def api_delete(self, fields=None, params=None, batch=None, pending=False):
-        param_types = {
-        }
-        enums = {
-        }
-        request = FacebookRequest(
-            node_id=self['id'],
-            method='DELETE',
-            endpoint='/',
-            api=self._api,
-            param_checker=TypeChecker(param_types, enums),
-            target_class=AbstractCrudObject,
-            api_type='NODE',
-            response_parser=ObjectParser(reuse_object=self),
-        )
-        request.add_params(params)
-        request.add_fields(fields)
-
-        if batch is not None:
-            request.add_to_batch(batch)
-            return request
-        elif pending:
-            return request
-        else:
-            self.assure_call()
-            return request.execute()
-
-    def api_get(self, fields=None, params=None, batch=None, pending=False):
-        param_types = {
-        }
-        enums = {
-        }
-        request = FacebookRequest(
-            node_id=self['id'],
-            method='GET',
-            endpoint='/',
-            api=self._api,
-            param_checker=TypeChecker(param_types, enums),
-            target_class=ProductFeed,
-            api_type='NODE',
-            response_parser=ObjectParser(reuse_object=self),
-        )
-        request.add_params(params)
-        request.add_fields(fields)
-
-        if batch is not None:
-            request.add_to_batch(batch)
-            return request
-        elif pending:
-            return request
-        else:
-            self.assure_call()
-            return request.execute()
-
-    def api_update(self, fields=None, params=None, batch=None, pending=False):
-        param_types = {
+    api_delete = ApiMethod(
+        method='DELETE',
+        endpoint='/',
+        target='abstractcrudobject.AbstractCrudObject',
+        api_type='NODE',
+    )
+
+    api_get = ApiMethod(
+        method='GET',
+        endpoint='/',
+        target='productfeed.ProductFeed',
+        api_type='NODE',
+    )
+
+    api_update = ApiMethod(
+        method='POST',
+        endpoint='/',
+        target='productfeed.ProductFeed',
+        api_type='NODE',
+        param_types={
             'default_currency': 'string',
             'deletion_enabled': 'bool',
             'delimiter': 'delimiter_enum',
@@ -148,121 +110,40 @@ class ProductFeed(
             'name': 'string',
             'quoted_fields': 'bool',
             'schedule': 'string',
-        }
-        enums = {
-            'delimiter_enum': ProductFeed.Delimiter.__dict__.values(),
-            'encoding_enum': ProductFeed.Encoding.__dict__.values(),
-        }
-        request = FacebookRequest(
-            node_id=self['id'],
-            method='POST',
-            endpoint='/',
-            api=self._api,
-            param_checker=TypeChecker(param_types, enums),
-            target_class=ProductFeed,
-            api_type='NODE',
-            response_parser=ObjectParser(reuse_object=self),
-        )
-        request.add_params(params)
-        request.add_fields(fields)
-
-        if batch is not None:
-            request.add_to_batch(batch)
-            return request
-        elif pending:
-            return request
-        else:
-            self.assure_call()
-            return request.execute()
-
-    def get_products(self, fields=None, params=None, batch=None, pending=False):
-        from facebookads.adobjects.productitem import ProductItem
-        param_types = {
-        }
-        enums = {
-        }
-        request = FacebookRequest(
-            node_id=self['id'],
-            method='GET',
-            endpoint='/products',
-            api=self._api,
-            param_checker=TypeChecker(param_types, enums),
-            target_class=ProductItem,
-            api_type='EDGE',
-            response_parser=ObjectParser(target_class=ProductItem),
-        )
-        request.add_params(params)
-        request.add_fields(fields)
-
-        if batch is not None:
-            request.add_to_batch(batch)
-            return request
-        elif pending:
-            return request
-        else:
-            self.assure_call()
-            return request.execute()
-
-    def get_uploads(self, fields=None, params=None, batch=None, pending=False):
-        from facebookads.adobjects.productfeedupload import ProductFeedUpload
-        param_types = {
-        }
-        enums = {
-        }
-        request = FacebookRequest(
-            node_id=self['id'],
-            method='GET',
-            endpoint='/uploads',
-            api=self._api,
-            param_checker=TypeChecker(param_types, enums),
-            target_class=ProductFeedUpload,
-            api_type='EDGE',
-            response_parser=ObjectParser(target_class=ProductFeedUpload),
-        )
-        request.add_params(params)
-        request.add_fields(fields)
-
-        if batch is not None:
-            request.add_to_batch(batch)
-            return request
-        elif pending:
-            return request
-        else:
-            self.assure_call()
-            return request.execute()
-
-    def create_upload(self, fields=None, params=None, batch=None, pending=False):
-        from facebookads.adobjects.productfeedupload import ProductFeedUpload
-        param_types = {
+        },
+        enums={
+            'delimiter_enum': 'productfeed.ProductFeed.Delimiter',
+            'encoding_enum': 'productfeed.ProductFeed.Encoding',
+        },
+    )
+
+    get_products = ApiMethod(
+        method='GET',
+        endpoint='/products',
+        target='productitem.ProductItem',
+        api_type='EDGE',
+    )
+
+    get_uploads = ApiMethod(
+        method='GET',
+        endpoint='/uploads',
+        target='productfeedupload.ProductFeedUpload',
+        api_type='EDGE',
+    )
+
+    create_upload = ApiMethod(
+        method='POST',
+        endpoint='/uploads',
+        target='productfeedupload.ProductFeedUpload',
+        api_type='EDGE',
+        param_types={
             'file': 'file',
             'password': 'string',
             'update_only': 'bool',
             'url': 'string',
             'username': 'string',
-        }
-        enums = {
-        }
-        request = FacebookRequest(
-            node_id=self['id'],
-            method='POST',
-            endpoint='/uploads',
-            api=self._api,
-            param_checker=TypeChecker(param_types, enums),
-            target_class=ProductFeedUpload,
-            api_type='EDGE',
-            response_parser=ObjectParser(target_class=ProductFeedUpload),
-        )
-        request.add_params(params)
-        request.add_fields(fields)
-
-        if batch is not None:
-            request.add_to_batch(batch)
-            return request
-        elif pending:
-            return request
-        else:
-            self.assure_call()
-            return request.execute()
+        },
+    )
 
     _field_types = {
         'country': 'string',
@@ -20,9 +20,7 @@
 
 from facebookads.adobjects.abstractobject import AbstractObject
 from facebookads.adobjects.abstractcrudobject import AbstractCrudObject
-from facebookads.adobjects.objectparser import ObjectParser
-from facebookads.api import FacebookRequest
-from facebookads.typechecker import TypeChecker
+from facebookads.adobjects.apimethod import ApiMethod
 
 """
 This class is auto-generated.
@@ -51,60 +49,19 @@ class ProductFeedUpload(
         manual_upload = 'Manual Upload'
         server_fetch = 'Server Fetch'
 
-    def api_get(self, fields=None, params=None, batch=None, pending=False):
-        param_types = {
-        }
-        enums = {
-        }
-        request = FacebookRequest(
-            node_id=self['id'],
-            method='GET',
-            endpoint='/',
-            api=self._api,
-            param_checker=TypeChecker(param_types, enums),
-            target_class=ProductFeedUpload,
-            api_type='NODE',
-            response_parser=ObjectParser(reuse_object=self),
-        )
-        request.add_params(params)
-        request.add_fields(fields)
-
-        if batch is not None:
-            request.add_to_batch(batch)
-            return request
-        elif pending:
-            return request
-        else:
-            self.assure_call()
-            return request.execute()
-
-    def get_errors(self, fields=None, params=None, batch=None, pending=False):
-        from facebookads.adobjects.productfeeduploaderror import ProductFeedUploadError
-        param_types = {
-        }
-        enums = {
-        }
-        request = FacebookRequest(
-            node_id=self['id'],
-            method='GET',
-            endpoint='/errors',
-            api=self._api,
-            param_checker=TypeChecker(param_types, enums),
-            target_class=ProductFeedUploadError,
-            api_type='EDGE',
-            response_parser=ObjectParser(target_class=ProductFeedUploadError),
-        )
-        request.add_params(params)
-        request.add_fields(fields)
-
-        if batch is not None:
-            request.add_to_batch(batch)
-            return request
-        elif pending:
-            return request
-        else:
-            self.assure_call()
-            return request.execute()
+    api_get = ApiMethod(
+        method='GET',
+        endpoint='/',
+        target='productfeedupload.ProductFeedUpload',
+        api_type='NODE',
+    )
+
+    get_errors = ApiMethod(
+        method='GET',
+        endpoint='/errors',
+        target='productfeeduploaderror.ProductFeedUploadError',
+        api_type='EDGE',
+    )
 
     _field_types = {
         'end_time': 'datetime',
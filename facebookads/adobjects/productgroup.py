@@ -20,9 +20,7 @@
 
 from facebookads.adobjects.abstractobject import AbstractObject
 from facebookads.adobjects.abstractcrudobject import AbstractCrudObject
-from facebookads.adobjects.objectparser import ObjectParser
-from facebookads.api import FacebookRequest
-from facebookads.typechecker import TypeChecker
+from facebookads.adobjects.apimethod import ApiMethod
 
 """
 This class is auto-generated.
@@ -53,120 +51,43 @@ class ProductGroup(
         from facebookads.adobjects.productcatalog import ProductCatalog
         return ProductCatalog(api=self._api, fbid=parent_id).create_product_group(fields, params, batch, pending)
 
-    def api_get(self, fields=None, params=None, batch=None, pending=False):
-        param_types = {
-        }
-        enums = {
-        }
-        request = FacebookRequest(
-            node_id=self['id'],
-            method='GET',
-            endpoint='/',
-            api=self._api,
-            param_checker=TypeChecker(param_types, enums),
-            target_class=ProductGroup,
-            api_type='NODE',
-            response_parser=ObjectParser(reuse_object=self),
-        )
-        request.add_params(params)
-        request.add_fields(fields)
-
-        if batch is not None:
-            request.add_to_batch(batch)
-            return request
-        elif pending:
-            return request
-        else:
-            self.assure_call()
-            return request.execute()
-
-    def api_update(self, fields=None, params=None, batch=None, pending=False):
-        param_types = {
+    api_get = ApiMethod(
+        method='GET',
+        endpoint='/',
+        target='productgroup.ProductGroup',
+        api_type='NODE',
+    )
+
+    api_update = ApiMethod(
+        method='POST',
+        endpoint='/',
+        target='productgroup.ProductGroup',
+        api_type='NODE',
+        param_types={
             'variants': 'list<Object>',
-        }
-        enums = {
-        }
-        request = FacebookRequest(
-            node_id=self['id'],
-            method='POST',
-            endpoint='/',
-            api=self._api,
-            param_checker=TypeChecker(param_types, enums),
-            target_class=ProductGroup,
-            api_type='NODE',
-            response_parser=ObjectParser(reuse_object=self),
-        )
-        request.add_params(params)
-        request.add_fields(fields)
-
-        if batch is not None:
-            request.add_to_batch(batch)
-            return request
-        elif pending:
-            return request
-        else:
-            self.assure_call()
-            return request.execute()
-
-    def get_product_sets(self, fields=None, params=None, batch=None, pending=False):
-        from facebookads.adobjects.productset import ProductSet
-        param_types = {
-        }
-        enums = {
-        }
-        request = FacebookRequest(
-            node_id=self['id'],
-            method='GET',
-            endpoint='/product_sets',
-            api=self._api,
-            param_checker=TypeChecker(param_types, enums),
-            target_class=ProductSet,
-            api_type='EDGE',
-            response_parser=ObjectParser(target_class=ProductSet),
-        )
-        request.add_params(params)
-        request.add_fields(fields)
-
-        if batch is not None:
-            request.add_to_batch(batch)
-            return request
-        elif pending:
-            return request
-        else:
-            self.assure_call()
-            return request.execute()
-
-    def get_products(self, fields=None, params=None, batch=None, pending=False):
-        from facebookads.adobjects.productitem import ProductItem
-        param_types = {
-        }
-        enums = {
-        }
-        request = FacebookRequest(
-            node_id=self['id'],
-            method='GET',
-            endpoint='/products',
-            api=self._api,
-            param_checker=TypeChecker(param_types, enums),
-            target_class=ProductItem,
-            api_type='EDGE',
-            response_parser=ObjectParser(target_class=ProductItem),
-        )
-        request.add_params(params)
-        request.add_fields(fields)
-
-        if batch is not None:
-            request.add_to_batch(batch)
-            return request
-        elif pending:
-            return request
-        else:
-            self.assure_call()
-            return request.execute()
-
-    def create_product(self, fields=None, params=None, batch=None, pending=False):
-        from facebookads.adobjects.productitem import ProductItem
-        param_types = {
+        },
+    )
+
+    get_product_sets = ApiMethod(
+        method='GET',
+        endpoint='/product_sets',
+        target='productset.ProductSet',
+        api_type='EDGE',
+    )
+
+    get_products = ApiMethod(
+        method='GET',
+        endpoint='/products',
+        target='productitem.ProductItem',
+        api_type='EDGE',
+    )
+
+    create_product = ApiMethod(
+        method='POST',
+        endpoint='/products',
+        target='productitem.ProductItem',
+        api_type='EDGE',
+        param_types={
             'additional_image_urls': 'list<string>',
             'android_app_name': 'string',
             'android_class': 'string',
@@ -217,34 +138,14 @@ class ProductGroup(
             'windows_phone_app_id': 'unsigned int',
             'windows_phone_app_name': 'string',
             'windows_phone_url': 'string',
-        }
-        enums = {
-            'availability_enum': ProductItem.Availability.__dict__.values(),
-            'condition_enum': ProductItem.Condition.__dict__.values(),
-            'gender_enum': ProductItem.Gender.__dict__.values(),
-            'visibility_enum': ProductItem.Visibility.__dict__.values(),
-        }
-        request = FacebookRequest(
-            node_id=self['id'],
-            method='POST',
-            endpoint='/products',
-            api=self._api,
-            param_checker=TypeChecker(param_types, enums),
-            target_class=ProductItem,
-            api_type='EDGE',
-            response_parser=ObjectParser(target_class=ProductItem),
-        )
-        request.add_params(params)
-        request.add_fields(fields)
-
-        if batch is not None:
-            request.add_to_batch(batch)
-            return request
-        elif pending:
-            return request
-        else:
-            self.assure_call()
-            return request.execute()
+        },
+        enums={
+            'availability_enum': 'productitem.ProductItem.Availability',
+            'condition_enum': 'productitem.ProductItem.Condition',
+            'gender_enum': 'productitem.ProductItem.Gender',
+            'visibility_enum': 'productitem.ProductItem.Visibility',
+        },
+    )
 
     _field_types = {
         'id': 'string',
@@ -20,9 +20,7 @@
 
 from facebookads.adobjects.abstractobject import AbstractObject
 from facebookads.adobjects.abstractcrudobject import AbstractCrudObject
-from facebookads.adobjects.objectparser import ObjectParser
-from facebookads.api import FacebookRequest
-from facebookads.typechecker import TypeChecker
+from facebookads.adobjects.apimethod import ApiMethod
 
 """
 This class is auto-generated.
@@ -95,270 +93,95 @@ class User(
         website = 'website'
         work = 'work'
 
-    def api_get(self, fields=None, params=None, batch=None, pending=False):
-        param_types = {
-        }
-        enums = {
-        }
-        request = FacebookRequest(
-            node_id=self['id'],
-            method='GET',
-            endpoint='/',
-            api=self._api,
-            param_checker=TypeChecker(param_types, enums),
-            target_class=User,
-            api_type='NODE',
-            response_parser=ObjectParser(reuse_object=self),
-        )
-        request.add_params(params)
-        request.add_fields(fields)
-
-        if batch is not None:
-            request.add_to_batch(batch)
-            return request
-        elif pending:
-            return request
-        else:
-            self.assure_call()
-            return request.execute()
-
-    def get_accounts(self, fields=None, params=None, batch=None, pending=False):
-        param_types = {
+    api_get = ApiMethod(
+        method='GET',
+        endpoint='/',
+        target='user.User',
+        api_type='NODE',
+    )
+
+    get_accounts = ApiMethod(
+        method='GET',
+        endpoint='/accounts',
+        target='abstractcrudobject.AbstractCrudObject',
+        api_type='EDGE',
+        param_types={
             'business_id': 'string',
             'is_business': 'bool',
             'is_place': 'bool',
             'is_promotable': 'bool',
-        }
-        enums = {
-        }
-        request = FacebookRequest(
-            node_id=self['id'],
-            method='GET',
-            endpoint='/accounts',
-            api=self._api,
-            param_checker=TypeChecker(param_types, enums),
-            target_class=AbstractCrudObject,
-            api_type='EDGE',
-            response_parser=ObjectParser(target_class=AbstractCrudObject),
-        )
-        request.add_params(params)
-        request.add_fields(fields)
-
-        if batch is not None:
-            request.add_to_batch(batch)
-            return request
-        elif pending:
-            return request
-        else:
-            self.assure_call()
-            return request.execute()
-
-    def get_ad_account_groups(self, fields=None, params=None, batch=None, pending=False):
-        from facebookads.adobjects.adaccountgroup import AdAccountGroup
-        param_types = {
-        }
-        enums = {
-        }
-        request = FacebookRequest(
-            node_id=self['id'],
-            method='GET',
-            endpoint='/adaccountgroups',
-            api=self._api,
-            param_checker=TypeChecker(param_types, enums),
-            target_class=AdAccountGroup,
-            api_type='EDGE',
-            response_parser=ObjectParser(target_class=AdAccountGroup),
-        )
-        request.add_params(params)
-        request.add_fields(fields)
-
-        if batch is not None:
-            request.add_to_batch(batch)
-            return request
-        elif pending:
-            return request
-        else:
-            self.assure_call()
-            return request.execute()
-
-    def create_ad_account_group(self, fields=None, params=None, batch=None, pending=False):
-        from facebookads.adobjects.adaccountgroup import AdAccountGroup
-        param_types = {
+        },
+    )
+
+    get_ad_account_groups = ApiMethod(
+        method='GET',
+        endpoint='/adaccountgroups',
+        target='adaccountgroup.AdAccountGroup',
+        api_type='EDGE',
+    )
+
+    create_ad_account_group = ApiMethod(
+        method='POST',
+        endpoint='/adaccountgroups',
+        target='adaccountgroup.AdAccountGroup',
+        api_type='EDGE',
+        param_types={
             'accounts': 'map',
             'name': 'string',
             'redownload': 'bool',
             'users': 'map',
-        }
-        enums = {
-        }
-        request = FacebookRequest(
-            node_id=self['id'],
-            method='POST',
-            endpoint='/adaccountgroups',
-            api=self._api,
-            param_checker=TypeChecker(param_types, enums),
-            target_class=AdAccountGroup,
-            api_type='EDGE',
-            response_parser=ObjectParser(target_class=AdAccountGroup),
-        )
-        request.add_params(params)
-        request.add_fields(fields)
-
-        if batch is not None:
-            request.add_to_batch(batch)
-            return request
-        elif pending:
-            return request
-        else:
-            self.assure_call()
-            return request.execute()
-
-    def get_ad_accounts(self, fields=None, params=None, batch=None, pending=False):
-        from facebookads.adobjects.adaccount import AdAccount
-        param_types = {
-        }
-        enums = {
-        }
-        request = FacebookRequest(
-            node_id=self['id'],
-            method='GET',
-            endpoint='/adaccounts',
-            api=self._api,
-            param_checker=TypeChecker(param_types, enums),
-            target_class=AdAccount,
-            api_type='EDGE',
-            response_parser=ObjectParser(target_class=AdAccount),
-        )
-        request.add_params(params)
-        request.add_fields(fields)
-
-        if batch is not None:
-            request.add_to_batch(batch)
-            return request
-        elif pending:
-            return request
-        else:
-            self.assure_call()
-            return request.execute()
-
-    def get_lead_gen_forms(self, fields=None, params=None, batch=None, pending=False):
-        from facebookads.adobjects.leadgenform import LeadgenForm
-        param_types = {
+        },
+    )
+
+    get_ad_accounts = ApiMethod(
+        method='GET',
+        endpoint='/adaccounts',
+        target='adaccount.AdAccount',
+        api_type='EDGE',
+    )
+
+    get_lead_gen_forms = ApiMethod(
+        method='GET',
+        endpoint='/leadgen_forms',
+        target='leadgenform.LeadgenForm',
+        api_type='EDGE',
+        param_types={
             'query': 'string',
-        }
-        enums = {
-        }
-        request = FacebookRequest(
-            node_id=self['id'],
-            method='GET',
-            endpoint='/leadgen_forms',
-            api=self._api,
-            param_checker=TypeChecker(param_types, enums),
-            target_class=LeadgenForm,
-            api_type='EDGE',
-            response_parser=ObjectParser(target_class=LeadgenForm),
-        )
-        request.add_params(params)
-        request.add_fields(fields)
-
-        if batch is not None:
-            request.add_to_batch(batch)
-            return request
-        elif pending:
-            return request
-        else:
-            self.assure_call()
-            return request.execute()
-
-    def get_picture(self, fields=None, params=None, batch=None, pending=False):
-        from facebookads.adobjects.profilepicturesource import ProfilePictureSource
-        param_types = {
+        },
+    )
+
+    get_picture = ApiMethod(
+        method='GET',
+        endpoint='/picture',
+        target='profilepicturesource.ProfilePictureSource',
+        api_type='EDGE',
+        param_types={
             'height': 'int',
             'redirect': 'bool',
             'type': 'type_enum',
             'width': 'int',
-        }
-        enums = {
-            'type_enum': ProfilePictureSource.Type.__dict__.values(),
-        }
-        request = FacebookRequest(
-            node_id=self['id'],
-            method='GET',
-            endpoint='/picture',
-            api=self._api,
-            param_checker=TypeChecker(param_types, enums),
-            target_class=ProfilePictureSource,
-            api_type='EDGE',
-            response_parser=ObjectParser(target_class=ProfilePictureSource),
-        )
-        request.add_params(params)
-        request.add_fields(fields)
-
-        if batch is not None:
-            request.add_to_batch(batch)
-            return request
-        elif pending:
-            return request
-        else:
-            self.assure_call()
-            return request.execute()
-
-    def get_promotable_domains(self, fields=None, params=None, batch=None, pending=False):
-        from facebookads.adobjects.domain import Domain
-        param_types = {
-        }
-        enums = {
-        }
-        request = FacebookRequest(
-            node_id=self['id'],
-            method='GET',
-            endpoint='/promotable_domains',
-            api=self._api,
-            param_checker=TypeChecker(param_types, enums),
-            target_class=Domain,
-            api_type='EDGE',
-            response_parser=ObjectParser(target_class=Domain),
-        )
-        request.add_params(params)
-        request.add_fields(fields)
-
-        if batch is not None:
-            request.add_to_batch(batch)
-            return request
-        elif pending:
-            return request
-        else:
-            self.assure_call()
-            return request.execute()
-
-    def get_promotable_events(self, fields=None, params=None, batch=None, pending=False):
-        from facebookads.adobjects.event import Event
-        param_types = {
+        },
+        enums={
+            'type_enum': 'profilepicturesource.ProfilePictureSource.Type',
+        },
+    )
+
+    get_promotable_domains = ApiMethod(
+        method='GET',
+        endpoint='/promotable_domains',
+        target='domain.Domain',
+        api_type='EDGE',
+    )
+
+    get_promotable_events = ApiMethod(
+        method='GET',
+        endpoint='/promotable_events',
+        target='event.Event',
+        api_type='EDGE',
+        param_types={
             'is_page_event': 'bool',
-        }
-        enums = {
-        }
-        request = FacebookRequest(
-            node_id=self['id'],
-            method='GET',
-            endpoint='/promotable_events',
-            api=self._api,
-            param_checker=TypeChecker(param_types, enums),
-            target_class=Event,
-            api_type='EDGE',
-            response_parser=ObjectParser(target_class=Event),
-        )
-        request.add_params(params)
-        request.add_fields(fields)
-
-        if batch is not None:
-            request.add_to_batch(batch)
-            return request
-        elif pending:
-            return request
-        else:
-            self.assure_call()
-            return request.execute()
+        },
+    )
 
     _field_types = {
         'about': 'string',
@@ -61,6 +61,9 @@ import six
 import collections
 import re
 import logging
+import random
+import threading
+import weakref
 
 from facebookads.adobjects.objectparser import ObjectParser
 from facebookads.typechecker import TypeChecker
@@ -198,6 +201,10 @@ class FacebookAdsApi(object):
         HTTP_METHOD_DELETE (class): HTTP DELETE method name
         HTTP_DEFAULT_HEADERS (class): Default HTTP headers for requests made by
             this sdk.
+        VALIDATION_FULL (class): Check the params of every request.
+        VALIDATION_SAMPLED (class): Check the params of a random sample of
+            requests.
+        VALIDATION_OFF (class): Do not check request params.
     """
 
     SDK_VERSION = apiconfig.ads_api_config['SDK_VERSION']
@@ -214,6 +221,12 @@ class FacebookAdsApi(object):
         'User-Agent': "fb-python-ads-api-sdk-%s" % SDK_VERSION,
     }
 
+    VALIDATION_FULL = 'full'
+
+    VALIDATION_SAMPLED = 'sampled'
+
+    VALIDATION_OFF = 'off'
+
     _request_callback_hooks = []
     _default_api = None
     _default_account_id = None
@@ -232,6 +245,9 @@ class FacebookAdsApi(object):
         self._num_requests_succeeded = 0
         self._num_requests_attempted = 0
         self._api_version = api_version or self.API_VERSION
+        self._identity_map = None
+        self._validation_mode = apiconfig.ads_api_config['VALIDATION_MODE']
+        self._validation_sample_rate = 0.01
 
     def get_num_requests_attempted(self):
         """Returns the number of calls attempted."""
@@ -241,6 +257,59 @@ class FacebookAdsApi(object):
         """Returns the number of calls that succeeded."""
         return self._num_requests_succeeded
 
+    def enable_identity_map(self, max_size=10000):
+        """Makes objects parsed through this api unique per class and fbid.
+        Once enabled, parsing an object whose fbid is already live merges the
+        new data into the existing instance instead of creating a copy.
+        Args:
+            max_size (optional): Number of most recently used objects that
+                are kept alive by the map. Older objects stay mapped only
+                while something else references them.
+        Returns:
+            The IdentityMap of this api.
+        """
+        if self._identity_map is None:
+            self._identity_map = IdentityMap(max_size)
+        return self._identity_map
+
+    def disable_identity_map(self):
+        """Stops mapping objects parsed through this api."""
+        self._identity_map = None
+
+    def get_identity_map(self):
+        """Returns the IdentityMap of this api or None if not enabled."""
+        return self._identity_map
+
+    def set_validation_mode(self, mode, sample_rate=0.01):
+        """Sets how the params and fields of requests are type checked.
+        Checking only warns, or raises in STRICT_MODE, so hot production
+        paths may sample it or turn it off.
+        Args:
+            mode: VALIDATION_FULL, VALIDATION_SAMPLED or VALIDATION_OFF.
+            sample_rate (optional): Fraction of requests checked under
+                VALIDATION_SAMPLED.
+        """
+        if mode not in (
+            self.VALIDATION_FULL,
+            self.VALIDATION_SAMPLED,
+            self.VALIDATION_OFF,
+        ):
+            raise ValueError("Unknown validation mode %r" % (mode,))
+        self._validation_mode = mode
+        self._validation_sample_rate = sample_rate
+
+    def get_validation_mode(self):
+        """Returns the validation mode of this api."""
+        return self._validation_mode
+
+    def should_validate(self):
+        """Returns whether a new request should check its params."""
+        if self._validation_mode == self.VALIDATION_FULL:
+            return True
+        if self._validation_mode == self.VALIDATION_OFF:
+            return False
+        return random.random() < self._validation_sample_rate
+
     @classmethod
     def init(
         cls,
@@ -296,6 +365,7 @@ class FacebookAdsApi(object):
         files=None,
         url_override=None,
         api_version=None,
+        body=None,
     ):
         """Makes an API call.
         Args:
@@ -312,6 +382,9 @@ class FacebookAdsApi(object):
                 header name and its value is the header value.
             files (optional): An optional mapping of file names to binary open
                 file objects. These files will be attached to the request.
+            body (optional): A file-like object sent as the request body as
+                it is read, with params in the query string. The caller sets
+                its Content-Type in headers.
         Returns:
             A FacebookResponse object containing the response body, headers,
             http status, and summary of the call that was made.
@@ -353,6 +426,8 @@ class FacebookAdsApi(object):
         # Get request response and encapsulate it in a FacebookResponse
         if method in ('GET', 'DELETE'):
             kwargs = {'params': params}
+        elif body is not None:
+            kwargs = {'params': params, 'data': body}
         else:
             kwargs = {'data': params}
 
@@ -407,6 +482,69 @@ class FacebookAdsApi(object):
         return FacebookAdsApiBatch(api=self)
 
 
+class IdentityMap(object):
+
+    """
+    Maps (class, fbid) pairs to the live object representing them.
+    Objects are referenced weakly, except for the max_size most recently
+    used ones which are kept alive so that objects seen on one page are
+    still unique when seen again on a later page.
+    """
+
+    def __init__(self, max_size=10000):
+        self._max_size = max_size
+        self._objects = weakref.WeakValueDictionary()
+        self._recent = collections.OrderedDict()
+        self._lock = threading.Lock()
+
+    def __len__(self):
+        return len(self._objects)
+
+    def _touch(self, key, obj):
+        self._recent.pop(key, None)
+        self._recent[key] = obj
+        while len(self._recent) > self._max_size:
+            self._recent.popitem(last=False)
+
+    def get(self, target_class, fbid):
+        """Returns the live target_class object with fbid, or None."""
+        key = (target_class, str(fbid))
+        with self._lock:
+            obj = self._objects.get(key)
+            if obj is not None:
+                self._touch(key, obj)
+            return obj
+
+    def add(self, obj):
+        """Maps obj by its class and fbid and returns it.
+        If another object is already mapped for them, it is replaced.
+        """
+        fbid = obj.get_id()
+        if not fbid:
+            raise FacebookBadObjectError(
+                "%s object needs an id to be mapped."
+                % obj.__class__.__name__,
+            )
+        key = (obj.__class__, str(fbid))
+        with self._lock:
+            self._objects[key] = obj
+            self._touch(key, obj)
+        return obj
+
+    def discard(self, obj):
+        """Removes obj from the map if it is mapped."""
+        key = (obj.__class__, str(obj.get_id()))
+        with self._lock:
+            if self._objects.get(key) is obj:
+                del self._objects[key]
+                self._recent.pop(key, None)
+
+    def clear(self):
+        with self._lock:
+            self._objects.clear()
+            self._recent.clear()
+
+
 class FacebookAdsApiBatch(object):
 
     """
@@ -645,6 +783,7 @@ class FacebookRequest:
         self._accepted_fields = []
         if target_class is not None:
             self._accepted_fields = target_class.Field.__dict__.values()
+        self._validate = self._api is None or self._api.should_validate()
 
     def add_file(self, file_path):
         if not self._allow_file_upload:
@@ -668,7 +807,7 @@ class FacebookRequest:
     def add_field(self, field):
         if field not in self._fields:
             self._fields.append(field)
-        if field not in self._accepted_fields:
+        if self._validate and field not in self._accepted_fields:
             api_utils.warning(self._endpoint + ' does not allow field ' + field)
         return self
 
@@ -680,7 +819,7 @@ class FacebookRequest:
         return self
 
     def add_param(self, key, value):
-        if not self._param_checker.is_valid_pair(key, value):
+        if self._validate and not self._param_checker.is_valid_pair(key, value):
             api_utils.warning('value of ' + key + ' might not be compatible. ' +
                 ' Expect ' + self._param_checker.get_type(key) + '; ' +
                 ' got ' + str(type(value)))
@@ -771,7 +910,8 @@ class Cursor(object):
         node_id=None,
         endpoint=None,
         object_parser=None,
-        maximum_results=None
+        maximum_results=None,
+        compact=False,
     ):
         """
         Initializes an cursor over the objects to which there is an edge from
@@ -794,6 +934,8 @@ class Cursor(object):
             endpoint (optional): The edge name.
             object_parser (optional): The ObjectParser to parse response.
             maximum_results (optional): Maximum number of result items over all pages (see AA-331)
+            compact (optional): Yield CompactObject records instead of full
+                target_objects_class instances, to save memory.
         """
         self.params = dict(params or {})
         target_objects_class._assign_fields_to_params(fields, self.params)
@@ -813,6 +955,7 @@ class Cursor(object):
         self._object_parser = object_parser or ObjectParser(
             api=self._api,
             target_class=self._target_objects_class,
+            compact=compact,
         )
         self._results_count = 0
         self._called_paths = []
@@ -21,5 +21,6 @@
 ads_api_config = {
   'API_VERSION': 'v3.2',
   'SDK_VERSION': 'v2.7.1.1',
-  'STRICT_MODE': False
+  'STRICT_MODE': False,
+  'VALIDATION_MODE': 'full'
 }
@@ -0,0 +1,243 @@
+# Copyright 2015 Facebook, Inc.
+
+# You are hereby granted a non-exclusive, worldwide, royalty-free license to
+# use, copy, modify, and distribute this software in source code or binary
+# form for use in connection with the web services and APIs provided by
+# Facebook.
+
+# As with any software that integrates with the Facebook platform, your use
+# of this software is subject to the Facebook Developer Principles and
+# Policies [http://developers.facebook.com/policy/]. This copyright notice
+# shall be included in all copies or substantial portions of the software.
+
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL
+# THE AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING
+# FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER
+# DEALINGS IN THE SOFTWARE.
+
+"""
+syncs custom audiences by uploading only the change of their members
+"""
+
+from facebookads.audience_uploader import CustomAudienceUploader
+from facebookads.pii_hashing import UserHasher
+
+import collections
+import itertools
+import json
+import sqlite3
+
+
+class AudienceSyncResult(collections.namedtuple(
+    'AudienceSyncResult',
+    ['num_users', 'num_added', 'num_removed', 'add_stats', 'remove_stats'],
+)):
+    """
+    The outcome of AudienceSync.sync: the number of distinct users of the
+    new list, of added and of removed users, and the UploadSessionStats of
+    the additions and of the removals, None when there were none.
+    """
+
+    __slots__ = ()
+
+
+class AudienceIndex(object):
+    """
+    The hashed members last uploaded to each audience, in a SQLite table
+    indexed by audience and member, so that differences with a new list
+    are computed on disk.
+    """
+
+    _ADDITIONS = (
+        'SELECT member FROM incoming EXCEPT '
+        'SELECT member FROM members WHERE audience_id = ?'
+    )
+
+    _REMOVALS = (
+        'SELECT member FROM members WHERE audience_id = ? EXCEPT '
+        'SELECT member FROM incoming'
+    )
+
+    def __init__(self, path=':memory:'):
+        """
+        Args:
+            path (optional): The SQLite database file, in memory by default.
+        """
+        self._connection = sqlite3.connect(path)
+        with self._connection:
+            self._connection.execute(
+                'CREATE TABLE IF NOT EXISTS members ('
+                'audience_id TEXT, member TEXT, '
+                'PRIMARY KEY (audience_id, member)) WITHOUT ROWID'
+            )
+
+    def close(self):
+        self._connection.close()
+
+    def count(self, audience_id):
+        """Returns the number of members of audience_id."""
+        return self._connection.execute(
+            'SELECT COUNT(*) FROM members WHERE audience_id = ?',
+            (audience_id,),
+        ).fetchone()[0]
+
+    def get_members(self, audience_id):
+        """Yields the hashed members of audience_id, sorted."""
+        cursor = self._connection.execute(
+            'SELECT member FROM members WHERE audience_id = ? ORDER BY member',
+            (audience_id,),
+        )
+        for member, in cursor:
+            yield _decode(member)
+
+    def load(self, members, chunk_size=10000):
+        """
+        Replaces the incoming list, to compare with the members of an
+        audience, by the given hashed members.
+        Returns:
+            The number of distinct members loaded.
+        """
+        with self._connection:
+            self._connection.execute(
+                'CREATE TEMP TABLE IF NOT EXISTS incoming ('
+                'member TEXT PRIMARY KEY) WITHOUT ROWID'
+            )
+            self._connection.execute('DELETE FROM incoming')
+            members = iter(members)
+            for chunk in iter(
+                lambda: list(itertools.islice(members, chunk_size)), [],
+            ):
+                self._connection.executemany(
+                    'INSERT OR IGNORE INTO incoming VALUES (?)',
+                    ((_encode(member),) for member in chunk),
+                )
+        return self._connection.execute(
+            'SELECT COUNT(*) FROM incoming').fetchone()[0]
+
+    def count_additions(self, audience_id):
+        """Returns the number of members get_additions yields."""
+        return self._count(self._ADDITIONS, audience_id)
+
+    def count_removals(self, audience_id):
+        """Returns the number of members get_removals yields."""
+        return self._count(self._REMOVALS, audience_id)
+
+    def get_additions(self, audience_id):
+        """Yields the loaded members that audience_id does not have."""
+        return self._select(self._ADDITIONS, audience_id)
+
+    def get_removals(self, audience_id):
+        """Yields the members of audience_id that were not loaded."""
+        return self._select(self._REMOVALS, audience_id)
+
+    def commit(self, audience_id):
+        """Makes the loaded members the members of audience_id."""
+        with self._connection:
+            self._connection.execute(
+                'DELETE FROM members WHERE audience_id = ? AND '
+                'member NOT IN (SELECT member FROM incoming)',
+                (audience_id,),
+            )
+            self._connection.execute(
+                'INSERT OR IGNORE INTO members '
+                'SELECT ?, member FROM incoming',
+                (audience_id,),
+            )
+
+    def _count(self, query, audience_id):
+        return self._connection.execute(
+            'SELECT COUNT(*) FROM (%s)' % query,
+            (audience_id,),
+        ).fetchone()[0]
+
+    def _select(self, query, audience_id):
+        for member, in self._connection.execute(query, (audience_id,)):
+            yield _decode(member)
+
+
+class AudienceSync(object):
+    """
+    Brings a CustomAudience to a new full list of users by uploading only
+    the difference with the list of the previous sync. The users are
+    hashed and loaded into an AudienceIndex, the additions and removals
+    are streamed from it to CustomAudienceUploader sessions, and the index
+    is updated once both uploads succeeded.
+    Example:
+        >>> sync = AudienceSync(AudienceIndex('audiences.db'))
+        >>> result = sync.sync(audience, CustomAudience.Schema.email_hash,
+        ...                    read_emails())
+        >>> result.num_added, result.num_removed
+    """
+
+    def __init__(self, index, processes=None, **uploader_kwargs):
+        """
+        Args:
+            index: The AudienceIndex of the uploaded members.
+            processes (optional): Size of the process pool hashing users.
+            uploader_kwargs (optional): Arguments of the
+                CustomAudienceUploader of the changes, e.g. max_workers.
+        """
+        self._index = index
+        self._processes = processes
+        self._uploader_kwargs = uploader_kwargs
+
+    def sync(self, audience, schema, users, is_raw=False, app_ids=None,
+             pre_hashed=None):
+        """
+        Adds and removes the users of audience so that it contains users.
+        Args:
+            audience: The CustomAudience to update.
+            schema, is_raw, app_ids, pre_hashed: See add_users of
+                CustomAudience.
+            users: An iterable of all the users the audience should have.
+        Returns:
+            An AudienceSyncResult.
+        """
+        audience_id = audience.get_id_assured()
+        hasher = UserHasher(schema, pre_hashed)
+        if self._processes is not None and self._processes > 1:
+            hashed = hasher.iter_hash_users(users, self._processes)
+        else:
+            hashed = map(hasher.hash_user, users)
+        num_users = self._index.load(hashed)
+
+        uploader = CustomAudienceUploader(
+            audience,
+            schema,
+            is_raw=is_raw,
+            app_ids=app_ids,
+            pre_hashed=True,
+            **self._uploader_kwargs
+        )
+        num_added = self._index.count_additions(audience_id)
+        num_removed = self._index.count_removals(audience_id)
+        add_stats = remove_stats = None
+        if num_added:
+            add_stats = uploader.add_users(
+                self._index.get_additions(audience_id),
+                estimated_num_total=num_added,
+            )
+        if num_removed:
+            remove_stats = uploader.remove_users(
+                self._index.get_removals(audience_id),
+                estimated_num_total=num_removed,
+            )
+        self._index.commit(audience_id)
+        return AudienceSyncResult(
+            num_users, num_added, num_removed, add_stats, remove_stats)
+
+
+def _encode(member):
+    # Multi-key users are lists of hashes, stored as their JSON.
+    if isinstance(member, (list, tuple)):
+        return json.dumps(member, separators=(',', ':'))
+    return member
+
+
+def _decode(member):
+    if member.startswith('['):
+        return json.loads(member)
+    return member
@@ -0,0 +1,233 @@
+# Copyright 2015 Facebook, Inc.
+
+# You are hereby granted a non-exclusive, worldwide, royalty-free license to
+# use, copy, modify, and distribute this software in source code or binary
+# form for use in connection with the web services and APIs provided by
+# Facebook.
+
+# As with any software that integrates with the Facebook platform, your use
+# of this software is subject to the Facebook Developer Principles and
+# Policies [http://developers.facebook.com/policy/]. This copyright notice
+# shall be included in all copies or substantial portions of the software.
+
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL
+# THE AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING
+# FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER
+# DEALINGS IN THE SOFTWARE.
+
+"""
+uploads custom audience users in chunked, concurrent sessions
+"""
+
+from facebookads.exceptions import FacebookRequestError
+from facebookads.pii_hashing import UserHasher
+
+from multiprocessing.pool import ThreadPool
+import collections
+import itertools
+import random
+import threading
+import time
+
+
+class UploadSessionStats(object):
+    """The totals of the batches of one upload session."""
+
+    def __init__(self, session_id):
+        self.session_id = session_id
+        self.num_batches = 0
+        self.num_sent = 0
+        self.num_received = 0
+        self.num_invalid_entries = 0
+        self.num_retries = 0
+        self.invalid_entry_samples = {}
+        self._lock = threading.Lock()
+
+    def add_response(self, num_sent, response):
+        with self._lock:
+            self.num_batches += 1
+            self.num_sent += num_sent
+            self.num_received += response.get('num_received', 0)
+            self.num_invalid_entries += response.get('num_invalid_entries', 0)
+            self.invalid_entry_samples.update(
+                response.get('invalid_entry_samples') or {})
+
+    def add_retry(self):
+        with self._lock:
+            self.num_retries += 1
+
+    def __repr__(self):
+        return '<%s session_id=%s batches=%d received=%d invalid=%d>' % (
+            self.__class__.__name__,
+            self.session_id,
+            self.num_batches,
+            self.num_received,
+            self.num_invalid_entries,
+        )
+
+
+class CustomAudienceUploader(object):
+    """
+    Adds or removes users of a CustomAudience in one upload session: the
+    users, from any iterable, are hashed as format_params does, split in
+    batches of batch_size, and the batches are posted by max_workers
+    threads with their session block. The batch flagged last_batch_flag is
+    only sent after all the others succeeded. Batches that failed with a
+    transient error are retried with exponential backoff.
+    Example:
+        >>> uploader = CustomAudienceUploader(
+        ...     audience, CustomAudience.Schema.email_hash)
+        >>> stats = uploader.add_users(read_emails(), estimated_num_total=5e6)
+        >>> stats.num_received, stats.num_invalid_entries
+    """
+
+    # Number of users per request the API accepts.
+    MAX_BATCH_SIZE = 10000
+
+    def __init__(
+        self,
+        audience,
+        schema,
+        is_raw=False,
+        app_ids=None,
+        pre_hashed=None,
+        batch_size=MAX_BATCH_SIZE,
+        max_workers=4,
+        max_retries=3,
+        retry_interval=1.0,
+        processes=None,
+        sleep=time.sleep,
+    ):
+        """
+        Args:
+            audience: The CustomAudience to upload to.
+            schema, is_raw, app_ids, pre_hashed: See add_users of
+                CustomAudience.
+            batch_size (optional): Users per request, at most MAX_BATCH_SIZE.
+            max_workers (optional): Number of requests in flight.
+            max_retries (optional): Attempts after the first of a batch
+                that failed with a transient error.
+            retry_interval (optional): Seconds before the first retry,
+                doubled at each one.
+            processes (optional): Size of the process pool hashing users,
+                see UserHasher.iter_hash_users; users are hashed in this
+                process if None.
+            sleep (optional): The function used to wait before retries.
+        """
+        if not 0 < batch_size <= self.MAX_BATCH_SIZE:
+            raise ValueError(
+                "batch_size must be between 1 and %d." % self.MAX_BATCH_SIZE)
+        self._audience = audience
+        self._schema = schema
+        self._is_raw = is_raw
+        self._app_ids = app_ids
+        self._hasher = UserHasher(schema, pre_hashed)
+        self._pre_hashed = pre_hashed
+        self._batch_size = batch_size
+        self._max_workers = max_workers
+        self._max_retries = max_retries
+        self._retry_interval = retry_interval
+        self._processes = processes
+        self._sleep = sleep
+
+    def add_users(self, users, estimated_num_total=None, session_id=None):
+        """
+        Adds users to the audience in one session.
+        Returns:
+            The UploadSessionStats of the session.
+        """
+        return self._upload('POST', users, estimated_num_total, session_id)
+
+    def remove_users(self, users, estimated_num_total=None, session_id=None):
+        """
+        Removes users from the audience in one session.
+        Returns:
+            The UploadSessionStats of the session.
+        """
+        return self._upload('DELETE', users, estimated_num_total, session_id)
+
+    def _upload(self, method, users, estimated_num_total, session_id):
+        if estimated_num_total is None and hasattr(users, '__len__'):
+            estimated_num_total = len(users)
+        if session_id is None:
+            session_id = random.randint(1, 2 ** 63 - 1)
+        stats = UploadSessionStats(session_id)
+
+        batches = self._iter_batches(users)
+        batch = next(batches, None)
+        if batch is None:
+            return stats
+        pool = ThreadPool(self._max_workers)
+        try:
+            pending = collections.deque()
+            for batch_seq in itertools.count(1):
+                next_batch = next(batches, None)
+                if next_batch is None:
+                    break
+                pending.append(pool.apply_async(self._send, (
+                    method, batch, stats, estimated_num_total, batch_seq,
+                    False,
+                )))
+                if len(pending) >= 2 * self._max_workers:
+                    pending.popleft().get()
+                batch = next_batch
+            while pending:
+                pending.popleft().get()
+        finally:
+            pool.terminate()
+            pool.join()
+        self._send(method, batch, stats, estimated_num_total, batch_seq, True)
+        return stats
+
+    def _iter_batches(self, users):
+        if self._processes is not None and self._processes > 1:
+            hashed = self._hasher.iter_hash_users(
+                users,
+                self._processes,
+                self._batch_size,
+            )
+        else:
+            hashed = map(self._hasher.hash_user, users)
+        hashed = iter(hashed)
+        return iter(
+            lambda: list(itertools.islice(hashed, self._batch_size)),
+            [],
+        )
+
+    def _send(self, method, batch, stats, estimated_num_total, batch_seq,
+              last_batch_flag):
+        params = self._audience.format_params(
+            self._schema,
+            batch,
+            self._is_raw,
+            self._app_ids,
+            pre_hashed=True,
+        )
+        params['session'] = {
+            'session_id': stats.session_id,
+            'batch_seq': batch_seq,
+            'last_batch_flag': last_batch_flag,
+        }
+        if estimated_num_total is not None:
+            params['session']['estimated_num_total'] = int(estimated_num_total)
+
+        interval = self._retry_interval
+        for attempt in itertools.count():
+            try:
+                response = self._audience.get_api_assured().call(
+                    method,
+                    (self._audience.get_id_assured(), 'users'),
+                    params=params,
+                )
+            except FacebookRequestError as e:
+                if attempt >= self._max_retries or not e.is_transient():
+                    raise
+                stats.add_retry()
+                self._sleep(interval)
+                interval *= 2
+            else:
+                stats.add_response(len(batch), response.json())
+                return
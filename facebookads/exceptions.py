@@ -43,6 +43,9 @@ class FacebookRequestError(FacebookError):
     only for failure callbacks) if not raised at the core api call method.
     """
 
+    # Error codes of temporary failures and of rate limiting.
+    TRANSIENT_ERROR_CODES = (1, 2, 4, 17, 32, 341, 613, 80000, 80004)
+
     def __init__(
         self, message,
         request_context,
@@ -138,6 +141,14 @@ class FacebookRequestError(FacebookError):
     def api_transient_error(self):
         return self._api_transient_error
 
+    def is_transient(self):
+        """Returns whether the same request may succeed when retried later."""
+        return bool(
+            self._api_transient_error or
+            (self._http_status or 0) >= 500 or
+            self._api_error_code in self.TRANSIENT_ERROR_CODES
+        )
+
     def get_message(self):
         return self._message
 
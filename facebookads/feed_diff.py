@@ -0,0 +1,351 @@
+# Copyright 2015 Facebook, Inc.
+
+# You are hereby granted a non-exclusive, worldwide, royalty-free license to
+# use, copy, modify, and distribute this software in source code or binary
+# form for use in connection with the web services and APIs provided by
+# Facebook.
+
+# As with any software that integrates with the Facebook platform, your use
+# of this software is subject to the Facebook Developer Principles and
+# Policies [http://developers.facebook.com/policy/]. This copyright notice
+# shall be included in all copies or substantial portions of the software.
+
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL
+# THE AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING
+# FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER
+# DEALINGS IN THE SOFTWARE.
+
+"""
+streams product feeds and diffs them with a snapshot of the catalog
+"""
+
+import collections
+import decimal
+import hashlib
+import itertools
+import json
+import sqlite3
+
+try:
+    import xml.etree.cElementTree as ElementTree
+except ImportError:
+    import xml.etree.ElementTree as ElementTree
+
+
+# Product fields of the Google Shopping attributes of a feed item.
+FEED_FIELDS = collections.OrderedDict([
+    ('title', 'name'),
+    ('description', 'description'),
+    ('link', 'url'),
+    ('image_link', 'image_url'),
+    ('brand', 'brand'),
+    ('condition', 'condition'),
+    ('availability', 'availability'),
+    ('google_product_category', 'category'),
+])
+
+
+class FeedChange(collections.namedtuple(
+    'FeedChange',
+    ['method', 'retailer_id', 'item'],
+)):
+    """
+    A product to send: its ProductCatalog.BatchMethod, retailer id and feed
+    item, None for deletions.
+    """
+
+    __slots__ = ()
+
+
+class _LocalNames(dict):
+    # Maps the tags of a document to their names without namespace.
+
+    def __missing__(self, tag):
+        name = self[tag] = tag.rsplit('}', 1)[-1]
+        return name
+
+
+def iter_feed_items(source, item_tag='item', id_field='id'):
+    """
+    Reads a Google Shopping RSS or Atom feed with iterparse and yields each
+    item as a dict of attribute name, without namespace, to text. Nested
+    attributes such as shipping are dicts, repeated ones lists. Each item
+    is removed from the tree once read, so memory does not grow with the
+    size of the feed.
+    Args:
+        source: A file name or file object.
+        item_tag (optional): The local name of the item elements, 'entry'
+            for Atom feeds.
+        id_field (optional): The attribute that must be present on items.
+    """
+    names = _LocalNames()
+    parents = []
+    for event, element in ElementTree.iterparse(source, ('start', 'end')):
+        if event == 'start':
+            parents.append(element)
+            continue
+        parents.pop()
+        if names[element.tag] != item_tag:
+            continue
+        item = _element_to_dict(element, names)
+        if parents:
+            parents[-1].remove(element)
+        if item.get(id_field):
+            yield item
+
+
+def _element_to_dict(element, names):
+    item = {}
+    for child in element:
+        name = names[child.tag]
+        if len(child):
+            value = _element_to_dict(child, names)
+        else:
+            value = (child.text or '').strip()
+        if name in item:
+            if not isinstance(item[name], list):
+                item[name] = [item[name]]
+            item[name].append(value)
+        else:
+            item[name] = value
+    return item
+
+
+def fingerprint(item):
+    """Returns a digest of item that changes when any of its values does."""
+    return hashlib.sha1(json.dumps(
+        item,
+        sort_keys=True,
+        separators=(',', ':'),
+    ).encode('utf8')).hexdigest()
+
+
+def feed_item_to_product_data(item):
+    """
+    Returns the product fields of a Google Shopping feed item, for the data
+    of a batch request: FEED_FIELDS renamed, and the price, e.g.
+    '9.99 BRL', split into price in cents and currency.
+    """
+    data = dict(
+        (field, item[name]) for name, field in FEED_FIELDS.items()
+        if name in item
+    )
+    price = item.get('sale_price') or item.get('price')
+    if price:
+        amount, _, currency = price.partition(' ')
+        data['price'] = int(decimal.Decimal(amount) * 100)
+        if currency:
+            data['currency'] = currency
+    return data
+
+
+class CatalogSnapshot(object):
+    """
+    The fingerprints of the items of each catalog as last sent, in a SQLite
+    table. A diff loads the fingerprints and the items of a feed into
+    temporary tables, in chunks, and compares them on disk.
+    """
+
+    def __init__(self, path=':memory:'):
+        """
+        Args:
+            path (optional): The SQLite database file, in memory by default.
+        """
+        self._connection = sqlite3.connect(path)
+        with self._connection:
+            self._connection.execute(
+                'CREATE TABLE IF NOT EXISTS products ('
+                'catalog_id TEXT, retailer_id TEXT, fingerprint TEXT, '
+                'PRIMARY KEY (catalog_id, retailer_id)) WITHOUT ROWID'
+            )
+            self._connection.execute(
+                'CREATE TEMP TABLE IF NOT EXISTS incoming ('
+                'retailer_id TEXT PRIMARY KEY, fingerprint TEXT, item TEXT)'
+            )
+            self._connection.execute(
+                'CREATE TEMP TABLE IF NOT EXISTS failed ('
+                'retailer_id TEXT PRIMARY KEY)'
+            )
+
+    def close(self):
+        self._connection.close()
+
+    def count(self, catalog_id):
+        """Returns the number of products of catalog_id."""
+        return self._connection.execute(
+            'SELECT COUNT(*) FROM products WHERE catalog_id = ?',
+            (catalog_id,),
+        ).fetchone()[0]
+
+    def load(self, items, id_field='id', chunk_size=10000):
+        """
+        Replaces the incoming items compared by diff with items.
+        Returns:
+            The number of distinct items loaded.
+        """
+        items = iter(items)
+        with self._connection:
+            self._connection.execute('DELETE FROM incoming')
+            for chunk in iter(
+                lambda: list(itertools.islice(items, chunk_size)), [],
+            ):
+                self._connection.executemany(
+                    'INSERT OR REPLACE INTO incoming VALUES (?, ?, ?)',
+                    (
+                        (item[id_field], fingerprint(item), json.dumps(item))
+                        for item in chunk
+                    ),
+                )
+        return self._connection.execute(
+            'SELECT COUNT(*) FROM incoming').fetchone()[0]
+
+    def diff(self, catalog_id, delete=True):
+        """
+        Yields a FeedChange for each loaded item that is new or whose
+        fingerprint changed, and, if delete, for each product of catalog_id
+        that was not loaded.
+        """
+        cursor = self._connection.execute(
+            'SELECT incoming.retailer_id, incoming.item, '
+            'products.fingerprint IS NULL '
+            'FROM incoming LEFT JOIN products '
+            'ON products.catalog_id = ? '
+            'AND products.retailer_id = incoming.retailer_id '
+            'WHERE products.fingerprint IS NULL '
+            'OR products.fingerprint != incoming.fingerprint',
+            (catalog_id,),
+        )
+        for retailer_id, item, is_new in cursor:
+            yield FeedChange(
+                'CREATE' if is_new else 'UPDATE',
+                retailer_id,
+                json.loads(item),
+            )
+        if delete:
+            cursor = self._connection.execute(
+                'SELECT retailer_id FROM products WHERE catalog_id = ? '
+                'AND retailer_id NOT IN (SELECT retailer_id FROM incoming)',
+                (catalog_id,),
+            )
+            for retailer_id, in cursor:
+                yield FeedChange('DELETE', retailer_id, None)
+
+    def commit(self, catalog_id, delete=True, failed=()):
+        """
+        Makes the loaded items the snapshot of catalog_id, except for the
+        retailer ids in failed, which keep their previous state so that the
+        next diff yields them again.
+        """
+        with self._connection:
+            self._connection.execute('DELETE FROM failed')
+            self._connection.executemany(
+                'INSERT OR IGNORE INTO failed VALUES (?)',
+                ((retailer_id,) for retailer_id in failed),
+            )
+            if delete:
+                self._connection.execute(
+                    'DELETE FROM products WHERE catalog_id = ? AND '
+                    'retailer_id NOT IN (SELECT retailer_id FROM incoming) '
+                    'AND retailer_id NOT IN (SELECT retailer_id FROM failed)',
+                    (catalog_id,),
+                )
+            self._connection.execute(
+                'INSERT OR REPLACE INTO products '
+                'SELECT ?, retailer_id, fingerprint FROM incoming '
+                'WHERE retailer_id NOT IN (SELECT retailer_id FROM failed)',
+                (catalog_id,),
+            )
+
+
+class CatalogFeedSync(object):
+    """
+    Sends to a ProductCatalog only the items of a feed that changed since
+    the previous sync, through bulk_update_products. The snapshot can be
+    seeded from the live catalog with load_catalog.
+    Example:
+        >>> sync = CatalogFeedSync(CatalogSnapshot('catalog.db'))
+        >>> changes, result = sync.sync(catalog, 'feed.xml')
+        >>> changes, result.errors
+    """
+
+    def __init__(self, snapshot, to_data=feed_item_to_product_data):
+        """
+        Args:
+            snapshot: The CatalogSnapshot of the catalogs.
+            to_data (optional): The function returning the product fields of
+                a feed item.
+        """
+        self._snapshot = snapshot
+        self._to_data = to_data
+
+    def load_catalog(self, catalog, to_item, fields=None):
+        """
+        Replaces the snapshot of catalog by its live products, read with
+        get_products.
+        Args:
+            catalog: The ProductCatalog.
+            to_item: The function returning the feed item of a ProductItem,
+                as iter_feed_items reads it, so that unchanged products
+                have the same fingerprint in the feed.
+            fields (optional): The product fields to_item reads.
+        """
+        self._snapshot.load(
+            to_item(product) for product in catalog.get_products(
+                fields=fields,
+                params={'limit': 500},
+            )
+        )
+        self._snapshot.commit(catalog.get_id_assured())
+
+    def sync(self, catalog, source, delete=False, **kwargs):
+        """
+        Args:
+            catalog: The ProductCatalog to update.
+            source: The feed, a file name or file object.
+            delete (optional): Whether products missing from the feed are
+                deleted from the catalog.
+            kwargs (optional): Arguments of bulk_update_products.
+        Returns:
+            A tuple of a Counter of the methods sent and the
+            ProductBatchResult. Items with errors, or still pending at the
+            timeout, are not recorded in the snapshot, so the next sync
+            sends them again; if an error does not tell its item, the
+            snapshot is left as it was.
+        """
+        catalog_id = catalog.get_id_assured()
+        self._snapshot.load(iter_feed_items(source))
+        counts = collections.Counter()
+
+        def requests():
+            for change in self._snapshot.diff(catalog_id, delete):
+                counts[change.method] += 1
+                request = {
+                    'method': change.method,
+                    'retailer_id': change.retailer_id,
+                }
+                if change.item is not None:
+                    request['data'] = self._to_data(change.item)
+                yield request
+
+        result = catalog.bulk_update_products(requests(), **kwargs)
+        failed = self._get_failed_ids(result.errors)
+        if failed is not None:
+            for ids in result.pending.values():
+                failed.update(ids)
+            self._snapshot.commit(catalog_id, delete, failed)
+        return counts, result
+
+    @staticmethod
+    def _get_failed_ids(errors):
+        failed = set()
+        for error in errors:
+            if 'retailer_ids' in error:
+                failed.update(error['retailer_ids'])
+            elif 'id' in error:
+                failed.add(error['id'])
+            else:
+                return None
+        return failed
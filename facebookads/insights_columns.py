@@ -0,0 +1,217 @@
+# Copyright 2015 Facebook, Inc.
+
+# You are hereby granted a non-exclusive, worldwide, royalty-free license to
+# use, copy, modify, and distribute this software in source code or binary
+# form for use in connection with the web services and APIs provided by
+# Facebook.
+
+# As with any software that integrates with the Facebook platform, your use
+# of this software is subject to the Facebook Developer Principles and
+# Policies [http://developers.facebook.com/policy/]. This copyright notice
+# shall be included in all copies or substantial portions of the software.
+
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL
+# THE AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING
+# FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER
+# DEALINGS IN THE SOFTWARE.
+
+"""
+converts insights rows into typed columns for analytics
+"""
+
+from facebookads.adobjects.adsinsights import AdsInsights
+
+import array
+import collections
+import itertools
+import operator
+
+try:
+    import numpy
+except ImportError:
+    numpy = None
+
+
+# Count metrics that the Graph API returns as strings.
+INTEGER_FIELDS = frozenset([
+    'app_store_clicks',
+    'call_to_action_clicks',
+    'clicks',
+    'deeplink_clicks',
+    'impressions',
+    'inline_link_clicks',
+    'inline_post_engagement',
+    'newsfeed_clicks',
+    'newsfeed_impressions',
+    'reach',
+    'social_clicks',
+    'social_impressions',
+    'social_reach',
+    'total_actions',
+    'total_unique_actions',
+    'unique_clicks',
+    'unique_impressions',
+    'unique_inline_link_clicks',
+    'unique_social_clicks',
+    'unique_social_impressions',
+    'website_clicks',
+])
+
+PIVOT_TYPE = 'list<AdsActionStats>'
+
+_INT_TYPECODE = 'q' if 'q' in array.typecodes else 'l'
+
+
+class InsightsColumns(object):
+    """
+    Collects insights rows, either raw dicts of the Graph API response or
+    AdsInsights objects, and converts them column by column into typed
+    arrays: count metrics into int64, float metrics into float64 and
+    everything else into lists. list<AdsActionStats> fields such as actions
+    are pivoted into one float64 column per action type, named
+    '<field>:<action_type>'. The arrays are NumPy arrays when NumPy is
+    installed and array.array objects otherwise.
+    Example:
+        >>> columns = InsightsColumns(['ad_id', 'spend', 'actions'])
+        >>> columns.add_rows(account.get_insights(fields, params))
+        >>> table = columns.build()
+        >>> table['actions:link_click']
+    """
+
+    def __init__(self, fields=None, value_field='value', use_numpy=None):
+        """
+        Args:
+            fields (optional): The fields to convert, in column order. All
+                fields present in the rows, sorted, if None.
+            value_field (optional): The AdsActionStats field pivoted into
+                the action columns, e.g. '28d_click'.
+            use_numpy (optional): Whether to build NumPy arrays, the default
+                is to use NumPy if it can be imported.
+        """
+        if use_numpy is None:
+            use_numpy = numpy is not None
+        elif use_numpy and numpy is None:
+            raise ValueError("NumPy is not installed.")
+        self._fields = fields
+        self._value_field = value_field
+        self._use_numpy = use_numpy
+        self._rows = []
+
+    def __len__(self):
+        return len(self._rows)
+
+    def add_rows(self, rows):
+        """Adds the rows of an iterable, e.g. an insights Cursor."""
+        self._rows.extend(rows)
+
+    def add_page(self, response):
+        """Adds the rows of a raw page of insights, i.e. {'data': [...]}."""
+        self._rows.extend(response.get('data', ()))
+
+    def get_fields(self):
+        """Returns the fields converted by build."""
+        if self._fields is not None:
+            return list(self._fields)
+        fields = set()
+        for row in self._rows:
+            fields.update(row)
+        return sorted(fields)
+
+    def build(self):
+        """
+        Returns:
+            An OrderedDict of column name to column, each column having one
+            value per row. Missing counts are 0, missing floats are NaN and
+            missing actions are 0.0.
+        """
+        columns = collections.OrderedDict()
+        field_types = AdsInsights._field_types
+        for field in self.get_fields():
+            field_type = field_types.get(field)
+            if field_type == PIVOT_TYPE:
+                columns.update(self._pivot(field))
+            elif field_type == 'float':
+                columns[field] = self._convert(field, 'nan', float, 'd')
+            elif field in INTEGER_FIELDS:
+                columns[field] = self._convert(field, 0, int, _INT_TYPECODE)
+            else:
+                columns[field] = self._values(field, None)
+        return columns
+
+    def _values(self, field, default):
+        return list(map(
+            operator.methodcaller('get', field, default),
+            self._rows,
+        ))
+
+    def _convert(self, field, default, convert, typecode):
+        values = map(convert, self._values(field, default))
+        if self._use_numpy:
+            return numpy.fromiter(
+                values,
+                numpy.dtype(typecode),
+                len(self._rows),
+            )
+        return array.array(typecode, values)
+
+    def _pivot(self, field):
+        # Flatten the actions of all rows at once, keeping the row index of
+        # each action, then scatter their values into one column per type.
+        row_actions = [actions or () for actions in self._values(field, None)]
+        actions = list(itertools.chain.from_iterable(row_actions))
+        row_indexes = list(itertools.chain.from_iterable(map(
+            itertools.repeat,
+            range(len(row_actions)),
+            map(len, row_actions),
+        )))
+        types = list(map(operator.itemgetter('action_type'), actions))
+        values = list(map(float, map(
+            operator.methodcaller('get', self._value_field, 0),
+            actions,
+        )))
+        action_types = sorted(set(types))
+        if self._use_numpy:
+            columns = self._scatter_numpy(
+                action_types, types, row_indexes, values)
+        else:
+            columns = self._scatter_array(
+                action_types, types, row_indexes, values)
+        return collections.OrderedDict(
+            ('%s:%s' % (field, action_type), column)
+            for action_type, column in zip(action_types, columns)
+        )
+
+    def _scatter_numpy(self, action_types, types, row_indexes, values):
+        codes = dict((action_type, code)
+                     for code, action_type in enumerate(action_types))
+        matrix = numpy.zeros((len(action_types), len(self._rows)))
+        if values:
+            # add.at sums the values of an action type that action
+            # breakdowns split in several entries of a row.
+            numpy.add.at(
+                matrix,
+                (list(map(codes.__getitem__, types)), row_indexes),
+                values,
+            )
+        return list(matrix)
+
+    def _scatter_array(self, action_types, types, row_indexes, values):
+        codes = dict((action_type, code)
+                     for code, action_type in enumerate(action_types))
+        columns = [array.array('d', [0.0]) * len(self._rows)
+                   for action_type in action_types]
+        for code, row_index, value in zip(
+            map(codes.__getitem__, types), row_indexes, values,
+        ):
+            columns[code][row_index] += value
+        return columns
+
+
+def insights_to_columns(rows, fields=None, value_field='value'):
+    """Returns the typed columns of rows, see InsightsColumns."""
+    columns = InsightsColumns(fields, value_field=value_field)
+    columns.add_rows(rows)
+    return columns.build()
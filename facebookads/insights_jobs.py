@@ -0,0 +1,401 @@
+# Copyright 2015 Facebook, Inc.
+
+# You are hereby granted a non-exclusive, worldwide, royalty-free license to
+# use, copy, modify, and distribute this software in source code or binary
+# form for use in connection with the web services and APIs provided by
+# Facebook.
+
+# As with any software that integrates with the Facebook platform, your use
+# of this software is subject to the Facebook Developer Principles and
+# Policies [http://developers.facebook.com/policy/]. This copyright notice
+# shall be included in all copies or substantial portions of the software.
+
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL
+# THE AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING
+# FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER
+# DEALINGS IN THE SOFTWARE.
+
+"""
+insights jobs manager that runs many async insights reports at once
+"""
+
+from facebookads.api import FacebookAdsApi
+from facebookads.exceptions import FacebookError
+from facebookads.exceptions import FacebookRequestError
+from facebookads.adobjects.adreportrun import AdReportRun
+
+import collections
+import heapq
+import itertools
+import random
+import time
+
+
+class InsightsJob(object):
+    """
+    An async insights report of one node, e.g. an AdAccount, and the
+    AdReportRun currently computing it.
+    """
+
+    def __init__(self, node, fields=None, params=None):
+        self.node = node
+        self.fields = fields
+        self.params = params
+        self.report_run = None
+        self.attempts = 0
+        self.error = None
+
+    def is_complete(self):
+        """Returns whether the report finished successfully."""
+        return (
+            self.report_run is not None and
+            self.report_run.get(AdReportRun.Field.async_status) ==
+            InsightsJobManager.STATUS_COMPLETED and
+            self.report_run.get(
+                AdReportRun.Field.async_percent_completion) == 100
+        )
+
+    def get_result(self, params=None):
+        """Returns the insights of the finished report, see get_result of
+        AdReportRun.
+        """
+        if not self.is_complete():
+            raise FacebookError(
+                "Insights job has not completed: %s" % (self.error,),
+            )
+        return self.report_run.get_result(params=params)
+
+
+class InsightsJobManager(object):
+    """
+    Runs async insights jobs with at most max_running of them in flight.
+    All running jobs are polled with a single multi-id request per round,
+    the delay between rounds grows while no job makes progress, and failed
+    jobs are submitted again up to max_retries times. A round whose request
+    fails is skipped and backed off like a round without progress.
+    Example:
+        >>> manager = InsightsJobManager()
+        >>> for account in accounts:
+        ...     manager.add(account, fields, {'level': 'ad'})
+        >>> for job in manager.run():
+        ...     for row in job.get_result():
+        ...         print(row)
+    """
+
+    STATUS_COMPLETED = 'Job Completed'
+
+    STATUS_FAILED = ('Job Failed', 'Job Skipped')
+
+    # Number of ids the Graph API accepts in one ?ids= request.
+    MAX_IDS_PER_POLL = 50
+
+    def __init__(
+        self,
+        api=None,
+        max_running=10,
+        max_retries=2,
+        min_interval=1.0,
+        max_interval=60.0,
+        backoff=1.5,
+        sleep=time.sleep,
+        max_poll_errors=5,
+    ):
+        """
+        Args:
+            api (optional): The api used to poll, the default api if None.
+            max_running (optional): Maximum number of jobs in flight.
+            max_retries (optional): Number of times a failed job is resubmitted.
+            min_interval (optional): Seconds between polls while jobs progress.
+            max_interval (optional): Upper bound of the poll interval.
+            backoff (optional): Factor applied to the interval after a poll
+                in which no job progressed.
+            sleep (optional): The function used to wait between polls.
+            max_poll_errors (optional): Number of polls in a row that may
+                fail before the error is raised.
+        """
+        self._api = api
+        self._max_running = max_running
+        self._max_retries = max_retries
+        self._min_interval = min_interval
+        self._max_interval = max_interval
+        self._backoff = backoff
+        self._sleep = sleep
+        self._max_poll_errors = max_poll_errors
+        self._poll_errors = 0
+        self._queued = collections.deque()
+        self._running = []
+        self._interval = min_interval
+
+    def add(self, node, fields=None, params=None):
+        """Queues an async insights report of node and returns its job."""
+        job = InsightsJob(node, fields, params)
+        self._queued.append(job)
+        return job
+
+    def run(self):
+        """
+        Submits and polls the queued jobs, and yields each job as soon as it
+        has finished. Jobs that failed more than max_retries times are yielded
+        with their error set, and is_complete() False.
+        """
+        while self._queued or self._running:
+            for job in self._submit():
+                yield job
+            if not self._running:
+                continue
+            self._sleep(self._interval)
+            for job in self._poll_running():
+                yield job
+
+    def poll(self, report_runs):
+        """
+        Reads the status of report_runs with one request per
+        MAX_IDS_PER_POLL runs and updates them in place. The runs of a
+        failed request are left as they were, unless more than
+        max_poll_errors polls in a row failed, then the error is raised.
+        Returns:
+            Whether all the runs were read.
+        """
+        by_id = dict((run.get_id_assured(), run) for run in report_runs)
+        ids = list(by_id)
+        api = self._api or FacebookAdsApi.get_default_api()
+        read_all = True
+        for start in range(0, len(ids), self.MAX_IDS_PER_POLL):
+            chunk = ids[start:start + self.MAX_IDS_PER_POLL]
+            try:
+                response = api.call(
+                    'GET',
+                    (),
+                    params={
+                        'ids': ','.join(chunk),
+                        'fields': ','.join([
+                            AdReportRun.Field.id,
+                            AdReportRun.Field.async_status,
+                            AdReportRun.Field.async_percent_completion,
+                            AdReportRun.Field.time_ref,
+                        ]),
+                    },
+                ).json()
+            except FacebookRequestError:
+                read_all = False
+                if self._poll_errors >= self._max_poll_errors:
+                    raise
+                continue
+            for fbid, data in response.items():
+                if fbid in by_id:
+                    by_id[fbid]._set_data(data)
+        self._poll_errors = 0 if read_all else self._poll_errors + 1
+        return read_all
+
+    def _submit(self):
+        failed = []
+        while self._queued and len(self._running) < self._max_running:
+            job = self._queued.popleft()
+            job.attempts += 1
+            try:
+                job.report_run = job.node.get_insights(
+                    fields=job.fields,
+                    params=job.params,
+                    async=True,
+                )
+            except FacebookError as e:
+                if self._retry(job, e):
+                    continue
+                failed.append(job)
+            else:
+                self._running.append(job)
+        return failed
+
+    def _poll_running(self):
+        progress = dict(
+            (id(job), job.report_run.get(
+                AdReportRun.Field.async_percent_completion))
+            for job in self._running
+        )
+        self.poll([job.report_run for job in self._running])
+
+        finished = []
+        running = []
+        progressed = False
+        for job in self._running:
+            status = job.report_run.get(AdReportRun.Field.async_status)
+            percent = job.report_run.get(
+                AdReportRun.Field.async_percent_completion)
+            if percent != progress[id(job)]:
+                progressed = True
+            if job.is_complete():
+                finished.append(job)
+                progressed = True
+            elif status in self.STATUS_FAILED:
+                progressed = True
+                if not self._retry(job, status):
+                    finished.append(job)
+            else:
+                running.append(job)
+        self._running = running
+
+        if progressed:
+            self._interval = self._min_interval
+        else:
+            self._interval = min(
+                self._interval * self._backoff,
+                self._max_interval,
+            )
+        return finished
+
+    def _retry(self, job, error):
+        """Requeues job if it has retries left, records error otherwise."""
+        job.error = error
+        if job.attempts <= self._max_retries:
+            job.report_run = None
+            self._queued.append(job)
+            return True
+        return False
+
+
+class ReportRunScheduler(object):
+    """
+    Polls many AdReportRuns from one thread, each at the time it is expected
+    to complete. The time to completion of a run is estimated from the rate
+    of its async_percent_completion since its time_ref, the next poll is
+    scheduled at a fraction of that time, with jitter, and all runs due at
+    the same time are read with the batched poll of InsightsJobManager.
+    Example:
+        >>> scheduler = ReportRunScheduler()
+        >>> runs = [account.get_insights(params=params, async=True)
+        ...         for account in accounts]
+        >>> for run in scheduler.wait(runs, timeout=3600):
+        ...     rows = run.get_result()
+    """
+
+    def __init__(
+        self,
+        manager=None,
+        min_interval=1.0,
+        max_interval=60.0,
+        poll_fraction=0.5,
+        jitter=0.1,
+        clock=time.time,
+        sleep=time.sleep,
+        random=random.random,
+    ):
+        """
+        Args:
+            manager (optional): The InsightsJobManager whose poll reads the
+                runs, one with the default api if None.
+            min_interval (optional): Minimum seconds between polls of a run.
+            max_interval (optional): Maximum seconds between polls of a run.
+            poll_fraction (optional): Fraction of the estimated time to
+                completion after which a run is polled again.
+            jitter (optional): Relative random spread of the delays, so runs
+                submitted together are not all polled together.
+            clock (optional): The function returning the current time.
+            sleep (optional): The function used to wait between polls.
+            random (optional): The function returning a float in [0, 1).
+        """
+        self._manager = manager or InsightsJobManager()
+        self._min_interval = min_interval
+        self._max_interval = max_interval
+        self._poll_fraction = poll_fraction
+        self._jitter = jitter
+        self._clock = clock
+        self._sleep = sleep
+        self._random = random
+        self._heap = []
+        self._counter = itertools.count()
+        self._delays = {}
+
+    def __len__(self):
+        return len(self._heap)
+
+    def add(self, run):
+        """Schedules the first poll of run."""
+        self._schedule(run, self._min_interval)
+
+    def wait(self, runs=(), timeout=None):
+        """
+        Adds runs, then polls all scheduled runs and yields each one as soon
+        as it completed or failed. Stops after timeout seconds, if given,
+        leaving the other runs scheduled for the next call.
+        """
+        for run in runs:
+            self.add(run)
+        deadline = None if timeout is None else self._clock() + timeout
+        while self._heap:
+            now = self._clock()
+            due = self._heap[0][0]
+            if deadline is not None and due > deadline:
+                if now < deadline:
+                    self._sleep(deadline - now)
+                return
+            if due > now:
+                self._sleep(due - now)
+                now = self._clock()
+
+            runs = collections.deque()
+            while self._heap and self._heap[0][0] <= now:
+                runs.append(heapq.heappop(self._heap)[2])
+            finished = collections.deque()
+            try:
+                self._manager.poll(runs)
+                now = self._clock()
+                while runs:
+                    run = runs[0]
+                    if self._is_finished(run):
+                        finished.append(run)
+                    else:
+                        self._schedule(run, self.get_delay(run, now))
+                    runs.popleft()
+                while finished:
+                    run = finished.popleft()
+                    self._delays.pop(id(run), None)
+                    yield run
+            finally:
+                # Runs that were not handled, because poll raised or the
+                # caller stopped iterating, are due again right away.
+                for run in itertools.chain(runs, finished):
+                    self._schedule(run, 0)
+
+    def get_delay(self, run, now=None):
+        """Returns the seconds to wait before the next poll of run."""
+        now = self._clock() if now is None else now
+        remaining = self.estimate_remaining(run, now)
+        if remaining is None:
+            # No progress to extrapolate from yet, back off.
+            delay = self._delays.get(id(run), self._min_interval) * 2
+        else:
+            delay = remaining * self._poll_fraction
+        return max(self._min_interval, min(self._max_interval, delay))
+
+    def estimate_remaining(self, run, now=None):
+        """
+        Returns the estimated seconds until run completes, or None when it
+        has made no progress yet.
+        """
+        now = self._clock() if now is None else now
+        percent = run.get(AdReportRun.Field.async_percent_completion) or 0
+        time_ref = run.get(AdReportRun.Field.time_ref)
+        if not percent or not time_ref or now <= time_ref:
+            return None
+        rate = float(percent) / (now - time_ref)
+        return (100 - percent) / rate
+
+    @staticmethod
+    def _is_finished(run):
+        status = run.get(AdReportRun.Field.async_status)
+        percent = run.get(AdReportRun.Field.async_percent_completion)
+        return (
+            status in InsightsJobManager.STATUS_FAILED or
+            status == InsightsJobManager.STATUS_COMPLETED and percent == 100
+        )
+
+    def _schedule(self, run, delay):
+        self._delays[id(run)] = delay
+        delay *= 1 + self._jitter * (2 * self._random() - 1)
+        heapq.heappush(
+            self._heap,
+            (self._clock() + delay, next(self._counter), run),
+        )
@@ -0,0 +1,215 @@
+# Copyright 2015 Facebook, Inc.
+
+# You are hereby granted a non-exclusive, worldwide, royalty-free license to
+# use, copy, modify, and distribute this software in source code or binary
+# form for use in connection with the web services and APIs provided by
+# Facebook.
+
+# As with any software that integrates with the Facebook platform, your use
+# of this software is subject to the Facebook Developer Principles and
+# Policies [http://developers.facebook.com/policy/]. This copyright notice
+# shall be included in all copies or substantial portions of the software.
+
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL
+# THE AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING
+# FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER
+# DEALINGS IN THE SOFTWARE.
+
+"""
+rolls ad level insights up to ad sets, campaigns and accounts locally
+"""
+
+from facebookads.insights_columns import InsightsColumns, numpy
+
+import array
+import collections
+
+
+# Metrics whose value of a group is the sum of its rows.
+ADDITIVE_FIELDS = frozenset([
+    'action_values',
+    'actions',
+    'app_store_clicks',
+    'call_to_action_clicks',
+    'clicks',
+    'deeplink_clicks',
+    'impressions',
+    'inline_link_clicks',
+    'inline_post_engagement',
+    'newsfeed_clicks',
+    'newsfeed_impressions',
+    'social_clicks',
+    'social_impressions',
+    'social_spend',
+    'spend',
+    'total_action_value',
+    'total_actions',
+    'video_10_sec_watched_actions',
+    'video_15_sec_watched_actions',
+    'video_30_sec_watched_actions',
+    'video_complete_watched_actions',
+    'video_p100_watched_actions',
+    'video_p25_watched_actions',
+    'video_p50_watched_actions',
+    'video_p75_watched_actions',
+    'video_p95_watched_actions',
+    'website_clicks',
+])
+
+# Ratio metrics recomputed from their sums: numerator, denominator, scale.
+RATIO_FIELDS = collections.OrderedDict([
+    ('ctr', ('clicks', 'impressions', 100.0)),
+    ('cpc', ('spend', 'clicks', 1.0)),
+    ('cpm', ('spend', 'impressions', 1000.0)),
+    ('inline_link_click_ctr', ('inline_link_clicks', 'impressions', 100.0)),
+    ('cost_per_inline_link_click', ('spend', 'inline_link_clicks', 1.0)),
+    ('cost_per_inline_post_engagement',
+     ('spend', 'inline_post_engagement', 1.0)),
+    ('cost_per_total_action', ('spend', 'total_actions', 1.0)),
+])
+
+# cost_per_action_type:<type> is recomputed as spend / actions:<type>.
+COST_PER_ACTION_FIELD = 'cost_per_action_type'
+
+
+class InsightsRollup(object):
+    """
+    Aggregates ad level insights rows, which must include adset_id,
+    campaign_id and account_id, at a higher level without querying the API
+    again. Additive metrics are summed per group, ratio metrics such as ctr,
+    cpc and cpm are recomputed from the summed components, and the other
+    metrics, e.g. reach or frequency, whose deduplicated value only the API
+    knows, are left out and reported by get_non_additive_fields.
+    The rows are converted to columns once; a rollup is a grouped sum per
+    column, done with numpy.bincount when NumPy is installed.
+    Example:
+        >>> rollup = InsightsRollup(account.get_insights(fields, {
+        ...     'level': 'ad',
+        ...     'time_increment': 1,
+        ... }))
+        >>> campaigns = rollup.rollup('campaign')
+        >>> campaigns['campaign_id'], campaigns['ctr']
+    """
+
+    LEVELS = collections.OrderedDict([
+        ('ad', 'ad_id'),
+        ('adset', 'adset_id'),
+        ('campaign', 'campaign_id'),
+        ('account', 'account_id'),
+    ])
+
+    def __init__(self, rows, dimensions=('date_start', 'date_stop'),
+                 use_numpy=None):
+        """
+        Args:
+            rows: The ad level rows, dicts or AdsInsights.
+            dimensions (optional): Fields that also split the groups, e.g.
+                the dates of daily rows and the breakdowns.
+            use_numpy (optional): See InsightsColumns.
+        """
+        columns = InsightsColumns(use_numpy=use_numpy)
+        columns.add_rows(rows)
+        self._use_numpy = columns._use_numpy
+        self._count = len(columns)
+        self._columns = columns.build()
+        self._dimensions = [
+            field for field in dimensions if field in self._columns
+        ]
+
+    def get_additive_fields(self):
+        """Returns the columns summed by rollup."""
+        return [
+            name for name in self._columns
+            if name.split(':', 1)[0] in ADDITIVE_FIELDS
+        ]
+
+    def get_ratio_fields(self):
+        """Returns the columns recomputed from their components."""
+        ratios = [
+            name for name, (numerator, denominator, scale) in
+            RATIO_FIELDS.items()
+            if name in self._columns and numerator in self._columns and
+            denominator in self._columns
+        ]
+        for name in self._columns:
+            field, _, action_type = name.partition(':')
+            if (
+                field == COST_PER_ACTION_FIELD and
+                'spend' in self._columns and
+                'actions:' + action_type in self._columns
+            ):
+                ratios.append(name)
+        return ratios
+
+    def get_non_additive_fields(self):
+        """
+        Returns the numeric columns that cannot be rolled up locally and
+        need a query at the target level, e.g. reach and frequency.
+        """
+        excluded = set(self.get_additive_fields())
+        excluded.update(self.get_ratio_fields())
+        excluded.update(self.LEVELS.values())
+        excluded.update(self._dimensions)
+        return [
+            name for name, column in self._columns.items()
+            if name not in excluded and not isinstance(column, list)
+        ]
+
+    def rollup(self, level):
+        """
+        Args:
+            level: One of the keys of LEVELS.
+        Returns:
+            An OrderedDict of columns with one value per group: the id of
+            the level, the dimensions, the summed metrics as float64 and
+            the recomputed ratios, NaN where the denominator is 0.
+        """
+        if level not in self.LEVELS:
+            raise ValueError("Unknown level %r." % (level,))
+        key_fields = [self.LEVELS[level]] + self._dimensions
+        if key_fields[0] not in self._columns:
+            raise ValueError("The rows have no %s." % (key_fields[0],))
+        index = {}
+        codes = [
+            index.setdefault(key, len(index))
+            for key in zip(*[self._columns[field] for field in key_fields])
+        ]
+        keys = sorted(index, key=index.__getitem__)
+
+        result = collections.OrderedDict()
+        for position, field in enumerate(key_fields):
+            result[field] = [key[position] for key in keys]
+        for name in self.get_additive_fields():
+            result[name] = self._sum(codes, len(keys), self._columns[name])
+        for name in self.get_ratio_fields():
+            field, _, action_type = name.partition(':')
+            if field == COST_PER_ACTION_FIELD:
+                numerator, denominator, scale = (
+                    'spend', 'actions:' + action_type, 1.0)
+            else:
+                numerator, denominator, scale = RATIO_FIELDS[name]
+            result[name] = self._divide(
+                result[numerator], result[denominator], scale)
+        return result
+
+    def _sum(self, codes, count, column):
+        if self._use_numpy:
+            return numpy.bincount(codes, weights=column, minlength=count)
+        sums = array.array('d', [0.0]) * count
+        for code, value in zip(codes, column):
+            sums[code] += value
+        return sums
+
+    def _divide(self, numerators, denominators, scale):
+        if self._use_numpy:
+            with numpy.errstate(divide='ignore', invalid='ignore'):
+                ratios = numerators * scale / denominators
+            ratios[denominators == 0] = numpy.nan
+            return ratios
+        return array.array('d', [
+            numerator * scale / denominator if denominator else float('nan')
+            for numerator, denominator in zip(numerators, denominators)
+        ])
@@ -0,0 +1,227 @@
+# Copyright 2015 Facebook, Inc.
+
+# You are hereby granted a non-exclusive, worldwide, royalty-free license to
+# use, copy, modify, and distribute this software in source code or binary
+# form for use in connection with the web services and APIs provided by
+# Facebook.
+
+# As with any software that integrates with the Facebook platform, your use
+# of this software is subject to the Facebook Developer Principles and
+# Policies [http://developers.facebook.com/policy/]. This copyright notice
+# shall be included in all copies or substantial portions of the software.
+
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL
+# THE AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING
+# FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER
+# DEALINGS IN THE SOFTWARE.
+
+"""
+splits long insights queries into time ranges that run in parallel
+"""
+
+from facebookads.exceptions import FacebookError, FacebookRequestError
+from facebookads.insights_jobs import InsightsJobManager
+
+from multiprocessing.pool import ThreadPool
+import datetime
+import json
+import six
+import threading
+import time
+
+
+class TimeRangeSplitter(object):
+    """
+    An execution strategy of get_insights that partitions the time_range of
+    a query with a day based time_increment into sub-ranges, runs them in
+    parallel, synchronously or as async jobs, and merges their rows in date
+    order. Sub-ranges are sized so that one request takes about
+    target_seconds, from the response times of the previous requests.
+    A synchronous sub-range that fails with a server error is split in half
+    and retried, as big ranges are the usual cause of insights timeouts.
+    Queries without a time_range or with an all_days or monthly
+    time_increment run unsplit.
+    Example:
+        >>> splitter = TimeRangeSplitter(max_workers=4)
+        >>> rows = account.get_insights(fields, {
+        ...     'time_range': {'since': '2016-01-01', 'until': '2016-12-31'},
+        ...     'time_increment': 1,
+        ... }, strategy=splitter)
+    """
+
+    DATE_FORMAT = '%Y-%m-%d'
+
+    def __init__(
+        self,
+        max_workers=4,
+        target_seconds=10.0,
+        chunk_days=7,
+        min_days=1,
+        max_days=90,
+        smoothing=0.5,
+    ):
+        """
+        Args:
+            max_workers (optional): Number of sub-ranges run at once.
+            target_seconds (optional): Desired duration of one request.
+            chunk_days (optional): Days per sub-range before any response
+                time is known.
+            min_days (optional): Lower bound of the days per sub-range.
+            max_days (optional): Upper bound of the days per sub-range.
+            smoothing (optional): Weight of the latest response time in the
+                learned seconds per day.
+        """
+        self._max_workers = max_workers
+        self._target_seconds = target_seconds
+        self._chunk_days = chunk_days
+        self._min_days = min_days
+        self._max_days = max_days
+        self._smoothing = smoothing
+        self._seconds_per_day = None
+        self._lock = threading.Lock()
+
+    def get_seconds_per_day(self):
+        """Returns the learned seconds per day of a request, or None."""
+        return self._seconds_per_day
+
+    def get_chunk_days(self, increment=1):
+        """Returns the days per sub-range, a multiple of increment."""
+        if self._seconds_per_day is None:
+            days = self._chunk_days
+        elif self._seconds_per_day <= 0:
+            days = self._max_days
+        else:
+            days = int(self._target_seconds / self._seconds_per_day)
+        days = max(self._min_days, min(self._max_days, days))
+        return max(increment, days - days % increment)
+
+    def split(self, since, until, increment=1):
+        """
+        Returns a list of (since, until) dates partitioning the inclusive
+        range since to until. Each sub-range but the last spans a multiple
+        of increment days, so time_increment buckets are never cut.
+        """
+        chunk = datetime.timedelta(days=self.get_chunk_days(increment))
+        one_day = datetime.timedelta(days=1)
+        ranges = []
+        start = since
+        while start <= until:
+            stop = min(start + chunk - one_day, until)
+            ranges.append((start, stop))
+            start = stop + one_day
+        return ranges
+
+    def get_insights(self, node, fields=None, params=None, async=False):
+        """
+        Runs the insights query of node, e.g. an AdAccount, split by time
+        range.
+        Returns:
+            A list of AdsInsights, ordered by date_start.
+        """
+        params = dict(params or {})
+        time_range = params.get('time_range')
+        increment = self._get_increment(params.get('time_increment'))
+        if not time_range or increment is None:
+            if async:
+                return self._run_async(node, fields, [params])
+            return list(node.get_insights(fields=fields, params=params))
+
+        if isinstance(time_range, six.string_types):
+            time_range = json.loads(time_range)
+        since = self._parse_date(time_range['since'])
+        until = self._parse_date(time_range['until'])
+        ranges = self.split(since, until, increment)
+
+        if async:
+            rows = self._run_async(node, fields, [
+                self._get_params(params, start, stop)
+                for start, stop in ranges
+            ])
+        else:
+            pool = ThreadPool(min(self._max_workers, len(ranges)) or 1)
+            try:
+                pages = pool.map(
+                    lambda bounds: self._fetch(
+                        node, fields, params, increment, *bounds),
+                    ranges,
+                )
+            finally:
+                pool.close()
+            rows = [row for page in pages for row in page]
+        # The sub-ranges do not overlap, so their rows only need ordering
+        # by date; the sort is stable so the API order of a day is kept.
+        rows.sort(key=lambda row: row.get('date_start') or '')
+        return rows
+
+    def _fetch(self, node, fields, params, increment, since, until):
+        days = (until - since).days + 1
+        started = time.time()
+        try:
+            rows = list(node.get_insights(
+                fields=fields,
+                params=self._get_params(params, since, until),
+            ))
+        except FacebookRequestError as e:
+            if days <= increment or not e.is_transient():
+                raise
+            self._learn(time.time() - started, days)
+            half = (days // 2 + increment - 1) // increment * increment
+            middle = since + datetime.timedelta(days=half)
+            return (
+                self._fetch(
+                    node, fields, params, increment,
+                    since, middle - datetime.timedelta(days=1),
+                ) +
+                self._fetch(node, fields, params, increment, middle, until)
+            )
+        self._learn(time.time() - started, days)
+        return rows
+
+    def _run_async(self, node, fields, params_list):
+        manager = InsightsJobManager(
+            api=node.get_api(),
+            max_running=self._max_workers,
+        )
+        jobs = [manager.add(node, fields, params) for params in params_list]
+        for job in manager.run():
+            if not job.is_complete():
+                raise FacebookError(
+                    "Insights job failed: %s" % (job.error,),
+                )
+        return [row for job in jobs for row in job.get_result()]
+
+    def _learn(self, seconds, days):
+        with self._lock:
+            seconds_per_day = float(seconds) / days
+            if self._seconds_per_day is None:
+                self._seconds_per_day = seconds_per_day
+            else:
+                self._seconds_per_day += self._smoothing * (
+                    seconds_per_day - self._seconds_per_day)
+
+    @classmethod
+    def _get_params(cls, params, since, until):
+        params = dict(params)
+        params['time_range'] = {
+            'since': since.strftime(cls.DATE_FORMAT),
+            'until': until.strftime(cls.DATE_FORMAT),
+        }
+        return params
+
+    @classmethod
+    def _parse_date(cls, value):
+        return datetime.datetime.strptime(value, cls.DATE_FORMAT).date()
+
+    @staticmethod
+    def _get_increment(time_increment):
+        if isinstance(time_increment, six.integer_types):
+            return time_increment
+        if (
+            isinstance(time_increment, six.string_types) and
+            time_increment.isdigit()
+        ):
+            return int(time_increment)
+        return None
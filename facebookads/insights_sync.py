@@ -0,0 +1,230 @@
+# Copyright 2015 Facebook, Inc.
+
+# You are hereby granted a non-exclusive, worldwide, royalty-free license to
+# use, copy, modify, and distribute this software in source code or binary
+# form for use in connection with the web services and APIs provided by
+# Facebook.
+
+# As with any software that integrates with the Facebook platform, your use
+# of this software is subject to the Facebook Developer Principles and
+# Policies [http://developers.facebook.com/policy/]. This copyright notice
+# shall be included in all copies or substantial portions of the software.
+
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL
+# THE AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING
+# FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER
+# DEALINGS IN THE SOFTWARE.
+
+"""
+incremental insights sync that keeps daily rows in a local SQLite store
+"""
+
+import collections
+import datetime
+import json
+import re
+import sqlite3
+
+
+class InsightsSyncResult(collections.namedtuple(
+    'InsightsSyncResult',
+    ['since', 'until', 'inserted', 'updated', 'unchanged'],
+)):
+    """
+    The outcome of InsightsSync.sync: the fetched date range, the new and
+    the changed rows, as dicts, and the number of unchanged rows.
+    """
+
+    __slots__ = ()
+
+
+class InsightsStore(object):
+    """
+    Daily insights rows keyed by level, object id, date and breakdowns, and
+    the last synced date of each node and level, in a SQLite database.
+    """
+
+    def __init__(self, path=':memory:'):
+        """
+        Args:
+            path (optional): The SQLite database file, in memory by default.
+        """
+        self._connection = sqlite3.connect(path)
+        with self._connection:
+            self._connection.execute(
+                'CREATE TABLE IF NOT EXISTS insights ('
+                'level TEXT, object_id TEXT, date TEXT, breakdowns TEXT, '
+                'data TEXT, '
+                'PRIMARY KEY (level, object_id, date, breakdowns))'
+            )
+            self._connection.execute(
+                'CREATE TABLE IF NOT EXISTS sync_state ('
+                'node_id TEXT, level TEXT, last_date TEXT, '
+                'PRIMARY KEY (node_id, level))'
+            )
+
+    def close(self):
+        self._connection.close()
+
+    def get_last_date(self, node_id, level):
+        """Returns the last synced date of node_id at level, or None."""
+        row = self._connection.execute(
+            'SELECT last_date FROM sync_state WHERE node_id = ? AND level = ?',
+            (node_id, level),
+        ).fetchone()
+        return _parse_date(row[0]) if row else None
+
+    def set_last_date(self, node_id, level, date):
+        with self._connection:
+            self._connection.execute(
+                'INSERT OR REPLACE INTO sync_state VALUES (?, ?, ?)',
+                (node_id, level, str(date)),
+            )
+
+    def get_rows(self, level, since, until):
+        """Returns the stored rows of level between the dates, inclusive."""
+        cursor = self._connection.execute(
+            'SELECT data FROM insights '
+            'WHERE level = ? AND date >= ? AND date <= ? '
+            'ORDER BY date, object_id, breakdowns',
+            (level, str(since), str(until)),
+        )
+        return [json.loads(data) for data, in cursor]
+
+    def upsert(self, level, keyed_rows):
+        """
+        Stores rows given as (object_id, date, breakdowns, row) tuples.
+        Returns:
+            A tuple (inserted, updated, unchanged) of the new rows, the
+            changed rows and the number of unchanged rows.
+        """
+        inserted = []
+        updated = []
+        unchanged = 0
+        with self._connection:
+            for object_id, date, breakdowns, row in keyed_rows:
+                data = json.dumps(row, sort_keys=True, separators=(',', ':'))
+                stored = self._connection.execute(
+                    'SELECT data FROM insights WHERE level = ? AND '
+                    'object_id = ? AND date = ? AND breakdowns = ?',
+                    (level, object_id, date, breakdowns),
+                ).fetchone()
+                if stored is not None and stored[0] == data:
+                    unchanged += 1
+                    continue
+                (updated if stored is not None else inserted).append(row)
+                self._connection.execute(
+                    'INSERT OR REPLACE INTO insights VALUES (?, ?, ?, ?, ?)',
+                    (level, object_id, date, breakdowns, data),
+                )
+        return inserted, updated, unchanged
+
+
+class InsightsSync(object):
+    """
+    Keeps the daily insights of nodes in an InsightsStore up to date. Each
+    sync fetches the days after the last synced one, and the days still
+    inside the attribution window, whose conversions may yet be restated;
+    older days are final and never fetched again.
+    Example:
+        >>> sync = InsightsSync(InsightsStore('insights.db'))
+        >>> result = sync.sync(account, fields, {
+        ...     'action_attribution_windows': ['7d_click', '1d_view'],
+        ... }, level='ad')
+        >>> for row in result.inserted + result.updated:
+        ...     load(row)
+    """
+
+    # The window of the API when action_attribution_windows is not set.
+    DEFAULT_ATTRIBUTION_DAYS = 28
+
+    def __init__(self, store, strategy=None, today=None):
+        """
+        Args:
+            store: The InsightsStore of the rows.
+            strategy (optional): The execution strategy passed to
+                get_insights, e.g. a TimeRangeSplitter.
+            today (optional): A function returning the last date to sync,
+                datetime.date.today by default.
+        """
+        self._store = store
+        self._strategy = strategy
+        self._today = today or datetime.date.today
+
+    @classmethod
+    def get_attribution_days(cls, params):
+        """Returns the longest window of action_attribution_windows, in days."""
+        windows = (params or {}).get('action_attribution_windows')
+        days = [
+            int(match.group(1))
+            for match in (re.match(r'(\d+)d_', window) for window in windows or ())
+            if match
+        ]
+        return max(days) if days else cls.DEFAULT_ATTRIBUTION_DAYS
+
+    def get_range(self, node_id, level, params=None, start_date=None):
+        """Returns the (since, until) dates the next sync fetches."""
+        until = self._today()
+        window_start = until - datetime.timedelta(
+            days=self.get_attribution_days(params))
+        last_date = self._store.get_last_date(node_id, level)
+        if last_date is None:
+            since = start_date or window_start
+        else:
+            since = min(last_date + datetime.timedelta(days=1), window_start)
+        return since, until
+
+    def sync(self, node, fields, params=None, level='ad', start_date=None):
+        """
+        Fetches the insights of node, e.g. an AdAccount, at level with one
+        row per day, and stores them.
+        Args:
+            node: The object to read insights from.
+            fields: The insights fields to fetch.
+            params (optional): Other parameters of the query, e.g.
+                breakdowns or action_attribution_windows.
+            level (optional): The level of the rows, e.g. 'ad'.
+            start_date (optional): The first date of the first sync,
+                the start of the attribution window by default.
+        Returns:
+            An InsightsSyncResult.
+        """
+        node_id = node.get_id_assured()
+        since, until = self.get_range(node_id, level, params, start_date)
+        params = dict(params or {})
+        params.update({
+            'level': level,
+            'time_increment': 1,
+            'time_range': {'since': str(since), 'until': str(until)},
+        })
+        id_field = '%s_id' % level
+        fields = list(fields)
+        if id_field not in fields:
+            fields.append(id_field)
+        breakdowns = params.get('breakdowns') or ()
+
+        kwargs = {}
+        if self._strategy is not None:
+            kwargs['strategy'] = self._strategy
+        rows = node.get_insights(fields=fields, params=params, **kwargs)
+
+        keyed_rows = []
+        for row in rows:
+            if hasattr(row, 'export_all_data'):
+                row = row.export_all_data()
+            keyed_rows.append((
+                row.get(id_field),
+                row.get('date_start'),
+                json.dumps([row.get(breakdown) for breakdown in breakdowns]),
+                row,
+            ))
+        inserted, updated, unchanged = self._store.upsert(level, keyed_rows)
+        self._store.set_last_date(node_id, level, until)
+        return InsightsSyncResult(since, until, inserted, updated, unchanged)
+
+
+def _parse_date(value):
+    return datetime.datetime.strptime(value, '%Y-%m-%d').date()
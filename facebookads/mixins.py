@@ -32,12 +32,12 @@ class CanValidate(object):
     """
     def remote_validate(self, params=None):
         params = params or {}
-        data_cache = dict(self._data)
-        changes_cache = dict(self._changes)
+        snapshot = self.snapshot()
         params['execution_options'] = ['validate_only']
-        self.save(params=params)
-        self._data = data_cache
-        self._changes = changes_cache
+        try:
+            self.save(params=params)
+        finally:
+            self.rollback(snapshot)
         return self
 
 
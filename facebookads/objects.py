@@ -23,63 +23,18 @@ DEPRECATED
 
 This file is kept for backward compatibility.
 Please use objects in adobjects folder instead.
-"""
 
-from facebookads.adobjects import (
-    adaccount,
-    adlabel,
-    abstractobject,
-    abstractcrudobject,
-    adimage,
-    campaign,
-    adset,
-    adcreative,
-    ad,
-    productcatalog,
-    adsinsights,
-    productitem,
-    productgroup,
-    productfeeduploaderror,
-    productfeedupload,
-    productfeed,
-    business,
-    transaction,
-    reachfrequencyprediction,
-    reachestimate,
-    ratecard,
-    partnercategory,
-    productset,
-    adspixel,
-    customaudience,
-    offsitepixel,
-    adactivity,
-    adplacepageset,
-    minimumbudget,
-    connectionobject,
-    externaleventsource,
-    customconversion,
-    lead,
-    videothumbnail,
-    targetingsentenceline,
-    adaccountgroup,
-    leadgenform,
-    adkeywordstats,
-    broadtargetingcategories,
-    lookalikespec,
-    targeting,
-    adspixelstatsresult,
-    adaccountuser,
-    advideo,
-    page,
-    targetingsearch,
-    clicktrackingtag,
-    adreportrun,
-    post
-)
+The legacy classes are only defined when they are first used, so importing
+this module does not import the adobjects modules they are built on.
+"""
 
 import facebookads
-import warnings
 import functools
+import importlib
+import sys
+import warnings
+
+from facebookads.utils import lazyimport
 
 
 def deprecated(fun=None, replacement=None):
@@ -105,897 +60,633 @@ class EdgeIterator(facebookads.api.Cursor):
     pass
 
 
-class AbstractObject(abstractobject.AbstractObject):
-    pass
-
-
-class AbstractCrudObject(abstractcrudobject.AbstractCrudObject):
-    pass
-
-
-class AdUser(adaccountuser.AdAccountUser):
-    pass
-
-
-class Page(page.Page):
-    pass
-
-
-class Activity(adactivity.AdActivity):
-    pass
-
-
-class AdAccount(adaccount.AdAccount):
-
-    @deprecated(replacement='get_generate_previews')
-    def get_ad_preview(self, fields=None, params=None):
-        """Returns iterator over previews generated under this account."""
-        return self.get_generate_previews(fields, params)
-
-    @deprecated(replacement='get_targeting_sentence_lines')
-    def get_targeting_description(self, fields=None, params=None):
-        """
-        Returns TargetingDescription object associated with this account.
-        """
-        return self.get_targeting_sentence_lines(fields, params).get_one()
-
-    @deprecated(replacement='get_broad_targeting_categories')
-    def get_broad_category_targeting(self, fields=None, params=None):
-        """
-        Returns iterator over BroadCategoryTargeting's associated with this
-        account.
-        """
-        return self.get_broad_targeting_categories(fields, params)
-
-    @deprecated(replacement='get_rate_card')
-    def get_rate_cards(self, fields=None, params=None):
-        """Returns iterator over RateCard's associated with this account."""
-        return self.get_rate_card(fields, params)
-
-    @deprecated(replacement='get_ad_sets_by_labels')
-    def get_adsets_by_labels(self, fields=None, params=None):
-        """
-        Returns the ad sets associated with the ad AdLabel
-        """
-        return self.get_ad_sets_by_labels(fields, params)
-
-    @deprecated(replacement='get_users')
-    def get_ad_users(self, fields=None, params=None):
-        """Returns iterator over AdUser's associated with this account."""
-        return self.get_users(fields, params)
-
-
-class AbstractCrudObject(abstractcrudobject.AbstractCrudObject):
-    pass
-
-
-
-class Page(page.Page):
-    pass
-
-    @classmethod
-    def get_endpoint(cls):
-        return 'adaccounts'
-
-    def get_node_path(self):
-        return (
-            self.get_parent_id_assured(),
-            self.get_endpoint(),
-            self.get_id_assured()
-        )
-
-    def get_ad_account(self):
-        """Returns an AdAccount object with the same account id."""
-        return AdAccount(fbid='act_' + self[self.Field.account_id])
-
-
-class AdAccountGroupUser(AbstractCrudObject):
-
-    class Field(object):
-        id = 'uid'
-        role = 'role'
-        uid = 'uid'
-
-    class Role(object):
-        administrator = 1001
-        general_user = 1002
-        reports_only = 1003
-
-    @classmethod
-    def get_endpoint(cls):
-        return 'users'
-
-    def get_node_path(self):
-        return (
-            self.get_parent_id_assured(),
-            self.get_endpoint(),
-            self.get_id_assured()
-        )
-
-    def get_ad_user(self):
-        """Returns an AdUser object with the same account id."""
-        return AdUser(fbid=self[self.Field.uid])
-
-
-class Campaign(campaign.Campaign):
-    class BuyingType(object):
-        auction = 'AUCTION'
-        fixed_price = 'FIXED_PRICE'
-        reserved = 'RESERVED'
-
-class Post(post.Post):
-    pass
-
-class AdSet(adset.AdSet):
-    class PacingType(object):
-        day_parting = 'day_parting'
-        standard = 'standard'
-        no_pacing = 'no_pacing'
-
-class Ad(ad.Ad):
-    @deprecated(replacement='get_previews')
-    def get_ad_preview(self, fields=None, params=None):
-        """Returns AdPreview object associated with this ad."""
-        return self.get_previews(fields, params).get_one()
-
-    @deprecated(replacement='get_targeting_sentence_lines')
-    def get_targeting_description(self, fields=None, params=None):
-        """Returns TargetingDescription object associated with this ad."""
-        return self.get_targeting_sentence_lines(fields, params).get_one()
-
-class AdConversionPixel(offsitepixel.OffsitePixel):
-    pass
-
-
-class AdsPixel(adspixel.AdsPixel):
-
-    @deprecated(replacement='unshare_pixel_from_ad_account')
-    def unshare_pixel(self, business_id, account_id):
-        return self.unshare_pixel_from_ad_account(business_id, account_id)
-
-    @deprecated(replacement='unshare_pixel_from_agency')
-    def unshare_pixel_agencies(self, business_id, agency_id):
-        return self.unshare_pixel_from_agency(business_id, agency_id)
-
-    @deprecated(replacement='share_pixel_with_ad_account')
-    def share_pixel(self, business_id, account_id):
-        return self.share_pixel_with_ad_account(business_id, account_id)
-
-    @deprecated(replacement='share_pixel_with_agency')
-    def share_pixel_agencies(self, business_id, agency_id):
-        return self.share_pixel_with_agency(business_id, agency_id)
-
-    @deprecated(replacement='get_ad_accounts')
-    def list_ad_accounts(self, business_id):
-        return self.get_ad_accounts(business_id)
-
-    @deprecated(replacement='get_agencies')
-    def list_shared_agencies(self):
-        return self.get_agencies()
-
-
-class AdCreative(adcreative.AdCreative):
-    @deprecated(replacement='get_previews')
-    def get_ad_preview(self, fields=None, params=None):
-        self.get_previews(fields=fields, params=params)
-
-
-class AdImage(adimage.AdImage):
-    pass
-
-class AdVideo(advideo.AdVideo):
-    pass
-
-
-class VideoThumbnail(videothumbnail.VideoThumbnail):
-    pass
-
-
-class GeneratePreview(AbstractObject):
-
-    class Field(object):
-        ad_format = 'ad_format'
-        body = 'body'
-        creative = 'creative'
-        post = 'post'
-        product_item_ids = 'product_item_ids'
-
-    class AdFormat(object):
-        desktop_feed_standard = 'DESKTOP_FEED_STANDARD'
-        mobile_banner = 'MOBILE_BANNER'
-        mobile_feed_standard = 'MOBILE_FEED_STANDARD'
-        mobile_interstitial = 'MOBILE_INTERSTITIAL'
-        right_column_standard = 'RIGHT_COLUMN_STANDARD'
-
-    @classmethod
-    def get_endpoint(cls):
-        return 'generatepreviews'
-
-    def get_html(self):
-        """Returns the preview html."""
-        return self[self.Field.body]
-
+# adobjects modules that used to be imported into this namespace.
+_ADOBJECT_MODULES = frozenset([
+    'abstractcrudobject',
+    'abstractobject',
+    'ad',
+    'adaccount',
+    'adaccountgroup',
+    'adaccountuser',
+    'adactivity',
+    'adcreative',
+    'adimage',
+    'adkeywordstats',
+    'adlabel',
+    'adplacepageset',
+    'adreportrun',
+    'adset',
+    'adsinsights',
+    'adspixel',
+    'adspixelstatsresult',
+    'advideo',
+    'broadtargetingcategories',
+    'business',
+    'businessmanager',
+    'campaign',
+    'clicktrackingtag',
+    'connectionobject',
+    'customaudience',
+    'customconversion',
+    'event',
+    'externaleventsource',
+    'facebookuser',
+    'facebookuseraccount',
+    'interest',
+    'lead',
+    'leadgenform',
+    'lookalikespec',
+    'minimumbudget',
+    'oauthaccesstoken',
+    'offsitepixel',
+    'page',
+    'partnercategory',
+    'post',
+    'productcatalog',
+    'productfeed',
+    'productfeedupload',
+    'productfeeduploaderror',
+    'productgroup',
+    'productitem',
+    'productset',
+    'ratecard',
+    'reachestimate',
+    'reachfrequencyprediction',
+    'targeting',
+    'targetingsearch',
+    'targetingsentenceline',
+    'transaction',
+    'userevents',
+    'userpermission',
+    'videothumbnail',
+])
+
+# Legacy classes that add nothing to the adobjects class they extend, as
+# (adobjects module, class name).
+_SUBCLASSES = {
+    'AbstractCrudObject': ('abstractcrudobject', 'AbstractCrudObject'),
+    'AbstractObject': ('abstractobject', 'AbstractObject'),
+    'Activity': ('adactivity', 'AdActivity'),
+    'AdConversionPixel': ('offsitepixel', 'OffsitePixel'),
+    'AdImage': ('adimage', 'AdImage'),
+    'AdLabel': ('adlabel', 'AdLabel'),
+    'AdPlacePageSet': ('adplacepageset', 'AdPlacePageSet'),
+    'AdUser': ('adaccountuser', 'AdAccountUser'),
+    'AdVideo': ('advideo', 'AdVideo'),
+    'AdsPixelStat': ('adspixelstatsresult', 'AdsPixelStatsResult'),
+    'BroadCategoryTargeting': ('broadtargetingcategories', 'BroadTargetingCategories'),
+    'BusinessManager': ('businessmanager', 'BusinessManager'),
+    'BusinessManagerPage': ('page', 'BusinessManagerPage'),
+    'ClickTrackingTag': ('clicktrackingtag', 'ClickTrackingTag'),
+    'CustomAudience': ('customaudience', 'CustomAudience'),
+    'CustomConversion': ('customconversion', 'CustomConversion'),
+    'Event': ('event', 'Event'),
+    'FacebookUser': ('facebookuser', 'FacebookUser'),
+    'FacebookUserAccount': ('facebookuseraccount', 'FacebookUserAccount'),
+    'Friend': ('facebookuser', 'Friend'),
+    'Interest': ('interest', 'Interest'),
+    'KeywordStats': ('adkeywordstats', 'AdKeywordStats'),
+    'Lead': ('lead', 'Lead'),
+    'LeadgenForm': ('leadgenform', 'LeadgenForm'),
+    'MinimumBudget': ('minimumbudget', 'MinimumBudget'),
+    'OAuthAccessToken': ('oauthaccesstoken', 'OAuthAccessToken'),
+    'PartnerCategory': ('partnercategory', 'PartnerCategory'),
+    'Post': ('post', 'Post'),
+    'ProductCatalog': ('productcatalog', 'ProductCatalog'),
+    'ProductCatalogExternalEventSource': ('externaleventsource', 'ExternalEventSource'),
+    'ProductFeedUpload': ('productfeedupload', 'ProductFeedUpload'),
+    'ProductFeedUploadError': ('productfeeduploaderror', 'ProductFeedUploadError'),
+    'ProductGroup': ('productgroup', 'ProductGroup'),
+    'ProductSet': ('productset', 'ProductSet'),
+    'PublicPage': ('page', 'Page'),
+    'RateCard': ('ratecard', 'RateCard'),
+    'ReachEstimate': ('reachestimate', 'ReachEstimate'),
+    'ReachFrequencyPrediction': ('reachfrequencyprediction', 'ReachFrequencyPrediction'),
+    'TaggableFriend': ('facebookuser', 'TaggableFriend'),
+    'TargetingDescription': ('targetingsentenceline', 'TargetingSentenceLine'),
+    'TargetingSearch': ('targetingsearch', 'TargetingSearch'),
+    'TargetingSpecsField': ('targeting', 'Targeting.Field'),
+    'Transaction': ('transaction', 'Transaction'),
+    'UserEvents': ('userevents', 'UserEvents'),
+    'UserPagePermission': ('page', 'UserPagePermission'),
+    'UserPermission': ('userpermission', 'UserPermission'),
+    'VideoThumbnail': ('videothumbnail', 'VideoThumbnail'),
+}
+
+_definitions = {}
+
+
+def _legacy_class(name):
+    """Registers a function that defines the legacy class called name."""
+    def register(define):
+        _definitions[name] = define
+        return define
+    return register
+
+
+def _legacy(name):
+    """Returns the legacy class called name, defining it if needed."""
+    return getattr(sys.modules[__name__], name)
+
+
+def _resolve(name):
+    """Returns the value of the module attribute called name."""
+    if name in _ADOBJECT_MODULES:
+        return importlib.import_module('facebookads.adobjects.' + name)
+    if name in _definitions:
+        cls = _definitions[name]()
+        cls.__qualname__ = name
+        return cls
+    if name in _SUBCLASSES:
+        module_name, base_name = _SUBCLASSES[name]
+        base = importlib.import_module('facebookads.adobjects.' + module_name)
+        for attr in base_name.split('.'):
+            base = getattr(base, attr)
+        return type(base)(name, (base,), {'__module__': __name__})
+    raise AttributeError(
+        "module '%s' has no attribute '%s'" % (__name__, name),
+    )
+
+
+@_legacy_class('Page')
+def _page():
+    from facebookads.adobjects import page
+
+    class Page(page.Page):
+        pass
 
-class AdCreativePreview(GeneratePreview):
+        @classmethod
+        def get_endpoint(cls):
+            return 'adaccounts'
 
-    @classmethod
-    def get_endpoint(cls):
-        return 'previews'
+        def get_node_path(self):
+            return (
+                self.get_parent_id_assured(),
+                self.get_endpoint(),
+                self.get_id_assured()
+            )
 
+        def get_ad_account(self):
+            """Returns an AdAccount object with the same account id."""
+            account_id = 'act_' + self[self.Field.account_id]
+            return _legacy('AdAccount')(fbid=account_id)
 
-class AdPreview(AdCreativePreview):
+    return Page
 
-    @classmethod
-    def get_endpoint(cls):
-        return 'previews'
 
+@_legacy_class('AdAccount')
+def _adaccount():
+    from facebookads.adobjects import adaccount
 
-class AdsPixelStat(adspixelstatsresult.AdsPixelStatsResult):
-    pass
+    class AdAccount(adaccount.AdAccount):
 
+        @deprecated(replacement='get_generate_previews')
+        def get_ad_preview(self, fields=None, params=None):
+            """Returns iterator over previews generated under this account."""
+            return self.get_generate_previews(fields, params)
 
-class KeywordStats(adkeywordstats.AdKeywordStats):
-    pass
+        @deprecated(replacement='get_targeting_sentence_lines')
+        def get_targeting_description(self, fields=None, params=None):
+            """
+            Returns TargetingDescription object associated with this account.
+            """
+            return self.get_targeting_sentence_lines(fields, params).get_one()
 
+        @deprecated(replacement='get_broad_targeting_categories')
+        def get_broad_category_targeting(self, fields=None, params=None):
+            """
+            Returns iterator over BroadCategoryTargeting's associated with this
+            account.
+            """
+            return self.get_broad_targeting_categories(fields, params)
 
-class BroadCategoryTargeting(broadtargetingcategories.BroadTargetingCategories):
-    pass
+        @deprecated(replacement='get_rate_card')
+        def get_rate_cards(self, fields=None, params=None):
+            """Returns iterator over RateCard's associated with this account."""
+            return self.get_rate_card(fields, params)
 
+        @deprecated(replacement='get_ad_sets_by_labels')
+        def get_adsets_by_labels(self, fields=None, params=None):
+            """
+            Returns the ad sets associated with the ad AdLabel
+            """
+            return self.get_ad_sets_by_labels(fields, params)
 
-class ClickTrackingTag(clicktrackingtag.ClickTrackingTag):
-    pass
+        @deprecated(replacement='get_users')
+        def get_ad_users(self, fields=None, params=None):
+            """Returns iterator over AdUser's associated with this account."""
+            return self.get_users(fields, params)
 
-class Activity(adactivity.AdActivity):
-    pass
+    return AdAccount
 
 
-class AdAccount(adaccount.AdAccount):
-
-    @deprecated(replacement='get_generate_previews')
-    def get_ad_preview(self, fields=None, params=None):
-        """Returns iterator over previews generated under this account."""
-        return self.get_generate_previews(fields, params)
-
-    @deprecated(replacement='get_targeting_sentence_lines')
-    def get_targeting_description(self, fields=None, params=None):
-        """
-        Returns TargetingDescription object associated with this account.
-        """
-        return self.get_targeting_sentence_lines(fields, params).get_one()
-
-    @deprecated(replacement='get_broad_targeting_categories')
-    def get_broad_category_targeting(self, fields=None, params=None):
-        """
-        Returns iterator over BroadCategoryTargeting's associated with this
-        account.
-        """
-        return self.get_broad_targeting_categories(fields, params)
-
-    @deprecated(replacement='get_rate_card')
-    def get_rate_cards(self, fields=None, params=None):
-        """Returns iterator over RateCard's associated with this account."""
-        return self.get_rate_card(fields, params)
-
-    @deprecated(replacement='get_ad_sets_by_labels')
-    def get_adsets_by_labels(self, fields=None, params=None):
-        """
-        Returns the ad sets associated with the ad AdLabel
-        """
-        return self.get_ad_sets_by_labels(fields, params)
-
-    @deprecated(replacement='get_users')
-    def get_ad_users(self, fields=None, params=None):
-        """Returns iterator over AdUser's associated with this account."""
-        return self.get_users(fields, params)
-
-
-class AdAccountGroup(adaccountgroup.AdAccountGroup):
-    def get_users(self, fields=None, params=None):
-        """
-        Returns iterator over AdAccountGroupUser's associated with this account
-        group.
-        """
-        return self.iterate_edge(AdAccountGroupUser, fields, params)
-
-class CustomAudience(customaudience.CustomAudience):
-    pass
+@_legacy_class('AdAccountGroupUser')
+def _adaccountgroupuser():
+    AbstractCrudObject = _legacy('AbstractCrudObject')
 
-class ConnectionObject(connectionobject.ConnectionObject):
+    class AdAccountGroupUser(AbstractCrudObject):
 
-    class Type(object):
-        application = 2
-        domain = 7
-        event = 3
-        page = 1
-        place = 6
+        class Field(object):
+            id = 'uid'
+            role = 'role'
+            uid = 'uid'
 
+        class Role(object):
+            administrator = 1001
+            general_user = 1002
+            reports_only = 1003
 
-class LookalikeAudience(customaudience.CustomAudience):
-    class Field(customaudience.CustomAudience.Field):
-        class LookalikeSpec(lookalikespec.LookalikeSpec.Field):
-            pass
+        @classmethod
+        def get_endpoint(cls):
+            return 'users'
 
+        def get_node_path(self):
+            return (
+                self.get_parent_id_assured(),
+                self.get_endpoint(),
+                self.get_id_assured()
+            )
 
-class AdAccountGroupAccount(AbstractObject):
+        def get_ad_user(self):
+            """Returns an AdUser object with the same account id."""
+            return _legacy('AdUser')(fbid=self[self.Field.uid])
 
-    class Field(object):
-        account_id = 'account_id'
-        status = 'status'
+    return AdAccountGroupUser
 
-    @classmethod
-    def get_endpoint(cls):
-        return 'adaccounts'
 
-    def get_node_path(self):
-        return (
-            self.get_parent_id_assured(),
-            self.get_endpoint(),
-            self.get_id_assured()
-        )
+@_legacy_class('Campaign')
+def _campaign():
+    from facebookads.adobjects import campaign
 
-    def get_ad_account(self):
-        """Returns an AdAccount object with the same account id."""
-        return AdAccount(fbid='act_' + self[self.Field.account_id])
+    class Campaign(campaign.Campaign):
+        class BuyingType(object):
+            auction = 'AUCTION'
+            fixed_price = 'FIXED_PRICE'
+            reserved = 'RESERVED'
 
-class AdAccountGroupUser(AbstractCrudObject):
+    return Campaign
 
-    class Field(object):
-        id = 'uid'
-        role = 'role'
-        uid = 'uid'
 
-    class Role(object):
-        administrator = 1001
-        general_user = 1002
-        reports_only = 1003
+@_legacy_class('AdSet')
+def _adset():
+    from facebookads.adobjects import adset
 
-    @classmethod
-    def get_endpoint(cls):
-        return 'users'
+    class AdSet(adset.AdSet):
+        class PacingType(object):
+            day_parting = 'day_parting'
+            standard = 'standard'
+            no_pacing = 'no_pacing'
 
-    def get_node_path(self):
-        return (
-            self.get_parent_id_assured(),
-            self.get_endpoint(),
-            self.get_id_assured()
-        )
+    return AdSet
 
-    def get_ad_user(self):
-        """Returns an AdUser object with the same account id."""
-        return AdUser(fbid=self[self.Field.uid])
 
-class PartnerCategory(partnercategory.PartnerCategory):
-    pass
+@_legacy_class('Ad')
+def _ad():
+    from facebookads.adobjects import ad
 
+    class Ad(ad.Ad):
+        @deprecated(replacement='get_previews')
+        def get_ad_preview(self, fields=None, params=None):
+            """Returns AdPreview object associated with this ad."""
+            return self.get_previews(fields, params).get_one()
 
-class RateCard(ratecard.RateCard):
-    pass
+        @deprecated(replacement='get_targeting_sentence_lines')
+        def get_targeting_description(self, fields=None, params=None):
+            """Returns TargetingDescription object associated with this ad."""
+            return self.get_targeting_sentence_lines(fields, params).get_one()
 
+    return Ad
 
-class Campaign(campaign.Campaign):
-    class BuyingType(object):
-        auction = 'AUCTION'
-        fixed_price = 'FIXED_PRICE'
-        reserved = 'RESERVED'
 
-class AdSet(adset.AdSet):
-    class PacingType(object):
-        day_parting = 'day_parting'
-        standard = 'standard'
-        no_pacing = 'no_pacing'
+@_legacy_class('AdsPixel')
+def _adspixel():
+    from facebookads.adobjects import adspixel
 
-class Ad(ad.Ad):
-    @deprecated(replacement='get_previews')
-    def get_ad_preview(self, fields=None, params=None):
-        """Returns AdPreview object associated with this ad."""
-        return self.get_previews(fields, params).get_one()
+    class AdsPixel(adspixel.AdsPixel):
 
-    @deprecated(replacement='get_targeting_sentence_lines')
-    def get_targeting_description(self, fields=None, params=None):
-        """Returns TargetingDescription object associated with this ad."""
-        return self.get_targeting_sentence_lines(fields, params).get_one()
+        @deprecated(replacement='unshare_pixel_from_ad_account')
+        def unshare_pixel(self, business_id, account_id):
+            return self.unshare_pixel_from_ad_account(business_id, account_id)
 
-class AdConversionPixel(offsitepixel.OffsitePixel):
-    pass
+        @deprecated(replacement='unshare_pixel_from_agency')
+        def unshare_pixel_agencies(self, business_id, agency_id):
+            return self.unshare_pixel_from_agency(business_id, agency_id)
 
+        @deprecated(replacement='share_pixel_with_ad_account')
+        def share_pixel(self, business_id, account_id):
+            return self.share_pixel_with_ad_account(business_id, account_id)
 
-class AdsPixel(adspixel.AdsPixel):
+    return AdsPixel
 
-    @deprecated(replacement='unshare_pixel_from_ad_account')
-    def unshare_pixel(self, business_id, account_id):
-        return self.unshare_pixel_from_ad_account(business_id, account_id)
 
-    @deprecated(replacement='unshare_pixel_from_agency')
-    def unshare_pixel_agencies(self, business_id, agency_id):
-        return self.unshare_pixel_from_agency(business_id, agency_id)
+@_legacy_class('AdCreative')
+def _adcreative():
+    from facebookads.adobjects import adcreative
 
-    @deprecated(replacement='share_pixel_with_ad_account')
-    def share_pixel(self, business_id, account_id):
-        return self.share_pixel_with_ad_account(business_id, account_id)
+    class AdCreative(adcreative.AdCreative):
+        @deprecated(replacement='get_previews')
+        def get_ad_preview(self, fields=None, params=None):
+            self.get_previews(fields=fields, params=params)
 
+    return AdCreative
 
-class ReachEstimate(reachestimate.ReachEstimate):
-    pass
 
+@_legacy_class('GeneratePreview')
+def _generatepreview():
+    AbstractObject = _legacy('AbstractObject')
 
-class ReachFrequencyPrediction(reachfrequencyprediction.ReachFrequencyPrediction):
-    pass
+    class GeneratePreview(AbstractObject):
+        class Field(object):
+            ad_format = 'ad_format'
+            body = 'body'
+            creative = 'creative'
+            post = 'post'
+            product_item_ids = 'product_item_ids'
 
+        class AdFormat(object):
+            desktop_feed_standard = 'DESKTOP_FEED_STANDARD'
+            mobile_banner = 'MOBILE_BANNER'
+            mobile_feed_standard = 'MOBILE_FEED_STANDARD'
+            mobile_interstitial = 'MOBILE_INTERSTITIAL'
+            right_column_standard = 'RIGHT_COLUMN_STANDARD'
 
-class TargetingDescription(targetingsentenceline.TargetingSentenceLine):
-    pass
+        @classmethod
+        def get_endpoint(cls):
+            return 'generatepreviews'
 
+        def get_html(self):
+            """Returns the preview html."""
+            return self[self.Field.body]
 
-class TargetingSearch(targetingsearch.TargetingSearch):
-    pass
+    return GeneratePreview
 
-class TargetingSpecsField(targeting.Targeting.Field):
-    pass
 
+@_legacy_class('AdCreativePreview')
+def _adcreativepreview():
+    GeneratePreview = _legacy('GeneratePreview')
 
-class Transaction(transaction.Transaction):
-    pass
+    class AdCreativePreview(GeneratePreview):
 
+        @classmethod
+        def get_endpoint(cls):
+            return 'previews'
 
-class Business(business.Business):
-    @deprecated(replacement='share_pixel_with_agency')
-    def share_pixel_agencies(self, business_id, agency_id):
-        return self.share_pixel_with_agency(business_id, agency_id)
+    return AdCreativePreview
 
-    @deprecated(replacement='get_ad_accounts')
-    def list_ad_accounts(self, business_id):
-        return self.get_ad_accounts(business_id)
 
-    @deprecated(replacement='get_agencies')
-    def list_shared_agencies(self):
-        return self.get_agencies()
+@_legacy_class('AdPreview')
+def _adpreview():
+    AdCreativePreview = _legacy('AdCreativePreview')
 
+    class AdPreview(AdCreativePreview):
 
-class AdCreative(adcreative.AdCreative):
-    @deprecated(replacement='get_previews')
-    def get_ad_preview(self, fields=None, params=None):
-        self.get_previews(fields=fields, params=params)
+        @classmethod
+        def get_endpoint(cls):
+            return 'previews'
 
+    return AdPreview
 
-class AdImage(adimage.AdImage):
-    pass
 
-class AdVideo(advideo.AdVideo):
-    pass
+@_legacy_class('AdAccountGroup')
+def _adaccountgroup():
+    from facebookads.adobjects import adaccountgroup
 
+    class AdAccountGroup(adaccountgroup.AdAccountGroup):
+        def get_users(self, fields=None, params=None):
+            """
+            Returns iterator over AdAccountGroupUser's associated with this account
+            group.
+            """
+            return self.iterate_edge(
+                _legacy('AdAccountGroupUser'), fields, params)
 
-class VideoThumbnail(videothumbnail.VideoThumbnail):
-    pass
+    return AdAccountGroup
 
 
-class GeneratePreview(AbstractObject):
-    class Field(object):
-        ad_format = 'ad_format'
-        body = 'body'
-        creative = 'creative'
-        post = 'post'
-        product_item_ids = 'product_item_ids'
+@_legacy_class('ConnectionObject')
+def _connectionobject():
+    from facebookads.adobjects import connectionobject
 
-    class AdFormat(object):
-        desktop_feed_standard = 'DESKTOP_FEED_STANDARD'
-        mobile_banner = 'MOBILE_BANNER'
-        mobile_feed_standard = 'MOBILE_FEED_STANDARD'
-        mobile_interstitial = 'MOBILE_INTERSTITIAL'
-        right_column_standard = 'RIGHT_COLUMN_STANDARD'
+    class ConnectionObject(connectionobject.ConnectionObject):
 
-    @classmethod
-    def get_endpoint(cls):
-        return 'generatepreviews'
+        class Type(object):
+            application = 2
+            domain = 7
+            event = 3
+            page = 1
+            place = 6
 
-    def get_html(self):
-        """Returns the preview html."""
-        return self[self.Field.body]
+    return ConnectionObject
 
 
-class ProductCatalog(productcatalog.ProductCatalog):
-    pass
+@_legacy_class('LookalikeAudience')
+def _lookalikeaudience():
+    from facebookads.adobjects import customaudience, lookalikespec
 
+    class LookalikeAudience(customaudience.CustomAudience):
 
-class ProductCatalogExternalEventSource(externaleventsource.ExternalEventSource):
-    pass
+        class Field(customaudience.CustomAudience.Field):
+            class LookalikeSpec(lookalikespec.LookalikeSpec.Field):
+                pass
 
+        class LookalikeType(object):
+            reach = 'reach'
+            similarity = 'similarity'
 
-class ProductFeed(productfeed.ProductFeed):
+        class ConversionType(object):
+            page_likes = 'page_likes'
 
-    class Format(object):
-        tsv = 'TSV'
-        xml = 'XML'
+        @classmethod
+        def get_endpoint(cls):
+            return 'customaudiences'
 
+    return LookalikeAudience
 
-class ProductFeedUpload(productfeedupload.ProductFeedUpload):
-    pass
 
+@_legacy_class('AdAccountGroupAccount')
+def _adaccountgroupaccount():
+    AbstractObject = _legacy('AbstractObject')
 
-class ProductFeedUploadError(productfeeduploaderror.ProductFeedUploadError):
-    pass
+    class AdAccountGroupAccount(AbstractObject):
 
+        class Field(object):
+            account_id = 'account_id'
+            status = 'status'
 
-class ProductSet(productset.ProductSet):
-    pass
+        @classmethod
+        def get_endpoint(cls):
+            return 'adaccounts'
 
+        def get_node_path(self):
+            return (
+                self.get_parent_id_assured(),
+                self.get_endpoint(),
+                self.get_id_assured()
+            )
 
-class ProductGroup(productgroup.ProductGroup):
-    pass
+        def get_ad_account(self):
+            """Returns an AdAccount object with the same account id."""
+            account_id = 'act_' + self[self.Field.account_id]
+            return _legacy('AdAccount')(fbid=account_id)
 
+    return AdAccountGroupAccount
 
-class Product(productitem.ProductItem):
-    class Field(productitem.ProductItem.Field):
-        title = 'title'
 
+@_legacy_class('Business')
+def _business():
+    from facebookads.adobjects import business
 
-class ProductAudience(customaudience.CustomAudience):
+    class Business(business.Business):
 
-    class Field(customaudience.CustomAudience.Field):
-        product_set_id = 'product_set_id'
-        inclusions = 'inclusions'
-        exclusions = 'exclusions'
+        class Field(object):
+            created_by = 'created_by'
+            creation_time = 'creation_time'
+            id = 'id'
+            name = 'name'
+            primary_page = 'primary_page'
+            timezone_id = 'timezone_id'
+            update_time = 'update_time'
+            updated_by = 'updated_by'
+            vertical_id = 'vertical_id'
 
-    @classmethod
-    def get_endpoint(cls):
-        return 'product_audiences'
+    return Business
 
-    def api_create(self, parent_id, fields=None, params=None, batch=None, pending=False):
-        from facebookads.adobjects.adaccount import AdAccount
-        return AdAccount(api=self._api, fbid=parent_id).create_product_audience(fields, params, batch, pending)
 
+@_legacy_class('ProductFeed')
+def _productfeed():
+    from facebookads.adobjects import productfeed
 
-class AdCreativePreview(GeneratePreview):
+    class ProductFeed(productfeed.ProductFeed):
 
-    @classmethod
-    def get_endpoint(cls):
-        return 'previews'
+        class Format(object):
+            tsv = 'TSV'
+            xml = 'XML'
 
+    return ProductFeed
 
-class AdPreview(AdCreativePreview):
 
-    @classmethod
-    def get_endpoint(cls):
-        return 'previews'
+@_legacy_class('Product')
+def _product():
+    from facebookads.adobjects import productitem
 
+    class Product(productitem.ProductItem):
+        class Field(productitem.ProductItem.Field):
+            title = 'title'
 
-class AdsPixelStat(adspixelstatsresult.AdsPixelStatsResult):
-    pass
+    return Product
 
 
-class KeywordStats(adkeywordstats.AdKeywordStats):
-    pass
+@_legacy_class('ProductAudience')
+def _productaudience():
+    from facebookads.adobjects import customaudience
 
+    class ProductAudience(customaudience.CustomAudience):
+        class Field(customaudience.CustomAudience.Field):
+            product_set_id = 'product_set_id'
+            inclusions = 'inclusions'
+            exclusions = 'exclusions'
 
-class BroadCategoryTargeting(broadtargetingcategories.BroadTargetingCategories):
-    pass
+        @classmethod
+        def get_endpoint(cls):
+            return 'product_audiences'
 
+        def api_create(self, parent_id, fields=None, params=None, batch=None, pending=False):
+            from facebookads.adobjects.adaccount import AdAccount
+            return AdAccount(api=self._api, fbid=parent_id).create_product_audience(fields, params, batch, pending)
 
-class ClickTrackingTag(clicktrackingtag.ClickTrackingTag):
-    pass
+    return ProductAudience
 
-class CustomAudience(customaudience.CustomAudience):
-    pass
 
-class LookalikeAudience(customaudience.CustomAudience):
+@_legacy_class('Insights')
+def _insights():
+    from facebookads.adobjects import adsinsights
 
-    class Field(customaudience.CustomAudience.Field):
-        class LookalikeSpec(lookalikespec.LookalikeSpec.Field):
+    class Insights(adsinsights.AdsInsights):
+        class Preset(adsinsights.AdsInsights.DatePreset):
             pass
 
-    class LookalikeType(object):
-        reach = 'reach'
-        similarity = 'similarity'
-
-    class ConversionType(object):
-        page_likes = 'page_likes'
-
-    @classmethod
-    def get_endpoint(cls):
-        return 'customaudiences'
-
-
-class PartnerCategory(partnercategory.PartnerCategory):
-    pass
-
-
-class RateCard(ratecard.RateCard):
-    pass
-
-
-class ReachEstimate(reachestimate.ReachEstimate):
-    pass
-
-
-class Insights(adsinsights.AdsInsights):
-
-    class Preset(adsinsights.AdsInsights.DatePreset):
-        pass
-
-    class Breakdown(adsinsights.AdsInsights.Breakdowns):
-        pass
-
-    class ActionBreakdown(adsinsights.AdsInsights.SummaryActionBreakdowns):
-        pass
-
-    class ActionAttributionWindow(adsinsights.AdsInsights.ActionAttributionWindows):
-        pass
-
-
-class ReachFrequencyPrediction(reachfrequencyprediction.ReachFrequencyPrediction):
-    pass
-
-
-class TargetingDescription(targetingsentenceline.TargetingSentenceLine):
-    pass
-
-
-class TargetingSearch(targetingsearch.TargetingSearch):
-    pass
-
-
-class AdLabel(adlabel.AdLabel):
-    pass
-
-
-class AdsByLabels(AbstractObject):
-
-    @classmethod
-    def get_endpoint(cls):
-        return 'adsbylabels'
-
-
-class AdCreativesByLabels(AbstractObject):
-
-    @classmethod
-    def get_endpoint(cls):
-        return 'adcreativesbylabels'
-
-
-class AdSetsByLabels(AbstractObject):
-
-    @classmethod
-    def get_endpoint(cls):
-        return 'adsetsbylabels'
-
-
-class CampaignsByLabels(AbstractObject):
-
-    @classmethod
-    def get_endpoint(cls):
-        return 'campaignsbylabels'
-
-
-class TargetingSpecsField(targeting.Targeting.Field):
-    pass
-
-
-class Transaction(transaction.Transaction):
-    pass
-
-
-class Business(business.Business):
-
-    class Field(object):
-        created_by = 'created_by'
-        creation_time = 'creation_time'
-        id = 'id'
-        name = 'name'
-        primary_page = 'primary_page'
-        timezone_id = 'timezone_id'
-        update_time = 'update_time'
-        updated_by = 'updated_by'
-        vertical_id = 'vertical_id'
-
-
-class ProductCatalog(productcatalog.ProductCatalog):
-    pass
-
-
-class ProductCatalogExternalEventSource(externaleventsource.ExternalEventSource):
-    pass
-
-
-class ProductFeed(productfeed.ProductFeed):
-
-    class Format(object):
-        tsv = 'TSV'
-        xml = 'XML'
+        class Breakdown(adsinsights.AdsInsights.Breakdowns):
+            pass
 
-class ProductFeedUpload(productfeedupload.ProductFeedUpload):
-    pass
+        class ActionBreakdown(adsinsights.AdsInsights.SummaryActionBreakdowns):
+            pass
 
+        class ActionAttributionWindow(adsinsights.AdsInsights.ActionAttributionWindows):
+            pass
 
-class ProductFeedUploadError(productfeeduploaderror.ProductFeedUploadError):
-    pass
+    return Insights
 
 
-class ProductSet(productset.ProductSet):
-    pass
+@_legacy_class('AdsByLabels')
+def _adsbylabels():
+    AbstractObject = _legacy('AbstractObject')
 
+    class AdsByLabels(AbstractObject):
 
-class ProductGroup(productgroup.ProductGroup):
-    pass
+        @classmethod
+        def get_endpoint(cls):
+            return 'adsbylabels'
 
+    return AdsByLabels
 
-class Lead(lead.Lead):
-    pass
 
+@_legacy_class('AdCreativesByLabels')
+def _adcreativesbylabels():
+    AbstractObject = _legacy('AbstractObject')
 
-class LeadgenForm(leadgenform.LeadgenForm):
-    pass
+    class AdCreativesByLabels(AbstractObject):
 
+        @classmethod
+        def get_endpoint(cls):
+            return 'adcreativesbylabels'
 
-class Product(productitem.ProductItem):
-    class Field(productitem.ProductItem.Field):
-        title = 'title'
+    return AdCreativesByLabels
 
 
-class ProductAudience(customaudience.CustomAudience):
-    class Field(customaudience.CustomAudience.Field):
-        product_set_id = 'product_set_id'
-        inclusions = 'inclusions'
-        exclusions = 'exclusions'
+@_legacy_class('AdSetsByLabels')
+def _adsetsbylabels():
+    AbstractObject = _legacy('AbstractObject')
 
-    @classmethod
-    def get_endpoint(cls):
-        return 'product_audiences'
+    class AdSetsByLabels(AbstractObject):
 
-    def api_create(self, parent_id, fields=None, params=None, batch=None, pending=False):
-        from facebookads.adobjects.adaccount import AdAccount
-        return AdAccount(api=self._api, fbid=parent_id).create_product_audience(fields, params, batch, pending)
+        @classmethod
+        def get_endpoint(cls):
+            return 'adsetsbylabels'
 
-class MinimumBudget(minimumbudget.MinimumBudget):
-    pass
+    return AdSetsByLabels
 
 
-class AsyncJob(adreportrun.AdReportRun):
+@_legacy_class('CampaignsByLabels')
+def _campaignsbylabels():
+    AbstractObject = _legacy('AbstractObject')
 
-    def __init__(self, target_objects_class):
-        adreportrun.AdReportRun.__init__(self)
-        self.target_objects_class = target_objects_class
+    class CampaignsByLabels(AbstractObject):
 
-class Insights(adsinsights.AdsInsights):
-    class Preset(adsinsights.AdsInsights.DatePreset):
-        pass
+        @classmethod
+        def get_endpoint(cls):
+            return 'campaignsbylabels'
 
-    class Breakdown(adsinsights.AdsInsights.Breakdowns):
-        pass
+    return CampaignsByLabels
 
-    class ActionBreakdown(adsinsights.AdsInsights.SummaryActionBreakdowns):
-        pass
 
-    class ActionAttributionWindow(adsinsights.AdsInsights.ActionAttributionWindows):
-        pass
+@_legacy_class('AsyncJob')
+def _asyncjob():
+    from facebookads.adobjects import adreportrun
 
+    class AsyncJob(adreportrun.AdReportRun):
 
-class AdPlacePageSet(adplacepageset.AdPlacePageSet):
-    pass
+        def __init__(self, target_objects_class):
+            adreportrun.AdReportRun.__init__(self)
+            self.target_objects_class = target_objects_class
 
+    return AsyncJob
 
-class CustomConversion(customconversion.CustomConversion):
-    pass
 
-#
-# Custom backwards compatibility mappings for abend:
-#
-from facebookads.adobjects import (
-    event,
-    facebookuser,
-    facebookuseraccount,
-    interest,
-    oauthaccesstoken,
-    page,
-    userevents,
-    userpermission,
-    businessmanager,
+__all__ = sorted(
+    ['deprecated', 'EdgeIterator'] +
+    list(_ADOBJECT_MODULES) +
+    list(_SUBCLASSES) +
+    list(_definitions),
 )
 
-class OAuthAccessToken(oauthaccesstoken.OAuthAccessToken):
-    pass
-
-
-class AdLabel(adlabel.AdLabel):
-    pass
-
-
-class Interest(interest.Interest):
-    pass
-
-
-class AdsByLabels(AbstractObject):
-
-    @classmethod
-    def get_endpoint(cls):
-        return 'adsbylabels'
-
-
-class UserPermission(userpermission.UserPermission):
-    pass
-
-
-class PublicPage(page.Page):  # for legacy compat with fbobjs
-    pass
-
-
-class UserPagePermission(page.UserPagePermission):
-    pass
-
-
-class FacebookUserAccount(facebookuseraccount.FacebookUserAccount):
-    pass
-
-
-class FacebookUser(facebookuser.FacebookUser):
-    pass
-
-
-class Friend(facebookuser.Friend):
-    pass
-
-
-class TaggableFriend(facebookuser.TaggableFriend):
-    pass
-
-
-class UserEvents(userevents.UserEvents):
-    pass
-
-
-class Event(event.Event):
-    pass
-
-
-class BusinessManager(businessmanager.BusinessManager):
-    pass
-
-
-class BusinessManagerPage(page.BusinessManagerPage):
-    pass
-
-
-class AdCreativesByLabels(AbstractObject):
-
-    @classmethod
-    def get_endpoint(cls):
-        return 'adcreativesbylabels'
-
-
-class AdSetsByLabels(AbstractObject):
-
-    @classmethod
-    def get_endpoint(cls):
-        return 'adsetsbylabels'
-
-
-class CampaignsByLabels(AbstractObject):
-
-    @classmethod
-    def get_endpoint(cls):
-        return 'campaignsbylabels'
-
-
-class Lead(lead.Lead):
-    pass
-
-
-class LeadgenForm(leadgenform.LeadgenForm):
-    pass
-
-
-class MinimumBudget(minimumbudget.MinimumBudget):
-    pass
-
-
-class AsyncJob(adreportrun.AdReportRun):
-
-    def __init__(self, target_objects_class):
-        adreportrun.AdReportRun.__init__(self)
-        self.target_objects_class = target_objects_class
-
-
-class AdPlacePageSet(adplacepageset.AdPlacePageSet):
-    pass
-
-
-class CustomConversion(customconversion.CustomConversion):
-    pass
+lazyimport.install(__name__, _resolve, __all__)
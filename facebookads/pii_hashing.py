@@ -0,0 +1,230 @@
+# Copyright 2015 Facebook, Inc.
+
+# You are hereby granted a non-exclusive, worldwide, royalty-free license to
+# use, copy, modify, and distribute this software in source code or binary
+# form for use in connection with the web services and APIs provided by
+# Facebook.
+
+# As with any software that integrates with the Facebook platform, your use
+# of this software is subject to the Facebook Developer Principles and
+# Policies [http://developers.facebook.com/policy/]. This copyright notice
+# shall be included in all copies or substantial portions of the software.
+
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL
+# THE AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING
+# FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER
+# DEALINGS IN THE SOFTWARE.
+
+"""
+normalizes and hashes custom audience users, optionally in a process pool
+"""
+
+from facebookads.exceptions import FacebookBadObjectError
+
+import collections
+import hashlib
+import itertools
+import multiprocessing
+import re
+import six
+
+
+EXTERN_ID = 'EXTERN_ID'
+
+EMAIL_HASH = 'EMAIL_SHA256'
+
+SINGLE_KEY_SCHEMAS = ('EMAIL_SHA256', 'PHONE_SHA256', 'MOBILE_ADVERTISER_ID')
+
+STRIP_CHARS = " \t\r\n\0\x0B."
+
+_NON_DIGITS = re.compile(r'[^0-9]')
+
+_NON_LETTERS = re.compile(r'[^a-zA-Z]')
+
+
+def _identity(value):
+    return value
+
+
+def _digits(value):
+    return _NON_DIGITS.sub('', value)
+
+
+def _two_digits(value):
+    value = _NON_DIGITS.sub('', value)
+    if len(value) == 1:
+        value = '0' + value
+    return value
+
+
+def _letters(value):
+    return _NON_LETTERS.sub('', value)
+
+
+def _gender(value):
+    return value.strip()[:1]
+
+
+def _zip(value):
+    return value.split('-', 1)[0]
+
+
+def _country(value):
+    return _NON_LETTERS.sub('', value)[:2]
+
+
+def _unknown(value):
+    return None
+
+
+# Normalization of each key of CustomAudience.Schema.MultiKeySchema.
+NORMALIZERS = {
+    'EXTERN_ID': _identity,
+    'EMAIL': _identity,
+    'MADID': _identity,
+    'PHONE': _digits,
+    'GEN': _gender,
+    'DOBY': _digits,
+    'DOBM': _two_digits,
+    'DOBD': _two_digits,
+    'LN': _letters,
+    'FN': _letters,
+    'CT': _letters,
+    'FI': _letters,
+    'ST': _letters,
+    'ZIP': _zip,
+    'COUNTRY': _country,
+}
+
+
+def normalize_key(key_name, key_value):
+    """Returns key_value normalized for key_name, None for unknown keys."""
+    if key_value is None:
+        return None
+    return NORMALIZERS.get(key_name, _unknown)(key_value)
+
+
+def _sha256(value):
+    if isinstance(value, six.text_type):
+        value = value.encode('utf8')
+    return hashlib.sha256(value).hexdigest()
+
+
+def _make_column_hasher(key_name):
+    normalize = NORMALIZERS.get(key_name, _unknown)
+    if key_name == EXTERN_ID:
+        return lambda value: normalize(str(value.strip(STRIP_CHARS).lower()))
+    return lambda value: _sha256(
+        normalize(str(value.strip(STRIP_CHARS).lower())))
+
+
+class UserHasher(object):
+    """
+    Normalizes and SHA-256 hashes the users of a CustomAudience schema, as
+    CustomAudience.format_params sends them. The hashing functions of a
+    multi-key schema are resolved once per column, and iter_hash_users
+    spreads chunks of users over a process pool while streaming, keeping
+    only a bounded number of chunks in flight.
+    Example:
+        >>> hasher = UserHasher(['EMAIL', 'FN', 'LN'])
+        >>> for hashed in hasher.iter_hash_users(read_users(), processes=8):
+        ...     write(hashed)
+    """
+
+    def __init__(self, schema, pre_hashed=False):
+        """
+        Args:
+            schema: A single key schema, e.g. 'EMAIL_SHA256', or a list of
+                MultiKeySchema keys.
+            pre_hashed (optional): Whether the values are already hashed.
+        """
+        self._schema = schema
+        self._pre_hashed = pre_hashed
+        if isinstance(schema, list):
+            self._hash_user = self._make_multi_key_hasher(schema, pre_hashed)
+        elif schema in SINGLE_KEY_SCHEMAS:
+            self._hash_user = self._make_single_key_hasher(schema, pre_hashed)
+        else:
+            # Other schemas, e.g. UID, are sent as they are.
+            self._hash_user = _identity
+
+    def hash_user(self, user):
+        """Returns the hashed value, or list of values, of one user."""
+        return self._hash_user(user)
+
+    def hash_users(self, users):
+        """Returns the list of hashed users, hashed in this process."""
+        return list(map(self._hash_user, users))
+
+    def iter_hash_users(self, users, processes=None, chunk_size=10000):
+        """
+        Yields the hashed users in order, hashing chunks of chunk_size users
+        in a pool of processes, all cores by default. users may be any
+        iterable, it is read as the chunks are submitted.
+        """
+        users = iter(users)
+        chunks = iter(lambda: list(itertools.islice(users, chunk_size)), [])
+        processes = processes or multiprocessing.cpu_count()
+        if processes <= 1:
+            for chunk in chunks:
+                for hashed in self.hash_users(chunk):
+                    yield hashed
+            return
+
+        pool = multiprocessing.Pool(processes)
+        try:
+            pending = collections.deque()
+            for chunk in chunks:
+                pending.append(pool.apply_async(
+                    _hash_chunk,
+                    ((self._schema, self._pre_hashed, chunk),),
+                ))
+                if len(pending) >= 2 * processes:
+                    for hashed in pending.popleft().get():
+                        yield hashed
+            while pending:
+                for hashed in pending.popleft().get():
+                    yield hashed
+        finally:
+            pool.terminate()
+            pool.join()
+
+    @staticmethod
+    def _make_single_key_hasher(schema, pre_hashed):
+        def normalize(user):
+            return user.strip(STRIP_CHARS).lower()
+
+        if schema != EMAIL_HASH:
+            normalize = _identity
+        if pre_hashed:
+            return normalize
+        return lambda user: _sha256(normalize(user))
+
+    @staticmethod
+    def _make_multi_key_hasher(schema, pre_hashed):
+        hashers = [_make_column_hasher(key_name) for key_name in schema]
+
+        def hash_user(user):
+            if len(schema) != len(user):
+                raise FacebookBadObjectError(
+                    "Number of keys in each list in the data should " +
+                    "match the number of keys specified in scheme",
+                )
+            if pre_hashed:
+                return user
+            return [hasher(key) for hasher, key in zip(hashers, user)]
+        return hash_user
+
+
+_hashers = {}
+
+
+def _hash_chunk(args):
+    schema, pre_hashed, chunk = args
+    key = (tuple(schema) if isinstance(schema, list) else schema, pre_hashed)
+    if key not in _hashers:
+        _hashers[key] = UserHasher(schema, pre_hashed)
+    return _hashers[key].hash_users(chunk)
@@ -0,0 +1,775 @@
+# Copyright 2014 Facebook, Inc.
+
+# You are hereby granted a non-exclusive, worldwide, royalty-free license to
+# use, copy, modify, and distribute this software in source code or binary
+# form for use in connection with the web services and APIs provided by
+# Facebook.
+
+# As with any software that integrates with the Facebook platform, your use
+# of this software is subject to the Facebook Developer Principles and
+# Policies [http://developers.facebook.com/policy/]. This copyright notice
+# shall be included in all copies or substantial portions of the software.
+
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL
+# THE AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING
+# FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER
+# DEALINGS IN THE SOFTWARE.
+
+'''
+Micro benchmarks for the Python Facebook Ads API SDK.
+
+They only exercise local code paths (parsing, hydration, request
+construction) against synthetic data, so no network access is needed.
+
+How to run:
+    python -m facebookads.test.benchmarks [benchmark_name ...]
+'''
+
+import collections
+import gc
+import json
+import os
+import re
+import shutil
+import subprocess
+import sys
+import tempfile
+import threading
+import time
+import timeit
+import warnings
+from six.moves import BaseHTTPServer
+from six.moves import socketserver
+from six.moves import urllib
+
+from facebookads.adobjects.ad import Ad
+from facebookads.adobjects.adaccount import AdAccount
+from facebookads.adobjects.adset import AdSet
+from facebookads.adobjects.adsinsights import AdsInsights
+from facebookads.adobjects.objectparser import ObjectParser
+from facebookads.api import FacebookAdsApi, FacebookResponse
+from facebookads.session import FacebookSession
+from facebookads import feed_diff
+from facebookads import insights_columns
+from facebookads import insights_rollup
+from facebookads import insights_splitter
+
+
+def make_insights_rows(count, actions_per_row=8):
+    """Returns count raw insights rows as returned by the Graph API."""
+    rows = []
+    for index in range(count):
+        actions = [
+            {
+                'action_type': 'action_type_%d' % action,
+                'value': str(index + action),
+                '1d_click': str(action),
+                '28d_click': str(action * 2),
+            }
+            for action in range(actions_per_row)
+        ]
+        rows.append({
+            'account_id': '1234',
+            'campaign_id': str(1000 + index % 10),
+            'adset_id': str(2000 + index % 100),
+            'ad_id': str(3000 + index),
+            'date_start': '2016-10-01',
+            'date_stop': '2016-10-01',
+            'impressions': str(1000 + index),
+            'clicks': str(10 + index % 50),
+            'reach': str(900 + index),
+            'spend': '%d.%02d' % (index % 500, index % 100),
+            'cpc': '0.5',
+            'cpm': '1.25',
+            'ctr': '0.01',
+            'actions': actions,
+            'cost_per_action_type': actions,
+        })
+    return rows
+
+
+def make_ad_rows(count):
+    """Returns count raw ad nodes as returned by the Graph API."""
+    return [
+        {
+            'id': str(6000000 + index),
+            'account_id': '1234',
+            'adset_id': str(2000 + index % 100),
+            'campaign_id': str(1000 + index % 10),
+            'name': 'Ad %d' % index,
+            'status': 'ACTIVE',
+            'configured_status': 'ACTIVE',
+            'effective_status': 'ACTIVE',
+            'bid_amount': str(100 + index % 10),
+            'created_time': '2016-10-01T00:00:00+0000',
+            'updated_time': '2016-10-02T00:00:00+0000',
+            'last_updated_by_app_id': '4321',
+        }
+        for index in range(count)
+    ]
+
+
+def bench_hydrate_ads(number=20):
+    """Parses a page of 500 ads, exercising AbstractCrudObject._set_data."""
+    page = {'data': make_ad_rows(500)}
+    parser = ObjectParser(target_class=Ad)
+    return timeit.timeit(lambda: parser.parse_multiple(page), number=number)
+
+
+def make_targeting(index):
+    """Returns a large raw targeting spec."""
+    return {
+        'age_min': 18,
+        'age_max': 65,
+        'genders': [1, 2],
+        'geo_locations': {
+            'countries': ['US', 'CA', 'GB'],
+            'cities': [
+                {'key': str(index * 100 + city), 'radius': 10,
+                 'distance_unit': 'mile'}
+                for city in range(50)
+            ],
+            'location_types': ['home', 'recent'],
+        },
+        'flexible_spec': [
+            {'interests': [
+                {'id': str(6000000 + interest), 'name': 'Interest %d' % interest}
+                for interest in range(30)
+            ]},
+        ],
+        'publisher_platforms': ['facebook', 'instagram'],
+        'device_platforms': ['mobile', 'desktop'],
+    }
+
+
+def bench_hydrate_adsets(number=5):
+    """Parses 500 ad sets with big targeting specs, reading id and status."""
+    page = {'data': [
+        {
+            'id': str(2000 + index),
+            'name': 'Ad set %d' % index,
+            'status': 'ACTIVE',
+            'targeting': make_targeting(index),
+        }
+        for index in range(500)
+    ]}
+    parser = ObjectParser(target_class=AdSet)
+
+    def run():
+        for adset in parser.parse_multiple(page):
+            adset[AdSet.Field.id], adset[AdSet.Field.status]
+    return timeit.timeit(run, number=number)
+
+
+def bench_validate_adsets(number=20):
+    """Snapshots, edits, exports changes and rolls back 500 ad sets, as
+    CanValidate.remote_validate does around its request.
+    """
+    adsets = []
+    for index in range(500):
+        adset = AdSet(str(2000 + index))
+        adset._set_data({
+            'name': 'Ad set %d' % index,
+            'status': 'ACTIVE',
+            'targeting': make_targeting(index),
+        })
+        adset[AdSet.Field.targeting]
+        adsets.append(adset)
+
+    def run():
+        for adset in adsets:
+            snapshot = adset.snapshot()
+            adset[AdSet.Field.targeting] = adset[AdSet.Field.targeting]
+            adset[AdSet.Field.status] = 'PAUSED'
+            adset.export_changed_data()
+            adset.rollback(snapshot)
+    return timeit.timeit(run, number=number)
+
+
+def bench_hydrate_insights(number=5):
+    """Parses a page of 500 insights rows with their actions lists."""
+    page = {'data': make_insights_rows(500)}
+    parser = ObjectParser(target_class=AdsInsights)
+    return timeit.timeit(lambda: parser.parse_multiple(page), number=number)
+
+
+def measure_allocated(build):
+    """Returns the bytes still allocated by the value build() returns."""
+    import tracemalloc
+    gc.collect()
+    tracemalloc.start()
+    try:
+        value = build()
+        gc.collect()
+        allocated, _ = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+    del value
+    return allocated
+
+
+def bench_memory_ads(count=20000):
+    """Bytes per ad kept in memory, full objects vs compact records."""
+    body = json.dumps({'data': make_ad_rows(count)})
+
+    def parse(compact):
+        response = FacebookResponse(body=body, http_status=200).json()
+        parser = ObjectParser(target_class=Ad, compact=compact)
+        return parser.parse_multiple(response)
+
+    return (
+        ('full', measure_allocated(lambda: parse(False)) / count, 'B/ad'),
+        ('compact', measure_allocated(lambda: parse(True)) / count, 'B/ad'),
+    )
+
+
+def bench_build_requests(number=5000, repeat=5):
+    """Seconds to build pending requests for hot AdAccount methods."""
+    account = AdAccount('act_123')
+    calls = (
+        ('get_insights', lambda: account.get_insights(
+            fields=['impressions', 'spend'],
+            params={'level': 'ad', 'date_preset': 'last_7d'},
+            pending=True,
+        )),
+        ('get_ads', lambda: account.get_ads(
+            fields=['name', 'status'],
+            params={'effective_status': ['ACTIVE', 'PAUSED']},
+            pending=True,
+        )),
+        ('create_ad', lambda: account.create_ad(
+            params={
+                'name': 'Ad',
+                'adset_id': '123',
+                'creative': {'creative_id': '456'},
+                'status': 'PAUSED',
+            },
+            pending=True,
+        )),
+    )
+    return tuple(
+        (name, min(timeit.repeat(call, number=number, repeat=repeat)), 's')
+        for name, call in calls
+    )
+
+
+def bench_validation_modes(number=5000, repeat=5):
+    """Seconds to build get_insights requests under each validation mode."""
+    api = FacebookAdsApi(FacebookSession())
+    account = AdAccount('act_123', api=api)
+    checker = account.get_insights(pending=True)._param_checker
+    fields = ['impressions', 'clicks', 'spend', 'actions', 'ctr', 'cpm']
+    params = {
+        'level': 'ad',
+        'date_preset': 'last_7d',
+        'breakdowns': ['age', 'gender'],
+        'action_breakdowns': ['action_type'],
+        'time_increment': '1',
+        'filtering': [
+            {'field': 'ad.effective_status', 'operator': 'IN',
+             'value': ['ACTIVE', 'PAUSED']},
+        ],
+    }
+
+    def build():
+        account.get_insights(fields=fields, params=params, pending=True)
+
+    def build_uncached():
+        checker._valid_pairs.clear()
+        build()
+
+    results = []
+    for variant, mode, call in (
+        ('full_uncached', FacebookAdsApi.VALIDATION_FULL, build_uncached),
+        ('full', FacebookAdsApi.VALIDATION_FULL, build),
+        ('sampled', FacebookAdsApi.VALIDATION_SAMPLED, build),
+        ('off', FacebookAdsApi.VALIDATION_OFF, build),
+    ):
+        api.set_validation_mode(mode)
+        timing = min(timeit.repeat(call, number=number, repeat=repeat))
+        results.append((variant, timing, 's'))
+    return tuple(results)
+
+
+def bench_import_objects(number=5):
+    """Seconds to import facebookads.objects and use one legacy class."""
+    root = os.path.dirname(os.path.dirname(os.path.dirname(
+        os.path.abspath(__file__),
+    )))
+    script = (
+        'import timeit\n'
+        'print(timeit.timeit('
+        '"import facebookads.objects; facebookads.objects.AdAccount", '
+        'number=1))\n'
+    )
+    timings = [
+        float(subprocess.check_output([sys.executable, '-c', script], cwd=root))
+        for _ in range(number)
+    ]
+    return min(timings)
+
+
+def bench_import_adobjects(number=5):
+    """Time and peak RSS of a process that imports every adobjects module."""
+    root = os.path.dirname(os.path.dirname(os.path.dirname(
+        os.path.abspath(__file__),
+    )))
+    script = (
+        'import importlib, pkgutil, resource, timeit\n'
+        'import facebookads.adobjects as adobjects\n'
+        'def load():\n'
+        '    for _, name, _ in pkgutil.iter_modules(adobjects.__path__):\n'
+        '        importlib.import_module("facebookads.adobjects." + name)\n'
+        'print(timeit.timeit(load, number=1))\n'
+        'print(resource.getrusage(resource.RUSAGE_SELF).ru_maxrss)\n'
+    )
+    runs = [
+        subprocess.check_output(
+            [sys.executable, '-c', script],
+            cwd=root,
+        ).split()
+        for _ in range(number)
+    ]
+    return (
+        ('time', min(float(run[0]) for run in runs), 's'),
+        ('max_rss', min(float(run[1]) for run in runs), 'KB'),
+    )
+
+
+def bench_insights_columns(number=5, repeat=3):
+    """Seconds to convert 20000 insights rows into typed columns, row by
+    row in Python and with InsightsColumns.
+    """
+    rows = make_insights_rows(20000)
+    fields = ['ad_id', 'impressions', 'clicks', 'reach', 'spend', 'cpc',
+              'cpm', 'ctr', 'actions', 'cost_per_action_type']
+
+    def by_row():
+        table = collections.defaultdict(list)
+        for index, row in enumerate(rows):
+            table['ad_id'].append(row['ad_id'])
+            for field in ('impressions', 'clicks', 'reach'):
+                table[field].append(int(row.get(field, 0)))
+            for field in ('spend', 'cpc', 'cpm', 'ctr'):
+                table[field].append(float(row.get(field, 'nan')))
+            for field in ('actions', 'cost_per_action_type'):
+                for action in row.get(field) or ():
+                    name = '%s:%s' % (field, action['action_type'])
+                    if name not in table:
+                        table[name] = [0.0] * len(rows)
+                    table[name][index] += float(action.get('value', 0))
+        return table
+
+    def by_column():
+        return insights_columns.insights_to_columns(rows, fields)
+
+    return tuple(
+        (name, min(timeit.repeat(function, number=number, repeat=repeat)), 's')
+        for name, function in (('rows', by_row), ('columns', by_column))
+    )
+
+
+def bench_split_insights(days=60, seconds_per_day=0.005):
+    """Seconds to read a daily report of 60 days from a node that answers
+    in seconds_per_day per day, unsplit and split in parallel.
+    """
+    class Node(object):
+        def get_insights(self, fields=None, params=None, async=False):
+            splitter = insights_splitter.TimeRangeSplitter
+            since = splitter._parse_date(params['time_range']['since'])
+            until = splitter._parse_date(params['time_range']['until'])
+            time.sleep(((until - since).days + 1) * seconds_per_day)
+            return []
+
+    params = {
+        'time_range': {'since': '2016-01-01', 'until': '2016-02-29'},
+        'time_increment': 1,
+    }
+    splitter = insights_splitter.TimeRangeSplitter(
+        max_workers=8,
+        target_seconds=0.02,
+    )
+    # Learn the response time once before measuring.
+    splitter.get_insights(Node(), [], params)
+    return (
+        ('unsplit', timeit.timeit(
+            lambda: Node().get_insights([], params), number=1), 's'),
+        ('split', timeit.timeit(
+            lambda: splitter.get_insights(Node(), [], params), number=1), 's'),
+    )
+
+
+def bench_insights_rollup(number=3, repeat=3):
+    """Seconds to roll 20000 ad rows up to ad sets and campaigns, after
+    one conversion to columns, and row by row in Python.
+    """
+    rows = make_insights_rows(20000)
+    rollup = insights_rollup.InsightsRollup(rows)
+
+    def by_row():
+        for key in ('adset_id', 'campaign_id'):
+            groups = {}
+            for row in rows:
+                group = groups.setdefault(
+                    (row[key], row['date_start'], row['date_stop']),
+                    collections.defaultdict(float),
+                )
+                for field in ('impressions', 'clicks', 'spend'):
+                    group[field] += float(row[field])
+                for action in row['actions']:
+                    group['actions:' + action['action_type']] += float(
+                        action['value'])
+            for group in groups.values():
+                group['ctr'] = group['clicks'] * 100.0 / group['impressions']
+                group['cpc'] = group['spend'] / group['clicks']
+                group['cpm'] = group['spend'] * 1000.0 / group['impressions']
+
+    def by_column():
+        rollup.rollup('adset')
+        rollup.rollup('campaign')
+
+    return tuple(
+        (name, min(timeit.repeat(function, number=number, repeat=repeat)), 's')
+        for name, function in (('rows', by_row), ('columns', by_column))
+    )
+
+
+def bench_hash_users(count=50000, number=1, repeat=3):
+    """Seconds to format 50000 multi-key custom audience users, in this
+    process and in a pool of one process per core.
+    """
+    from facebookads.adobjects.customaudience import CustomAudience
+    schema = ['EXTERN_ID', 'EMAIL', 'PHONE', 'FN', 'LN', 'DOBM', 'ZIP']
+    users = [
+        [str(i), ' User%d@Example.com ' % i, '+1 (650) 555-%04d' % (i % 10000),
+         'First', "O'Name", str(i % 12 + 1), '94025-%04d' % (i % 10000)]
+        for i in range(count)
+    ]
+    return tuple(
+        (name, min(timeit.repeat(
+            lambda: CustomAudience.format_params(
+                schema, users, is_raw=True, **kwargs),
+            number=number,
+            repeat=repeat,
+        )), 's')
+        for name, kwargs in (
+            ('serial', {}),
+            ('pool', {'processes': max(2, os.cpu_count() or 1)}),
+        )
+    )
+
+
+def write_feed(path, count, changed_every=None):
+    """Writes a Google Shopping feed of count items, with a different price
+    for one item in changed_every.
+    """
+    with open(path, 'w') as feed:
+        feed.write(
+            '<?xml version="1.0"?>\n<rss '
+            'xmlns:g="http://base.google.com/ns/1.0" version="2.0">'
+            '<channel><title>Store</title>\n'
+        )
+        for index in range(count):
+            price = index % 1000
+            if changed_every and index % changed_every == 0:
+                price += 1
+            feed.write(
+                '<item><g:id>ID_%d</g:id><g:title>Product %d</g:title>'
+                '<g:link>http://www.example.com/%d.html</g:link>'
+                '<g:availability>in stock</g:availability>'
+                '<g:price>%d.99 BRL</g:price><g:condition>new</g:condition>'
+                '</item>\n' % (index, index, index, price)
+            )
+        feed.write('</channel></rss>\n')
+
+
+def bench_feed_diff(count=1000000):
+    """Items per second and peak RSS of reading a feed of count items with
+    ElementTree.parse and with iter_feed_items, and seconds to snapshot it
+    and to diff it with a feed where 1% of the prices changed.
+    """
+    root = os.path.dirname(os.path.dirname(os.path.dirname(
+        os.path.abspath(__file__),
+    )))
+    directory = tempfile.mkdtemp()
+    try:
+        path = os.path.join(directory, 'feed.xml')
+        changed_path = os.path.join(directory, 'changed.xml')
+        write_feed(path, count)
+        write_feed(changed_path, count, changed_every=100)
+
+        results = []
+        for name, read in (
+            ('parse', 'len(ElementTree.parse(path).getroot().findall('
+                      '"./channel/item"))'),
+            ('iterparse', 'sum(1 for _ in feed_diff.iter_feed_items(path))'),
+        ):
+            script = (
+                'import resource, sys, time\n'
+                'import xml.etree.cElementTree as ElementTree\n'
+                'from facebookads import feed_diff\n'
+                'path = sys.argv[1]\n'
+                'start = time.time()\n'
+                'count = %s\n'
+                'print(count / (time.time() - start))\n'
+                'print(resource.getrusage(resource.RUSAGE_SELF).ru_maxrss)\n'
+            ) % read
+            rate, rss = subprocess.check_output(
+                [sys.executable, '-c', script, path],
+                cwd=root,
+            ).split()
+            results.append((name, float(rate), 'items/s'))
+            results.append((name + '_max_rss', float(rss), 'KB'))
+
+        snapshot = feed_diff.CatalogSnapshot(
+            os.path.join(directory, 'snapshot.db'))
+        start = time.time()
+        snapshot.load(feed_diff.iter_feed_items(path))
+        snapshot.commit('1')
+        results.append(('snapshot', time.time() - start, 's'))
+        start = time.time()
+        snapshot.load(feed_diff.iter_feed_items(changed_path))
+        changes = sum(1 for _ in snapshot.diff('1'))
+        results.append(('diff', time.time() - start, 's'))
+        results.append(('changes', changes, 'items'))
+        snapshot.close()
+        return tuple(results)
+    finally:
+        shutil.rmtree(directory)
+
+
+class VideoEndpoint(BaseHTTPServer.BaseHTTPRequestHandler):
+    """A stand-in for the video upload endpoint that answers each request
+    after the server's latency, uses the file size as upload session id,
+    and discards each chunk and asks for the next chunk_size bytes.
+    """
+    protocol_version = 'HTTP/1.1'
+    disable_nagle_algorithm = True
+
+    def do_POST(self):
+        time.sleep(self.server.latency)
+        remaining = int(self.headers['Content-Length'])
+        if not self.headers['Content-Type'].startswith('multipart/'):
+            params = urllib.parse.parse_qs(
+                self.rfile.read(remaining).decode('utf-8'))
+            if params['upload_phase'] == ['finish']:
+                self.reply({'success': True})
+                return
+            size = params['file_size'][0]
+            body = self.get_offsets(int(size), 0)
+            body['upload_session_id'] = body['video_id'] = size
+            self.reply(body)
+            return
+        block = memoryview(bytearray(1024 * 1024))
+        head = None
+        while remaining:
+            count = self.rfile.readinto(block[:min(remaining, len(block))])
+            if head is None:
+                head = block[:count].tobytes()
+            remaining -= count
+        params = dict(re.findall(b'name="(\\w+)"\r\n\r\n(\\w+)\r\n', head))
+        size = int(params[b'upload_session_id'])
+        start = int(params[b'start_offset']) + self.server.chunk_size
+        self.reply(self.get_offsets(size, min(start, size)))
+
+    def get_offsets(self, size, start):
+        return {
+            'start_offset': str(start),
+            'end_offset': str(min(start + self.server.chunk_size, size)),
+        }
+
+    def reply(self, body):
+        body = json.dumps(body).encode('utf-8')
+        self.send_response(200)
+        self.send_header('Content-Type', 'application/json')
+        self.send_header('Content-Length', str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, *args):
+        pass
+
+
+class VideoEndpointServer(socketserver.ThreadingMixIn,
+                          BaseHTTPServer.HTTPServer):
+    """Serves a VideoEndpoint on a free local port, a thread a connection."""
+    daemon_threads = True
+
+    def __init__(self, chunk_size, latency=0):
+        BaseHTTPServer.HTTPServer.__init__(
+            self, ('127.0.0.1', 0), VideoEndpoint)
+        self.chunk_size = chunk_size
+        self.latency = latency
+        thread = threading.Thread(target=self.serve_forever)
+        thread.daemon = True
+        thread.start()
+
+    def close(self):
+        self.shutdown()
+        self.server_close()
+
+
+def upload_video(variant, path, port, chunk_size):
+    """Sends the file at path to a VideoEndpoint on port by reading and
+    posting whole chunks as files, or with VideoUploadTransferRequestManager,
+    and prints the MB/s, the CPU seconds and the peak RSS in KB.
+    """
+    import resource
+    from facebookads import video_uploader
+    session = FacebookSession(access_token='t')
+    session.GRAPH = 'http://127.0.0.1:%d' % port
+    api = FacebookAdsApi(session)
+    start_time = time.time()
+    if variant == 'read':
+        request = video_uploader.VideoUploadRequest(api)
+        start, end = 0, chunk_size
+        with open(path, 'rb') as video:
+            while start != end:
+                video.seek(start)
+                chunk = video.read(end - start)
+                request.setParams(
+                    {'upload_phase': 'transfer', 'start_offset': start,
+                     'upload_session_id': str(os.path.getsize(path))},
+                    {'video_file_chunk': (path, chunk, 'multipart/form-data')},
+                )
+                response = request.send(('act_1', 'advideos')).json()
+                start = int(response['start_offset'])
+                end = int(response['end_offset'])
+    else:
+        context = video_uploader.VideoUploadRequestContext()
+        context.account_id = 'act_1'
+        context.session_id = str(os.path.getsize(path))
+        context.file_path = path
+        context.start_offset = 0
+        context.end_offset = chunk_size
+        video_uploader.VideoUploadTransferRequestManager(api).send_request(
+            context,
+        )
+    print(os.path.getsize(path) / (time.time() - start_time) / 2 ** 20)
+    usage = resource.getrusage(resource.RUSAGE_SELF)
+    print(usage.ru_utime + usage.ru_stime)
+    print(usage.ru_maxrss)
+
+
+def bench_upload_video(size=2 * 1024 ** 3, chunk_size=32 * 1024 ** 2):
+    """MB/s, CPU seconds and peak RSS of sending a 2GB video to a local
+    stand-in for the upload endpoint in 32MB chunks, read whole and posted
+    as files, and streamed from reused buffers by
+    VideoUploadTransferRequestManager. The stand-in runs in this process, so
+    on few cores the MB/s are bound by it and the CPU seconds tell more.
+    """
+    root = os.path.dirname(os.path.dirname(os.path.dirname(
+        os.path.abspath(__file__),
+    )))
+    directory = tempfile.mkdtemp()
+    server = VideoEndpointServer(chunk_size)
+    try:
+        path = os.path.join(directory, 'video.mp4')
+        block = os.urandom(1024 * 1024)
+        with open(path, 'wb') as video:
+            for _ in range(size // len(block)):
+                video.write(block)
+        results = []
+        for variant in ('read', 'stream'):
+            rate, cpu, rss = subprocess.check_output(
+                [sys.executable, '-c',
+                 'import sys\n'
+                 'from facebookads.test import benchmarks\n'
+                 'benchmarks.upload_video(sys.argv[1], sys.argv[2], '
+                 'int(sys.argv[3]), int(sys.argv[4]))\n',
+                 variant, path, str(server.server_address[1]),
+                 str(chunk_size)],
+                cwd=root,
+            ).split()
+            results.append((variant, float(rate), 'MB/s'))
+            results.append((variant + '_cpu', float(cpu), 's'))
+            results.append((variant + '_max_rss', float(rss), 'KB'))
+        return tuple(results)
+    finally:
+        server.close()
+        shutil.rmtree(directory)
+
+
+def bench_upload_videos(count=48, latency=0.02, chunk_size=1024 ** 2):
+    """Seconds to upload count videos of 64KB to 4MB to a local stand-in
+    for the upload endpoint that answers after latency seconds, one after
+    the other with VideoUploader and with VideoUploadPools of 8 workers,
+    and the MB/s of a pool capped at 20MB/s.
+    """
+    from facebookads.adobjects.advideo import AdVideo
+    from facebookads import video_upload_pool
+    from facebookads import video_uploader
+    directory = tempfile.mkdtemp()
+    server = VideoEndpointServer(chunk_size, latency)
+    try:
+        session = FacebookSession(access_token='t')
+        session.GRAPH = 'http://127.0.0.1:%d' % server.server_address[1]
+        api = FacebookAdsApi(session)
+        videos = []
+        for index in range(count):
+            path = os.path.join(directory, '%d.mp4' % index)
+            with open(path, 'wb') as video_file:
+                video_file.write(b'v' * (64 * 1024 << index % 7))
+            video = AdVideo(parent_id='act_%d' % (index % 3), api=api)
+            video[AdVideo.Field.filepath] = path
+            videos.append(video)
+        total = sum(os.path.getsize(video['filepath']) for video in videos)
+
+        results = []
+        start = time.time()
+        for video in videos:
+            video_uploader.VideoUploader().upload(video)
+        results.append(('sequential', time.time() - start, 's'))
+        for name, kwargs in (
+            ('pool', {}),
+            ('pool_capped', {'bytes_per_second': 20 * 1024 ** 2}),
+        ):
+            pool = video_upload_pool.VideoUploadPool(
+                max_workers=8, max_per_account=4, **kwargs)
+            start = time.time()
+            pool.upload(videos)
+            results.append((name, time.time() - start, 's'))
+        results.append((
+            'pool_capped_rate', total / results[-1][1] / 1024 ** 2, 'MB/s'))
+        return tuple(results)
+    finally:
+        server.close()
+        shutil.rmtree(directory)
+
+
+BENCHMARKS = collections.OrderedDict([
+    ('hydrate_insights', bench_hydrate_insights),
+    ('hydrate_ads', bench_hydrate_ads),
+    ('hydrate_adsets', bench_hydrate_adsets),
+    ('validate_adsets', bench_validate_adsets),
+    ('memory_ads', bench_memory_ads),
+    ('build_requests', bench_build_requests),
+    ('validation_modes', bench_validation_modes),
+    ('import_objects', bench_import_objects),
+    ('import_adobjects', bench_import_adobjects),
+    ('insights_columns', bench_insights_columns),
+    ('split_insights', bench_split_insights),
+    ('insights_rollup', bench_insights_rollup),
+    ('hash_users', bench_hash_users),
+    ('feed_diff', bench_feed_diff),
+    ('upload_video', bench_upload_video),
+    ('upload_videos', bench_upload_videos),
+])
+
+
+def main(names=None):
+    warnings.simplefilter('ignore')
+    for name in names or BENCHMARKS:
+        result = BENCHMARKS[name]()
+        if not isinstance(result, tuple):
+            result = (('', result, 's'),)
+        for variant, value, unit in result:
+            label = name + ('[%s]' % variant if variant else '')
+            print('%-30s %12.4f %s' % (label, value, unit))
+
+
+if __name__ == '__main__':
+    main(sys.argv[1:])
@@ -26,12 +26,25 @@ How to run:
 '''
 
 import unittest
+import collections
+import itertools
+import gc
 import json
 import inspect
+import os
 import six
+import subprocess
+import sys
+import warnings
+import threading
+import datetime
+import math
 import re
 import hashlib
+import shutil
+import tempfile
 from six.moves import urllib
+from six.moves import BaseHTTPServer
 from sys import version_info
 from .. import api
 from .. import objects
@@ -39,7 +52,28 @@ from .. import specs
 from .. import exceptions
 from .. import session
 from .. import utils
+from .. import typechecker
+from .. import video_upload_pool
+from .. import video_uploader
+from .. import audience_sync
+from .. import audience_uploader
+from .. import feed_diff
+from .. import insights_columns
+from .. import insights_jobs
+from .. import insights_rollup
+from .. import insights_splitter
+from .. import insights_sync
+from .. import pii_hashing
 from facebookads.utils import version
+from facebookads import adobjects
+from facebookads.adobjects import adaccount
+from facebookads.adobjects import adsactionstats
+from facebookads.adobjects import adsinsights
+from facebookads.adobjects import apimethod
+from facebookads.adobjects import advideo
+from facebookads.adobjects import adreportrun
+from facebookads.adobjects import compactobject
+from facebookads.adobjects import objectparser
 
 
 class CustomAudienceTestCase(unittest.TestCase):
@@ -125,6 +159,293 @@ class CustomAudienceTestCase(unittest.TestCase):
         actual = payload['payload']['data']
         assert actual == expected
 
+    def test_format_params_processes(self):
+        schema = [
+            objects.CustomAudience.Schema.MultiKeySchema.email,
+            objects.CustomAudience.Schema.MultiKeySchema.phone,
+            objects.CustomAudience.Schema.MultiKeySchema.dobm,
+            objects.CustomAudience.Schema.MultiKeySchema.country,
+        ]
+        users = [
+            [' Foo%d@Example.com.' % i, '+1 (650) 555-%04d' % i,
+             str(i % 12), 'United States']
+            for i in range(50)
+        ]
+        expected = objects.CustomAudience.format_params(
+            schema, users, is_raw=True)
+        actual = objects.CustomAudience.format_params(
+            schema, users, is_raw=True, processes=2)
+        self.assertEqual(actual, expected)
+        self.assertEqual(
+            list(pii_hashing.UserHasher(schema).iter_hash_users(
+                iter(users), processes=2, chunk_size=7)),
+            expected['payload']['data'],
+        )
+        self.assertEqual(
+            objects.CustomAudience.normalize_key('DOBM', '3'), '03')
+
+    def test_format_params_matches_baseline(self):
+        # The normalization format_params did before pii_hashing, inlined.
+        def baseline_normalize_key(key_name, key_value):
+            if key_name in ('EXTERN_ID', 'EMAIL', 'MADID'):
+                return key_value
+            if key_name in ('PHONE', 'DOBY'):
+                return re.sub(r'[^0-9]', '', key_value)
+            if key_name == 'GEN':
+                return key_value.strip()[:1]
+            if key_name in ('DOBM', 'DOBD'):
+                key_value = re.sub(r'[^0-9]', '', key_value)
+                if len(key_value) == 1:
+                    key_value = '0' + key_value
+                return key_value
+            if key_name in ('LN', 'FN', 'CT', 'FI', 'ST'):
+                return re.sub(r'[^a-zA-Z]', '', key_value)
+            if key_name == 'ZIP':
+                return re.split('-', key_value)[0]
+            if key_name == 'COUNTRY':
+                return re.sub(r'[^a-zA-Z]', '', key_value)[:2]
+
+        def baseline_data(schema, users, pre_hashed):
+            hashed_users = []
+            if not isinstance(schema, list):
+                for user in users:
+                    if schema == 'EMAIL_SHA256':
+                        user = user.strip(" \t\r\n\0\x0B.").lower()
+                    if isinstance(user, six.text_type) and not pre_hashed:
+                        user = user.encode('utf8')
+                    if pre_hashed:
+                        hashed_users.append(user)
+                    else:
+                        hashed_users.append(hashlib.sha256(user).hexdigest())
+                return hashed_users
+            for user in users:
+                if pre_hashed:
+                    hashed_users.append(user)
+                    continue
+                hashed_user = []
+                for key_name, key in zip(schema, user):
+                    key = key.strip(" \t\r\n\0\x0B.").lower()
+                    key = baseline_normalize_key(key_name, str(key))
+                    if key_name != 'EXTERN_ID':
+                        if isinstance(key, six.text_type):
+                            key = key.encode('utf8')
+                        key = hashlib.sha256(key).hexdigest()
+                    hashed_user.append(key)
+                hashed_users.append(hashed_user)
+            return hashed_users
+
+        def outcome(function, *args):
+            try:
+                return function(*args)
+            except Exception as e:
+                return type(e)
+
+        values = {
+            'EXTERN_ID': [u' Ext-42. ', u'ID\u00e9'],
+            'EMAIL': [u' Foo@Example.com.', u'J\u00dcRGEN@example.de'],
+            'PHONE': [u'+1 (650) 555-0100', u'\uff10\uff11-23'],
+            'GEN': [u' Male', u'f'],
+            'DOBY': [u'1980', u'19\u0668 0'],
+            'DOBM': [u'3', u'12', u''],
+            'DOBD': [u'7.', u'31'],
+            'LN': [u"O'Brien", u'M\u00fcller'],
+            'FN': [u'Jean-Luc', u'\u00c9mile'],
+            'FI': [u'J.', u'\u00c9'],
+            'CT': [u'San Francisco', u'K\u00f6ln'],
+            'ST': [u'CA', u'Baden-W\u00fcrttemberg'],
+            'ZIP': [u'94025-1234', u'10115'],
+            'MADID': [u'AbC-123', u'\u00e9'],
+            'COUNTRY': [u'United States', u'\u00c9tats-Unis'],
+        }
+        schema = sorted(values)
+        users = [
+            [values[key][i % len(values[key])] for key in schema]
+            for i in range(6)
+        ]
+        multi_keys = objects.CustomAudience.Schema.MultiKeySchema
+        self.assertEqual(
+            set(schema),
+            set(value for name, value in vars(multi_keys).items()
+                if not name.startswith('_')),
+        )
+        single_users = [
+            u' Foo@Example.com.', u'J\u00dcRGEN@example.de', u'+16505550100',
+        ]
+        cases = [(schema, users)] + [
+            ([key], [[value] for value in values[key]]) for key in schema
+        ] + [
+            (single_schema, single_users)
+            for single_schema in pii_hashing.SINGLE_KEY_SCHEMAS
+        ]
+        for case_schema, case_users in cases:
+            # A pool per case is slow, the full schema covers it.
+            pooled = (None, 2) if case_schema is schema else (None,)
+            for pre_hashed in (None, True):
+                expected = outcome(
+                    baseline_data, case_schema, case_users, pre_hashed)
+                for processes in pooled:
+                    actual = outcome(
+                        lambda: objects.CustomAudience.format_params(
+                            case_schema, case_users, is_raw=True,
+                            pre_hashed=pre_hashed, processes=processes,
+                        )['payload']['data'])
+                    self.assertEqual(
+                        actual, expected,
+                        (case_schema, pre_hashed, processes))
+
+
+class CustomAudienceUploaderTestCase(unittest.TestCase):
+
+    class FakeResponse(object):
+        def __init__(self, body):
+            self.body = body
+
+        def json(self):
+            return self.body
+
+    class FakeApi(object):
+        """Fails the first attempt of the batches in fail_batches."""
+
+        def __init__(self, fail_batches=(), status=500):
+            self.fail_batches = set(fail_batches)
+            self.status = status
+            self.calls = []
+            self.lock = threading.Lock()
+
+        def call(self, method, path, params=None):
+            session = params['session']
+            with self.lock:
+                self.calls.append((method, path, session, params['payload']))
+                if session['batch_seq'] in self.fail_batches:
+                    self.fail_batches.remove(session['batch_seq'])
+                    raise exceptions.FacebookRequestError(
+                        "fail", {}, self.status, {}, '{}')
+            data = params['payload']['data']
+            return CustomAudienceUploaderTestCase.FakeResponse({
+                'session_id': session['session_id'],
+                'num_received': len(data),
+                'num_invalid_entries': 1,
+            })
+
+    def test_add_users(self):
+        fake_api = self.FakeApi(fail_batches=[2])
+        audience = objects.CustomAudience('123', api=fake_api)
+        uploader = audience_uploader.CustomAudienceUploader(
+            audience,
+            objects.CustomAudience.Schema.email_hash,
+            batch_size=3,
+            sleep=lambda seconds: None,
+        )
+        emails = ['user%d@example.com' % i for i in range(10)]
+        stats = uploader.add_users(iter(emails), estimated_num_total=10,
+                                   session_id=7)
+
+        self.assertEqual(stats.num_batches, 4)
+        self.assertEqual(stats.num_received, 10)
+        self.assertEqual(stats.num_invalid_entries, 4)
+        self.assertEqual(stats.num_retries, 1)
+        sessions = [call[2] for call in fake_api.calls]
+        self.assertEqual(
+            sorted(session['batch_seq'] for session in sessions),
+            [1, 2, 2, 3, 4],
+        )
+        self.assertEqual(sessions[-1], {
+            'session_id': 7,
+            'batch_seq': 4,
+            'last_batch_flag': True,
+            'estimated_num_total': 10,
+        })
+        self.assertEqual(fake_api.calls[-1][1], ('123', 'users'))
+        hashed = [
+            data for call in sorted(
+                fake_api.calls, key=lambda call: call[2]['batch_seq'])
+            for data in call[3]['data']
+        ]
+        self.assertEqual(
+            sorted(set(hashed)),
+            sorted(objects.CustomAudience.format_params(
+                objects.CustomAudience.Schema.email_hash,
+                emails,
+            )['payload']['data']),
+        )
+
+    def test_retries_exhausted(self):
+        fake_api = self.FakeApi(fail_batches=[1])
+        audience = objects.CustomAudience('123', api=fake_api)
+        uploader = audience_uploader.CustomAudienceUploader(
+            audience,
+            objects.CustomAudience.Schema.email_hash,
+            max_retries=0,
+        )
+        self.assertRaises(
+            exceptions.FacebookRequestError,
+            uploader.remove_users,
+            ['user@example.com'],
+        )
+
+    def test_permanent_error_not_retried(self):
+        fake_api = self.FakeApi(fail_batches=[1], status=400)
+        audience = objects.CustomAudience('123', api=fake_api)
+        sleeps = []
+        uploader = audience_uploader.CustomAudienceUploader(
+            audience,
+            objects.CustomAudience.Schema.email_hash,
+            sleep=sleeps.append,
+        )
+        self.assertRaises(
+            exceptions.FacebookRequestError,
+            uploader.add_users,
+            ['user@example.com'],
+        )
+        self.assertEqual((len(fake_api.calls), sleeps), (1, []))
+
+        stats = uploader.add_users([])
+        self.assertEqual((len(fake_api.calls), stats.num_batches), (1, 0))
+
+
+class AudienceSyncTestCase(unittest.TestCase):
+
+    def test_sync(self):
+        fake_api = CustomAudienceUploaderTestCase.FakeApi()
+        audience = objects.CustomAudience('123', api=fake_api)
+        schema = objects.CustomAudience.Schema.email_hash
+        sync = audience_sync.AudienceSync(
+            audience_sync.AudienceIndex(),
+            batch_size=2,
+        )
+
+        def hashed(emails):
+            return objects.CustomAudience.format_params(
+                schema, emails)['payload']['data']
+
+        result = sync.sync(audience, schema, ['a@x.com', 'b@x.com', 'A@x.com'])
+        self.assertEqual(result[:3], (2, 2, 0))
+        self.assertIsNone(result.remove_stats)
+        self.assertEqual(result.add_stats.num_received, 2)
+
+        del fake_api.calls[:]
+        result = sync.sync(audience, schema, iter(['b@x.com', 'c@x.com']))
+        self.assertEqual(result[:3], (2, 1, 1))
+        self.assertEqual(
+            [(call[0], call[3]['data']) for call in fake_api.calls],
+            [('POST', hashed(['c@x.com'])), ('DELETE', hashed(['a@x.com']))],
+        )
+
+        del fake_api.calls[:]
+        result = sync.sync(audience, schema, ['c@x.com', 'b@x.com'])
+        self.assertEqual(result[:3], (2, 0, 0))
+        self.assertEqual(fake_api.calls, [])
+
+    def test_multi_key_members(self):
+        index = audience_sync.AudienceIndex()
+        members = [['h1', 'h2'], ['h3', 'h4']]
+        self.assertEqual(index.load(members), 2)
+        self.assertEqual(sorted(index.get_additions('1')), members)
+        index.commit('1')
+        self.assertEqual(index.count('1'), 2)
+        index.load([['h3', 'h4']])
+        self.assertEqual(list(index.get_removals('1')), [['h1', 'h2']])
+
 
 class EdgeIteratorTestCase(unittest.TestCase):
 
@@ -251,6 +572,80 @@ class AbstractCrudObjectTestCase(unittest.TestCase):
         del account['name']
         assert len(account._changes) == 0
 
+    def test_set_data_does_not_log_changes(self):
+        ad = objects.Ad('123')
+        ad['name'] = 'local'
+        ad._set_data({'name': 'remote', 'bid_amount': u'-5'})
+        self.assertEqual(ad['name'], 'remote')
+        self.assertEqual(ad['bid_amount'], -5)
+        self.assertEqual(ad._changes, {})
+
+    def test_set_data_defers_nested_objects(self):
+        adset = objects.AdSet('123')
+        adset._set_data({
+            'targeting': {'age_min': 18, 'geo_locations': {'countries': ['US']}},
+        })
+        self.assertIsInstance(adset._data['targeting'], typechecker.LazyValue)
+        self.assertEqual(adset.export_all_data()['targeting'], {
+            'age_min': 18, 'geo_locations': {'countries': ['US']},
+        })
+        targeting = adset['targeting']
+        self.assertIsInstance(targeting, objects.targeting.Targeting)
+        self.assertIs(adset._data['targeting'], targeting)
+        self.assertEqual(targeting['geo_locations']['countries'], ['US'])
+
+    def test_snapshot_and_rollback(self):
+        adset = objects.AdSet('123')
+        adset._set_data({'name': 'foo', 'status': 'ACTIVE'})
+        adset['name'] = 'bar'
+        snapshot = adset.snapshot()
+        adset['status'] = 'PAUSED'
+        adset._set_data({'name': 'baz'})
+        adset.rollback(snapshot)
+        self.assertEqual(adset['name'], 'bar')
+        self.assertEqual(adset['status'], 'ACTIVE')
+        self.assertEqual(adset.export_changed_data(), {'name': 'bar'})
+        adset['status'] = 'PAUSED'
+        self.assertEqual(snapshot[0]['status'], 'ACTIVE')
+
+    def test_nested_changes_are_tracked(self):
+        adset = objects.AdSet('123')
+        adset._set_data({
+            'name': 'foo',
+            'targeting': {'age_min': 18, 'geo_locations': {'countries': ['US']}},
+        })
+        self.assertEqual(adset.export_changed_data(), {})
+        adset['targeting']['geo_locations']['countries'] = ['CA']
+        self.assertEqual(
+            adset.get_changed_fields(),
+            ['targeting.geo_locations.countries'],
+        )
+        self.assertEqual(adset.export_changed_data(), {
+            'targeting': {'age_min': 18, 'geo_locations': {'countries': ['CA']}},
+        })
+        adset._clear_history()
+        self.assertEqual(adset.get_changed_fields(), [])
+
+    def test_set_data_calls_setitem_trigger(self):
+        run = adreportrun.AdReportRun()
+        run._set_data({'report_run_id': '987', 'async_percent_completion': 3})
+        self.assertEqual(run.get_id(), '987')
+        self.assertEqual(run._changes, {})
+
+    def test_set_data_respects_custom_setitem(self):
+        class MyObject(objects.AbstractCrudObject):
+            class Field:
+                id = 'id'
+
+            def __setitem__(self, key, value):
+                value = value.upper() if key == 'name' else value
+                super(MyObject, self).__setitem__(key, value)
+
+        obj = MyObject()
+        obj._set_data({'name': 'foo'})
+        self.assertEqual(obj['name'], 'FOO')
+        self.assertEqual(obj._changes, {})
+
     def test_fields_to_params(self):
         """
         Demonstrates that AbstractCrudObject._assign_fields_to_params()
@@ -369,6 +764,743 @@ class AbstractObjectTestCase(unittest.TestCase):
             self.fail('Cannot call __repr__ on AbstractObject\n %s' % e)
 
 
+
+class TypeCheckerTestCase(unittest.TestCase):
+
+    def test_converts_primitive_strings(self):
+        checker = typechecker.TypeChecker(
+            {'count': 'unsigned int', 'rate': 'float', 'active': 'bool'},
+            {},
+        )
+        self.assertEqual(checker.get_typed_value('count', u'-12'), -12)
+        self.assertEqual(checker.get_typed_value('rate', u'0.5'), 0.5)
+        self.assertIs(checker.get_typed_value('active', u'0'), False)
+        self.assertEqual(checker.get_typed_value('other', u'12'), u'12')
+
+    def test_converts_nested_objects(self):
+        checker = typechecker.TypeChecker(
+            {'spec': 'AdCreativeOfferData', 'counts': 'map<string, int>'},
+            {},
+        )
+        spec = checker.get_typed_value('spec', {'barcode': 'foo'})
+        self.assertEqual(spec.__class__.__name__, 'AdCreativeOfferData')
+        self.assertEqual(spec['barcode'], 'foo')
+        self.assertEqual(
+            checker.get_typed_value('counts', {u'a': 1}),
+            {u'a': 1},
+        )
+
+    def test_enum_check(self):
+        checker = typechecker.TypeChecker(
+            {'level': 'level_enum'},
+            {'level_enum': adsinsights.AdsInsights.Level.__dict__.values()},
+        )
+        self.assertTrue(checker.is_valid_pair('level', 'ad'))
+        self.assertFalse(checker.is_valid_pair('level', 'nope'))
+        self.assertFalse(checker.is_valid_pair('level', ['ad']))
+
+    def test_ad_object_registry(self):
+        checker = typechecker.TypeChecker({}, {})
+        self.assertIs(
+            checker.get_ad_object_class('AdsActionStats'),
+            adsactionstats.AdsActionStats,
+        )
+        self.assertIsNone(checker.get_ad_object_class('NotAnAdObject'))
+        self.assertTrue(checker.is_type('list<AdsActionStats>', [{}]))
+        self.assertFalse(checker.is_type('NotAnAdObject', {}))
+
+    def test_field_checker_is_shared_per_class(self):
+        self.assertIs(
+            adsinsights.AdsInsights()._field_checker,
+            adsinsights.AdsInsights()._field_checker,
+        )
+
+    def test_param_schema(self):
+        schema = typechecker.ParamSchema(
+            param_types={'level': 'level_enum', 'phase': 'phase_enum'},
+            enums={
+                'level_enum': 'adsinsights.AdsInsights.Level',
+                'phase_enum': ['start', 'finish'],
+            },
+        )
+        checker = schema.get_checker()
+        self.assertIs(schema.get_checker(), checker)
+        self.assertTrue(checker.is_valid_pair('level', 'ad'))
+        self.assertFalse(checker.is_valid_pair('level', 'nope'))
+        self.assertTrue(checker.is_valid_pair('phase', 'start'))
+        self.assertFalse(checker.is_valid_pair('phase', 'transfer'))
+
+    def test_valid_pair_cache(self):
+        checker = typechecker.TypeChecker({'ids': 'list<int>'}, {})
+        self.assertTrue(checker.is_valid_pair('ids', [1, 2]))
+        self.assertTrue(checker.is_valid_pair('ids', [3]))
+        self.assertFalse(checker.is_valid_pair('ids', [True]))
+        self.assertFalse(checker.is_valid_pair('ids', ['a']))
+        self.assertTrue(checker.is_valid_pair('ids', ['12']))
+        self.assertEqual(len(checker._valid_pairs), 4)
+
+    def test_valid_pair_cache_skips_large_strings(self):
+        checker = typechecker.TypeChecker(
+            {'name': 'string', 'ids': 'list<int>', 'data': 'Object'}, {})
+        image = 'x' * (1024 * 1024)
+        self.assertTrue(checker.is_valid_pair('name', image))
+        self.assertTrue(checker.is_valid_pair('name', 'other name'))
+        self.assertFalse(checker.is_valid_pair('ids', ['1' * 100 + 'x']))
+        self.assertTrue(checker.is_valid_pair('data', {'bytes': image}))
+        self.assertEqual(list(checker._valid_pairs), [('name', str)])
+
+    def test_generated_methods_share_checker(self):
+        account = adaccount.AdAccount('act_123')
+        first = account.get_insights(pending=True)
+        second = account.get_insights(pending=True)
+        self.assertIs(first._param_checker, second._param_checker)
+
+
+class ApiMethodTestCase(unittest.TestCase):
+
+    def test_methods_are_installed_on_first_access(self):
+        class Node(objects.AbstractCrudObject):
+            get_things = apimethod.ApiMethod(
+                method='GET',
+                endpoint='/things',
+                target='ad.Ad',
+                api_type='EDGE',
+                param_types={'limit': 'int'},
+            )
+
+        self.assertIsInstance(vars(Node)['get_things'], apimethod.ApiMethod)
+        method = Node.get_things
+        self.assertNotIsInstance(vars(Node)['get_things'], apimethod.ApiMethod)
+        self.assertEqual(method.__name__, 'get_things')
+        if six.PY3:
+            self.assertEqual(
+                list(inspect.signature(method).parameters),
+                ['self', 'fields', 'params', 'batch', 'pending'],
+            )
+
+        request = Node('123').get_things(
+            fields=['name'],
+            params={'limit': 10},
+            pending=True,
+        )
+        self.assertEqual(request._path, ('123', 'things'))
+        self.assertIs(request._target_class, objects.ad.Ad)
+        self.assertEqual(request.get_params(), {'limit': 10})
+        self.assertEqual(request.get_fields(), ['name'])
+
+    def test_node_methods_parse_into_the_node(self):
+        ad = objects.Ad('123')
+        request = ad.api_get(pending=True)
+        self.assertIs(request._response_parser._reuse_object, ad)
+
+
+class CompactObjectTestCase(unittest.TestCase):
+
+    def test_mapping_interface(self):
+        record = compactobject.CompactObject(
+            objects.Ad,
+            {'id': '123', 'name': 'foo', 'bid_amount': u'-5'},
+        )
+        self.assertEqual(record.get_id(), '123')
+        self.assertEqual(record['bid_amount'], -5)
+        record['name'] = 'bar'
+        del record['bid_amount']
+        self.assertEqual(dict(record), {'id': '123', 'name': 'bar'})
+        self.assertEqual(len(record), 2)
+        self.assertFalse(hasattr(record, '__dict__'))
+
+    def test_parser_builds_compact_records(self):
+        parser = objectparser.ObjectParser(target_class=objects.Ad, compact=True)
+        records = parser.parse_multiple({'data': [{'id': '1'}, {'id': '2'}]})
+        self.assertEqual([r.get_id() for r in records], ['1', '2'])
+        self.assertTrue(
+            all(isinstance(r, compactobject.CompactObject) for r in records))
+
+    def test_to_object(self):
+        record = compactobject.CompactObject(
+            objects.Ad,
+            {'id': '123', 'name': 'foo'},
+        )
+        ad = record.to_object()
+        self.assertIsInstance(ad, objects.Ad)
+        self.assertEqual(ad.export_all_data(), record.export_all_data())
+        self.assertEqual(ad._changes, {})
+
+
+
+class InsightsJobManagerTestCase(unittest.TestCase):
+
+    class FakeResponse(object):
+        def __init__(self, body):
+            self.body = body
+
+        def json(self):
+            return self.body
+
+    class FakeApi(object):
+        """Completes each report run after the given number of polls."""
+
+        def __init__(self, polls_needed, failures=()):
+            self.polls_needed = polls_needed
+            self.polls = {}
+            self.calls = []
+            self.failures = list(failures)
+
+        def call(self, method, path, params=None):
+            self.calls.append(params['ids'])
+            if self.failures:
+                raise self.failures.pop(0)
+            body = {}
+            for fbid in params['ids'].split(','):
+                self.polls[fbid] = self.polls.get(fbid, 0) + 1
+                needed = self.polls_needed[fbid]
+                if needed is None:
+                    status, percent = 'Job Failed', 0
+                elif self.polls[fbid] >= needed:
+                    status, percent = 'Job Completed', 100
+                else:
+                    status, percent = 'Job Running', 50
+                body[fbid] = {
+                    'id': fbid,
+                    'async_status': status,
+                    'async_percent_completion': percent,
+                }
+            return InsightsJobManagerTestCase.FakeResponse(body)
+
+    class FakeNode(object):
+        def __init__(self, name):
+            self.name = name
+            self.submitted = 0
+
+        def get_insights(self, fields=None, params=None, async=False):
+            self.submitted += 1
+            run = adreportrun.AdReportRun(
+                '%s-%d' % (self.name, self.submitted))
+            return run
+
+    def test_runs_jobs_with_shared_polls(self):
+        fake_api = self.FakeApi({'a-1': 1, 'b-1': 4, 'c-1': 2})
+        manager = insights_jobs.InsightsJobManager(
+            api=fake_api,
+            max_running=2,
+            sleep=lambda seconds: None,
+        )
+        for name in 'abc':
+            manager.add(self.FakeNode(name))
+        finished = [job.report_run.get_id() for job in manager.run()]
+        self.assertEqual(finished, ['a-1', 'c-1', 'b-1'])
+        self.assertEqual(fake_api.calls[0], 'a-1,b-1')
+        self.assertEqual(len(fake_api.calls), 4)
+
+    def test_retries_failed_jobs(self):
+        fake_api = self.FakeApi({'a-1': None, 'a-2': None, 'b-1': None,
+                                 'b-2': 1})
+        manager = insights_jobs.InsightsJobManager(
+            api=fake_api,
+            max_retries=1,
+            sleep=lambda seconds: None,
+        )
+        failed = manager.add(self.FakeNode('a'))
+        retried = manager.add(self.FakeNode('b'))
+        self.assertEqual(len(list(manager.run())), 2)
+        self.assertFalse(failed.is_complete())
+        self.assertEqual(failed.attempts, 2)
+        self.assertRaises(exceptions.FacebookError, failed.get_result)
+        self.assertTrue(retried.is_complete())
+
+    def test_failed_poll(self):
+        error = exceptions.FacebookRequestError(
+            'busy', {}, 503, {}, '{"error": {"code": 2}}')
+        fake_api = self.FakeApi({'a-1': 1}, failures=[error])
+        sleeps = []
+        manager = insights_jobs.InsightsJobManager(
+            api=fake_api,
+            sleep=sleeps.append,
+        )
+        job = manager.add(self.FakeNode('a'))
+        self.assertEqual(list(manager.run()), [job])
+        self.assertTrue(job.is_complete())
+        self.assertEqual(sleeps, [1.0, 1.5])
+
+        fake_api = self.FakeApi({'a-1': 1}, failures=[error] * 3)
+        manager = insights_jobs.InsightsJobManager(
+            api=fake_api,
+            sleep=lambda seconds: None,
+            max_poll_errors=2,
+        )
+        manager.add(self.FakeNode('a'))
+        self.assertRaises(
+            exceptions.FacebookRequestError, list, manager.run())
+
+
+class ReportRunSchedulerTestCase(unittest.TestCase):
+
+    class FakeManager(object):
+        """Completes each run linearly over the given seconds from 0."""
+
+        def __init__(self, clock, durations):
+            self.clock = clock
+            self.durations = durations
+            self.polls = []
+            self.failures = []
+
+        def poll(self, runs):
+            self.polls.append(sorted(run['id'] for run in runs))
+            if self.failures:
+                raise self.failures.pop(0)
+            for run in runs:
+                duration = self.durations[run['id']]
+                percent = min(100, int(100 * self.clock[0] / duration))
+                run._set_data({
+                    'async_status':
+                        'Job Completed' if percent == 100 else 'Job Running',
+                    'async_percent_completion': percent,
+                    'time_ref': 0,
+                })
+
+    def make_scheduler(self, durations):
+        clock = [0.0]
+
+        def sleep(seconds):
+            clock[0] += seconds
+
+        manager = self.FakeManager(clock, durations)
+        scheduler = insights_jobs.ReportRunScheduler(
+            manager=manager,
+            max_interval=600.0,
+            clock=lambda: clock[0],
+            sleep=sleep,
+            random=lambda: 0.5,
+        )
+        runs = [adreportrun.AdReportRun(fbid) for fbid in sorted(durations)]
+        return scheduler, manager, runs, clock
+
+    def test_wait(self):
+        scheduler, manager, runs, clock = self.make_scheduler(
+            {'fast': 1, 'slow': 1000})
+        done = [(run['id'], clock[0]) for run in scheduler.wait(runs)]
+        self.assertEqual(done[0], ('fast', 1.0))
+        self.assertEqual(done[1][0], 'slow')
+        self.assertLess(done[1][1], 1100)
+        # A fixed 1 second interval would have polled the slow run 1000
+        # times.
+        self.assertLess(len(manager.polls), 30)
+        self.assertEqual(manager.polls[0], ['fast', 'slow'])
+
+    def test_wait_timeout(self):
+        scheduler, manager, runs, clock = self.make_scheduler({'slow': 100})
+        self.assertEqual(list(scheduler.wait(runs, timeout=10)), [])
+        self.assertEqual(clock[0], 10)
+        self.assertEqual(len(scheduler), 1)
+        self.assertEqual([run['id'] for run in scheduler.wait()], ['slow'])
+
+    def test_wait_keeps_unhandled_runs(self):
+        scheduler, manager, runs, clock = self.make_scheduler(
+            {'a': 1, 'b': 1})
+        manager.failures = [exceptions.FacebookRequestError(
+            'busy', {}, 503, {}, '{"error": {"code": 2}}')]
+        self.assertRaises(
+            exceptions.FacebookRequestError, list, scheduler.wait(runs))
+        self.assertEqual(len(scheduler), 2)
+
+        clock[0] = 5
+        waiting = scheduler.wait()
+        first = next(waiting)
+        waiting.close()
+        self.assertEqual(len(scheduler), 1)
+        self.assertEqual(
+            [run['id'] for run in scheduler.wait()],
+            [run['id'] for run in runs if run is not first],
+        )
+
+
+class InsightsColumnsTestCase(unittest.TestCase):
+
+    rows = [
+        {
+            'ad_id': '1',
+            'clicks': '10',
+            'spend': '1.5',
+            'actions': [
+                {'action_type': 'link_click', 'value': '3'},
+                {'action_type': 'like', 'value': '1', '1d_click': '1'},
+            ],
+        },
+        {
+            'ad_id': '2',
+            'spend': '2.25',
+            'actions': [
+                {'action_type': 'link_click', 'value': '4'},
+                {'action_type': 'link_click', 'value': '1'},
+            ],
+        },
+    ]
+
+    def test_build(self):
+        fields = ['ad_id', 'clicks', 'spend', 'actions']
+        columns = insights_columns.InsightsColumns(fields, use_numpy=False)
+        columns.add_page({'data': self.rows})
+        table = columns.build()
+        self.assertEqual(list(table), [
+            'ad_id',
+            'clicks',
+            'spend',
+            'actions:like',
+            'actions:link_click',
+        ])
+        self.assertEqual(table['ad_id'], ['1', '2'])
+        self.assertEqual(list(table['clicks']), [10, 0])
+        self.assertEqual(table['clicks'].typecode,
+                         insights_columns._INT_TYPECODE)
+        self.assertEqual(list(table['spend']), [1.5, 2.25])
+        self.assertEqual(list(table['actions:like']), [1.0, 0.0])
+        self.assertEqual(list(table['actions:link_click']), [3.0, 5.0])
+
+    def test_build_from_objects(self):
+        rows = objectparser.ObjectParser(
+            target_class=adsinsights.AdsInsights,
+        ).parse_multiple({'data': self.rows})
+        table = insights_columns.insights_to_columns(
+            rows,
+            value_field='1d_click',
+        )
+        self.assertEqual(
+            list(table),
+            ['actions:like', 'actions:link_click', 'ad_id', 'clicks', 'spend'],
+        )
+        self.assertEqual(list(table['actions:like']), [1.0, 0.0])
+        self.assertEqual(list(table['actions:link_click']), [0.0, 0.0])
+        self.assertEqual(list(table['clicks']), [10, 0])
+
+
+class InsightsRollupTestCase(unittest.TestCase):
+
+    rows = [
+        {'ad_id': '1', 'adset_id': '10', 'campaign_id': '100',
+         'impressions': '1000', 'clicks': '10', 'spend': '5.0',
+         'reach': '900', 'ctr': '1.0',
+         'actions': [{'action_type': 'like', 'value': '2'}],
+         'cost_per_action_type': [{'action_type': 'like', 'value': '2.5'}]},
+        {'ad_id': '2', 'adset_id': '10', 'campaign_id': '100',
+         'impressions': '3000', 'clicks': '0', 'spend': '3.0',
+         'reach': '2500', 'ctr': '0.0'},
+        {'ad_id': '3', 'adset_id': '20', 'campaign_id': '100',
+         'impressions': '0', 'clicks': '0', 'spend': '0.0',
+         'reach': '0', 'ctr': '0.0'},
+    ]
+
+    def test_rollup(self):
+        rollup = insights_rollup.InsightsRollup(self.rows, use_numpy=False)
+        self.assertEqual(rollup.get_non_additive_fields(), ['reach'])
+        adsets = rollup.rollup('adset')
+        self.assertEqual(adsets['adset_id'], ['10', '20'])
+        self.assertEqual(list(adsets['impressions']), [4000.0, 0.0])
+        self.assertEqual(list(adsets['clicks']), [10.0, 0.0])
+        self.assertEqual(list(adsets['spend']), [8.0, 0.0])
+        self.assertEqual(adsets['ctr'][0], 0.25)
+        self.assertNotIn('cpm', adsets)
+        self.assertTrue(math.isnan(adsets['ctr'][1]))
+        self.assertEqual(adsets['cost_per_action_type:like'][0], 4.0)
+        self.assertNotIn('reach', adsets)
+
+        campaigns = rollup.rollup('campaign')
+        self.assertEqual(campaigns['campaign_id'], ['100'])
+        self.assertEqual(list(campaigns['impressions']), [4000.0])
+        self.assertRaises(ValueError, rollup.rollup, 'account')
+        self.assertRaises(ValueError, rollup.rollup, 'business')
+
+
+class AdReportRunExportTestCase(unittest.TestCase):
+
+    class Handler(BaseHTTPServer.BaseHTTPRequestHandler):
+        """Serves the body and content type set on the server."""
+
+        def do_GET(self):
+            self.server.paths.append(self.path)
+            self.send_response(200)
+            self.send_header('Content-Type', self.server.content_type)
+            self.end_headers()
+            self.wfile.write(self.server.body)
+
+        def log_message(self, *args):
+            pass
+
+    def setUp(self):
+        self.server = BaseHTTPServer.HTTPServer(('127.0.0.1', 0), self.Handler)
+        self.server.paths = []
+        self.server.content_type = 'text/csv'
+        self.server.body = (
+            u'\ufeffAd ID,Impressions,Amount Spent,Ad Name\r\n'
+            u'1,100,1.5,"multi\r\nline"\r\n'
+            u'2,,2.25,caf\u00e9\r\n'
+        ).encode('utf-8')
+        thread = threading.Thread(
+            target=self.server.serve_forever,
+            kwargs={'poll_interval': 0.01},
+        )
+        thread.daemon = True
+        thread.start()
+        self.run_ = adreportrun.AdReportRun(
+            '123',
+            api=api.FacebookAdsApi(session.FacebookSession(access_token='t')),
+        )
+        self.run_.EXPORT_URL = 'http://127.0.0.1:%d/export' % (
+            self.server.server_address[1])
+
+    def tearDown(self):
+        self.server.shutdown()
+        self.server.server_close()
+
+    rename = {
+        'Ad ID': 'ad_id',
+        'Impressions': 'impressions',
+        'Amount Spent': 'spend',
+        'Ad Name': 'ad_name',
+    }
+
+    def test_export_rows(self):
+        rows = list(self.run_.export_rows(chunk_size=5))
+        self.assertEqual(rows[0]['Ad Name'], 'multi\r\nline')
+        self.assertEqual(rows[1]['Ad Name'], u'caf\u00e9')
+        self.assertIn('report_run_id=123', self.server.paths[0])
+        self.assertIn('format=csv', self.server.paths[0])
+
+        columns = self.run_.export_columns(rename=self.rename, chunk_rows=1)
+        self.assertEqual(columns['ad_id'], ['1', '2'])
+        self.assertEqual(list(columns['impressions']), [100, 0])
+        self.assertEqual(list(columns['spend']), [1.5, 2.25])
+
+    def test_export_fallback(self):
+        self.server.content_type = 'text/html'
+        row = adsinsights.AdsInsights()
+        row.set_data({'ad_id': '1'})
+        calls = []
+
+        def get_insights(params=None):
+            calls.append(params)
+            return [row]
+
+        self.run_.get_insights = get_insights
+        self.assertEqual(
+            list(self.run_.export_rows(
+                params={'locale': 'en_US'}, insights_params={'limit': 10})),
+            [{'ad_id': '1'}],
+        )
+        self.assertEqual(calls, [{'limit': 10}])
+        self.assertIn('locale=en_US', self.server.paths[0])
+        self.assertRaises(
+            exceptions.FacebookError,
+            list,
+            self.run_.export_rows(fallback=False),
+        )
+
+    def test_export_columns_rejects_actions(self):
+        self.assertRaises(
+            ValueError, self.run_.export_columns, fields=['ad_id', 'actions'])
+        self.assertEqual(self.server.paths, [])
+
+        self.server.content_type = 'text/html'
+        row = adsinsights.AdsInsights()
+        row.set_data({'ad_id': '1', 'actions': [
+            {'action_type': 'like', 'value': '1'},
+        ]})
+        self.run_.get_insights = lambda params=None: [row]
+        self.assertRaises(ValueError, self.run_.export_columns)
+
+
+class TimeRangeSplitterTestCase(unittest.TestCase):
+
+    class FakeNode(object):
+        """Returns one row per day and ad, without ids, and fails for ranges
+        longer than max_days.
+        """
+
+        def __init__(self, max_days=None, ads=1, status=500, code=1):
+            self.max_days = max_days
+            self.ads = ads
+            self.status = status
+            self.code = code
+            self.ranges = []
+
+        def get_insights(self, fields=None, params=None, async=False):
+            splitter = insights_splitter.TimeRangeSplitter
+            since = splitter._parse_date(params['time_range']['since'])
+            until = splitter._parse_date(params['time_range']['until'])
+            self.ranges.append((since.day, until.day))
+            days = (until - since).days + 1
+            if self.max_days is not None and days > self.max_days:
+                raise exceptions.FacebookRequestError(
+                    "timeout", {}, self.status, {},
+                    json.dumps({'error': {'code': self.code}}))
+            dates = [
+                since + datetime.timedelta(days=day) for day in range(days)
+            ]
+            return [
+                {'date_start': str(date), 'date_stop': str(date), 'spend': ad}
+                for date in reversed(dates)
+                for ad in range(self.ads)
+            ]
+
+    params = {
+        'time_range': {'since': '2016-10-01', 'until': '2016-10-10'},
+        'time_increment': '1',
+    }
+
+    def test_split(self):
+        splitter = insights_splitter.TimeRangeSplitter(chunk_days=3)
+        since = datetime.date(2016, 10, 1)
+        ranges = splitter.split(since, datetime.date(2016, 10, 8), 2)
+        self.assertEqual(
+            [(start.day, stop.day) for start, stop in ranges],
+            [(1, 2), (3, 4), (5, 6), (7, 8)],
+        )
+        splitter._learn(1.0, 1)
+        self.assertEqual(splitter.get_chunk_days(), 10)
+
+    def test_get_insights(self):
+        node = self.FakeNode()
+        splitter = insights_splitter.TimeRangeSplitter(chunk_days=4)
+        rows = splitter.get_insights(node, ['ad_id'], self.params)
+        self.assertEqual(sorted(node.ranges), [(1, 4), (5, 8), (9, 10)])
+        self.assertEqual(
+            [row['date_start'] for row in rows],
+            ['2016-10-%02d' % day for day in range(1, 11)],
+        )
+        self.assertIsNotNone(splitter.get_seconds_per_day())
+
+    def test_split_on_error(self):
+        node = self.FakeNode(max_days=2)
+        splitter = insights_splitter.TimeRangeSplitter(
+            chunk_days=10,
+            max_workers=1,
+        )
+        rows = splitter.get_insights(node, ['ad_id'], self.params)
+        self.assertEqual(len(rows), 10)
+        self.assertEqual(node.ranges[:3], [(1, 10), (1, 5), (1, 2)])
+
+        # Only transient errors are worth a split
+        node = self.FakeNode(max_days=2, status=400, code=100)
+        self.assertRaises(
+            exceptions.FacebookRequestError,
+            splitter.get_insights, node, ['ad_id'], self.params,
+        )
+        self.assertEqual(node.ranges, [(1, 10)])
+
+    def test_rows_without_ids(self):
+        splitter = insights_splitter.TimeRangeSplitter(chunk_days=4)
+        rows = splitter.get_insights(
+            self.FakeNode(ads=3), ['spend'], self.params)
+        self.assertEqual(len(rows), 30)
+        self.assertEqual([row['spend'] for row in rows[:3]], [0, 1, 2])
+
+    def test_strategy_rejects_batch(self):
+        account = adaccount.AdAccount('act_1')
+        self.assertRaises(
+            ValueError,
+            account.get_insights,
+            params=self.params,
+            pending=True,
+            strategy=insights_splitter.TimeRangeSplitter(),
+        )
+
+
+class InsightsSyncTestCase(unittest.TestCase):
+
+    class FakeNode(object):
+        """Has one ad whose clicks of a day are its day of month, plus a
+        restatement bonus for the days in restated.
+        """
+
+        def __init__(self):
+            self.params = []
+            self.restated = {}
+
+        def get_id_assured(self):
+            return 'act_1'
+
+        def get_insights(self, fields=None, params=None):
+            self.params.append(params)
+            since = insights_sync._parse_date(params['time_range']['since'])
+            until = insights_sync._parse_date(params['time_range']['until'])
+            rows = []
+            while since <= until:
+                rows.append({
+                    'ad_id': '1',
+                    'date_start': str(since),
+                    'date_stop': str(since),
+                    'clicks': str(since.day + self.restated.get(since.day, 0)),
+                })
+                since += datetime.timedelta(days=1)
+            return rows
+
+    def test_get_attribution_days(self):
+        get_days = insights_sync.InsightsSync.get_attribution_days
+        self.assertEqual(get_days({}), 28)
+        self.assertEqual(
+            get_days({'action_attribution_windows': ['1d_view', '7d_click']}),
+            7,
+        )
+
+    def test_sync(self):
+        node = self.FakeNode()
+        today = [datetime.date(2016, 10, 20)]
+        store = insights_sync.InsightsStore()
+        sync = insights_sync.InsightsSync(store, today=lambda: today[0])
+        params = {'action_attribution_windows': ['7d_click']}
+
+        result = sync.sync(
+            node, ['clicks'], params, start_date=datetime.date(2016, 10, 1))
+        self.assertEqual(len(result.inserted), 20)
+        self.assertEqual(node.params[0]['time_range'],
+                         {'since': '2016-10-01', 'until': '2016-10-20'})
+
+        today[0] = datetime.date(2016, 10, 21)
+        node.restated[19] = 5
+        result = sync.sync(node, ['clicks'], params)
+        self.assertEqual((result.since, result.until), (
+            datetime.date(2016, 10, 14), datetime.date(2016, 10, 21)))
+        self.assertEqual([row['date_start'] for row in result.inserted],
+                         ['2016-10-21'])
+        self.assertEqual([row['clicks'] for row in result.updated], ['24'])
+        self.assertEqual(result.unchanged, 6)
+        self.assertEqual(len(store.get_rows('ad', '2016-10-01', '2016-10-31')),
+                         21)
+
+
+class IdentityMapTestCase(unittest.TestCase):
+
+    def setUp(self):
+        self.api = api.FacebookAdsApi(
+            session.FacebookSession(access_token='token'))
+
+    def parse(self, target_class, data):
+        parser = objectparser.ObjectParser(api=self.api, target_class=target_class)
+        return parser.parse_single(data)
+
+    def test_disabled_by_default(self):
+        first = self.parse(objects.Ad, {'id': '1'})
+        self.assertIsNot(first, self.parse(objects.Ad, {'id': '1'}))
+
+    def test_same_fbid_is_same_object(self):
+        self.api.enable_identity_map()
+        first = self.parse(objects.Ad, {'id': '1', 'name': 'foo'})
+        second = self.parse(objects.Ad, {'id': '1', 'status': 'PAUSED'})
+        self.assertIs(first, second)
+        self.assertEqual(first['name'], 'foo')
+        self.assertEqual(first['status'], 'PAUSED')
+        self.assertIsNot(first, self.parse(objects.AdSet, {'id': '1'}))
+        self.assertIs(
+            self.api.get_identity_map().get(objects.Ad, '1'), first)
+
+    def test_evicted_objects_are_released(self):
+        identity_map = self.api.enable_identity_map(max_size=1)
+        self.parse(objects.Ad, {'id': '1'})
+        second = self.parse(objects.Ad, {'id': '2'})
+        gc.collect()
+        self.assertIsNone(identity_map.get(objects.Ad, '1'))
+        self.assertIs(identity_map.get(objects.Ad, '2'), second)
+
+
 class SessionTestCase(unittest.TestCase):
 
     def gen_appsecret_proof(self, access_token, app_secret):
@@ -409,6 +1541,554 @@ class ProductCatalogTestCase(unittest.TestCase):
         catalog = objects.ProductCatalog()
         self.assertEqual(b64_id_as_str, catalog.b64_encoded_id(product_id))
 
+    class FakeApi(object):
+        """Processes each batch after two status checks."""
+
+        def __init__(self):
+            self.batches = []
+            self.checks = collections.Counter()
+            self.lock = threading.Lock()
+            self.failures = []
+            self.check_failures = []
+            self.errors = {'h1': [{'id': 'ID_2', 'message': 'bad'}]}
+
+        def call(self, method, path, params=None):
+            with self.lock:
+                if path[1] == 'batch':
+                    if self.failures:
+                        raise self.failures.pop(0)
+                    self.batches.append(params['requests'])
+                    body = {'handles': ['h%d' % len(self.batches)]}
+                else:
+                    if self.check_failures:
+                        raise self.check_failures.pop(0)
+                    handle = params['handle']
+                    self.checks[handle] += 1
+                    status = {'status': 'started'}
+                    if self.checks[handle] >= 2:
+                        errors = self.errors.get(handle, [])
+                        status = {
+                            'status': 'finished',
+                            'errors_total_count': len(errors),
+                            'errors': errors,
+                        }
+                    body = {'data': [status]}
+            return CustomAudienceUploaderTestCase.FakeResponse(body)
+
+    def test_bulk_update_products(self):
+        fake_api = self.FakeApi()
+        catalog = objects.ProductCatalog('123', api=fake_api)
+        sleeps = []
+        result = catalog.bulk_update_products(
+            itertools.chain(
+                [('ID_%d' % i, {'price': i}) for i in range(5)],
+                [{'method': 'DELETE', 'retailer_id': 'ID_9'}],
+            ),
+            batch_size=4,
+            sleep=sleeps.append,
+        )
+        self.assertEqual(sorted(result.handles), ['h1', 'h2'])
+        self.assertEqual(result.num_requests, 6)
+        self.assertEqual(
+            result.errors,
+            [{'id': 'ID_2', 'message': 'bad', 'handle': 'h1'}],
+        )
+        self.assertEqual(len(sleeps), 1)
+        requests = sorted(
+            (request for batch in fake_api.batches for request in batch),
+            key=lambda request: request['retailer_id'],
+        )
+        self.assertEqual(requests[0], {
+            'method': 'UPDATE',
+            'retailer_id': 'ID_0',
+            'data': {'price': 0},
+        })
+        self.assertEqual(requests[-1], {
+            'method': 'DELETE',
+            'retailer_id': 'ID_9',
+        })
+
+    def test_bulk_update_products_failed_batch(self):
+        fake_api = self.FakeApi()
+        fake_api.failures = [
+            exceptions.FacebookRequestError(
+                'busy', {}, 500, {}, '{"error": {"code": 2}}'),
+            exceptions.FacebookRequestError(
+                'bad', {}, 400, {}, '{"error": {"code": 100}}'),
+        ]
+        catalog = objects.ProductCatalog('123', api=fake_api)
+        sleeps = []
+        result = catalog.bulk_update_products(
+            [('ID_%d' % i, {'price': i}) for i in range(4)],
+            batch_size=2,
+            max_workers=1,
+            sleep=sleeps.append,
+        )
+        # The first batch is retried once, then fails for good
+        self.assertEqual(result.handles, ['h1'])
+        self.assertEqual(fake_api.batches[0][0]['retailer_id'], 'ID_2')
+        self.assertEqual(
+            result.errors[0],
+            {'message': 'bad', 'code': 100, 'retailer_ids': ['ID_0', 'ID_1']},
+        )
+        self.assertEqual(sleeps[0], 1.0)
+
+    def test_bulk_update_products_failed_status(self):
+        fake_api = self.FakeApi()
+        fake_api.errors = {}
+        fake_api.check_failures = [
+            exceptions.FacebookRequestError(
+                'busy', {}, 500, {}, '{"error": {"code": 2}}'),
+            exceptions.FacebookRequestError(
+                'bad', {}, 400, {}, '{"error": {"code": 100}}'),
+        ]
+        catalog = objects.ProductCatalog('123', api=fake_api)
+        sleeps = []
+        updates = [('ID_%d' % i, {'price': i}) for i in range(4)]
+        result = catalog.bulk_update_products(
+            updates,
+            batch_size=2,
+            max_workers=1,
+            sleep=sleeps.append,
+            retry_interval=2.0,
+        )
+        # h1 is checked again after a backoff, h2 fails for good
+        self.assertEqual(result.errors, [{
+            'message': 'bad',
+            'code': 100,
+            'handle': 'h2',
+            'retailer_ids': ['ID_2', 'ID_3'],
+        }])
+        self.assertEqual(fake_api.checks['h1'], 2)
+        self.assertEqual((sleeps, result.pending), ([2.0, 1.0], {}))
+
+        # Batches still processing at the timeout are returned
+        result = catalog.bulk_update_products(
+            updates[:2], timeout=0, sleep=sleeps.append)
+        self.assertEqual(result.errors, [])
+        self.assertEqual(result.pending, {'h3': ['ID_0', 'ID_1']})
+
+
+class FeedDiffTestCase(unittest.TestCase):
+
+    def make_feed(self, prices):
+        items = ''.join(
+            '<item><g:id>ID_%d</g:id><g:title>Bowl %d</g:title>'
+            '<g:price>%s BRL</g:price><g:shipping><g:country>BR</g:country>'
+            '</g:shipping></item>' % (index, index, price)
+            for index, price in enumerate(prices)
+        )
+        return six.BytesIO((
+            '<?xml version="1.0"?><rss '
+            'xmlns:g="http://base.google.com/ns/1.0" version="2.0">'
+            '<channel><title>Store</title>%s</channel></rss>' % items
+        ).encode('utf8'))
+
+    def test_iter_feed_items(self):
+        items = list(feed_diff.iter_feed_items(self.make_feed(['9.99'])))
+        self.assertEqual(items, [{
+            'id': 'ID_0',
+            'title': 'Bowl 0',
+            'price': '9.99 BRL',
+            'shipping': {'country': 'BR'},
+        }])
+        self.assertEqual(
+            feed_diff.feed_item_to_product_data(items[0]),
+            {'name': 'Bowl 0', 'price': 999, 'currency': 'BRL'},
+        )
+
+    def test_sync(self):
+        fake_api = ProductCatalogTestCase.FakeApi()
+        fake_api.errors = {}
+        catalog = objects.ProductCatalog('123', api=fake_api)
+        sync = feed_diff.CatalogFeedSync(feed_diff.CatalogSnapshot())
+        kwargs = {'sleep': lambda seconds: None}
+
+        counts, result = sync.sync(
+            catalog, self.make_feed(['1.00', '2.00', '3.00']), **kwargs)
+        self.assertEqual(counts, {'CREATE': 3})
+
+        del fake_api.batches[:]
+        counts, result = sync.sync(
+            catalog, self.make_feed(['1.00', '2.50']), delete=True, **kwargs)
+        self.assertEqual(counts, {'UPDATE': 1, 'DELETE': 1})
+        self.assertEqual(
+            sorted(fake_api.batches[0], key=lambda r: r['retailer_id']),
+            [
+                {'method': 'UPDATE', 'retailer_id': 'ID_1',
+                 'data': {'name': 'Bowl 1', 'price': 250, 'currency': 'BRL'}},
+                {'method': 'DELETE', 'retailer_id': 'ID_2'},
+            ],
+        )
+
+        del fake_api.batches[:]
+        counts, result = sync.sync(
+            catalog, self.make_feed(['1.00', '2.50']), **kwargs)
+        self.assertEqual(counts, {})
+        self.assertEqual(fake_api.batches, [])
+
+    def test_sync_with_failed_item(self):
+        fake_api = ProductCatalogTestCase.FakeApi()
+        catalog = objects.ProductCatalog('123', api=fake_api)
+        sync = feed_diff.CatalogFeedSync(feed_diff.CatalogSnapshot())
+        kwargs = {'sleep': lambda seconds: None}
+
+        counts, result = sync.sync(
+            catalog, self.make_feed(['1.00', '2.00', '3.00']), **kwargs)
+        self.assertEqual(counts, {'CREATE': 3})
+        self.assertEqual([error['id'] for error in result.errors], ['ID_2'])
+
+        # Only the failed item is sent again
+        fake_api.errors = {}
+        counts, result = sync.sync(
+            catalog, self.make_feed(['1.00', '2.00', '3.00']), **kwargs)
+        self.assertEqual(counts, {'CREATE': 1})
+        self.assertEqual(fake_api.batches[-1][0]['retailer_id'], 'ID_2')
+
+        # Without the ids of the failed items, nothing is recorded
+        fake_api.errors = {'h3': [{'message': 'bad'}]}
+        counts, result = sync.sync(
+            catalog, self.make_feed(['1.50', '2.00', '3.00']), **kwargs)
+        fake_api.errors = {}
+        counts, result = sync.sync(
+            catalog, self.make_feed(['1.50', '2.00', '3.00']), **kwargs)
+        self.assertEqual(counts, {'UPDATE': 1})
+
+        # Items of batches still processing at the timeout are sent again
+        counts, result = sync.sync(
+            catalog, self.make_feed(['1.50', '2.50', '3.00']), timeout=0,
+            **kwargs)
+        self.assertEqual(list(result.pending.values()), [['ID_1']])
+        counts, result = sync.sync(
+            catalog, self.make_feed(['1.50', '2.50', '3.00']), **kwargs)
+        self.assertEqual(counts, {'UPDATE': 1})
+
+
+class VideoUploadTransferTestCase(unittest.TestCase):
+
+    class Handler(BaseHTTPServer.BaseHTTPRequestHandler):
+        """Answers upload requests from the server's list of replies."""
+
+        def do_POST(self):
+            body = self.rfile.read(int(self.headers['Content-Length']))
+            if not self.headers['Content-Type'].startswith('multipart/'):
+                params = urllib.parse.parse_qs(body.decode('utf-8'))
+                self.server.phases.append(params['upload_phase'][0])
+                self.reply(*self.server.replies.pop(0))
+                return
+            self.server.phases.append('transfer')
+            start = int(re.search(
+                b'name="start_offset"\r\n\r\n([0-9]+)\r\n', body).group(1))
+            chunk = re.search(
+                b'name="video_file_chunk"; filename="video.mp4"\r\n'
+                b'Content-Type: multipart/form-data\r\n\r\n(.*)\r\n--',
+                body,
+                re.DOTALL,
+            ).group(1)
+            status, reply = self.server.replies.pop(0)
+            if status == 200:
+                self.server.received[start] = chunk
+            self.reply(status, reply)
+
+        def reply(self, status, reply):
+            self.send_response(status)
+            self.send_header('Content-Type', 'application/json')
+            self.end_headers()
+            self.wfile.write(json.dumps(reply).encode('utf-8'))
+
+        def log_message(self, *args):
+            pass
+
+    def setUp(self):
+        self.server = BaseHTTPServer.HTTPServer(('127.0.0.1', 0), self.Handler)
+        self.server.received = {}
+        self.server.phases = []
+        thread = threading.Thread(
+            target=self.server.serve_forever,
+            kwargs={'poll_interval': 0.01},
+        )
+        thread.daemon = True
+        thread.start()
+        self.session = session.FacebookSession(access_token='t')
+        self.session.GRAPH = 'http://127.0.0.1:%d' % (
+            self.server.server_address[1])
+        self.directory = tempfile.mkdtemp()
+        self.path = os.path.join(self.directory, 'video.mp4')
+        self.data = os.urandom(10000)
+        with open(self.path, 'wb') as video:
+            video.write(self.data)
+
+    def tearDown(self):
+        self.server.shutdown()
+        self.server.server_close()
+        shutil.rmtree(self.directory)
+
+    def offsets(self, start, end):
+        return 200, {'start_offset': str(start), 'end_offset': str(end)}
+
+    def test_send_request(self):
+        self.server.replies = [
+            self.offsets(3000, 6000),
+            (500, {'error': {'message': 'Please retry', 'is_transient': True}}),
+            self.offsets(6000, 9000),
+            self.offsets(9000, 10000),
+            (400, {'error': {
+                'message': 'Wrong offset',
+                'error_subcode': 1363037,
+                'error_data': {'start_offset': 2000, 'end_offset': 10000},
+            }}),
+            self.offsets(10000, 10000),
+        ]
+        context = video_uploader.VideoUploadRequestContext()
+        context.account_id = 'act_1'
+        context.session_id = '1'
+        context.file_path = self.path
+        context.start_offset = 0
+        context.end_offset = 3000
+        waits = []
+        manager = video_uploader.VideoUploadTransferRequestManager(
+            api.FacebookAdsApi(self.session),
+            sleep=waits.append,
+            random=lambda: 0.5,
+        )
+        response = manager.send_request(context)
+
+        self.assertEqual(response['start_offset'], '10000')
+        self.assertEqual(waits, [1.0])
+        self.assertEqual(sorted(self.server.received), [0, 2000, 3000, 6000])
+        self.assertEqual(self.server.received[2000], self.data[2000:])
+        self.assertEqual(
+            b''.join(self.server.received[offset] for offset in (0, 3000)),
+            self.data[:6000],
+        )
+        self.assertFalse(self.server.replies)
+
+    def test_resume_upload(self):
+        api_ = api.FacebookAdsApi(self.session)
+        state_path = os.path.join(self.directory, 'video.json')
+        started = [
+            (200, {'start_offset': '0', 'end_offset': '4000',
+                   'upload_session_id': '1', 'video_id': '2'}),
+            self.offsets(4000, 8000),
+        ]
+        self.server.replies = started + [
+            (400, {'error': {'message': 'Closed', 'code': 1}}),
+        ]
+        video = advideo.AdVideo(parent_id='act_1', api=api_)
+        video[advideo.AdVideo.Field.filepath] = self.path
+        uploader = video_uploader.VideoUploader()
+        self.assertRaises(
+            exceptions.FacebookRequestError,
+            uploader.upload, video, state_path=state_path,
+        )
+        with open(state_path) as state_file:
+            state = json.load(state_file)
+        self.assertEqual(
+            (state['start_offset'], state['end_offset']), (4000, 8000))
+
+        self.server.phases = []
+        self.server.replies = [
+            self.offsets(8000, 10000),
+            self.offsets(10000, 10000),
+            (200, {'success': True}),
+        ]
+        result = uploader.upload(video, state_path=state_path)
+        self.assertEqual(result['id'], '2')
+        self.assertEqual(
+            self.server.phases, ['transfer', 'transfer', 'finish'])
+        self.assertEqual(self.server.received[4000], self.data[4000:8000])
+        self.assertFalse(os.path.exists(state_path))
+
+        # A changed file starts a new upload session
+        self.server.replies = started + [
+            (400, {'error': {'message': 'Closed', 'code': 1}}),
+        ]
+        self.assertRaises(
+            exceptions.FacebookRequestError,
+            uploader.upload, video, state_path=state_path,
+        )
+        with open(self.path, 'r+b') as video_file:
+            video_file.write(b'changed')
+        self.server.phases = []
+        self.server.replies = started + [
+            self.offsets(8000, 10000),
+            self.offsets(10000, 10000),
+            (200, {'success': True}),
+        ]
+        uploader.upload(video, state_path=state_path)
+        self.assertEqual(self.server.phases[0], 'start')
+
+    def test_resume_corrupt_state(self):
+        video = advideo.AdVideo(
+            parent_id='act_1', api=api.FacebookAdsApi(self.session))
+        video[advideo.AdVideo.Field.filepath] = self.path
+        state_path = os.path.join(self.directory, 'video.json')
+        for state in ('{"account_id": "act_1", "file_si', '{}', '[]'):
+            with open(state_path, 'w') as state_file:
+                state_file.write(state)
+            self.server.phases = []
+            self.server.replies = [
+                (200, {'start_offset': '0', 'end_offset': '10000',
+                       'upload_session_id': '1', 'video_id': '2'}),
+                self.offsets(10000, 10000),
+                (200, {'success': True}),
+            ]
+            result = video_uploader.VideoUploader().upload(
+                video, state_path=state_path)
+            self.assertEqual(result['id'], '2')
+            self.assertEqual(
+                self.server.phases, ['start', 'transfer', 'finish'])
+            self.assertFalse(os.path.exists(state_path))
+
+    def test_chunk_body(self):
+        body = video_uploader.VideoUploadChunkBody(
+            {'upload_phase': 'transfer'},
+            'video_file_chunk',
+            'video.mp4',
+            memoryview(bytearray(b'x' * 10)),
+        )
+        blocks = [bytes(block) for block in body]
+        self.assertEqual(len(body), len(b''.join(blocks)))
+        self.assertEqual(blocks[1], b'x' * 10)
+        self.assertIn(b'name="upload_phase"\r\n\r\ntransfer\r\n', blocks[0])
+
+
+class VideoUploadPoolTestCase(unittest.TestCase):
+
+    class Handler(BaseHTTPServer.BaseHTTPRequestHandler):
+        """Asks for 1000 byte chunks of videos of any size."""
+
+        def do_POST(self):
+            body = self.rfile.read(int(self.headers['Content-Length']))
+            if self.headers['Content-Type'].startswith('multipart/'):
+                params = dict(
+                    (key.decode('ascii'), value.decode('ascii'))
+                    for key, value in re.findall(
+                        b'name="(\\w+)"\r\n\r\n(\\w+)\r\n', body)
+                )
+                params['upload_phase'] = 'transfer'
+            else:
+                params = dict(
+                    (key, values[0]) for key, values in
+                    urllib.parse.parse_qs(body.decode('utf-8')).items()
+                )
+            status, reply = 200, {'success': True}
+            if 'act_0' in self.path:
+                status, reply = 400, {'error': {'message': 'No', 'code': 1}}
+            elif params['upload_phase'] == 'start':
+                # The session id is the file size
+                reply = {'upload_session_id': params['file_size'],
+                         'video_id': params['file_size'],
+                         'start_offset': '0',
+                         'end_offset': str(min(1000, int(params['file_size'])))}
+            elif params['upload_phase'] == 'transfer':
+                size = int(params['upload_session_id'])
+                start = min(int(params['start_offset']) + 1000, size)
+                reply = {'start_offset': str(start),
+                         'end_offset': str(min(start + 1000, size))}
+            self.send_response(status)
+            self.send_header('Content-Type', 'application/json')
+            self.end_headers()
+            self.wfile.write(json.dumps(reply).encode('utf-8'))
+
+        def log_message(self, *args):
+            pass
+
+    def setUp(self):
+        self.server = BaseHTTPServer.HTTPServer(('127.0.0.1', 0), self.Handler)
+        thread = threading.Thread(
+            target=self.server.serve_forever,
+            kwargs={'poll_interval': 0.01},
+        )
+        thread.daemon = True
+        thread.start()
+        self.directory = tempfile.mkdtemp()
+        session_ = session.FacebookSession(access_token='t')
+        session_.GRAPH = 'http://127.0.0.1:%d' % (
+            self.server.server_address[1])
+        self.api = api.FacebookAdsApi(session_)
+
+    def tearDown(self):
+        self.server.shutdown()
+        self.server.server_close()
+        shutil.rmtree(self.directory)
+
+    def make_video(self, account_id, size):
+        path = os.path.join(self.directory, '%s_%d.mp4' % (account_id, size))
+        with open(path, 'wb') as video_file:
+            video_file.write(b'v' * size)
+        video = advideo.AdVideo(parent_id=account_id, api=self.api)
+        video[advideo.AdVideo.Field.filepath] = path
+        return video
+
+    def test_upload(self):
+        videos = [
+            self.make_video('act_1', 3500),
+            self.make_video('act_2', 2000),
+            self.make_video('act_1', 1000),
+            self.make_video('act_0', 10),
+        ]
+        events = []
+        pool = video_upload_pool.VideoUploadPool(
+            max_workers=2,
+            max_per_account=1,
+            callback=events.append,
+        )
+        results = pool.upload(videos)
+
+        self.assertEqual(
+            [result.response and result.response['id'] for result in results],
+            ['3500', '2000', '1000', None],
+        )
+        self.assertIsInstance(results[3].error, exceptions.FacebookRequestError)
+        started = [
+            event.file_size for event in events if event.phase == 'started']
+        self.assertEqual(started[:2], [10, 1000])
+        # Only one upload of act_1 at a time
+        phases = [
+            (event.phase, event.file_size) for event in events
+            if event.video.get_parent_id_assured() == 'act_1'
+        ]
+        self.assertLess(
+            phases.index(('finished', 1000)), phases.index(('started', 3500)))
+        self.assertEqual(
+            [event.bytes_sent for event in events
+             if event.file_size == 3500 and event.phase == 'transferred'],
+            [1000, 2000, 3000, 3500],
+        )
+
+    def test_bandwidth_limiter(self):
+        now = [0.0]
+
+        def sleep(seconds):
+            now[0] += seconds
+
+        limiter = video_upload_pool.BandwidthLimiter(
+            1000, burst=500, clock=lambda: now[0], sleep=sleep)
+        for _ in range(4):
+            limiter.acquire(500)
+        self.assertEqual(now[0], 1.0)
+        now[0] += 10
+        limiter.acquire(500)
+        self.assertEqual(now[0], 11.0)
+
+    def test_upload_without_file(self):
+        missing = self.make_video('act_1', 10)
+        os.remove(missing[advideo.AdVideo.Field.filepath])
+        no_path = advideo.AdVideo(parent_id='act_1', api=self.api)
+        events = []
+        pool = video_upload_pool.VideoUploadPool(callback=events.append)
+        results = pool.upload([missing, no_path, self.make_video('act_1', 20)])
+
+        self.assertIsInstance(results[0].error, OSError)
+        self.assertIsInstance(results[1].error, exceptions.FacebookError)
+        self.assertEqual(
+            (results[2].response['id'], results[2].error), ('20', None))
+        self.assertEqual(
+            [event.phase for event in events if event.file_size is None],
+            ['failed', 'failed'],
+        )
+
 
 class SessionWithoutAppSecretTestCase(unittest.TestCase):
     def test_appsecret_proof_absence(self):
@@ -458,6 +2138,37 @@ class UrlsUtilsTestCase(unittest.TestCase):
         )
 
 
+class ValidationModeTestCase(unittest.TestCase):
+
+    def build_request(self, mode):
+        fb_api = api.FacebookAdsApi(session.FacebookSession())
+        fb_api.set_validation_mode(mode)
+        account = adaccount.AdAccount('act_123', api=fb_api)
+        with warnings.catch_warnings(record=True) as caught:
+            warnings.simplefilter('always')
+            request = account.get_insights(
+                fields=['not_a_field'],
+                params={'level': 'not_a_level'},
+                pending=True,
+            )
+        self.assertEqual(request.get_params()['level'], 'not_a_level')
+        return caught
+
+    def test_modes(self):
+        self.assertEqual(
+            len(self.build_request(api.FacebookAdsApi.VALIDATION_FULL)),
+            2,
+        )
+        self.assertEqual(
+            len(self.build_request(api.FacebookAdsApi.VALIDATION_OFF)),
+            0,
+        )
+
+    def test_unknown_mode(self):
+        fb_api = api.FacebookAdsApi(session.FacebookSession())
+        self.assertRaises(ValueError, fb_api.set_validation_mode, 'some')
+
+
 class FacebookAdsApiBatchTestCase(unittest.TestCase):
 
     def test_add_works_with_utf8(self):
@@ -478,6 +2189,60 @@ class VersionUtilsTestCase(unittest.TestCase):
         assert re.search('[0-9]+\.[0-9]+\.[0-9]', version_value)
 
 
+class LazyImportTestCase(unittest.TestCase):
+
+    def run_script(self, script):
+        root = os.path.dirname(os.path.dirname(os.path.dirname(
+            os.path.abspath(__file__),
+        )))
+        output = subprocess.check_output(
+            [sys.executable, '-c', script],
+            cwd=root,
+        )
+        return output.decode('utf-8')
+
+    def loaded_adobjects(self, statement):
+        return set(self.run_script(
+            statement + '\n'
+            'import sys\n'
+            'print(" ".join(m for m in sys.modules '
+            'if m.startswith("facebookads.adobjects.")))\n'
+        ).split())
+
+    def test_objects_import_is_lazy(self):
+        loaded = self.loaded_adobjects('import facebookads.objects')
+        self.assertNotIn('facebookads.adobjects.adaccount', loaded)
+        self.assertLess(len(loaded), 5)
+
+        loaded = self.loaded_adobjects(
+            'import facebookads.objects\n'
+            'facebookads.objects.AdAccount',
+        )
+        self.assertIn('facebookads.adobjects.adaccount', loaded)
+        self.assertNotIn('facebookads.adobjects.adcreative', loaded)
+
+    def test_lazy_attributes(self):
+        self.assertIs(objects.AdAccount, objects.AdAccount)
+        self.assertTrue(issubclass(objects.AdAccount, adaccount.AdAccount))
+        self.assertEqual(objects.AdAccount.__module__, 'facebookads.objects')
+        self.assertIn('AdAccount', dir(objects))
+        self.assertIs(adobjects.AdAccount, adaccount.AdAccount)
+        self.assertIs(adobjects.adaccount, adaccount)
+        self.assertRaises(AttributeError, getattr, objects, 'Missing')
+        self.assertRaises(AttributeError, getattr, adobjects, 'Missing')
+
+    def test_legacy_method_uses_unread_class(self):
+        # In a new process, so that AdAccountGroupUser was never read
+        output = self.run_script(
+            'from facebookads import objects\n'
+            'group = objects.AdAccountGroup("1")\n'
+            'group.iterate_edge = lambda cls, fields, params: cls\n'
+            'users = group.get_users()\n'
+            'print(users is objects.AdAccountGroupUser)\n'
+        )
+        self.assertEqual(output.split(), ['True'])
+
+
 class FacebookResponseTestCase(unittest.TestCase):
 
     def test_is_success_200(self):
@@ -28,20 +28,94 @@ from facebookads.exceptions import(
     FacebookBadParameterTypeException,
 )
 
+class LazyValue(object):
+    """
+    A nested AdObject kept as its raw dict until it is first read.
+    AbstractObject replaces it by the converted object on access or export.
+    """
+
+    __slots__ = ('_convert', '_raw', '_value', '_resolved')
+
+    def __init__(self, convert, raw):
+        self._convert = convert
+        self._raw = raw
+        self._value = None
+        self._resolved = False
+
+    def resolve(self):
+        """Returns the converted value, converting it on first call."""
+        if not self._resolved:
+            self._value = self._convert(self._raw)
+            self._resolved = True
+            self._raw = None
+        return self._value
+
+
 class TypeChecker:
     """
     A checker for field/params types of objects and API requests.
     You may change the setting in apiconfig.py. Under STRICT mode, any check
     failures will throw exception. Under non-STRICT mode, failures will result
     in warning messages.
+
+    Type strings such as 'list<AdsActionStats>' are parsed once per checker
+    and compiled into callables, so checking or converting a value does not
+    re-parse its type. Ad object classes referenced by type name are looked
+    up once per process through the _ad_object_classes registry.
+
+    is_valid_pair also remembers its result per param and value shape (see
+    _get_value_shape), so repeating a request does not check it again.
     """
 
     primitive_types = set(["unsigned int", "int", "bool", "string", "Object",
         "datetime", "float"])
 
+    # Maps type names to AdObject classes, or to None if there is no
+    # AdObject with that name.
+    _ad_object_classes = {}
+
+    # Bounds for the is_valid_pair cache: values with more items or longer
+    # strings than this are checked every time, and the cache is reset when
+    # it grows larger.
+    _max_shape_items = 64
+    _max_shape_string = 64
+    _max_valid_pairs = 1024
+
+    # Types whose check of a string does not depend on its content.
+    _string_types = frozenset(['string', 'unicode', 'datetime'])
+
     def __init__(self, type_check_info, type_check_enum):
         self._type_check_info = type_check_info
         self._enum_data = type_check_enum
+        self._type_checks = {}
+        self._converters = {}
+        self._valid_pairs = {}
+
+    @classmethod
+    def register_ad_object(cls, type_name, ad_object_class):
+        """Registers the AdObject class to use for fields of type type_name."""
+        cls._ad_object_classes[type_name] = ad_object_class
+
+    @classmethod
+    def get_ad_object_class(cls, type_name):
+        """Returns the AdObject class named type_name or None if not found."""
+        try:
+            return cls._ad_object_classes[type_name]
+        except KeyError:
+            pass
+        try:
+            mod = importlib.import_module(
+                "facebookads.adobjects." + type_name.lower())
+        except ImportError:
+            cls._ad_object_classes[type_name] = None
+            return None
+        except Exception:
+            return None
+        # The module may still be initializing, only cache a hit.
+        ad_object_class = getattr(mod, type_name, None)
+        if ad_object_class is not None:
+            cls._ad_object_classes[type_name] = ad_object_class
+        return ad_object_class
 
     def is_primitive_type(self, type):
         return (type in self.primitive_types) or (type in self._enum_data)
@@ -78,59 +152,153 @@ class TypeChecker:
     def is_valid_pair(self, param, value):
         if self.is_valid_key(param):
             value_type = self._type_check_info[param]
-            return self.is_type(value_type, value)
+            # File checks depend on the file system, not on the value.
+            shape = None
+            if (value_type in self._string_types and
+                    isinstance(value, six.string_types)):
+                shape = type(value)
+            elif value_type != 'file':
+                shape = self._get_value_shape(value)
+            if shape is None:
+                return self.is_type(value_type, value)
+            key = (param, shape)
+            try:
+                return self._valid_pairs[key]
+            except KeyError:
+                pass
+            is_valid = self.is_type(value_type, value)
+            if len(self._valid_pairs) >= self._max_valid_pairs:
+                self._valid_pairs.clear()
+            self._valid_pairs[key] = is_valid
+            return is_valid
         else:
             return True
 
+    @classmethod
+    def _get_value_shape(cls, value, depth=0):
+        """
+        Returns a hashable signature of value such that values with the same
+        signature pass or fail the same type checks, or None if value is too
+        large to be worth caching. Short strings are kept as they are, since
+        enum, bool and digit checks depend on their content; other scalars
+        are reduced to their type.
+        """
+        if isinstance(value, six.string_types):
+            if len(value) > cls._max_shape_string:
+                return None
+            return value
+        if isinstance(value, (list, dict)):
+            if depth > 2 or len(value) > cls._max_shape_items:
+                return None
+            shapes = set()
+            if isinstance(value, dict):
+                for key, item in value.items():
+                    key_shape = cls._get_value_shape(key, depth + 1)
+                    item_shape = cls._get_value_shape(item, depth + 1)
+                    if key_shape is None or item_shape is None:
+                        return None
+                    shapes.add((key_shape, item_shape))
+            else:
+                for item in value:
+                    item_shape = cls._get_value_shape(item, depth + 1)
+                    if item_shape is None:
+                        return None
+                    shapes.add(item_shape)
+            return (type(value), frozenset(shapes))
+        return type(value)
+
     def is_type(self, value_type, value, allow_dict_as_obj=True):
         if value is None or value_type is None:
             return True
+        return self._get_type_check(value_type)(value, allow_dict_as_obj)
+
+    def _get_type_check(self, value_type):
+        try:
+            return self._type_checks[value_type]
+        except KeyError:
+            check = self._compile_type_check(value_type)
+            self._type_checks[value_type] = check
+            return check
 
+    def _compile_type_check(self, value_type):
+        """Returns a callable(value, allow_dict_as_obj) checking value_type."""
         if value_type in self._enum_data:
-            return value in self._enum_data[value_type]
+            enum_values = list(self._enum_data[value_type])
+            try:
+                enum_lookup = frozenset(enum_values)
+            except TypeError:
+                enum_lookup = enum_values
+
+            def check_enum(value, allow_dict_as_obj=True):
+                if value is None:
+                    return True
+                try:
+                    return value in enum_lookup
+                except TypeError:
+                    return value in enum_values
+            return check_enum
         if value_type == 'file':
-            return os.path.isfile(value)
+            return lambda value, allow_dict_as_obj=True: (
+                value is None or os.path.isfile(value))
         if value_type == 'list':
-            return isinstance(value, list)
+            return lambda value, allow_dict_as_obj=True: (
+                value is None or isinstance(value, list))
 
-        if isinstance(value, dict) and value_type in ['map', 'Object']:
-            return True
-        if isinstance(value, bool):
-            return value_type in ['bool']
-        if isinstance(value, six.string_types):
-            if value_type in ['string', 'unicode', 'file', 'datetime']:
+        dict_is_type = value_type in ['map', 'Object']
+        bool_is_type = value_type in ['bool']
+        string_is_type = value_type in ['string', 'unicode', 'file', 'datetime']
+        digits_is_type = value_type in ['int', 'unsigned int', 'float']
+        number_is_type = value_type in [
+            'int', 'unsigned int', 'float', 'string', 'datetime']
+        is_list = self.is_type_collection(value_type, 'list')
+        is_map = not is_list and self.is_type_collection(value_type, 'map')
+        if is_list:
+            sub_type = self.get_type_from_collection(value_type, 'list')[0]
+        elif is_map:
+            sub_types = self.get_type_from_collection(value_type, 'map')
+        marker = '_is' + value_type
+
+        def check(value, allow_dict_as_obj=True):
+            if value is None:
                 return True
-            elif value_type == 'bool' and value in ['true', 'false']:
+            if isinstance(value, dict) and dict_is_type:
                 return True
-            elif value_type in ['int', 'unsigned int', 'float']:
-                return value.isdigit()
-            else:
-                return False
-        if isinstance(value, (int, float)):
-            return value_type in ['int', 'unsigned int', 'float', 'string', 'datetime']
+            if isinstance(value, bool):
+                return bool_is_type
+            if isinstance(value, six.string_types):
+                if string_is_type:
+                    return True
+                elif bool_is_type and value in ['true', 'false']:
+                    return True
+                elif digits_is_type:
+                    return value.isdigit()
+                else:
+                    return False
+            if isinstance(value, (int, float)):
+                return number_is_type
 
-        if self.is_type_collection(value_type, 'list'):
-            if not isinstance(value, list):
-                return False
-            sub_type = self.get_type_from_collection(value_type, 'list')[0]
-            return all([self.is_type(sub_type, item) for item in value])
-        if self.is_type_collection(value_type, 'map'):
-            if not isinstance(value, dict):
-                return False
-            sub_types = self.get_type_from_collection(value_type, 'map')
-            sub_type_key = sub_types[0]
-            sub_type_value = sub_types[1]
-            return all([self.is_type(sub_type_key, k) and
-                self.is_type(sub_type_value, v) for k, v in value.items()])
+            if is_list:
+                if not isinstance(value, list):
+                    return False
+                check_item = self._get_type_check(sub_type)
+                return all(check_item(item) for item in value)
+            if is_map:
+                if not isinstance(value, dict):
+                    return False
+                check_key = self._get_type_check(sub_types[0])
+                check_value = self._get_type_check(sub_types[1])
+                return all(check_key(k) and check_value(v)
+                           for k, v in value.items())
 
-        if (type(value).__name__ == value_type or
-                    hasattr(value, '_is' + value_type)):
-            return True
+            if (type(value).__name__ == value_type or
+                        hasattr(value, marker)):
+                return True
 
-        if allow_dict_as_obj and isinstance(value, dict):
-            return self._type_is_ad_object(value_type)
+            if allow_dict_as_obj and isinstance(value, dict):
+                return self._type_is_ad_object(value_type)
 
-        return False
+            return False
+        return check
 
     def is_type_collection(self, value_type, collection_name):
         return collection_name == value_type[:len(collection_name)]
@@ -156,21 +324,33 @@ class TypeChecker:
             return self._type_check_info[param] == "file"
         return False
 
-    def get_typed_value(self, key, value):
-        if not self.is_valid_key(key):
-            return value
+    def get_typed_value(self, key, value, lazy=False):
+        """Returns value converted to the type of key.
+        With lazy=True a dict holding a nested AdObject is returned wrapped
+        in a LazyValue and only converted when the LazyValue is resolved.
+        """
+        try:
+            convert = self._converters[key]
+        except KeyError:
+            convert = self._compile_converter(key)
+            self._converters[key] = convert
+        return convert(value, lazy)
+
+    def _compile_converter(self, key):
+        """Returns a callable converting a raw value of field key."""
         field_type = self.get_type(key)
-        if self.is_type(field_type, value, allow_dict_as_obj=False):
-            return value
+        if field_type is None:
+            return lambda value, lazy=False: value
+        check = self._get_type_check(field_type)
+        is_primitive = self.is_primitive_type(field_type)
 
-        if self.is_primitive_type(field_type) and isinstance(value, six.text_type):
-            typed_value = self.convert_string_to_prim_type(field_type, value)
-        elif self.is_type_collection(field_type, "list"):
+        if self.is_type_collection(field_type, "list"):
             sub_type = self.get_type_from_collection(field_type, "list")[0]
-            if isinstance(value, list):
-                typed_value = [self.get_typed_value(sub_type, v) for v in value]
-            else:
-                typed_value = [self.get_typed_value(sub_type, value)]
+
+            def convert_collection(value):
+                if isinstance(value, list):
+                    return [self.get_typed_value(sub_type, v) for v in value]
+                return [self.get_typed_value(sub_type, value)]
         elif self.is_type_collection(field_type, "map"):
             sub_types = self.get_type_from_collection(field_type, "map")
             if len(sub_types) == 2:
@@ -179,38 +359,100 @@ class TypeChecker:
             else:
                 sub_type_key = 'string'
                 sub_type_value = sub_types[0]
-            typed_value = dict(
-                (self.get_typed_value(sub_type_key, k),
-                self.get_typed_value(sub_type_value, v))
-                for (k, v) in value.items()
-            )
-        elif isinstance(value, dict):
+
+            def convert_collection(value):
+                return dict(
+                    (self.get_typed_value(sub_type_key, k),
+                    self.get_typed_value(sub_type_value, v))
+                    for (k, v) in value.items()
+                )
+        else:
+            convert_collection = None
+
+        def convert_object(value):
             try:
-                typed_value = self._create_field_object(field_type, value)
+                return self._create_field_object(field_type, value)
             except:
+                return value
+
+        def convert(value, lazy=False):
+            if (value is None or isinstance(value, LazyValue) or
+                    check(value, False)):
+                return value
+
+            if is_primitive and isinstance(value, six.text_type):
+                typed_value = self.convert_string_to_prim_type(
+                    field_type, value)
+            elif convert_collection is not None:
+                typed_value = convert_collection(value)
+            elif isinstance(value, dict):
+                if lazy and self._type_is_ad_object(field_type):
+                    return LazyValue(convert_object, value)
+                typed_value = convert_object(value)
+            else:
                 typed_value = value
-        else:
-            typed_value = value
 
-        if not self.is_type(field_type, typed_value):
-            api_utils.warning('Value of ' + key + ' is not be compatible.' +
-                ' Expect ' + field_type + '; got ' + str(type(typed_value)))
-        return typed_value
+            if not check(typed_value):
+                api_utils.warning('Value of ' + key + ' is not be compatible.' +
+                    ' Expect ' + field_type + '; got ' + str(type(typed_value)))
+            return typed_value
+        return convert
 
     def _create_field_object(self, field_type, data=None):
-        mod = importlib.import_module(
-            "facebookads.adobjects." + field_type.lower())
-        if mod is not None and hasattr(mod, field_type):
-            obj = (getattr(mod, field_type))()
-            if data is not None:
-                obj._set_data(data)
-            return obj
-        return None
+        ad_object_class = self.get_ad_object_class(field_type)
+        if ad_object_class is None:
+            raise FacebookBadParameterTypeException(
+                'No AdObject found for type ' + str(field_type))
+        obj = ad_object_class()
+        if data is not None:
+            obj._set_data(data)
+        return obj
 
     def _type_is_ad_object(self, value_type):
+        return self.get_ad_object_class(value_type) is not None
+
+
+class ParamSchema(object):
+    """
+    The parameter types of one generated API method.
+
+    Generated modules declare a schema per method at module level, and every
+    call of the method shares the schema's TypeChecker instead of building
+    new type and enum tables. An enum is either a list of values or the path
+    of an enum class under facebookads.adobjects, e.g.
+    'adsinsights.AdsInsights.DatePreset'. Enum classes are imported when the
+    checker is first needed, since the adobjects modules import each other.
+    """
+
+    def __init__(self, param_types, enums=None):
+        self._param_types = param_types
+        self._enums = enums or {}
+        self._checker = None
+
+    def get_checker(self):
+        """Returns the TypeChecker for this schema, building it once."""
+        checker = self._checker
+        if checker is None:
+            enums = {}
+            for enum_name, values in self._enums.items():
+                if isinstance(values, six.string_types):
+                    values = self._get_enum_class(values).__dict__.values()
+                enums[enum_name] = self._freeze(values)
+            checker = self._checker = TypeChecker(self._param_types, enums)
+        return checker
+
+    @staticmethod
+    def _get_enum_class(path):
+        module_name, _, class_path = path.partition('.')
+        value = importlib.import_module('facebookads.adobjects.' + module_name)
+        for attr in class_path.split('.'):
+            value = getattr(value, attr)
+        return value
+
+    @staticmethod
+    def _freeze(values):
+        values = tuple(values)
         try:
-            mod = importlib.import_module(
-                "facebookads.adobjects." + value_type.lower())
-            return mod is not None
-        except:
-            return False
+            return frozenset(values)
+        except TypeError:
+            return values
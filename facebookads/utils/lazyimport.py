@@ -0,0 +1,76 @@
+# Copyright 2014 Facebook, Inc.
+
+# You are hereby granted a non-exclusive, worldwide, royalty-free license to
+# use, copy, modify, and distribute this software in source code or binary
+# form for use in connection with the web services and APIs provided by
+# Facebook.
+
+# As with any software that integrates with the Facebook platform, your use
+# of this software is subject to the Facebook Developer Principles and
+# Policies [http://developers.facebook.com/policy/]. This copyright notice
+# shall be included in all copies or substantial portions of the software.
+
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL
+# THE AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING
+# FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER
+# DEALINGS IN THE SOFTWARE.
+
+"""
+lazyimport contains helpers to defer imports until a module attribute is
+first used.
+"""
+
+import sys
+import threading
+import types
+
+
+class LazyModule(types.ModuleType):
+    """A module whose missing attributes are resolved on first access.
+
+    This provides the module level __getattr__ of PEP 562 on all the Python
+    versions supported by this package. A resolved value is stored on both
+    this module and the module it replaces, so functions defined in the
+    original module see it as a regular global.
+    """
+
+    def __init__(self, module, resolve, names=()):
+        super(LazyModule, self).__init__(module.__name__, module.__doc__)
+        self.__dict__.update(module.__dict__)
+        self._lazy_module = module
+        self._lazy_resolve = resolve
+        self._lazy_names = frozenset(names)
+        self._lazy_lock = threading.RLock()
+
+    def __getattr__(self, name):
+        if name.startswith('__') or name.startswith('_lazy_'):
+            raise AttributeError(name)
+        with self._lazy_lock:
+            if name in self.__dict__:
+                return self.__dict__[name]
+            value = self._lazy_resolve(name)
+            setattr(self, name, value)
+            setattr(self._lazy_module, name, value)
+            return value
+
+    def __dir__(self):
+        return sorted(set(self.__dict__) | self._lazy_names)
+
+
+def install(name, resolve, names=()):
+    """Replaces a loaded module with a LazyModule in sys.modules.
+
+    Args:
+        name: The name of the module, usually __name__ of the caller.
+        resolve: A callable taking an attribute name and returning its value.
+            It must raise AttributeError for unknown names.
+        names: The names that resolve knows about, listed by dir().
+    Returns:
+        The LazyModule now registered under name.
+    """
+    module = LazyModule(sys.modules[name], resolve, names)
+    sys.modules[name] = module
+    return module
@@ -0,0 +1,273 @@
+# Copyright 2015 Facebook, Inc.
+
+# You are hereby granted a non-exclusive, worldwide, royalty-free license to
+# use, copy, modify, and distribute this software in source code or binary
+# form for use in connection with the web services and APIs provided by
+# Facebook.
+
+# As with any software that integrates with the Facebook platform, your use
+# of this software is subject to the Facebook Developer Principles and
+# Policies [http://developers.facebook.com/policy/]. This copyright notice
+# shall be included in all copies or substantial portions of the software.
+
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL
+# THE AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING
+# FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER
+# DEALINGS IN THE SOFTWARE.
+
+"""
+uploads many videos concurrently under shared bandwidth and account limits
+"""
+
+from facebookads.exceptions import FacebookError
+from facebookads.video_uploader import VideoUploadSession
+
+from multiprocessing.pool import ThreadPool
+import collections
+import hashlib
+import os
+import threading
+import time
+
+
+class VideoUploadEvent(collections.namedtuple(
+    'VideoUploadEvent',
+    ['video', 'phase', 'bytes_sent', 'file_size', 'error'],
+)):
+    """
+    A progress report of VideoUploadPool: phase is 'started', 'transferred'
+    after each acknowledged chunk, 'finished' or 'failed', with the bytes
+    of the video the server acknowledged so far and the exception of a
+    failed upload.
+    """
+
+    __slots__ = ()
+
+
+class VideoUploadResult(collections.namedtuple(
+    'VideoUploadResult',
+    ['video', 'response', 'error'],
+)):
+    """
+    The outcome of one upload of VideoUploadPool.upload: the video info
+    returned by the finish phase, or the exception the upload raised.
+    """
+
+    __slots__ = ()
+
+
+class BandwidthLimiter(object):
+    """
+    Spaces out byte counts, from any number of threads, so that on average
+    at most bytes_per_second are let through. Each acquire reserves the
+    next free slot of the shared budget, so callers are served in turn and
+    up to burst bytes may pass at once after a pause.
+    """
+
+    def __init__(
+        self,
+        bytes_per_second,
+        burst=1024 * 1024,
+        clock=time.time,
+        sleep=time.sleep,
+    ):
+        """
+        Args:
+            bytes_per_second: The average rate let through.
+            burst (optional): Bytes let through without waiting after the
+                budget was left unused.
+            clock (optional): The function returning the current time.
+            sleep (optional): The function used to wait.
+        """
+        if bytes_per_second <= 0:
+            raise ValueError("bytes_per_second must be positive.")
+        self._rate = float(bytes_per_second)
+        self._burst = burst
+        self._clock = clock
+        self._sleep = sleep
+        self._lock = threading.Lock()
+        self._next = None
+
+    def acquire(self, count):
+        """
+        Blocks until count more bytes may be sent.
+        """
+        with self._lock:
+            now = self._clock()
+            earliest = now - self._burst / self._rate
+            if self._next is None or self._next < earliest:
+                self._next = earliest
+            delay = self._next - now
+            self._next += count / self._rate
+        if delay > 0:
+            self._sleep(delay)
+
+
+class VideoUploadPool(object):
+    """
+    Uploads AdVideos with a filepath through up to max_workers concurrent
+    VideoUploadSessions, which share the api of their videos. The smallest
+    files go first, at most max_per_account uploads of one account run at
+    a time, and the chunks of all uploads share a BandwidthLimiter when
+    bytes_per_second is given. Progress is reported to callback as
+    VideoUploadEvents, one call at a time.
+    Example:
+        >>> pool = VideoUploadPool(
+        ...     max_workers=8, max_per_account=4, bytes_per_second=50e6,
+        ...     callback=print)
+        >>> for result in pool.upload(videos):
+        ...     print(result.video[AdVideo.Field.filepath], result.error)
+    """
+
+    def __init__(
+        self,
+        max_workers=4,
+        max_per_account=None,
+        bytes_per_second=None,
+        callback=None,
+        wait_for_encoding=False,
+        state_dir=None,
+    ):
+        """
+        Args:
+            max_workers (optional): Number of uploads in flight.
+            max_per_account (optional): Number of uploads in flight to one
+                ad account, unlimited if None.
+            bytes_per_second (optional): Cap on the rate the chunks of all
+                uploads are sent at, uncapped if None.
+            callback (optional): Called with each VideoUploadEvent.
+            wait_for_encoding (optional): See VideoUploader.upload.
+            state_dir (optional): A directory where each upload keeps its
+                state file, so that uploading the same videos again resumes
+                the ones that were interrupted; see VideoUploadSession.
+        """
+        if max_workers < 1:
+            raise ValueError("max_workers must be at least 1.")
+        if max_per_account is not None and max_per_account < 1:
+            raise ValueError("max_per_account must be at least 1.")
+        self._max_workers = max_workers
+        self._max_per_account = max_per_account
+        self._limiter = None
+        if bytes_per_second is not None:
+            self._limiter = BandwidthLimiter(bytes_per_second)
+        self._callback = callback
+        self._wait_for_encoding = wait_for_encoding
+        self._state_dir = state_dir
+        self._lock = threading.Lock()
+
+    def upload(self, videos):
+        """
+        Uploads the videos, each in its own upload session.
+        Returns:
+            A list of VideoUploadResult, in the order of videos. A failed
+            upload, or a video without a readable file, does not stop the
+            others.
+        """
+        videos = list(videos)
+        results = [None] * len(videos)
+        sizes = [None] * len(videos)
+        accounts = [None] * len(videos)
+        for index, video in enumerate(videos):
+            try:
+                accounts[index] = video.get_parent_id_assured()
+                sizes[index] = self._get_file_size(video)
+            except Exception as e:
+                self._emit(video, 'failed', None, None, e)
+                results[index] = VideoUploadResult(video, None, e)
+        pending = sorted(
+            (index for index in range(len(videos)) if results[index] is None),
+            key=sizes.__getitem__,
+        )
+        in_flight = set()
+        running = collections.Counter()
+        done = threading.Condition()
+
+        def run(index):
+            result = None
+            try:
+                result = self._upload(videos[index], sizes[index])
+            except Exception as e:
+                result = VideoUploadResult(videos[index], None, e)
+            finally:
+                with done:
+                    results[index] = result
+                    in_flight.remove(index)
+                    running[accounts[index]] -= 1
+                    done.notify()
+
+        pool = ThreadPool(self._max_workers)
+        try:
+            with done:
+                while pending or in_flight:
+                    index = self._next_runnable(
+                        accounts, pending, in_flight, running)
+                    if index is None:
+                        done.wait()
+                        continue
+                    pending.remove(index)
+                    in_flight.add(index)
+                    running[accounts[index]] += 1
+                    pool.apply_async(run, (index,))
+        finally:
+            pool.terminate()
+            pool.join()
+        return results
+
+    def _next_runnable(self, accounts, pending, in_flight, running):
+        if len(in_flight) >= self._max_workers:
+            return None
+        for index in pending:
+            if (self._max_per_account is None or
+                    running[accounts[index]] < self._max_per_account):
+                return index
+        return None
+
+    def _upload(self, video, file_size):
+        def on_chunk(start_offset, end_offset):
+            self._emit(video, 'transferred', start_offset, file_size)
+
+        try:
+            self._emit(video, 'started', 0, file_size)
+            session = VideoUploadSession(
+                video,
+                self._wait_for_encoding,
+                state_path=self._get_state_path(video),
+                limiter=self._limiter,
+                callback=on_chunk,
+            )
+            response = session.start()
+        except Exception as e:
+            self._emit(video, 'failed', None, file_size, e)
+            return VideoUploadResult(video, None, e)
+        self._emit(video, 'finished', file_size, file_size)
+        return VideoUploadResult(video, response, None)
+
+    def _emit(self, video, phase, bytes_sent, file_size, error=None):
+        if self._callback is not None:
+            with self._lock:
+                self._callback(VideoUploadEvent(
+                    video, phase, bytes_sent, file_size, error,
+                ))
+
+    def _get_state_path(self, video):
+        if self._state_dir is None:
+            return None
+        key = '%s:%s' % (
+            video.get_parent_id_assured(),
+            os.path.abspath(video[video.Field.filepath]),
+        )
+        return os.path.join(
+            self._state_dir,
+            hashlib.sha1(key.encode('utf-8')).hexdigest() + '.json',
+        )
+
+    @staticmethod
+    def _get_file_size(video):
+        if video.Field.filepath not in video:
+            raise FacebookError(
+                "VideoUploadPool only uploads AdVideos with a filepath.",
+            )
+        return os.path.getsize(video[video.Field.filepath])
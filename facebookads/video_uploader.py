@@ -26,9 +26,15 @@ from facebookads.exceptions import FacebookError
 from facebookads.exceptions import FacebookRequestError
 from abc import ABCMeta, abstractmethod
 
+import hashlib
+import io
+import json
 import os
 import ntpath
+import random
+import threading
 import time
+import uuid
 
 
 class VideoUploader(object):
@@ -39,12 +45,15 @@ class VideoUploader(object):
     def __init__(self):
         self._session = None
 
-    def upload(self, video, wait_for_encoding=False):
+    def upload(self, video, wait_for_encoding=False, state_path=None):
         """
         Upload the given video file.
         Args:
             video(required): The AdVideo object that will be uploaded
             wait_for_encoding: Whether to wait until encoding is finished.
+            state_path: A file where the upload session is saved as chunks
+                are acknowledged, so an upload that was interrupted resumes
+                from there when it is given again.
         """
         # Check there is no existing session
         if self._session:
@@ -53,15 +62,41 @@ class VideoUploader(object):
             )
 
         # Initiate an upload session
-        self._session = VideoUploadSession(video, wait_for_encoding)
-        result = self._session.start()
-        self._session = None
-        return result
+        self._session = VideoUploadSession(
+            video,
+            wait_for_encoding,
+            state_path=state_path,
+        )
+        try:
+            return self._session.start()
+        finally:
+            self._session = None
 
 
 class VideoUploadSession(object):
+    """
+    Runs the start, transfer and finish phases of a chunked video upload.
+
+    With a state_path, the session id and the offsets the server asked for
+    next are written there after the start phase and each acknowledged
+    chunk, with the size and hash of the video file. A later session with
+    the same state_path and an unchanged file skips the start phase and
+    resumes the transfer from those offsets. The file is removed once the
+    upload is finished.
+
+    A limiter, such as a video_upload_pool.BandwidthLimiter, caps the rate
+    the chunks are sent at, and callback is called with the start and end
+    offsets the server asks for next after each acknowledged chunk.
+    """
 
-    def __init__(self, video, wait_for_encoding=False):
+    def __init__(
+        self,
+        video,
+        wait_for_encoding=False,
+        state_path=None,
+        limiter=None,
+        callback=None,
+    ):
         self._video = video
         self._api = video.get_api_assured()
         if (video.Field.filepath in video):
@@ -72,6 +107,10 @@ class VideoUploadSession(object):
             self._file_path = None
         self._account_id = video.get_parent_id_assured()
         self._wait_for_encoding = wait_for_encoding
+        self._state_path = state_path
+        self._state = None
+        self._file_hash = None
+        self._callback = callback
         # Setup start request manager
         self._start_request_manager = VideoUploadStartRequestManager(
             self._api,
@@ -80,6 +119,8 @@ class VideoUploadSession(object):
         # Setup transfer request manager
         self._transfer_request_manager = VideoUploadTransferRequestManager(
             self._api,
+            limiter=limiter,
+            callback=self._on_chunk,
         )
 
         # Setup finish request manager
@@ -88,19 +129,24 @@ class VideoUploadSession(object):
         )
 
     def start(self):
-        # Run start request manager
-        start_response = self._start_request_manager.send_request(
-            self.getStartRequestContext(),
-        ).json()
-        self._start_offset = int(start_response['start_offset'])
-        self._end_offset = int(start_response['end_offset'])
-        self._session_id = start_response['upload_session_id']
-        video_id = start_response['video_id']
+        resumed = self._resume()
+        if not resumed:
+            self._start()
 
         # Run transfer request manager
-        self._transfer_request_manager.send_request(
-            self.getTransferRequestContext(),
-        )
+        try:
+            self._transfer_request_manager.send_request(
+                self.getTransferRequestContext(),
+            )
+        except FacebookRequestError:
+            if not resumed:
+                raise
+            # The saved session is no longer accepted, start over
+            self._start()
+            self._transfer_request_manager.send_request(
+                self.getTransferRequestContext(),
+            )
+        video_id = self._video_id
 
         # Run finish request manager
         response = self._finish_request_manager.send_request(
@@ -115,8 +161,79 @@ class VideoUploadSession(object):
         body['id'] = video_id
         del body['success']
 
+        if self._state is not None and os.path.exists(self._state_path):
+            os.remove(self._state_path)
         return body
 
+    def _start(self):
+        # Run start request manager
+        start_response = self._start_request_manager.send_request(
+            self.getStartRequestContext(),
+        ).json()
+        self._start_offset = int(start_response['start_offset'])
+        self._end_offset = int(start_response['end_offset'])
+        self._session_id = start_response['upload_session_id']
+        self._video_id = start_response['video_id']
+
+        if self._state_path and self._file_path:
+            self._state = {
+                'account_id': self._account_id,
+                'file_path': self._file_path,
+                'file_size': os.path.getsize(self._file_path),
+                'file_hash': self._get_file_hash(),
+                'upload_session_id': self._session_id,
+                'video_id': self._video_id,
+            }
+            self._save_offsets(self._start_offset, self._end_offset)
+
+    def _resume(self):
+        if not (self._state_path and self._file_path and
+                os.path.exists(self._state_path)):
+            return False
+        try:
+            with open(self._state_path) as state_file:
+                state = json.load(state_file)
+            # Only resume an upload of the same, unchanged file
+            if (state['account_id'] != self._account_id or
+                    state['file_size'] != os.path.getsize(self._file_path) or
+                    state['file_hash'] != self._get_file_hash()):
+                return False
+            offsets = (
+                state['upload_session_id'],
+                state['video_id'],
+                state['start_offset'],
+                state['end_offset'],
+            )
+        except (ValueError, KeyError, TypeError):
+            # A corrupt or partly written state file starts a new upload
+            return False
+        self._state = state
+        (self._session_id, self._video_id,
+         self._start_offset, self._end_offset) = offsets
+        return True
+
+    def _get_file_hash(self):
+        if self._file_hash is None:
+            self._file_hash = get_file_hash(self._file_path)
+        return self._file_hash
+
+    def _on_chunk(self, start_offset, end_offset):
+        self._save_offsets(start_offset, end_offset)
+        if self._callback is not None:
+            self._callback(start_offset, end_offset)
+
+    def _save_offsets(self, start_offset, end_offset):
+        if self._state is None:
+            return
+        self._state['start_offset'] = start_offset
+        self._state['end_offset'] = end_offset
+        # Write a new file and rename it over the old one, so a process
+        # killed mid-write leaves the previous state
+        temp_path = self._state_path + '.tmp'
+        with open(temp_path, 'w') as state_file:
+            json.dump(self._state, state_file)
+        getattr(os, 'replace', os.rename)(temp_path, self._state_path)
+
     def getStartRequestContext(self):
         context = VideoUploadRequestContext()
         if (self._file_path):
@@ -187,72 +304,152 @@ class VideoUploadStartRequestManager(VideoUploadRequestManager):
         }
 
 
+def get_file_hash(path, block_size=1024 * 1024):
+    """
+    Returns the hex SHA-1 digest of the file at path.
+    """
+    digest = hashlib.sha1()
+    block = bytearray(block_size)
+    with io.open(path, 'rb', buffering=0) as f:
+        count = f.readinto(block)
+        while count:
+            digest.update(memoryview(block)[:count])
+            count = f.readinto(block)
+    return digest.hexdigest()
+
+
 class VideoUploadTransferRequestManager(VideoUploadRequestManager):
+    """
+    Sends the chunks asked for by the server. Each chunk is read with
+    readinto into one of two reused buffers and streamed from there, and
+    the next chunk is read while the current one is being sent.
+    """
+
+    def __init__(
+        self,
+        api,
+        max_retries=5,
+        retry_interval=1.0,
+        max_retry_interval=30.0,
+        jitter=0.5,
+        sleep=time.sleep,
+        random=random.random,
+        limiter=None,
+        callback=None,
+    ):
+        """
+        Args:
+            api: The FacebookAdsApi the chunks are sent through.
+            max_retries (optional): How many times a chunk is resent after
+                a transient error before it is raised.
+            retry_interval (optional): Seconds before the first resend,
+                doubled for each following one.
+            max_retry_interval (optional): The longest wait between resends.
+            jitter (optional): Relative random spread of the waits, so
+                parallel uploads do not retry in step.
+            sleep (optional): The function used to wait before resends.
+            random (optional): The function returning a float in [0, 1).
+            limiter (optional): An object whose acquire(count) blocks until
+                count more bytes may be sent, shared to cap the bandwidth of
+                several uploads.
+            callback (optional): Called with the start and end offsets the
+                server asks for next each time it acknowledges a chunk.
+        """
+        super(VideoUploadTransferRequestManager, self).__init__(api)
+        self._max_retries = max_retries
+        self._retry_interval = retry_interval
+        self._max_retry_interval = max_retry_interval
+        self._jitter = jitter
+        self._sleep = sleep
+        self._random = random
+        self._limiter = limiter
+        self._callback = callback
+        self._buffers = [bytearray(), bytearray()]
 
     def send_request(self, context):
         """
         send transfer request with the given context
         """
-        # Init a VideoUploadRequest
-        request = VideoUploadRequest(self._api)
         self._start_offset = context.start_offset
         self._end_offset = context.end_offset
         filepath = context.file_path
         file_size = os.path.getsize(filepath)
         # Give a chance to retry every 10M, or at least twice
         retry = max(file_size / (1024 * 1024 * 10), 2)
-        f = open(filepath, 'rb')
-        # While the there are still more chunks to send
-        while self._start_offset != self._end_offset:
-            # Read a chunk of file
-            f.seek(self._start_offset)
-            chunk = f.read(self._end_offset - self._start_offset)
-            context.start_offset = self._start_offset
-            context.end_offset = self._end_offset
-            # Parse the context
-            request.setParams(
-                self.getParamsFromContext(context),
-                {'video_file_chunk': (
-                    context.file_path,
-                    chunk,
-                    'multipart/form-data',
-                )},
-            )
-            # send the request
-            try:
-                response = request.send(
-                    (context.account_id, 'advideos'),
-                ).json()
-                self._start_offset = int(response['start_offset'])
-                self._end_offset = int(response['end_offset'])
-            except FacebookRequestError as e:
-                subcode = e.api_error_subcode()
-                body = e.body()
-                if subcode == 1363037:
-                    # existing issue, try again immedidately
-                    if (body and 'error' in body and
-                            'error_data' in body['error'] and
-                            'start_offset' in body['error']['error_data'] and
-                            retry > 0):
-                        self._start_offset = int(
-                            body['error']['error_data']['start_offset'],
-                        )
-                        self._end_offset = int(
-                            body['error']['error_data']['end_offset'],
-                        )
+        attempts = 0
+        response = None
+        chunk = None
+        current = 0
+        prefetch = None
+        f = io.open(filepath, 'rb', buffering=0)
+        try:
+            # While the there are still more chunks to send
+            while self._start_offset != self._end_offset:
+                if chunk is None:
+                    chunk = self._read_chunk(
+                        f, current, self._start_offset, self._end_offset,
+                    )
+                # Guess the next chunk is as long as this one and read it
+                # into the other buffer while this one is sent
+                prefetch = None
+                next_range = (
+                    self._end_offset,
+                    min(2 * self._end_offset - self._start_offset, file_size),
+                )
+                if next_range[1] > next_range[0]:
+                    prefetch = _ChunkPrefetch(
+                        self._read_chunk, (f, 1 - current) + next_range,
+                    )
+                    prefetch.start()
+                try:
+                    response = self._send_chunk(context, chunk)
+                    offsets = (
+                        int(response['start_offset']),
+                        int(response['end_offset']),
+                    )
+                    attempts = 0
+                    if self._callback is not None:
+                        self._callback(*offsets)
+                except FacebookRequestError as e:
+                    offsets = self._get_error_offsets(e)
+                    if offsets is not None and retry > 0:
+                        # existing issue, try again immedidately
                         retry = max(retry - 1, 0)
-                        continue
-                elif ('error' in body and
-                        'is_transient' in body['error']):
-                    if body['error']['is_transient']:
-                        time.sleep(1)
-                        continue
-                f.close()
-                raise e
-
-        f.close()
+                    elif (self._is_transient(e) and
+                            attempts < self._max_retries):
+                        self._sleep(self.get_retry_interval(attempts))
+                        attempts += 1
+                        offsets = (self._start_offset, self._end_offset)
+                    else:
+                        raise e
+
+                if prefetch is not None and offsets == next_range:
+                    chunk = prefetch.get()
+                    current = 1 - current
+                else:
+                    if prefetch is not None:
+                        prefetch.join()
+                    if offsets != (self._start_offset, self._end_offset):
+                        chunk = None
+                prefetch = None
+                self._start_offset, self._end_offset = offsets
+        finally:
+            if prefetch is not None:
+                prefetch.join()
+            f.close()
+
         return response
 
+    def get_retry_interval(self, attempt):
+        """
+        Returns the seconds to wait before the given resend of a chunk.
+        """
+        interval = min(
+            self._retry_interval * 2 ** attempt,
+            self._max_retry_interval,
+        )
+        return interval * (1 + self._jitter * (2 * self._random() - 1))
+
     def getParamsFromContext(self, context):
         return {
             'upload_phase': 'transfer',
@@ -260,6 +457,140 @@ class VideoUploadTransferRequestManager(VideoUploadRequestManager):
             'upload_session_id': context.session_id,
         }
 
+    def _read_chunk(self, f, index, start, end):
+        size = end - start
+        if len(self._buffers[index]) < size:
+            self._buffers[index] = bytearray(size)
+        chunk = memoryview(self._buffers[index])[:size]
+        f.seek(start)
+        read = 0
+        while read < size:
+            count = f.readinto(chunk[read:])
+            if not count:
+                raise FacebookError(
+                    'video file is shorter than the requested chunk',
+                )
+            read += count
+        return chunk
+
+    def _send_chunk(self, context, chunk):
+        context.start_offset = self._start_offset
+        context.end_offset = self._end_offset
+        request = VideoUploadRequest(self._api)
+        request.setBody(VideoUploadChunkBody(
+            self.getParamsFromContext(context),
+            'video_file_chunk',
+            ntpath.basename(context.file_path),
+            chunk,
+            limiter=self._limiter,
+        ))
+        return request.send((context.account_id, 'advideos')).json()
+
+    @staticmethod
+    def _get_error_offsets(error):
+        body = error.body()
+        if (error.api_error_subcode() == 1363037 and
+                isinstance(body, dict) and
+                'error_data' in body.get('error', {}) and
+                'start_offset' in body['error']['error_data']):
+            error_data = body['error']['error_data']
+            return (
+                int(error_data['start_offset']),
+                int(error_data['end_offset']),
+            )
+        return None
+
+    @staticmethod
+    def _is_transient(error):
+        # Connection errors come back as 500s with a plain text body
+        return error.api_transient_error() or (
+            not isinstance(error.body(), dict) and
+            error.http_status() >= 500
+        )
+
+
+class _ChunkPrefetch(threading.Thread):
+    # Reads a chunk in the background. A thread per chunk, since a pool's
+    # shutdown polls and would delay small uploads.
+
+    def __init__(self, read, args):
+        super(_ChunkPrefetch, self).__init__()
+        self.daemon = True
+        self._read = read
+        self._args = args
+        self._chunk = None
+        self._error = None
+
+    def run(self):
+        try:
+            self._chunk = self._read(*self._args)
+        except Exception as e:
+            self._error = e
+
+    def get(self):
+        self.join()
+        if self._error is not None:
+            raise self._error
+        return self._chunk
+
+
+class VideoUploadChunkBody(object):
+    """
+    multipart/form-data request body of the transfer params and one chunk
+    of the video, read out in blocks that reference the chunk's buffer
+    instead of copying it
+    """
+
+    block_size = 1024 * 1024
+
+    def __init__(self, params, name, file_name, chunk, limiter=None):
+        self._limiter = limiter
+        boundary = uuid.uuid4().hex
+        head = [
+            '--%s\r\nContent-Disposition: form-data; name="%s"\r\n\r\n%s\r\n'
+            % (boundary, key, value)
+            for key, value in sorted(params.items())
+        ]
+        head.append(
+            '--%s\r\nContent-Disposition: form-data; name="%s"; '
+            'filename="%s"\r\nContent-Type: multipart/form-data\r\n\r\n'
+            % (boundary, name, file_name)
+        )
+        self.content_type = 'multipart/form-data; boundary=%s' % boundary
+        self._parts = [
+            memoryview(''.join(head).encode('utf-8')),
+            memoryview(chunk),
+            memoryview(('\r\n--%s--\r\n' % boundary).encode('utf-8')),
+        ]
+        self._length = sum(len(part) for part in self._parts)
+
+    def __len__(self):
+        return self._length
+
+    def __iter__(self):
+        block = self.read()
+        while block:
+            yield block
+            block = self.read()
+
+    def read(self, size=-1):
+        """
+        Returns the next block of the body as a memoryview. Blocks are at
+        least block_size long, since http clients read in small blocks and
+        write whatever they are given. With a limiter, waits until the
+        block may be sent.
+        """
+        while self._parts and not len(self._parts[0]):
+            self._parts.pop(0)
+        if not self._parts:
+            return b''
+        size = max(size, self.block_size)
+        block = self._parts[0][:size]
+        self._parts[0] = self._parts[0][size:]
+        if self._limiter is not None:
+            self._limiter.acquire(len(block))
+        return block
+
 
 class VideoUploadFinishRequestManager(VideoUploadRequestManager):
 
@@ -359,24 +690,37 @@ class VideoUploadRequest(object):
     def __init__(self, api):
         self._params = None
         self._files = None
+        self._body = None
         self._api = api
 
     def send(self, path):
         """
         send the current request
         """
+        headers = None
+        if self._body is not None:
+            headers = {'Content-Type': self._body.content_type}
         return self._api.call(
             'POST',
             path,
             params=self._params,
+            headers=headers,
             files=self._files,
             url_override='https://graph-video.facebook.com',
+            body=self._body,
         )
 
     def setParams(self, params, files=None):
         self._params = params
         self._files = files
 
+    def setBody(self, body):
+        """
+        set a streamed request body, such as a VideoUploadChunkBody, that
+        carries the params itself
+        """
+        self._body = body
+
 
 class VideoEncodingStatusChecker(object):
 